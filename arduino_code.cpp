@@ -162,6 +162,39 @@ bool persistentDataInitialized = false;
 unsigned long lastDataRequest = 0;
 const unsigned long DATA_REQUEST_INTERVAL = 5000;  // Request initialization data every 5 seconds until received
 
+// --- Binary Telemetry Frames (optional) ---
+// Advertised in INIT_REQUEST, enabled when the Pi answers BINARY_MODE:1
+// Frame on the wire: 0x00 + COBS(payload + CRC16 little-endian) + 0x00
+// Text messages (INIT_REQUEST, SAVE_DATA, RESET_TRIP, STYLE_CHANGE, debug) stay ASCII lines
+const bool BINARY_TELEMETRY_SUPPORTED = true;
+bool binaryTelemetry = false;
+const byte FRAME_FAST = 0x01;    // speed, fuel, oil, coolant, oil temp, rpm, battery, brightness, fuel consumption
+const byte FRAME_STATUS = 0x02;  // button/switch flags, fuel range, instant/average MPG, fuel flow
+byte frameSequence = 0;
+
+// --- Delta Telemetry Lines (optional) ---
+// Advertised in INIT_REQUEST, enabled when the Pi answers DELTA_MODE:1 (binary frames take priority)
+// KF:<seq>,KEY:value,... keyframe with every field, DF:<seq>,KEY:value... only fields that changed
+const bool DELTA_TELEMETRY_SUPPORTED = true;
+bool deltaTelemetry = false;
+const unsigned long KEYFRAME_INTERVAL = 1000;  // Full keyframe once a second, deltas every 100ms
+unsigned long lastKeyframe = 0;
+byte deltaSequence = 0;
+const byte DELTA_FIELD_COUNT = 24;
+const char* const DELTA_KEYS[DELTA_FIELD_COUNT] = {
+  "SPEED", "FUEL", "OIL", "COOLANT", "OILTEMP", "RPM", "BATTERY", "BRIGHTNESS", "FUEL_CONSUMPTION",
+  "FUELRNG", "IMPG", "AMPG", "FLOW",
+  "TRIP_BTN", "AVG_BTN", "OIL_P_SW", "OIL_T_SW", "COOL_SW", "VOLT_SW",
+  "AMPG_SW", "IMPG_SW", "TRIP_SW", "FUELR_SW", "METR_SW"
+};
+const byte DELTA_DECIMALS[DELTA_FIELD_COUNT] = {
+  1, 1, 1, 1, 1, 0, 1, 1, 3,
+  1, 1, 1, 3,
+  0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0
+};
+long lastSentDelta[DELTA_FIELD_COUNT];  // Last value sent per field, scaled by its printed decimals
+
 // --- Utility Functions ---
 float analogToVoltage(int value) {
   // Manual ADC calculation with explicit values
@@ -595,10 +628,125 @@ void generateOdometerPulse() {
   }
 }
 
+// --- Binary Telemetry Functions ---
+uint16_t crc16(const byte* data, size_t length) {
+  // CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) - matches binascii.crc_hqx on the Pi
+  uint16_t crc = 0xFFFF;
+  for (size_t i = 0; i < length; i++) {
+    crc ^= (uint16_t)data[i] << 8;
+    for (byte bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : (crc << 1);
+    }
+  }
+  return crc;
+}
+
+size_t cobsEncode(const byte* input, size_t length, byte* output) {
+  // Consistent Overhead Byte Stuffing - output never contains 0x00 (needs length + 1 bytes)
+  size_t writeIndex = 1;
+  size_t codeIndex = 0;
+  byte code = 1;
+  for (size_t readIndex = 0; readIndex < length; readIndex++) {
+    if (input[readIndex] == 0) {
+      output[codeIndex] = code;
+      code = 1;
+      codeIndex = writeIndex++;
+    } else {
+      output[writeIndex++] = input[readIndex];
+      code++;
+      if (code == 0xFF) {
+        output[codeIndex] = code;
+        code = 1;
+        codeIndex = writeIndex++;
+      }
+    }
+  }
+  output[codeIndex] = code;
+  return writeIndex;
+}
+
+size_t putFloat(byte* buffer, size_t pos, float value) {
+  memcpy(buffer + pos, &value, 4);  // AVR floats are IEEE-754 little-endian
+  return pos + 4;
+}
+
+size_t putUInt16(byte* buffer, size_t pos, uint16_t value) {
+  buffer[pos] = value & 0xFF;
+  buffer[pos + 1] = value >> 8;
+  return pos + 2;
+}
+
+void sendBinaryFrame(byte* payload, size_t length) {
+  // Append CRC, COBS-encode and send between zero delimiters
+  byte encoded[48];
+  putUInt16(payload, length, crc16(payload, length));
+  size_t encodedLength = cobsEncode(payload, length + 2, encoded);
+  Serial.write((byte)0);
+  Serial.write(encoded, encodedLength);
+  Serial.write((byte)0);
+}
+
+void sendFastFrame(float speed, float fuelPct, float oilPSI, float coolantF, float oilTempF,
+                   float rpm, float batteryVolts, float brightness, float fuelConsumption) {
+  // Layout must match FAST_FRAME in arduino_telemetry.py: <BBfffffHfff
+  byte payload[40];
+  size_t pos = 0;
+  payload[pos++] = FRAME_FAST;
+  payload[pos++] = frameSequence++;
+  pos = putFloat(payload, pos, speed);
+  pos = putFloat(payload, pos, fuelPct);
+  pos = putFloat(payload, pos, oilPSI);
+  pos = putFloat(payload, pos, coolantF);
+  pos = putFloat(payload, pos, oilTempF);
+  pos = putUInt16(payload, pos, (uint16_t)(rpm + 0.5));
+  pos = putFloat(payload, pos, batteryVolts);
+  pos = putFloat(payload, pos, brightness);
+  pos = putFloat(payload, pos, fuelConsumption);
+  sendBinaryFrame(payload, pos);
+}
+
+void sendStatusFrame(uint16_t flags, float range, float instMPG, float avgMPG, float flowGPH) {
+  // Layout must match STATUS_FRAME in arduino_telemetry.py: <BBHffff
+  byte payload[24];
+  size_t pos = 0;
+  payload[pos++] = FRAME_STATUS;
+  payload[pos++] = frameSequence++;
+  pos = putUInt16(payload, pos, flags);
+  pos = putFloat(payload, pos, range);
+  pos = putFloat(payload, pos, instMPG);
+  pos = putFloat(payload, pos, avgMPG);
+  pos = putFloat(payload, pos, flowGPH);
+  sendBinaryFrame(payload, pos);
+}
+
+void sendDeltaTelemetry(const float* values, bool keyframe) {
+  // Only fields whose printed value changed (all of them in a keyframe)
+  Serial.print(keyframe ? "KF:" : "DF:");
+  Serial.print(deltaSequence++);
+  for (byte i = 0; i < DELTA_FIELD_COUNT; i++) {
+    long scaled = lround(values[i] * pow(10, DELTA_DECIMALS[i]));
+    if (keyframe || scaled != lastSentDelta[i]) {
+      Serial.print(",");
+      Serial.print(DELTA_KEYS[i]);
+      Serial.print(":");
+      Serial.print(values[i], DELTA_DECIMALS[i]);
+      lastSentDelta[i] = scaled;
+    }
+  }
+  Serial.println();
+}
+
 // --- Persistent Data Communication Functions ---
 void requestPersistentData() {
-  // Request initialization data from Raspberry Pi
-  Serial.println("INIT_REQUEST:PERSISTENT_DATA");
+  // Request initialization data from Raspberry Pi (and offer binary/delta telemetry)
+  Serial.print("INIT_REQUEST:PERSISTENT_DATA");
+  if (BINARY_TELEMETRY_SUPPORTED) {
+    Serial.print(",BINARY:1");
+  }
+  if (DELTA_TELEMETRY_SUPPORTED) {
+    Serial.print(",DELTA:1");
+  }
+  Serial.println();
 }
 
 void processPersistentDataResponse() {
@@ -607,6 +755,19 @@ void processPersistentDataResponse() {
     String response = Serial.readStringUntil('\n');
     response.trim();
     
+    if (response.startsWith("BINARY_MODE:")) {
+      // Pi accepted binary telemetry frames (sent just before INIT_DATA)
+      binaryTelemetry = BINARY_TELEMETRY_SUPPORTED && response.substring(12).toInt() == 1;
+      return;
+    }
+    
+    if (response.startsWith("DELTA_MODE:")) {
+      // Pi accepted delta telemetry lines - start with a keyframe
+      deltaTelemetry = DELTA_TELEMETRY_SUPPORTED && response.substring(11).toInt() == 1;
+      lastKeyframe = 0;
+      return;
+    }
+    
     if (response.startsWith("AVG_MPG_UPDATE:")) {
       // Receive calculated average MPG from Raspberry Pi
       String data = response.substring(15); // Remove "AVG_MPG_UPDATE:" prefix
@@ -1315,20 +1476,56 @@ void loop() {
     // Serial.println();
 
     // Output essential data with optimized Pi processing
-    Serial.print("SPEED:"); Serial.print(currentSpeed, 1); Serial.print(",");
-    Serial.print("FUEL:"); Serial.print(fuelPct, 1); Serial.print(",");
-    Serial.print("OIL:"); Serial.print(oilPSI, 1); Serial.print(",");
-    Serial.print("COOLANT:"); Serial.print(coolantF, 1); Serial.print(",");
-    Serial.print("OILTEMP:"); Serial.print(oilTempF, 1); Serial.print(",");
-    Serial.print("RPM:"); Serial.print(currentRPM, 0); Serial.print(",");
-    Serial.print("BATTERY:"); Serial.print(batteryVolts, 1); Serial.print(",");
-    Serial.print("BRIGHTNESS:"); Serial.print(brightness, 1); Serial.print(",");
-    Serial.print("FUEL_CONSUMPTION:"); Serial.print(currentFuelConsumptionLbHr, 3);
-    Serial.println();
+    if (binaryTelemetry) {
+      // 41 bytes on the wire instead of ~110 characters of text
+      sendFastFrame(currentSpeed, fuelPct, oilPSI, coolantF, oilTempF, currentRPM,
+                    batteryVolts, brightness, currentFuelConsumptionLbHr);
+    } else if (deltaTelemetry) {
+      // Switch states ride along in the same line - the separate switch line is skipped
+      bool keyframe = lastKeyframe == 0 || now - lastKeyframe >= KEYFRAME_INTERVAL;
+      if (keyframe) {
+        lastKeyframe = now;
+      }
+      float values[DELTA_FIELD_COUNT] = {
+        currentSpeed, fuelPct, oilPSI, coolantF, oilTempF, currentRPM, batteryVolts, brightness,
+        currentFuelConsumptionLbHr, fuelRange, instantMPG, averageMPG, currentFuelFlowGPH,
+        (float)tripOdoReset, (float)avgFuelReset, (float)oilPressureSwitch, (float)oilTempSwitch,
+        (float)coolantTempSwitch, (float)voltsSwitch, (float)avgMpgSwitch, (float)instMpgSwitch,
+        (float)tripOdoSwitch, (float)fuelRangeSwitch, (float)metricSwitch
+      };
+      sendDeltaTelemetry(values, keyframe);
+    } else {
+      Serial.print("SPEED:"); Serial.print(currentSpeed, 1); Serial.print(",");
+      Serial.print("FUEL:"); Serial.print(fuelPct, 1); Serial.print(",");
+      Serial.print("OIL:"); Serial.print(oilPSI, 1); Serial.print(",");
+      Serial.print("COOLANT:"); Serial.print(coolantF, 1); Serial.print(",");
+      Serial.print("OILTEMP:"); Serial.print(oilTempF, 1); Serial.print(",");
+      Serial.print("RPM:"); Serial.print(currentRPM, 0); Serial.print(",");
+      Serial.print("BATTERY:"); Serial.print(batteryVolts, 1); Serial.print(",");
+      Serial.print("BRIGHTNESS:"); Serial.print(brightness, 1); Serial.print(",");
+      Serial.print("FUEL_CONSUMPTION:"); Serial.print(currentFuelConsumptionLbHr, 3);
+      Serial.println();
+    }
     
     // Send switch states and other data more frequently (every 200ms for better responsiveness)
     static unsigned long lastSwitchUpdate = 0;
-    if (now - lastSwitchUpdate >= 150) {  // Increased frequency for better responsiveness
+    if (now - lastSwitchUpdate >= 150 && binaryTelemetry) {
+      // Same fields as the text line below, switches/buttons packed into one bit field
+      uint16_t flags = 0;
+      if (tripOdoReset) flags |= 1 << 0;
+      if (avgFuelReset) flags |= 1 << 1;
+      if (oilPressureSwitch) flags |= 1 << 2;
+      if (oilTempSwitch) flags |= 1 << 3;
+      if (coolantTempSwitch) flags |= 1 << 4;
+      if (voltsSwitch) flags |= 1 << 5;
+      if (avgMpgSwitch) flags |= 1 << 6;
+      if (instMpgSwitch) flags |= 1 << 7;
+      if (tripOdoSwitch) flags |= 1 << 8;
+      if (fuelRangeSwitch) flags |= 1 << 9;
+      if (metricSwitch) flags |= 1 << 10;
+      sendStatusFrame(flags, fuelRange, instantMPG, averageMPG, currentFuelFlowGPH);
+      lastSwitchUpdate = now;
+    } else if (now - lastSwitchUpdate >= 150 && !deltaTelemetry) {  // Increased frequency for better responsiveness
       // IMPORTANT: Critical data FIRST so it's not truncated
       // Button data first (for style change)
       Serial.print("TRIP_BTN:"); Serial.print(tripOdoReset); Serial.print(",");
@@ -1,5 +1,4 @@
 import pygame
-import serial
 import math
 import time
 import os
@@ -7,18 +6,112 @@ import subprocess
 import json
 import signal
 import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict, deque
 from datetime import datetime
+from arduino_telemetry import PortSupervisor, SerialReader, SerialRecorder, ReplaySerial, field_age
+from gauge_geometry import (diagonal_speedometer_ticks, diagonal_bar_segments, diagonal_speed_marks,
+                            intermediate_speeds, mountain_position, mountain_bar_segments, mountain_curve,
+                            mountain_rpm_marks, mountain_tachometer_ticks, zx_tachometer_shape)
 
-print("THIS IS A DEBUG MESSAGE 1")
-# Remove window positioning to match temp_debug_with_grid.py
-# os.environ['SDL_VIDEO_WINDOW_POS'] = '-1024,0'  # DISABLED - was preventing center screen access
+# Importing this module has no side effects - DashboardEngine.start() initializes pygame, opens the
+# window and the Arduino, step() renders a frame and shutdown() closes it all (see main() at the end)
 
-# Configure SDL for Raspberry Pi displays
-os.environ['DISPLAY'] = ':0'  # Use X11 display
-os.environ['SDL_VIDEODRIVER'] = 'x11'  # Use X11 for multi-head support
+# Headless benchmark run (tools/benchmark_rotation.py) - no window, no Arduino, exits after N frames
+BENCHMARK_FRAMES = int(os.environ.get('DASHBOARD_BENCHMARK_FRAMES', '0'))
 
-pygame.init()
-pygame.mixer.quit()  # Disable audio to stop ALSA errors
+def init_pygame(headless=False):
+    """Point SDL at the Pi's displays (dummy video driver when headless) and start pygame without audio"""
+    # Remove window positioning to match temp_debug_with_grid.py
+    # os.environ['SDL_VIDEO_WINDOW_POS'] = '-1024,0'  # DISABLED - was preventing center screen access
+    
+    # Configure SDL for Raspberry Pi displays
+    os.environ['DISPLAY'] = ':0'  # Use X11 display
+    os.environ['SDL_VIDEODRIVER'] = 'dummy' if headless else 'x11'  # Use X11 for multi-head support
+    
+    pygame.init()
+    pygame.mixer.quit()  # Disable audio to stop ALSA errors
+
+# Font registry - SysFont() searches for the font file and loads the TTF on every call,
+# so each (family, size, bold) is created once and shared by every draw function
+font_registry = {}
+font_loads = 0  # Fonts loaded since the last frame - stays at zero once warmed up
+
+# Every (family, size) the five styles draw with - loaded before the first frame
+# Arial 16-28 covers the perspective-scaled tachometer numbers and the 21pt milestone labels
+WARM_FONTS = ([('Arial', size) for size in range(12, 29)] +
+              [('Arial', size) for size in (30, 32, 36, 40, 48, 56)] +
+              [('Courier', size) for size in (22, 28, 42)])
+
+def get_font(family, size, bold=True):
+    """Shared font for (family, size, bold), loaded on first use"""
+    global font_loads
+    key = (family, size, bold)
+    font = font_registry.get(key)
+    if font is None:
+        font = pygame.font.SysFont(family, size, bold=bold)
+        font_registry[key] = font
+        font_loads += 1
+    return font
+
+def warm_font_registry():
+    """Load every dashboard font up front so no frame pays for a TTF load"""
+    global font_loads
+    for family, size in WARM_FONTS:
+        get_font(family, size)
+    print(f"🔤 Pre-loaded {len(font_registry)} fonts")
+    font_loads = 0
+
+# Surface allocations - once the caches are warm a frame should allocate no new pixels, so every
+# place on the render path that creates a surface goes through counted() and shows up in the stats
+surface_allocations = 0  # Since the start of the current frame
+frame_allocations = []   # Per-frame counts
+
+def counted(surface):
+    """Count a freshly allocated surface, returns it unchanged"""
+    global surface_allocations
+    surface_allocations += 1
+    return surface
+
+# Rendered text cache - labels and tick numbers are the same strings frame after frame,
+# but font.render() rasterizes them on the CPU every call
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # Memory cap for cached text surfaces
+TEXT_CACHE_MAX_ENTRIES = 2048
+text_cache = OrderedDict()  # (font, text, antialias, color, indexed style) -> surface, least recently used first
+text_cache_bytes = 0
+text_cache_hits = 0
+text_cache_misses = 0
+indexed_style = None  # Style whose 8-bit palette the render targets use, None = true colour
+
+def render_text(font, text, antialias, color):
+    """font.render() through the LRU text cache - the surface is shared, only blit it"""
+    global text_cache_bytes, text_cache_hits, text_cache_misses
+    key = (font, text, antialias, color, indexed_style)
+    surface = text_cache.get(key)
+    if surface is not None:
+        text_cache.move_to_end(key)
+        text_cache_hits += 1
+        return surface
+    
+    text_cache_misses += 1
+    if indexed_style is None:
+        surface = counted(font.render(text, antialias, color))
+    else:
+        # Blits onto 8-bit targets ignore per-pixel alpha - anti-alias against the style
+        # background, map into the palette and key the background out instead
+        background = INDEXED_STYLES[indexed_style][0]
+        surface = counted(font.render(text, antialias, color, background)).convert(speedometer_surface)
+        surface.set_colorkey(background)
+    text_cache[key] = surface
+    text_cache_bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+    
+    # Evict least recently used text (live values like speed digits churn, labels stay)
+    while text_cache_bytes > TEXT_CACHE_MAX_BYTES or len(text_cache) > TEXT_CACHE_MAX_ENTRIES:
+        _, old = text_cache.popitem(last=False)
+        text_cache_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+    return surface
 
 # Extended window to include all three screens side by side
 TOTAL_WIDTH = 5000  # Increased width to prevent tachometer clipping
@@ -58,39 +151,299 @@ DSI_X_OFFSET = 2048  # DSI screen starts after both HDMI screens
 # Check if fullscreen mode is requested (default to fullscreen for dashboard)
 fullscreen_mode = os.environ.get('COMBINED_FULLSCREEN', '1') == '1'  # Default to '1' (fullscreen)
 
-if fullscreen_mode:
-    # Use borderless window spanning all screens at position (0,0)
-    screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT), pygame.NOFRAME)
-    print("Combined dashboard started in BORDERLESS FULLSCREEN mode")
-else:
-    screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT))
-    print("Combined dashboard started in WINDOWED mode")
-    print("Instructions: Press F11 for fullscreen")
-
-pygame.display.set_caption("C4 Dual Dashboard - Combined")
-pygame.mouse.set_visible(False)  # Hide mouse cursor for dashboard
-clock = pygame.time.Clock()
-
-# Track fullscreen state
-is_fullscreen = fullscreen_mode
-
-# Create surfaces for each dashboard (will be rotated)
-speedometer_surface = pygame.Surface((1024, 768))
-tachometer_surface = pygame.Surface((1024, 968))  # Increased height by 200px total for odometer space
-
-# Load symbol images
-try:
-    coolant_temp_symbol = pygame.image.load("coolant_temp_symbol.png")
-    oil_symbol = pygame.image.load("oil_symbol.png")
-    gas_pump_symbol = pygame.image.load("gas_pump_symbol.png")
-    battery_symbol = pygame.image.load("battery_symbol.png")
-    print("Symbol images loaded successfully")
-except Exception as e:
-    print(f"Warning: Could not load symbol images: {e}")
-    coolant_temp_symbol = None
-    oil_symbol = None
-    gas_pump_symbol = None
-    battery_symbol = None
+# Window and frame clock - set up by DashboardEngine.start()
+screen = None           # Surface the three screens are composited onto
+display_output = True   # screen is the display window (False: a surface handed to the engine)
+clock = None
+is_fullscreen = fullscreen_mode  # Track fullscreen state
+
+def open_window(fullscreen):
+    """(Re)open the window spanning all three screens - borderless at (0,0) in fullscreen mode"""
+    global screen, is_fullscreen
+    if fullscreen:
+        # Use borderless window spanning all screens at position (0,0)
+        screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT), pygame.NOFRAME)
+    else:
+        screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT))
+    is_fullscreen = fullscreen
+    return screen
+
+# Rotated output - rotating a whole 1024x768 surface costs ~5ms a frame, so each screen keeps
+# a persistent rotated copy and only the tiles whose pixels changed since last frame are rotated
+ROTATE_TILE = 64            # Tile edge in source pixels
+ROTATE_FULL_FRACTION = 0.5  # Above this share of changed tiles one full copy is cheaper
+TILED_ROTATION = os.environ.get('DASHBOARD_TILED_ROTATION', '1') == '1'  # 0 = rotate whole surfaces every frame
+
+class RotatedBuffer:
+    """Persistent rotated copy of a render surface, refreshed tile by tile"""
+
+    def __init__(self, source, angle):
+        self.source = source
+        self.width, self.height = source.get_size()
+        self.angle = angle % 360
+        rotated_size = (self.height, self.width) if self.angle in (90, 270) else (self.width, self.height)
+        self.indexed = source.get_bitsize() == 8  # Palette-indexed target (see INDEXED_STYLES)
+        if self.indexed:
+            self.surface = pygame.Surface(rotated_size, 0, 8)  # Indices compared - a palette change leaves them alone
+        else:
+            self.surface = pygame.Surface(rotated_size).convert()
+        self.palette_changed = False  # Set by set_palette(), the whole screen goes out next update
+        self.brightness_level = None  # Dimming level of the rotated copy (palette, or overlay on the copied tiles)
+        self.tiles = [pygame.Rect(x, y, min(ROTATE_TILE, self.width - x), min(ROTATE_TILE, self.height - y))
+                      for y in range(0, self.height, ROTATE_TILE) for x in range(0, self.width, ROTATE_TILE)]
+        # Change detection without copying pixels out: a memcmp of each band (row of tiles) against
+        # the previous source pixels skips the bands nothing moved in; in the others each tile is
+        # blitted into a persistent scratch surface of its size and compared with its last copy
+        pitch = source.get_pitch()
+        self.bands = [(y * pitch, min(y + ROTATE_TILE, self.height) * pitch,
+                       [i for i, tile in enumerate(self.tiles) if tile.top == y])
+                      for y in range(0, self.height, ROTATE_TILE)]
+        self.previous = bytearray(pitch * self.height)  # Source pixels as of the last update
+        self.scratches = {}
+        self.tile_scratch = []  # Per tile: (scratch surface, offset in previous_tiles, pixel bytes)
+        offset = 0
+        for tile in self.tiles:
+            if tile.size not in self.scratches:
+                self.scratches[tile.size] = pygame.Surface(tile.size, 0, source)
+            scratch = self.scratches[tile.size]
+            size = scratch.get_pitch() * tile.height
+            self.tile_scratch.append((scratch, offset, size))
+            offset += size
+        self.previous_tiles = bytearray(offset)  # Each tile's pixels as of the last update
+        self.previous_valid = False               # False = treat every tile as changed
+        self.dirty = []                           # Rotated rects refreshed by the last update
+        self.full_rotations = 0
+        self.tile_rotations = 0
+
+    def rotated_rect(self, rect):
+        """Where a source rect lands after the rotation (pygame angles turn counterclockwise)"""
+        x, y, w, h = rect
+        if self.angle == 270:
+            return pygame.Rect(self.height - y - h, x, h, w)
+        if self.angle == 90:
+            return pygame.Rect(y, self.width - x - w, h, w)
+        if self.angle == 180:
+            return pygame.Rect(self.width - x - w, self.height - y - h, w, h)
+        return pygame.Rect(x, y, w, h)
+
+    def turned(self, pixels):
+        """A PixelArray view turned by the buffer angle - a view, no pixels are copied"""
+        if self.angle == 270:
+            return pixels.transpose()[::-1, :]
+        if self.angle == 90:
+            return pixels.transpose()[:, ::-1]
+        if self.angle == 180:
+            return pixels[::-1, ::-1]
+        return pixels
+
+    def copy_rotated(self, rects):
+        """Copy source rects into their rotated place pixel for pixel (same format, no new surfaces)"""
+        source = pygame.PixelArray(self.source)
+        target = pygame.PixelArray(self.surface)
+        try:
+            for rect in rects:
+                dest = self.rotated_rect(rect)
+                target[dest.left:dest.right, dest.top:dest.bottom] = \
+                    self.turned(source[rect.left:rect.right, rect.top:rect.bottom])
+        finally:
+            # PixelArrays lock their surfaces - release them before anything blits
+            source.close()
+            target.close()
+
+    def changed_tiles(self):
+        """Tiles whose pixels differ from the last update (all of them after reset())"""
+        previous = self.previous
+        previous_tiles = self.previous_tiles
+        everything = not self.previous_valid
+        if everything and self.indexed:
+            # Same palette on both sides, so the blits below copy indices unmapped
+            for scratch in self.scratches.values():
+                scratch.set_palette(self.source.get_palette())
+        bands = []
+        proxy = self.source.get_buffer()  # Locks the source - released before the tile blits
+        with memoryview(proxy) as pixels:
+            for band_start, band_end, band_tiles in self.bands:
+                if everything or not previous.startswith(pixels[band_start:band_end], band_start):
+                    previous[band_start:band_end] = pixels[band_start:band_end]
+                    bands.append(band_tiles)
+        del proxy
+        changed = []
+        for band_tiles in bands:
+            for index in band_tiles:
+                tile = self.tiles[index]
+                scratch, offset, size = self.tile_scratch[index]
+                scratch.blit(self.source, (0, 0), tile)
+                tile_pixels = scratch.get_buffer()
+                if everything or not previous_tiles.startswith(tile_pixels, offset):
+                    previous_tiles[offset:offset + size] = tile_pixels
+                    changed.append(tile)
+                del tile_pixels  # Unlocks the scratch for the next blit
+        self.previous_valid = True
+        return changed
+
+    def update(self):
+        """Bring the rotated copy up to date with the source, returns the rotated surface"""
+        changed = self.changed_tiles()
+        
+        if len(changed) > len(self.tiles) * ROTATE_FULL_FRACTION:
+            # Most of the screen moved (first frame, style change) - one full copy
+            self.copy_rotated([self.source.get_rect()])
+            self.full_rotations += 1
+            self.dirty = [self.surface.get_rect()]
+        else:
+            self.copy_rotated(changed)
+            self.dirty = [self.rotated_rect(tile) for tile in changed]
+            self.tile_rotations += len(changed)
+        if not self.indexed and self.brightness_level:
+            # Tiles come over undimmed - darken just those, the rest of the copy is dimmed already
+            overlay = brightness_overlay(self.surface.get_size(), self.brightness_level)
+            for rect in self.dirty:
+                self.surface.blit(overlay, rect, rect)
+        if self.palette_changed:
+            # Same indices, new colours - every pixel on the window changes
+            self.dirty = [self.surface.get_rect()]
+            self.palette_changed = False
+        return self.surface
+
+    def set_palette(self, palette):
+        """Recolour an indexed rotated copy - 256 entries, no pixels touched"""
+        self.surface.set_palette(palette)
+        self.palette_changed = True
+
+    def reset(self):
+        """Forget the previous frame so the next update copies and pushes the whole screen"""
+        self.previous_valid = False
+
+def rotate_screen(buffer):
+    """Rotated image of a render surface for blitting onto the window"""
+    if not TILED_ROTATION:
+        rotated = counted(pygame.transform.rotate(buffer.source, buffer.angle))
+        if buffer.indexed:
+            rotated.set_palette(buffer.surface.get_palette())  # Dimmed colours live on the buffer
+        return rotated
+    return buffer.update()
+
+# Dirty-rectangle display updates - the 5000x768 window is mostly empty space between the three
+# screens, so only the window areas under changed rotated tiles are pushed to the X server
+DIRTY_UPDATES = TILED_ROTATION and os.environ.get('DASHBOARD_DIRTY_UPDATES', '1') == '1'
+show_dirty_rects = os.environ.get('DASHBOARD_SHOW_DIRTY', '0') == '1'  # Outline pushed regions (F3 toggles)
+DIRTY_OUTLINE_COLOR = (255, 0, 255)
+full_redraw = True     # Repaint and push the whole window (first frame, window mode change, banner)
+update_rects = []      # Window rects pushed this frame
+frame_regions = []     # (buffer, rect, position) composited this frame
+dirty_outlines = []    # Regions outlined last frame - repainted before the next outlines are drawn
+pushed_pixels = 0      # Window pixels pushed since start
+full_window_pixels = 0 # Pixels a full flip would have pushed over the same frames
+
+def composite_screen(buffer, rotated, position, full):
+    """Blit a rotated screen onto the window - whole on a full redraw, else only its changed tiles"""
+    if full:
+        screen.blit(rotated, position)
+        frame_regions.append((buffer, rotated.get_rect(), position))
+        return
+    for rect in buffer.dirty:
+        screen.blit(rotated, (position[0] + rect.x, position[1] + rect.y), rect)
+        update_rects.append(rect.move(position))
+        frame_regions.append((buffer, rect, position))
+
+def outline_dirty_regions(full):
+    """Debug overlay - frame what was pushed this frame, wiping last frame's outlines first"""
+    global dirty_outlines
+    if not full:
+        # A full redraw already painted over them
+        for buffer, rect, position in dirty_outlines:
+            screen.blit(buffer.surface, (position[0] + rect.x, position[1] + rect.y), rect)
+            update_rects.append(rect.move(position))
+    dirty_outlines = list(frame_regions) if show_dirty_rects else []
+    for buffer, rect, position in dirty_outlines:
+        pygame.draw.rect(screen, DIRTY_OUTLINE_COLOR, rect.move(position), 1)
+
+def push_display(full):
+    """Send this frame to the display - flip on a full redraw, else only the changed rects"""
+    global pushed_pixels, full_window_pixels
+    window = screen.get_rect()
+    full_window_pixels += window.width * window.height
+    # An engine rendering into a caller's surface (display_output off) has nothing to send
+    if full:
+        if display_output:
+            pygame.display.flip()
+        pushed_pixels += window.width * window.height
+    else:
+        rects = [rect.clip(window) for rect in update_rects]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        if rects and display_output:
+            pygame.display.update(rects)
+        pushed_pixels += sum(rect.width * rect.height for rect in rects)
+    update_rects.clear()
+    frame_regions.clear()
+
+# Symbol images - loaded once, converted to the display format (plain opaque copies for PNGs
+# without transparency) and kept pre-scaled per size, so draw code only blits from memory
+SYMBOL_FILES = {
+    "coolant_temp": "coolant_temp_symbol.png",
+    "oil": "oil_symbol.png",
+    "gas_pump": "gas_pump_symbol.png",
+    "battery": "battery_symbol.png",
+    "c4_logo": "c4_logo.png",
+}
+# Every size the dashboard draws each symbol at - built at startup
+SYMBOL_SIZES = {
+    "coolant_temp": [(40, 40)],
+    "oil": [(40, 40)],
+    "gas_pump": [(50, 50)],
+    "battery": [(40, 40)],
+    "c4_logo": [],
+}
+
+class AssetManager:
+    """Symbol images by name, converted once and cached per (size, tint)"""
+
+    def __init__(self, files):
+        self.files = files
+        self.sources = {}   # name -> converted full-size image, None if it failed to load
+        self.variants = {}  # (name, size, tint) -> scaled / tinted copy
+        self.builds = 0
+
+    def source(self, name):
+        """Full-size image in the display format, None when the file is missing"""
+        if name not in self.sources:
+            try:
+                image = pygame.image.load(self.files[name])
+                opaque = pygame.mask.from_surface(image, 254).count() == image.get_width() * image.get_height()
+                self.sources[name] = image.convert() if opaque else image.convert_alpha()
+            except Exception as e:
+                print(f"Warning: Could not load symbol image {self.files[name]}: {e}")
+                self.sources[name] = None
+        return self.sources[name]
+
+    def get(self, name, size=None, tint=None):
+        """Image scaled to size and optionally tinted (grayscale times a style colour), None if missing"""
+        key = (name, size, tint)
+        variant = self.variants.get(key)
+        if variant is not None or key in self.variants:
+            return variant
+        
+        variant = self.source(name)
+        if variant is not None and (size is not None or tint is not None):
+            self.builds += 1
+            if size is not None and size != variant.get_size():
+                variant = counted(pygame.transform.scale(variant, size))
+            if tint is not None:
+                variant = counted(pygame.transform.grayscale(variant))
+                variant.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        self.variants[key] = variant
+        return variant
+
+    def preload(self, sizes, tints=(None,)):
+        """Build every listed size (and tint) up front, returns how many images loaded"""
+        for name, name_sizes in sizes.items():
+            for tint in tints:
+                self.get(name, None, tint)
+                for size in name_sizes:
+                    self.get(name, size, tint)
+        return sum(1 for image in self.sources.values() if image is not None)
+
+assets = AssetManager(SYMBOL_FILES)  # Preloaded by DashboardEngine.start() once the display is open
 
 # Colors
 BLACK = (0, 0, 0)
@@ -103,6 +456,145 @@ PURPLE = (138, 43, 226)
 ORANGE = (255, 165, 0)
 RED = (255, 0, 0)
 
+# Synthwave gradients - the mountains, sun and grid change colour with RPM or speed along
+# piecewise ramps; they are sampled once into lookup tables so a frame indexes a colour
+# instead of interpolating it
+GRADIENT_LUT_SIZE = 1024
+GRADIENT_MAX_RPM = 7000
+GRADIENT_MAX_SPEED = 140
+
+def gradient_lut(stops, max_value, size=GRADIENT_LUT_SIZE):
+    """size colours from 0 to max_value, interpolated between (value, color) stops - flat past the last stop"""
+    lut = []
+    for i in range(size):
+        value = i / (size - 1) * max_value
+        color = stops[-1][1]
+        for (value1, color1), (value2, color2) in zip(stops, stops[1:]):
+            if value <= value2:
+                factor = (value - value1) / (value2 - value1)
+                color = tuple(int(c1 + (c2 - c1) * factor) for c1, c2 in zip(color1, color2))
+                break
+        lut.append(color)
+    return tuple(lut)
+
+def gradient_index(value, max_value, size=GRADIENT_LUT_SIZE):
+    """Nearest gradient lookup table entry for value (clamped to the table)"""
+    return min(max(int(value / max_value * (size - 1) + 0.5), 0), size - 1)
+
+def gradient_color(lut, value, max_value):
+    """Colour of value in a gradient lookup table"""
+    return lut[gradient_index(value, max_value, len(lut))]
+
+def duller(color, factor=0.6):
+    """color with every channel scaled down (fills behind bright outlines)"""
+    return tuple(int(c * factor) for c in color)
+
+# Cyan -> purple -> red for the grid and the mountains, black -> cyan -> yellow for the sun
+SYNTHWAVE_RPM_COLORS = gradient_lut(((0, NEON_CYAN), (3000, PURPLE), (7000, RED)), GRADIENT_MAX_RPM)
+SYNTHWAVE_SPEED_COLORS = gradient_lut(((0, NEON_CYAN), (40, PURPLE), (85, RED)), GRADIENT_MAX_SPEED)
+SYNTHWAVE_SUN_COLORS = gradient_lut(((0, BLACK), (1500, NEON_CYAN), (4500, YELLOW)), GRADIENT_MAX_RPM)
+SYNTHWAVE_MOUNTAIN_FILLS = tuple(duller(color) for color in SYNTHWAVE_RPM_COLORS)
+# The sun is 6 bands from its colour at the top to 36% of it at the bottom
+SYNTHWAVE_SUN_BANDS = tuple(
+    tuple(tuple(int(bright * (1 - band / 5) + dark * (band / 5)) for bright, dark in zip(color, duller(duller(color))))
+          for band in range(6))
+    for color in SYNTHWAVE_SUN_COLORS)
+
+# Odometer colours - drawn on the tachometer in every style
+ODOMETER_BORDER = (100, 100, 100)     # Gray border
+ODOMETER_BACKGROUND = (20, 20, 20)    # Dark background
+ODOMETER_DECIMAL = (255, 200, 0)      # Yellow/orange for decimal digit
+ODOMETER_TITLE = (200, 200, 200)
+REDLINE_DIM_RED = (150, 50, 50)       # Unlit redline ticks of the BX and 300ZX tachometers
+
+# Indexed rendering - the Citroën BX, Subaru XT and 300ZX screens are one hue on a tinted black,
+# which fits an 8-bit palette (ramps from the background to each ink cover anti-aliased text and
+# dimmed segments). Those styles draw into 8-bit targets and software brightness rewrites 256
+# palette entries instead of blending an overlay over every pixel. Synthwave and Corvette C4
+# (gradients, logo) stay on the true-colour targets. Every colour a style draws has to be in its
+# ink list - anything else lands on the nearest entry (tests/test_indexed_palette.py checks this)
+INDEXED_RENDERING = os.environ.get('DASHBOARD_INDEXED_RENDERING', '1') == '1'
+INDEXED_KEY_COLOR = (255, 0, 255)  # Last palette entry, transparent in layers - no style draws magenta
+WARNING_INKS = [RED, (255, 255, 255), YELLOW, (255, 140, 0), (255, 100, 100)]  # Alerts shared by all styles
+# Odometer and the DSI's OFF / N/A / --- gray, also in every style
+SHARED_INKS = WARNING_INKS + [ODOMETER_DECIMAL, ODOMETER_TITLE, ODOMETER_BORDER, ODOMETER_BACKGROUND, (128, 128, 128)]
+INDEXED_STYLES = {
+    STYLE_CITROEN_BX: (BX_BLACK, [BX_GREEN, BX_DARK_GREEN, BX_DIM_GREEN, REDLINE_DIM_RED] + SHARED_INKS),
+    # XT bars: deep shadow, unfilled RPM bar, grid (XT_DIM_AMBER + (20, 15, 10))
+    STYLE_SUBARU_XT: (XT_BLACK, [XT_AMBER, XT_DARK_AMBER, XT_DIM_AMBER, (100, 60, 0), (180, 100, 0),
+                                 (170, 105, 10)] + SHARED_INKS),
+    STYLE_NISSAN_300ZX: (ZX_BLACK, [ZX_TURQUOISE, ZX_BRIGHT_TURQUOISE, ZX_DIM_TURQUOISE, ZX_DARK_TURQUOISE,
+                                    REDLINE_DIM_RED] + SHARED_INKS),
+}
+
+def build_style_palette(background, inks):
+    """256 colours - the background, pure black, every ink exactly, ramps from the background up to
+    each ink (steps shared out by distance, for anti-aliased edges), the key"""
+    palette = [background, BLACK]
+    for ink in inks:
+        if ink not in palette:
+            palette.append(ink)
+    inks = palette[2:]
+    spans = [max(abs(c - b) for b, c in zip(background, ink)) for ink in inks]
+    free = 255 - len(palette)
+    for ink, span in zip(inks, spans):
+        steps = max(free * span // sum(spans), 1)
+        for step in range(1, steps):  # The ink itself is in already
+            palette.append(tuple(b + (c - b) * step // steps for b, c in zip(background, ink)))
+    return palette + [background] * (255 - len(palette)) + [INDEXED_KEY_COLOR]
+
+# Render targets - the three screen surfaces and their rotation buffers, created by
+# create_render_targets() once the display is open
+speedometer_surface = tachometer_surface = dsi_render_surface = None
+speedometer_rotation = tachometer_rotation = dsi_rotation = None
+rgb_targets = None
+indexed_targets = None
+render_targets_style = None  # Style the current render targets were selected for
+
+def create_render_targets():
+    """True-colour screen surfaces and rotation buffers, plus the 8-bit set for INDEXED_STYLES"""
+    global speedometer_surface, tachometer_surface, dsi_render_surface
+    global speedometer_rotation, tachometer_rotation, dsi_rotation
+    global rgb_targets, indexed_targets, render_targets_style
+    # Create surfaces for each dashboard (will be rotated) - persistent and in the display's pixel
+    # format, so nothing is converted or allocated when they are drawn, rotated and blitted
+    speedometer = pygame.Surface((1024, 768)).convert()
+    tachometer = pygame.Surface((1024, 968)).convert()  # Increased height by 200px total for odometer space
+    dsi = pygame.Surface((DSI_SCREEN_WIDTH, DSI_SCREEN_HEIGHT)).convert()
+    rgb_targets = (speedometer, tachometer, dsi,
+                   RotatedBuffer(speedometer, 270), RotatedBuffer(tachometer, 270), RotatedBuffer(dsi, 180))
+    indexed_targets = None
+    if INDEXED_RENDERING:
+        indexed_surfaces = [pygame.Surface(surface.get_size(), 0, 8) for surface in rgb_targets[:3]]
+        indexed_targets = tuple(indexed_surfaces) + tuple(RotatedBuffer(surface, buffer.angle)
+                                                          for surface, buffer in zip(indexed_surfaces, rgb_targets[3:]))
+    (speedometer_surface, tachometer_surface, dsi_render_surface,
+     speedometer_rotation, tachometer_rotation, dsi_rotation) = rgb_targets
+    render_targets_style = None  # First frame selects the targets for the current style
+
+def select_render_targets(style):
+    """Point the screen surfaces and rotation buffers at the indexed or true-colour targets"""
+    global speedometer_surface, tachometer_surface, dsi_render_surface
+    global speedometer_rotation, tachometer_rotation, dsi_rotation, render_targets_style, indexed_style
+    if indexed_targets and style in INDEXED_STYLES:
+        targets = indexed_targets
+        palette = build_style_palette(*INDEXED_STYLES[style])
+        for surface in targets[:3]:
+            surface.set_palette(palette)
+        for buffer in targets[3:]:
+            buffer.surface.set_palette(palette)
+            buffer.brightness_level = None
+        indexed_style = style
+    else:
+        targets = rgb_targets
+        indexed_style = None
+    # The window still shows the old style - copy and push the whole of every screen
+    for buffer in targets[3:]:
+        buffer.reset()
+    (speedometer_surface, tachometer_surface, dsi_render_surface,
+     speedometer_rotation, tachometer_rotation, dsi_rotation) = targets
+    render_targets_style = style
+
 # SPEEDOMETER PARAMETERS - ADJUSTED UP FOR BETTER SYNTHWAVE POSITIONING
 SPEEDO_X_OFFSET = 350
 SPEEDO_Y_OFFSET = 480  # Moved up for better Synthwave layout (was 550, now 480, -70px up)
@@ -126,49 +618,22 @@ TACHO_GRID_Y = 430  # Moved down more (was 400, now 430, +30px down)
 # Arduino Serial Configuration
 SERIAL_BAUD = 115200  # 12x faster serial communication for ultra-low latency
 SERIAL_TIMEOUT = 0.1  # Reliable timeout for stable connection
-
-# Auto-detect Arduino port
-def find_arduino_port():
-    """Automatically find Arduino serial port"""
-    import serial.tools.list_ports
-    
-    # Common Arduino ports to try first
-    common_ports = ['/dev/ttyACM0', '/dev/ttyACM1', '/dev/ttyUSB0', '/dev/ttyUSB1']
-    
-    # Get all available ports
-    available_ports = [port.device for port in serial.tools.list_ports.comports()]
-    
-    # Try common ports first
-    for port in common_ports:
-        if port in available_ports:
-            try:
-                test_ser = serial.Serial(port, SERIAL_BAUD, timeout=1)
-                test_ser.close()
-                print(f"Found Arduino on {port}")
-                return port
-            except:
-                continue
-    
-    # Try other available ports
-    for port in available_ports:
-        if port not in common_ports:
-            try:
-                test_ser = serial.Serial(port, SERIAL_BAUD, timeout=1)
-                test_ser.close()
-                print(f"Found Arduino on {port}")
-                return port
-            except:
-                continue
-    
-    return None
-
-SERIAL_PORT = find_arduino_port() or '/dev/ttyACM0'  # Fallback to default
+BINARY_TELEMETRY = os.environ.get('DASHBOARD_BINARY_TELEMETRY', '0') == '1'  # Accept COBS/CRC frames when the Arduino offers them
+DELTA_TELEMETRY = os.environ.get('DASHBOARD_DELTA_TELEMETRY', '0') == '1'  # Accept KF:/DF: changed-fields-only lines when offered
+RECORD_LOG = os.environ.get('DASHBOARD_RECORD')        # Tee everything the Arduino sends into this session log
+REPLAY_LOG = os.environ.get('DASHBOARD_REPLAY')        # Play a recorded session instead of opening the port
+REPLAY_SPEED = float(os.environ.get('DASHBOARD_REPLAY_SPEED', '1'))  # 1 = real time, 4 = 4x, 0 = as fast as possible
 
 # Persistent Data Management
 PERSISTENT_DATA_FILE = "corvette_persistent_data.json"
+if REPLAY_LOG:
+    PERSISTENT_DATA_FILE = "corvette_replay_data.json"  # Replayed drives must not add to the real odometer
+# Engines without the Arduino (benchmarks, tests, embedding) keep their odometer out of the working directory
+ENGINE_DATA_FILE = os.path.join(tempfile.gettempdir(), "corvette_engine_data.json")
 
 class PersistentDataManager:
-    def __init__(self):
+    def __init__(self, path=PERSISTENT_DATA_FILE):
+        self.path = path  # JSON file, backups go next to it
         self.data = {
             "total_odometer": 89240.5,  # Current odometer reading
             "trip_odometer": 0.0,
@@ -183,8 +648,8 @@ class PersistentDataManager:
     def load_data(self):
         """Load persistent data from JSON file"""
         try:
-            if os.path.exists(PERSISTENT_DATA_FILE):
-                with open(PERSISTENT_DATA_FILE, 'r') as f:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
                     loaded_data = json.load(f)
                     self.data.update(loaded_data)
                 print(f"Loaded persistent data: Total ODO: {self.data['total_odometer']:.1f} miles, "
@@ -203,13 +668,13 @@ class PersistentDataManager:
             
             # Create backup every 1000 saves
             if self.data["save_count"] % 1000 == 0:
-                backup_file = f"{PERSISTENT_DATA_FILE}.backup_{int(time.time())}"
-                if os.path.exists(PERSISTENT_DATA_FILE):
+                backup_file = f"{self.path}.backup_{int(time.time())}"
+                if os.path.exists(self.path):
                     import shutil
-                    shutil.copy2(PERSISTENT_DATA_FILE, backup_file)
+                    shutil.copy2(self.path, backup_file)
                     print(f"Created backup: {backup_file}")
             
-            with open(PERSISTENT_DATA_FILE, 'w') as f:
+            with open(self.path, 'w') as f:
                 json.dump(self.data, f, indent=2)
             
         except Exception as e:
@@ -254,29 +719,27 @@ class PersistentDataManager:
             except Exception as e:
                 print(f"Error sending init data: {e}")
 
-# Initialize persistent data manager
-persistent_data = PersistentDataManager()
+# Persistent data manager - loaded by DashboardEngine.start()
+persistent_data = None
 
-# Button timing variables
-button_trip_start_time = 0
-button_avg_start_time = 0
-button_combo_start_time = 0
+# Button timing variables - start times are None while the button is up (0 is a valid clock time)
+button_trip_start_time = None
+button_avg_start_time = None
+button_combo_start_time = None
 button_trip_triggered = False
 button_avg_triggered = False
 button_combo_triggered = False
 BUTTON_HOLD_TIME = 1000  # 1 second in milliseconds
 
-def handle_button_timing(trip_pressed, avg_pressed):
-    """Handle button timing logic in Raspberry Pi"""
+def handle_button_timing(trip_pressed, avg_pressed, current_time):
+    """Handle button timing logic in Raspberry Pi - current_time is when the states were read (dashboard_clock ms)"""
     global button_trip_start_time, button_avg_start_time, button_combo_start_time
     global button_trip_triggered, button_avg_triggered, button_combo_triggered
     global current_style_index
     
-    current_time = pygame.time.get_ticks()
-    
     # Check for combo (both buttons pressed)
     if trip_pressed and avg_pressed:
-        if button_combo_start_time == 0:
+        if button_combo_start_time is None:
             button_combo_start_time = current_time
             button_combo_triggered = False
         elif current_time - button_combo_start_time >= BUTTON_HOLD_TIME and not button_combo_triggered:
@@ -295,15 +758,15 @@ def handle_button_timing(trip_pressed, avg_pressed):
     else:
         # Reset combo ONLY when BOTH buttons are released (not when only one is pressed)
         if not trip_pressed and not avg_pressed:
-            if button_combo_start_time > 0:
-                button_combo_start_time = 0
+            if button_combo_start_time is not None:
+                button_combo_start_time = None
                 button_combo_triggered = False
         
         # Handle individual buttons only when combo is not active
         
         # Trip reset button
         if trip_pressed:
-            if button_trip_start_time == 0:
+            if button_trip_start_time is None:
                 button_trip_start_time = current_time
                 button_trip_triggered = False
             elif current_time - button_trip_start_time >= BUTTON_HOLD_TIME and not button_trip_triggered:
@@ -313,12 +776,12 @@ def handle_button_timing(trip_pressed, avg_pressed):
                 print("🔄 TRIP RESET!")
                 button_trip_triggered = True
         else:
-            button_trip_start_time = 0
+            button_trip_start_time = None
             button_trip_triggered = False
         
         # Average reset button
         if avg_pressed:
-            if button_avg_start_time == 0:
+            if button_avg_start_time is None:
                 button_avg_start_time = current_time
                 button_avg_triggered = False
             elif current_time - button_avg_start_time >= BUTTON_HOLD_TIME and not button_avg_triggered:
@@ -326,33 +789,117 @@ def handle_button_timing(trip_pressed, avg_pressed):
                 print("🔄 AVERAGE RESET!")
                 button_avg_triggered = True
         else:
-            button_avg_start_time = 0
+            button_avg_start_time = None
             button_avg_triggered = False
 
-# Load saved dashboard style
-if "dashboard_style" in persistent_data.data:
-    current_style_index = persistent_data.data["dashboard_style"]
-    print(f"🎨 Loaded saved style: {'Synthwave' if current_style_index == STYLE_SYNTHWAVE else 'Citroën BX'}")
-else:
-    # Default to Synthwave if no saved style
-    current_style_index = STYLE_SYNTHWAVE
-    persistent_data.data["dashboard_style"] = current_style_index
-
-# Initialize serial connection
-try:
-    ser = serial.Serial(SERIAL_PORT, SERIAL_BAUD, timeout=SERIAL_TIMEOUT)
-    print(f"Connected to Arduino on {SERIAL_PORT}")
-    serial_connected = True
-    # Send initialization data to Arduino
-    persistent_data.send_init_data(ser)
-except Exception as e:
-    print(f"Failed to connect to Arduino: {e}")
-    print("Running in demo mode...")
-    serial_connected = False
-    ser = None
-
-# Simple connection tracking
-was_ever_connected = serial_connected
+def load_saved_style():
+    """Start in the style saved in the persistent data (DASHBOARD_STYLE overrides it)"""
+    global current_style_index
+    if "dashboard_style" in persistent_data.data:
+        current_style_index = persistent_data.data["dashboard_style"]
+        print(f"🎨 Loaded saved style: {'Synthwave' if current_style_index == STYLE_SYNTHWAVE else 'Citroën BX'}")
+    else:
+        # Default to Synthwave if no saved style
+        current_style_index = STYLE_SYNTHWAVE
+        persistent_data.data["dashboard_style"] = current_style_index
+    if os.environ.get('DASHBOARD_STYLE'):
+        current_style_index = int(os.environ['DASHBOARD_STYLE']) % 5  # Start in this style (benchmarks, screenshots)
+
+# Arduino connection - set up by connect_arduino()
+port_supervisor = None   # Port discovery and reopening
+session_recorder = None  # DASHBOARD_RECORD tee around the port
+serial_reader = None     # Background thread that owns the port
+SERIAL_PORT = "none"     # Port (or replay log) in use, for the startup banner
+serial_connected = False
+
+# Timebase (ms) of the sample timestamps, speed/RPM timeouts, button holds and animations -
+# pygame ticks live, the recorded session time in a replay so odometer and holds come out the
+# same at any DASHBOARD_REPLAY_SPEED (set by connect_arduino(), DashboardEngine(clock=...))
+dashboard_clock = pygame.time.get_ticks
+
+def frame_clock():
+    """Benchmark timebase - frames at 60 FPS in ms, so pulses and blinks repeat exactly from run to run"""
+    return loop_counter * 1000 // 60
+
+def open_arduino_port():
+    """Open the Arduino port - the reader thread reconnects through here after a USB drop"""
+    ser = port_supervisor.open()
+    if ser is not None and session_recorder is not None:
+        session_recorder.ser = ser  # Keep appending to the same session log
+        return session_recorder
+    return ser
+
+def remember_arduino_port():
+    """Cache the working port so the next ignition cycle tries it first"""
+    if port_supervisor.fixed_port:
+        return  # DASHBOARD_SERIAL_PORT override - not a discovery result
+    if (persistent_data.data.get("arduino_port") != port_supervisor.port or
+            persistent_data.data.get("arduino_serial_number") != port_supervisor.serial_number):
+        persistent_data.data["arduino_port"] = port_supervisor.port
+        persistent_data.data["arduino_serial_number"] = port_supervisor.serial_number
+        persistent_data.save_data()
+
+def connect_arduino(enabled=True, clock=None):
+    """Open the Arduino (or the replay log) and start the background reader - demo mode without it,
+    clock overrides the timebase (pygame ticks, or the session time of a replay)"""
+    global port_supervisor, session_recorder, serial_reader, SERIAL_PORT, serial_connected, was_ever_connected
+    global dashboard_clock
+    
+    # Arduino port discovery - reads USB descriptors and opens only the chosen port (opening resets the Arduino)
+    port_supervisor = PortSupervisor(SERIAL_BAUD, SERIAL_TIMEOUT,
+                                     last_port=persistent_data.data.get("arduino_port"),
+                                     serial_number=persistent_data.data.get("arduino_serial_number"),
+                                     fixed_port=os.environ.get('DASHBOARD_SERIAL_PORT'))
+    
+    # Initialize serial connection
+    try:
+        if not enabled:
+            SERIAL_PORT = "none"
+            raise IOError("benchmark run - Arduino not opened" if BENCHMARK_FRAMES else "Arduino disabled")
+        if REPLAY_LOG:
+            ser = ReplaySerial(REPLAY_LOG, speed=REPLAY_SPEED, timeout=SERIAL_TIMEOUT)
+            clock = clock or ser.clock  # Recorded time - a 50x replay still integrates the whole drive
+            SERIAL_PORT = REPLAY_LOG
+            print(f"Replaying serial session {REPLAY_LOG} at {'max' if REPLAY_SPEED <= 0 else f'{REPLAY_SPEED:g}x'} speed")
+        else:
+            ser = port_supervisor.open()
+            SERIAL_PORT = port_supervisor.port or "auto-detect"
+            if ser is None:
+                raise IOError("no Arduino port found")
+            print(f"Connected to Arduino on {SERIAL_PORT}")
+            remember_arduino_port()
+        if RECORD_LOG:
+            session_recorder = SerialRecorder(ser, RECORD_LOG)
+            ser = session_recorder
+            print(f"Recording serial session to {RECORD_LOG}")
+        serial_connected = True
+        # Send initialization data to Arduino
+        persistent_data.send_init_data(ser)
+    except Exception as e:
+        print(f"Failed to connect to Arduino: {e}")
+        print("Running in demo mode (reconnecting in the background)...")
+        serial_connected = False
+        ser = None
+    
+    # Background reader owns the port from here on - the render loop only reads its snapshots
+    # It also keeps looking for the Arduino while it is unplugged (never for a replay)
+    dashboard_clock = clock or pygame.time.get_ticks
+    serial_reader = SerialReader(ser, clock=dashboard_clock,
+                                 reconnect=None if REPLAY_LOG or not enabled else open_arduino_port)
+    serial_reader.start()
+    
+    # Simple connection tracking
+    was_ever_connected = serial_connected
+
+last_telemetry_sequence = 0  # Last snapshot applied by apply_telemetry()
+last_status_time = 0         # Last switch/button line applied
+TELEMETRY_TIMEOUT_MS = 500   # Speed/RPM older than this read 0 / N/A
+SENSOR_STALE_MS = 3000       # Sensors older than this (three delta keyframes) read zero
+STALE_SENSORS = (("fuel", "current_fuel_level"), ("oil", "current_oil_pressure"),
+                 ("coolant", "current_coolant_temp"), ("oil_temp", "current_oil_temp"),
+                 ("battery", "current_battery_voltage"))
+stale_fields = set()         # Sensors currently zeroed by expire_stale_fields()
+was_ever_connected = False
 
 # Current values
 current_speed = 0.0
@@ -408,6 +955,138 @@ switch_inst_mpg = False
 switch_avg_mpg = False
 switch_metric = False
 
+# Static layer cache - gauge borders, titles, scale labels and bar frames only change with the
+# style, the metric switch or the gauge selection switches, so they are drawn once into a layer
+# and blitted every frame; the draw functions then only paint the live values
+static_layers = {}  # name -> (key, layer surface, blit position)
+static_layer_builds = 0
+
+def static_layer_key():
+    """Everything a static layer depends on - any change rebuilds the layers"""
+    return (current_style_index, switch_metric,
+            switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts,
+            switch_fuel_range, switch_trip_odo, switch_inst_mpg, switch_avg_mpg)
+
+def render_layer(size, draw, background=None, crop=True):
+    """Surface drawn by draw(surface) as (layer, position) - opaque with background, else transparent and
+    cropped to what was drawn (crop=False skips the bounds scan, which costs ~10ms on a full screen)"""
+    if indexed_style is not None:
+        # 8-bit layer in the target palette so blits are plain index copies; transparency is a
+        # reserved key entry because blits onto 8-bit targets ignore per-pixel alpha
+        layer = counted(pygame.Surface(size, 0, 8))
+        layer.set_palette(speedometer_surface.get_palette())
+        layer.fill(background if background is not None else INDEXED_KEY_COLOR)
+        draw(layer)
+        position = (0, 0)
+        if background is None and crop:
+            layer.set_colorkey(INDEXED_KEY_COLOR)
+            bounds = layer.get_bounding_rect()
+            layer = layer.subsurface(bounds).copy()
+            position = bounds.topleft
+    elif background is not None:
+        # Opaque layer covering the whole surface - blitting it replaces the background fill
+        layer = counted(pygame.Surface(size))
+        layer.fill(background)
+        draw(layer)
+        layer = layer.convert()
+        position = (0, 0)
+    else:
+        # Transparent layer cropped to what was drawn, so the per-frame blit stays small
+        layer = counted(pygame.Surface(size, pygame.SRCALPHA))
+        draw(layer)
+        position = (0, 0)
+        if crop:
+            bounds = layer.get_bounding_rect()
+            layer = layer.subsurface(bounds).copy()
+            position = bounds.topleft
+        layer = layer.convert_alpha()
+    return layer, position
+
+def get_static_layer(name, size, draw_static, background=None):
+    """Cached static layer as (surface, position), drawn with draw_static(surface) when stale"""
+    global static_layer_builds
+    key = static_layer_key()
+    cached = static_layers.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    static_layer_builds += 1
+    layer, position = render_layer(size, draw_static, background)
+    static_layers[name] = (key, layer, position)
+    return layer, position
+
+# Gauge memo - most gauges only look different when their value crosses a tick (20 ZX bar
+# ticks, 18 speedometer ticks, 17 DSI fuel ticks), yet they were redrawn every frame. A memoized
+# draw function quantizes its arguments to what is visible; while that stays the same the last
+# rendered gauge is blitted as one layer. Building a layer costs a few ms, so a gauge whose value
+# keeps moving (sweeping needle, fuel sloshing across a tick) is drawn directly until its state
+# has held for GAUGE_MEMO_SETTLE calls, and at most one layer is built per frame. Layers are kept
+# per target size and pixel format, since they are built to match the surface they are blitted to.
+# A hit is pixel-exact on the 8-bit targets; in true colour the RLE alpha blit can put anti-aliased
+# edges 1/255 off the direct draw (invisible, but screenshot comparisons need a tolerance of 1)
+GAUGE_MEMO = os.environ.get('DASHBOARD_GAUGE_MEMO', '1') == '1'  # 0 = always draw gauges directly
+GAUGE_MEMO_SETTLE = 8  # Calls with an unchanged state before it gets a layer (~130ms at 60 FPS)
+gauge_memo = {}        # (function name, slot, target size, bits) -> [state, static key, layer surface or None, blit position, calls seen]
+gauge_memo_stats = {}  # function name -> [hits, misses, layer builds]
+gauge_memo_build_frame = None  # loop_counter of the last layer build
+
+def memoize_gauge(quantize):
+    """Decorator for draw_*(surface, ...) functions - quantize(*args, **kwargs) returns (slot, state)
+    where slot names the gauge instance and state is everything visible about the value, or None
+    to draw directly (e.g. static layer passes). Hits match a direct draw to within 1/255 per channel"""
+    def decorate(draw):
+        name = draw.__name__
+        stats = gauge_memo_stats.setdefault(name, [0, 0, 0])
+        
+        def memoized(surface, *args, **kwargs):
+            global gauge_memo_build_frame
+            quantized = quantize(*args, **kwargs) if GAUGE_MEMO else None
+            if quantized is None:
+                return draw(surface, *args, **kwargs)
+            slot, state = quantized
+            # The same gauge drawn onto another surface (screenshot, rotated copy) gets its own layer
+            key = (name, slot, surface.get_size(), surface.get_bitsize())
+            static_key = static_layer_key()  # Style, metric and gauge switches change the look too
+            cached = gauge_memo.get(key)
+            if cached is None or cached[0] != state or cached[1] != static_key:
+                cached = gauge_memo[key] = [state, static_key, None, None, 0]
+            elif cached[2] is not None:
+                stats[0] += 1
+                surface.blit(cached[2], cached[3])
+                return
+            
+            stats[1] += 1
+            cached[4] += 1
+            if cached[4] < GAUGE_MEMO_SETTLE or gauge_memo_build_frame == loop_counter:
+                return draw(surface, *args, **kwargs)
+            
+            # Settled - keep a full-size layer (no bounds scan) for the following frames
+            stats[2] += 1
+            gauge_memo_build_frame = loop_counter
+            layer, position = render_layer(surface.get_size(), lambda s: draw(s, *args, **kwargs), crop=False)
+            # Run-length encoded, the blit skips the transparent runs - 10-20x faster than a plain
+            # alpha blit (anti-aliased text edges can come out 1/255 off in true colour)
+            if layer.get_flags() & pygame.SRCALPHA:
+                layer.set_alpha(255, pygame.RLEACCEL)
+            else:
+                layer.set_colorkey(INDEXED_KEY_COLOR, pygame.RLEACCEL)
+            cached[2], cached[3] = layer, position
+            surface.blit(layer, position)
+        
+        memoized.__name__ = name
+        memoized.__doc__ = draw.__doc__
+        memoized.draw = draw  # Undecorated function
+        return memoized
+    return decorate
+
+def gauge_memo_summary():
+    """Hit rate per memoized gauge as 'name hits/calls (percent, layer builds)' strings"""
+    summary = []
+    for name, (hits, misses, builds) in sorted(gauge_memo_stats.items()):
+        if hits + misses:
+            summary.append(f"{name} {hits}/{hits + misses} ({100.0 * hits / (hits + misses):.1f}%, {builds} builds)")
+    return summary
+
 # Button states for visual feedback
 button_trip_reset = False
 button_avg_reset = False
@@ -435,6 +1114,51 @@ SEGMENTS = {
     9: [1,1,1,1,0,1,1]
 }
 
+# Seven-segment sprite atlas - digits used to be rebuilt from segment polygons on every frame;
+# each (glyph, size, colour, dim) is now drawn once into a colour-keyed sprite, so a display is
+# N blits. Sprites are in the render targets' format (8-bit for indexed styles), which changes
+# with the style - the atlas is dropped and refilled lazily when the style changes.
+digit_atlas = {}          # (draw function, glyph, color, size, dim_factor) -> (sprite, pad)
+digit_atlas_style = None  # Style the sprites were built for
+digit_sprite_builds = 0
+
+def keyed_surface(size):
+    """Blank surface in the render targets' format, transparent where INDEXED_KEY_COLOR is"""
+    if indexed_style is not None:
+        surface = pygame.Surface(size, 0, 8)
+        surface.set_palette(speedometer_surface.get_palette())
+    else:
+        surface = pygame.Surface(size).convert()
+    surface.fill(INDEXED_KEY_COLOR)
+    surface.set_colorkey(INDEXED_KEY_COLOR, pygame.RLEACCEL)  # Sprites never change - RLE blits fastest
+    return counted(surface)
+
+def get_digit_sprite(draw_glyph, glyph, color, size, dim_factor=1.0):
+    """Cached sprite of one glyph as (sprite, pad) - blit it at (x - pad, y - pad)"""
+    global digit_atlas_style, digit_sprite_builds
+    if digit_atlas_style != current_style_index:
+        digit_atlas.clear()
+        digit_atlas_style = current_style_index
+    key = (draw_glyph, glyph, color, size, dim_factor)
+    cached = digit_atlas.get(key)
+    if cached is not None:
+        return cached
+    
+    digit_sprite_builds += 1
+    pad = max(6, size // 4)  # Segments overhang the glyph box by half their thickness
+    sprite = keyed_surface((size + 2 * pad + 1, int(size * 1.5) + 2 * pad + 1))
+    draw_glyph(sprite, pad, pad, glyph, color, size, dim_factor, atlas=False)
+    digit_atlas[key] = (sprite, pad)
+    return digit_atlas[key]
+
+def draw_decimal_point(surface, x, y, glyph, color, size, dim_factor=1.0, atlas=True):
+    """Decimal point centred on (x, y) - glyph and size only key the sprite"""
+    if atlas:
+        sprite, pad = get_digit_sprite(draw_decimal_point, glyph, color, size, dim_factor)
+        surface.blit(sprite, (x - pad, y - pad))
+        return
+    pygame.draw.circle(surface, color, (x, y), 4)
+
 # Metric conversion functions
 def mph_to_kph(mph):
     """Convert MPH to KPH"""
@@ -490,21 +1214,52 @@ def decode_instant_mpg_display(instant_mpg_value, fuel_flow_gph=0.0, apply_compe
 
 # Reconnection logic removed - was causing blocking issues
 
-def apply_software_brightness(surface, brightness_factor):
-    """Apply software brightness by creating a dark overlay"""
-    if brightness_factor >= 1.0:
+# Software dimming overlays - one black surface per screen size, built once; the brightness is
+# quantized so a twitchy dimmer input doesn't touch every pixel with a new alpha each frame
+BRIGHTNESS_LEVELS = 64
+brightness_overlays = {}  # surface size -> [overlay, quantized level it is set to]
+
+def dimmed_palette(palette, level):
+    """Palette darkened the way the overlay at this level would darken it"""
+    keep = 255 - level * 255 // BRIGHTNESS_LEVELS
+    return [(color.r * keep // 255, color.g * keep // 255, color.b * keep // 255) for color in palette]
+
+def apply_software_brightness(buffer, brightness_factor):
+    """Dim a screen - rewrite the palette of an indexed target, else darken it with a persistent overlay"""
+    level = min(max(int((1.0 - brightness_factor) * BRIGHTNESS_LEVELS), 0), BRIGHTNESS_LEVELS)
+    if buffer.indexed:
+        # O(256) instead of O(pixels) - the source keeps the undimmed palette so drawing maps right
+        if level != buffer.brightness_level:
+            buffer.set_palette(dimmed_palette(buffer.source.get_palette(), level))
+            buffer.brightness_level = level
+        return
+    if TILED_ROTATION:
+        # The rotated copy is dimmed tile by tile as it is refreshed - a new level redoes all of it
+        if level != buffer.brightness_level:
+            buffer.brightness_level = level
+            buffer.reset()
+        return
+    if level <= 0:
         return  # No dimming needed
     
-    # Create a dark overlay
-    overlay = pygame.Surface(surface.get_size())
-    overlay.fill(BLACK)
-    
-    # Calculate alpha for overlay (higher alpha = darker)
-    alpha = int((1.0 - brightness_factor) * 255)
-    overlay.set_alpha(alpha)
-    
     # Blit the overlay onto the surface
-    surface.blit(overlay, (0, 0))
+    surface = buffer.source
+    surface.blit(brightness_overlay(surface.get_size(), level), (0, 0))
+
+def brightness_overlay(size, level):
+    """Black overlay of this size with its alpha set for the dimming level"""
+    cached = brightness_overlays.get(size)
+    if cached is None:
+        overlay = counted(pygame.Surface(size))
+        overlay.fill(BLACK)
+        cached = brightness_overlays[size] = [overlay.convert(), None]
+    
+    # Alpha for the overlay (higher alpha = darker), only reset when the level moves
+    overlay, current_level = cached
+    if level != current_level:
+        overlay.set_alpha(level * 255 // BRIGHTNESS_LEVELS)
+        cached[1] = level
+    return overlay
 
 def set_screen_brightness(brightness_percent):
     """Set brightness for all three screens based on percentage (20-100, never completely dark)"""
@@ -552,22 +1307,83 @@ def set_screen_brightness(brightness_percent):
         # Silently ignore errors to avoid slowing down the main loop
         pass
 
-def read_arduino_data():
+def handle_control_message(line):
+    """Act on a control message queued by the serial reader thread"""
+    global current_style_index
+    
+    # Handle Arduino initialization requests
+    if line.startswith("INIT_REQUEST:PERSISTENT_DATA"):
+        # print("Arduino requesting persistent data")  # Disabled for performance
+        # Arduino offers binary telemetry frames - accept before init data so it switches right away
+        if BINARY_TELEMETRY and ",BINARY:1" in line and serial_reader.is_open:
+            try:
+                serial_reader.write(b"BINARY_MODE:1\n")
+            except:
+                pass
+        # Arduino offers delta lines (only fields that changed, keyframe every second)
+        if DELTA_TELEMETRY and ",DELTA:1" in line and serial_reader.is_open:
+            try:
+                serial_reader.write(b"DELTA_MODE:1\n")
+            except:
+                pass
+        persistent_data.send_init_data(serial_reader)
+        return
+    
+    # Handle Arduino reset commands
+    if line.startswith("RESET_TRIP:"):
+        # Reset trip odometer (distance calculation now done by Pi)
+        persistent_data.data["trip_odometer"] = 0.0
+        persistent_data.save_data()
+        # Send reset average MPG to Arduino
+        if serial_reader and serial_reader.is_open:
+            try:
+                serial_reader.write(b"AVG_MPG_UPDATE:0.0\n")
+            except:
+                pass
+        # Trip odometer reset by Arduino button
+        return
+    
+    # Handle style change command (both buttons held for 2+ seconds)
+    if line.startswith("STYLE_CHANGE:"):
+        current_style_index = (current_style_index + 1) % 5  # Cycle between 0, 1, 2, 3, and 4
+        
+        # Save the new style to persistent data
+        persistent_data.data["dashboard_style"] = current_style_index
+        persistent_data.save_data()
+        return
+    
+    # Handle Arduino save data commands
+    if line.startswith("SAVE_DATA:"):
+        data_part = line[10:]  # Remove "SAVE_DATA:" prefix
+        parts = data_part.split(',')
+        if len(parts) >= 1:  # New format: only fuel data (distance calculated by Pi)
+            try:
+                fuel_used = float(parts[0])
+                fuel_used_bpw = float(parts[1]) if len(parts) > 1 else 0.0
+                # Update only fuel data, keep existing distance data
+                persistent_data.data["fuel_used"] = fuel_used
+                persistent_data.data["fuel_used_bpw"] = fuel_used_bpw
+                persistent_data.save_data()
+                # print(f"Saved fuel data: {fuel_used:.2f}, {fuel_used_bpw:.2f}")  # Disabled for performance
+            except ValueError as e:
+                print(f"Error parsing save data: {e}")
+
+def read_arduino_data(now_ms=None):
     """Read speed, RPM, and sensor data from Arduino"""
     global current_speed, current_rpm, demo_rpm_direction
     global current_fuel_level, current_oil_pressure, current_coolant_temp, current_oil_temp
-    global current_battery_voltage, current_brightness
-    global display_rpm, last_rpm_time
-    global display_speed, last_speed_time
-    global switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts
-    global switch_fuel_range, switch_trip_odo, switch_inst_mpg, switch_avg_mpg, switch_metric
-    global current_fuel_range, current_inst_mpg, current_avg_mpg, current_fuel_flow_gph
-    global last_speed_update_time, distance_calculation_initialized
-    global serial_connected, ser
-    global speed_samples, last_speed_update  # Added missing global declarations
+    global current_fuel_consumption_lbhr, current_fuel_flow_gph
+    global serial_connected, was_ever_connected
     
     # Debug timing removed for performance
     
+    if not serial_connected and serial_reader.connected:
+        # Reader thread found the Arduino again (or for the first time) - back to live data
+        serial_connected = True
+        was_ever_connected = True
+        if not REPLAY_LOG:
+            remember_arduino_port()
+    
     if not serial_connected:
             # Only show demo if Arduino was NEVER connected from the beginning
             if not was_ever_connected:
@@ -596,269 +1412,221 @@ def read_arduino_data():
                 
             return current_speed, current_rpm
     
-    try:
-        if ser is None or not ser.is_open:
-            raise Exception("Serial connection is not open")
-        
-        # Simple, reliable serial processing - back to working version
-        if ser.in_waiting > 0:
-            # If buffer is getting full (>1000 bytes), clear old data
-            if ser.in_waiting > 1000:
-                ser.reset_input_buffer()  # Clear the buffer
-                line = ""
-            else:
-                line = ser.readline().decode('utf-8', errors='ignore').strip()
-        else:
-            line = ""  # No data available, don't block
-        
-        if not line:
-            return current_speed, current_rpm
-        
+    # Port failed - freeze last values until the reader thread reconnects
+    if serial_reader is None or not serial_reader.connected:
+        serial_connected = False
+        return current_speed, current_rpm
+    
+    # Handle control messages first, in the order the Arduino sent them
+    for line in serial_reader.pop_control_messages():
+        handle_control_message(line)
+    
+    # Latest telemetry published by the reader thread (never blocks)
+    snapshot = serial_reader.snapshot
+    apply_telemetry(snapshot, now_ms)
+    
+    # Buttons come only from the reader's queued changes - a coalesced snapshot can skip a press
+    update_buttons(serial_reader.pop_button_events(), now_ms if now_ms is not None else dashboard_clock())
+    
+    # Timeouts run every frame - apply_telemetry() skips frames without a new snapshot, so a
+    # silent Arduino on an open port would otherwise hold the last speed and sensors forever
+    expire_stale_fields(snapshot, now_ms if now_ms is not None else dashboard_clock())
+    return current_speed, current_rpm
 
-        
-        # Parse Arduino data
-        # Parse the actual format
-        # Handle Arduino initialization requests
-        if line.startswith("INIT_REQUEST:PERSISTENT_DATA"):
-            # print("Arduino requesting persistent data")  # Disabled for performance
-            persistent_data.send_init_data(ser)
-            return current_speed, current_rpm
-        
-        # Handle Arduino reset commands
-        if line.startswith("RESET_TRIP:"):
-            # Reset trip odometer (distance calculation now done by Pi)
-            persistent_data.data["trip_odometer"] = 0.0
-            persistent_data.save_data()
-            # Send reset average MPG to Arduino
-            if ser and ser.is_open:
-                try:
-                    ser.write(b"AVG_MPG_UPDATE:0.0\n")
-                except:
-                    pass
-            # Trip odometer reset by Arduino button
-            return current_speed, current_rpm
-        
-        # Handle style change command (both buttons held for 2+ seconds)
-        if line.startswith("STYLE_CHANGE:"):
-            global current_style_index
-            current_style_index = (current_style_index + 1) % 5  # Cycle between 0, 1, 2, 3, and 4
-            
-            # Save the new style to persistent data
-            persistent_data.data["dashboard_style"] = current_style_index
-            persistent_data.save_data()
-            
-            return current_speed, current_rpm
-        
+def update_buttons(events, now):
+    """Feed (time, trip, avg) button changes in order, then check running holds at now"""
+    global button_trip_reset, button_avg_reset
+    
+    # Changes at the time they happened - the previous state lasted until each change, so a
+    # hold that ended between two frames (a few per second in a 50x replay) still reaches 1 second
+    for event_time, trip_pressed, avg_pressed in events:
+        handle_button_timing(button_trip_reset, button_avg_reset, event_time)
+        handle_button_timing(trip_pressed, avg_pressed, event_time)
+        button_trip_reset, button_avg_reset = trip_pressed, avg_pressed
+    
+    # A button still held fires once it has been down for BUTTON_HOLD_TIME, without waiting for a change
+    handle_button_timing(button_trip_reset, button_avg_reset, now)
 
-        
-        # Handle Arduino save data commands
-        if line.startswith("SAVE_DATA:"):
-            data_part = line[10:]  # Remove "SAVE_DATA:" prefix
-            parts = data_part.split(',')
-            if len(parts) >= 1:  # New format: only fuel data (distance calculated by Pi)
-                try:
-                    fuel_used = float(parts[0])
-                    fuel_used_bpw = float(parts[1]) if len(parts) > 1 else 0.0
-                    # Update only fuel data, keep existing distance data
-                    persistent_data.data["fuel_used"] = fuel_used
-                    persistent_data.data["fuel_used_bpw"] = fuel_used_bpw
-                    persistent_data.save_data()
-                    # print(f"Saved fuel data: {fuel_used:.2f}, {fuel_used_bpw:.2f}")  # Disabled for performance
-                except ValueError as e:
-                    print(f"Error parsing save data: {e}")
-            return current_speed, current_rpm
-        
-        if "SPEED:" in line or "FUELRNG:" in line or "AMPG_SW:" in line:
-            
-            # Split by comma and parse key:value pairs (handles both high and low frequency messages)
-            pairs = line.split(",")
-            data = {}
-            for pair in pairs:
-                if ":" in pair:
-                    key, value = pair.split(":", 1)
-                    try:
-                        data[key.strip()] = float(value.strip())
-                    except ValueError:
-                        pass  # Skip non-numeric values
-            
+def expire_stale_fields(snapshot, now):
+    """Zero speed, RPM and sensors whose last confirmed sample is too old (see field_age)"""
+    global display_speed, current_rpm, display_rpm
+    
+    age = field_age(snapshot, "speed", now)
+    if age is not None and age >= TELEMETRY_TIMEOUT_MS:
+        display_speed = 0.0
+    age = field_age(snapshot, "rpm", now)
+    if age is not None and age >= TELEMETRY_TIMEOUT_MS:
+        current_rpm = None
+        display_rpm = 0.0
+    
+    # A sensor that stopped reporting (or that a lost delta line left unconfirmed) reads zero,
+    # like an analog gauge whose sender lost signal, instead of freezing on a healthy value
+    for slot, name in STALE_SENSORS:
+        age = field_age(snapshot, slot, now)
+        if age is not None and age >= SENSOR_STALE_MS:
+            globals()[name] = 0.0
+            if slot not in stale_fields:
+                stale_fields.add(slot)
+                print(f"⚠️ No {slot} data for {age / 1000:.1f}s - gauge zeroed")
+        elif slot in stale_fields:
+            stale_fields.discard(slot)
+            print(f"✅ {slot} data back")
 
-            
-            # Update speed if available with essential processing restored
-            if "SPEED" in data:
-                current_speed = data["SPEED"]
-                current_time = pygame.time.get_ticks()
-                last_speed_time = current_time  # Update timestamp
-                
-                # Essential distance calculation (simplified from old version)
-                if distance_calculation_initialized and last_speed_update_time > 0:
-                    delta_time_ms = current_time - last_speed_update_time
-                    if delta_time_ms > 0 and current_speed > 0.1:  # Only when moving
-                        # Calculate distance increment in miles
-                        distance_increment = (current_speed * delta_time_ms) / 3600000.0  # MPH * ms -> miles
-                        
-                        # Update odometer values
-                        persistent_data.data["total_odometer"] += distance_increment
-                        persistent_data.data["trip_odometer"] += distance_increment
-                        
-                        # Calculate average MPG (simplified)
-                        total_fuel_used = persistent_data.data["fuel_used"] + persistent_data.data["fuel_used_bpw"]
-                        if total_fuel_used > 0.01 and persistent_data.data["trip_odometer"] > 0.01:
-                            calculated_avg_mpg = persistent_data.data["trip_odometer"] / total_fuel_used
-                            if calculated_avg_mpg > 50.0:
-                                calculated_avg_mpg = 50.0
-                            current_avg_mpg = calculated_avg_mpg
-                        else:
-                            current_avg_mpg = 0.0
+def apply_telemetry(snapshot, now_ms=None):
+    """Take speed, RPM, sensors and switches from a TelemetrySnapshot, returns (speed, rpm) -
+    now_ms is the frame time in the snapshot's clock (dashboard_clock() by default)"""
+    global current_speed, current_rpm
+    global current_fuel_level, current_oil_pressure, current_coolant_temp, current_oil_temp
+    global current_battery_voltage, current_brightness
+    global display_rpm, last_rpm_time
+    global display_speed, last_speed_time
+    global switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts
+    global switch_fuel_range, switch_trip_odo, switch_inst_mpg, switch_avg_mpg, switch_metric
+    global current_fuel_range, current_inst_mpg, current_avg_mpg, current_fuel_flow_gph
+    global last_speed_update_time, distance_calculation_initialized
+    global last_telemetry_sequence, last_status_time
+    global current_fuel_consumption_lbhr
+    
+    if snapshot.sequence == last_telemetry_sequence:
+        return current_speed, current_rpm
+    last_telemetry_sequence = snapshot.sequence
+    current_time = now_ms if now_ms is not None else dashboard_clock()
+    
+    # Update speed if a new sample arrived, with essential processing restored
+    if snapshot.speed_time != last_speed_time:
+        current_speed = snapshot.speed
+        last_speed_time = snapshot.speed_time  # Update timestamp
+        
+        # Essential distance calculation (simplified from old version)
+        if distance_calculation_initialized and last_speed_update_time > 0:
+            delta_time_ms = last_speed_time - last_speed_update_time
+            if delta_time_ms > 0 and current_speed > 0.1:  # Only when moving
+                # Calculate distance increment in miles
+                distance_increment = (current_speed * delta_time_ms) / 3600000.0  # MPH * ms -> miles
                 
-                last_speed_update_time = current_time
-                distance_calculation_initialized = True
+                # Update odometer values
+                persistent_data.data["total_odometer"] += distance_increment
+                persistent_data.data["trip_odometer"] += distance_increment
                 
-                # Essential speed processing (simplified from old working version)
-                display_speed = current_speed  # Simple assignment for now
-            else:
-                # No speed data in this message - check if we should timeout
-                current_time = pygame.time.get_ticks()
-                if current_speed is not None and (current_time - last_speed_time) < 500:  # 500ms timeout
-                    # Keep last good values - prevents brief gaps during fast serial updates
-                    pass
+                # Calculate average MPG (simplified)
+                total_fuel_used = persistent_data.data["fuel_used"] + persistent_data.data["fuel_used_bpw"]
+                if total_fuel_used > 0.01 and persistent_data.data["trip_odometer"] > 0.01:
+                    calculated_avg_mpg = persistent_data.data["trip_odometer"] / total_fuel_used
+                    if calculated_avg_mpg > 50.0:
+                        calculated_avg_mpg = 50.0
+                    current_avg_mpg = calculated_avg_mpg
                 else:
-                    # Timeout exceeded or first time - reset
-                    display_speed = 0.0
+                    current_avg_mpg = 0.0
+        
+        last_speed_update_time = last_speed_time
+        distance_calculation_initialized = True
+        
+        # Essential speed processing (simplified from old working version)
+        display_speed = current_speed  # Simple assignment for now
+    elif (current_time - last_speed_time) >= TELEMETRY_TIMEOUT_MS:
+        # Timeout exceeded or first time - reset
+        display_speed = 0.0
+    
+    # Handle RPM data - no simulation when Arduino is connected
+    if snapshot.rpm_time != last_rpm_time:
+        current_rpm = snapshot.rpm  # Use actual RPM data (including 0 if that's the value)
+        last_rpm_time = snapshot.rpm_time  # Update timestamp
+        
+        # Adaptive RPM smoothing - fast for big changes, stable for small ones
+        if display_rpm == 0.0:  # First reading
+            display_rpm = current_rpm
+        else:
+            rpm_difference = abs(current_rpm - display_rpm)
             
-            # Handle RPM data - no simulation when Arduino is connected
-            if "RPM" in data:
-                current_rpm = data["RPM"]  # Use actual RPM data (including 0 if that's the value)
-                last_rpm_time = pygame.time.get_ticks()  # Update timestamp
-                
-                # Adaptive RPM smoothing - fast for big changes, stable for small ones
-                if display_rpm == 0.0:  # First reading
-                    display_rpm = current_rpm
-                else:
-                    rpm_difference = abs(current_rpm - display_rpm)
-                    
-                    # Deadband: ignore very small changes to prevent 6↔7 oscillation
-                    if rpm_difference < RPM_DEADBAND:
-                        # Keep current display value - no change for small oscillations
-                        pass
-                    elif rpm_difference > 50:
-                        # Large change: fast response (revving up/down)
-                        display_rpm = display_rpm + (current_rpm - display_rpm) * RPM_FAST_SMOOTHING
-                    else:
-                        # Medium change: normal smoothing
-                        display_rpm = display_rpm + (current_rpm - display_rpm) * RPM_SLOW_SMOOTHING
-                
-                # Debug output disabled for maximum performance
-                # print(f"RPM DEBUG: Arduino={data['RPM']}, Smooth={display_rpm:.0f}, Display_calc={int(display_rpm)//100}, Should_show={int(display_rpm)//100:02d}")
+            # Deadband: ignore very small changes to prevent 6↔7 oscillation
+            if rpm_difference < RPM_DEADBAND:
+                # Keep current display value - no change for small oscillations
+                pass
+            elif rpm_difference > 50:
+                # Large change: fast response (revving up/down)
+                display_rpm = display_rpm + (current_rpm - display_rpm) * RPM_FAST_SMOOTHING
             else:
-                # No RPM data in this message - check if we should timeout
-                current_time = pygame.time.get_ticks()
-                if current_rpm is not None and (current_time - last_rpm_time) < 500:  # 500ms timeout
-                    # Keep last good values - prevents brief N/A flicker during fast serial updates
-                    pass
-                else:
-                    # Timeout exceeded or first time - show N/A
-                    current_rpm = None
-                    display_rpm = 0.0
-            
-            # Update sensor data for 3rd dashboard
-            if "FUEL" in data:
-                current_fuel_level = data["FUEL"]
-            if "OIL" in data:
-                current_oil_pressure = data["OIL"]
-            if "COOLANT" in data:
-                # Arduino now sends Fahrenheit directly, handle special "LO" value
-                current_coolant_temp = data["COOLANT"]
-            if "OILTEMP" in data:
-                # Arduino now sends Fahrenheit directly, handle special "LO" value
-                current_oil_temp = data["OILTEMP"]
-            if "BATTERY" in data:
-                current_battery_voltage = data["BATTERY"]
-            if "BRIGHTNESS" in data:
-                current_brightness = data["BRIGHTNESS"]
-            if "FUEL_CONSUMPTION" in data:
-                current_fuel_consumption_lbhr = data["FUEL_CONSUMPTION"]
-            
-            # Update trip/MPG data (FIXED - this was missing!)
-            if "TRIP_ODO" in data:
-                current_trip_odo = data["TRIP_ODO"]
-            if "TOTAL_ODO" in data:
-                current_total_odo = data["TOTAL_ODO"]
-            if "FUELRNG" in data:
-                current_fuel_range = data["FUELRNG"]
-            if "IMPG" in data:
-                current_inst_mpg = data["IMPG"]
-            if "AMPG" in data:
-                current_avg_mpg = data["AMPG"]
-            if "FLOW" in data:
-                current_fuel_flow_gph = data["FLOW"]
-
-            
-            # Update switch states for gauge switching
-            if "OIL_P_SW" in data:
-                switch_oil_pressure = bool(int(data["OIL_P_SW"]))
-            if "OIL_T_SW" in data:
-                switch_oil_temp = bool(int(data["OIL_T_SW"]))
-            if "COOL_SW" in data:
-                switch_coolant_temp = bool(int(data["COOL_SW"]))
-            if "VOLT_SW" in data:
-                switch_volts = bool(int(data["VOLT_SW"]))
-            if "FUELR_SW" in data:
-                switch_fuel_range = bool(int(data["FUELR_SW"]))
-            if "TRIP_SW" in data:
-                switch_trip_odo = bool(int(data["TRIP_SW"]))
-            if "IMPG_SW" in data:
-                switch_inst_mpg = bool(int(data["IMPG_SW"]))
-            if "AMPG_SW" in data:
-                switch_avg_mpg = bool(int(data["AMPG_SW"]))
-            if "METR_SW" in data:
-                switch_metric = bool(int(data["METR_SW"]))
-            
-            # Handle button states with timing logic
-            if "TRIP_BTN" in data and "AVG_BTN" in data:
-                trip_btn = bool(int(data["TRIP_BTN"]))
-                avg_btn = bool(int(data["AVG_BTN"]))
-                
-                handle_button_timing(trip_btn, avg_btn)
-            
-            # Update button states for visual feedback
-            if "TRIP_BTN" in data:
-                button_trip_reset = bool(int(data["TRIP_BTN"]))
-            if "AVG_BTN" in data:
-                button_avg_reset = bool(int(data["AVG_BTN"]))
-            
-            # Handle persistent data communication
-            if "TOTAL_ODO" in data and "TRIP_ODO" in data and "FUEL_USED" in data:
-                # Update persistent data from Arduino
-                persistent_data.update_data(
-                    data["TOTAL_ODO"],
-                    data["TRIP_ODO"], 
-                    data["FUEL_USED"]
-                )
-            
-            # Clean console output
-            rpm_display = "N/A" if current_rpm is None else f"{current_rpm:.0f}"
-            #print(f"Arduino - Speed: {current_speed:.1f} MPH, RPM: {rpm_display}")
-        # Silently ignore other message formats
-    except Exception as e:
-        if serial_connected:
-            # Arduino connection lost - switch to demo mode
-            serial_connected = False
-            if ser:
-                try:
-                    ser.close()
-                except:
-                    pass
-                    ser = None
-        # print(f"Serial read error: {e}")  # Disabled - connectivity issue resolved
-        pass  # Silent error handling for performance
+                # Medium change: normal smoothing
+                display_rpm = display_rpm + (current_rpm - display_rpm) * RPM_SLOW_SMOOTHING
+    elif (current_time - last_rpm_time) >= TELEMETRY_TIMEOUT_MS:
+        # Timeout exceeded or first time - show N/A
+        current_rpm = None
+        display_rpm = 0.0
+    
+    # Update sensor data for 3rd dashboard
+    if snapshot.fuel is not None:
+        current_fuel_level = snapshot.fuel
+    if snapshot.oil is not None:
+        current_oil_pressure = snapshot.oil
+    if snapshot.coolant is not None:
+        # Arduino now sends Fahrenheit directly, handle special "LO" value
+        current_coolant_temp = snapshot.coolant
+    if snapshot.oil_temp is not None:
+        # Arduino now sends Fahrenheit directly, handle special "LO" value
+        current_oil_temp = snapshot.oil_temp
+    if snapshot.battery is not None:
+        current_battery_voltage = snapshot.battery
+    if snapshot.brightness is not None:
+        current_brightness = snapshot.brightness
+    if snapshot.fuel_consumption is not None:
+        current_fuel_consumption_lbhr = snapshot.fuel_consumption
+    
+    # Switch/button line - only apply once per line so Pi-side average MPG isn't overwritten every frame
+    if snapshot.status_time != last_status_time:
+        last_status_time = snapshot.status_time
+        
+        # Update trip/MPG data (FIXED - this was missing!)
+        if snapshot.fuel_range is not None:
+            current_fuel_range = snapshot.fuel_range
+        if snapshot.inst_mpg is not None:
+            current_inst_mpg = snapshot.inst_mpg
+        if snapshot.avg_mpg is not None:
+            current_avg_mpg = snapshot.avg_mpg
+        if snapshot.flow is not None:
+            current_fuel_flow_gph = snapshot.flow
+        
+        # Update switch states for gauge switching
+        if snapshot.oil_pressure_sw is not None:
+            switch_oil_pressure = snapshot.oil_pressure_sw
+        if snapshot.oil_temp_sw is not None:
+            switch_oil_temp = snapshot.oil_temp_sw
+        if snapshot.coolant_sw is not None:
+            switch_coolant_temp = snapshot.coolant_sw
+        if snapshot.volts_sw is not None:
+            switch_volts = snapshot.volts_sw
+        if snapshot.fuel_range_sw is not None:
+            switch_fuel_range = snapshot.fuel_range_sw
+        if snapshot.trip_sw is not None:
+            switch_trip_odo = snapshot.trip_sw
+        if snapshot.inst_mpg_sw is not None:
+            switch_inst_mpg = snapshot.inst_mpg_sw
+        if snapshot.avg_mpg_sw is not None:
+            switch_avg_mpg = snapshot.avg_mpg_sw
+        if snapshot.metric_sw is not None:
+            switch_metric = snapshot.metric_sw
+    
+    # Handle persistent data communication
+    if snapshot.total_odo is not None and snapshot.trip_odo is not None and snapshot.fuel_used is not None:
+        # Update persistent data from Arduino
+        persistent_data.update_data(
+            snapshot.total_odo,
+            snapshot.trip_odo,
+            snapshot.fuel_used
+        )
     
     return current_speed, current_rpm
 
-def draw_7_segment_digit(surface, x, y, digit, color, size=50, dim_factor=1.0):
+def draw_7_segment_digit(surface, x, y, digit, color, size=50, dim_factor=1.0, atlas=True):
     """Draw a single 7-segment digit with optional dimming for leading zeros"""
     if digit < 0 or digit > 9:
         return
     
+    # Blit the pre-rendered digit - atlas=False draws the segment polygons (sprite builds)
+    if atlas:
+        sprite, pad = get_digit_sprite(draw_7_segment_digit, digit, color, size, dim_factor)
+        surface.blit(sprite, (x - pad, y - pad))
+        return
+    
     segments = SEGMENTS[digit]
     w, h = size, size * 1.5
     gap = max(2, size // 12)  # Proportional gap (4px for 50px size)
@@ -953,8 +1721,8 @@ def draw_speed_display(surface, speed):
     # Use multi-digit display with leading zero dimming
     draw_multi_digit_display(surface, display_speed, 3, start_x, start_y, digit_width, YELLOW, 50, 0.3)
     
-    font_small = pygame.font.SysFont('Arial', 24, bold=True)
-    unit_label = font_small.render(unit_text, True, YELLOW)
+    font_small = get_font('Arial', 24)
+    unit_label = render_text(font_small, unit_text, True, YELLOW)
     unit_rect = unit_label.get_rect(center=(start_x + digit_width, start_y + 120))
     surface.blit(unit_label, unit_rect)
 
@@ -966,8 +1734,8 @@ def draw_rpm_display(surface, rpm):
     
     if rpm is None:
         # Show "N/A" when no RPM data is available
-        font_na = pygame.font.SysFont('Arial', 40, bold=True)
-        na_text = font_na.render("N/A", True, (128, 128, 128))  # Gray color for N/A
+        font_na = get_font('Arial', 40)
+        na_text = render_text(font_na, "N/A", True, (128, 128, 128))  # Gray color for N/A
         na_rect = na_text.get_rect()
         na_x = start_x + digit_width - na_rect.width // 2  # Center where digits would be
         surface.blit(na_text, (na_x, start_y + 20))
@@ -977,8 +1745,8 @@ def draw_rpm_display(surface, rpm):
         # Ensure we show the correct value: 741 RPM should show "07" (meaning 0700 RPM range)
         draw_multi_digit_display(surface, rpm_hundreds, 2, start_x, start_y, digit_width, YELLOW, 50, 0.3)
     
-    font_small = pygame.font.SysFont('Arial', 24, bold=True)
-    rpm_text = font_small.render("RPM/100", True, YELLOW)  # Changed from "RPM" to "RPM/100"
+    font_small = get_font('Arial', 24)
+    rpm_text = render_text(font_small, "RPM/100", True, YELLOW)  # Changed from "RPM" to "RPM/100"
     rpm_rect = rpm_text.get_rect(center=(start_x + digit_width * 1 - 10, start_y + 105))  # Moved 10 pixels to the left
     surface.blit(rpm_text, rpm_rect)
 
@@ -993,10 +1761,10 @@ def draw_odometer_separate(surface, total_miles):
     digit_width = 28
     digit_height = 35
     digit_spacing = 30
-    border_color = (100, 100, 100)
-    bg_color = (20, 20, 20)
+    border_color = ODOMETER_BORDER
+    bg_color = ODOMETER_BACKGROUND
     digit_color = (255, 255, 255)
-    decimal_color = (255, 200, 0)
+    decimal_color = ODOMETER_DECIMAL
     
     if total_miles is None or total_miles < 0:
         total_miles = 0.0
@@ -1008,12 +1776,12 @@ def draw_odometer_separate(surface, total_miles):
     decimal_str = f"{decimal_part:01d}"
     
     # Draw title at top of surface
-    font_title = pygame.font.SysFont('Arial', 14, bold=True)
-    title_text = font_title.render("ODOMETER", True, (200, 200, 200))
+    font_title = get_font('Arial', 14)
+    title_text = render_text(font_title, "ODOMETER", True, ODOMETER_TITLE)
     surface.blit(title_text, (odo_x - 60, 5))  # Top of surface
     
     # Draw digits
-    font_digit = pygame.font.SysFont('Courier', 22, bold=True)
+    font_digit = get_font('Courier', 22)
     
     for i, digit_char in enumerate(integer_str):
         x = odo_x - (6 - i) * digit_spacing
@@ -1025,7 +1793,7 @@ def draw_odometer_separate(surface, total_miles):
         pygame.draw.rect(surface, bg_color, digit_rect.inflate(-4, -4))
         
         # Draw digit
-        digit_surface = font_digit.render(digit_char, True, digit_color)
+        digit_surface = render_text(font_digit, digit_char, True, digit_color)
         digit_rect_center = digit_surface.get_rect(center=(x, y))
         surface.blit(digit_surface, digit_rect_center)
     
@@ -1039,7 +1807,7 @@ def draw_odometer_separate(surface, total_miles):
     pygame.draw.rect(surface, border_color, decimal_digit_rect, 2)
     pygame.draw.rect(surface, bg_color, decimal_digit_rect.inflate(-4, -4))
     
-    decimal_surface = font_digit.render(decimal_str, True, decimal_color)
+    decimal_surface = render_text(font_digit, decimal_str, True, decimal_color)
     decimal_rect_center = decimal_surface.get_rect(center=(decimal_digit_x, odo_y))
     surface.blit(decimal_surface, decimal_rect_center)
 
@@ -1053,10 +1821,10 @@ def draw_odometer_display(surface, total_miles):
     digit_width = 32
     digit_height = 45
     digit_spacing = 35
-    border_color = (100, 100, 100)  # Gray border
-    bg_color = (20, 20, 20)         # Dark background
+    border_color = ODOMETER_BORDER
+    bg_color = ODOMETER_BACKGROUND
     digit_color = (255, 255, 255)   # White digits
-    decimal_color = (255, 200, 0)   # Yellow/orange for decimal digit
+    decimal_color = ODOMETER_DECIMAL
     
     # Ensure we have a valid number
     if total_miles is None or total_miles < 0:
@@ -1074,7 +1842,7 @@ def draw_odometer_display(surface, total_miles):
     # Title removed for cleaner appearance
     
     # Use regular font instead of 7-segment for reliability
-    font_digit = pygame.font.SysFont('Courier', 28, bold=True)  # Monospace font
+    font_digit = get_font('Courier', 28)  # Monospace font
     
     # Draw integer digits (6 digits)
     for i, digit_char in enumerate(integer_str):
@@ -1091,7 +1859,7 @@ def draw_odometer_display(surface, total_miles):
         pygame.draw.rect(surface, bg_color, bg_rect)
         
         # Draw the digit using regular font
-        digit_text = font_digit.render(digit_char, True, digit_color)
+        digit_text = render_text(font_digit, digit_char, True, digit_color)
         digit_rect = digit_text.get_rect(center=(x + digit_width//2, y + digit_height//2))
         surface.blit(digit_text, digit_rect)
     
@@ -1113,7 +1881,7 @@ def draw_odometer_display(surface, total_miles):
     pygame.draw.rect(surface, bg_color, bg_rect)
     
     # Draw the decimal digit in different color
-    decimal_digit_text = font_digit.render(decimal_str, True, decimal_color)
+    decimal_digit_text = render_text(font_digit, decimal_str, True, decimal_color)
     decimal_digit_rect = decimal_digit_text.get_rect(center=(x + digit_width//2, y + digit_height//2))
     surface.blit(decimal_digit_text, decimal_digit_rect)
 
@@ -1126,35 +1894,19 @@ def draw_synthwave_mountains(surface, rpm):
     scene_width = int(280 * scale_factor)  # Scaled width
     scene_height = int(120 * scale_factor)  # Scaled height
     
-    def interpolate_color(color1, color2, factor):
-        return tuple(int(c1 + (c2 - c1) * factor) for c1, c2 in zip(color1, color2))
-    
     # Handle None RPM case
     if rpm is None:
         # No RPM data - use default colors
         mountain_color = NEON_CYAN  # Default cyan color
+        mountain_fill_color = duller(NEON_CYAN)
         sun_color = BLACK  # Invisible sun
     else:
-        # Mountain color (same progression as grid)
-        if rpm <= 3000:
-            factor = rpm / 3000.0
-            mountain_color = interpolate_color(NEON_CYAN, PURPLE, factor)
-        else:
-            factor = min((rpm - 3000) / 4000.0, 1.0)
-            mountain_color = interpolate_color(PURPLE, RED, factor)
-        
-        # Sun color progression (black -> cyan -> yellow)
-        if rpm <= 1500:
-            # Low RPM: black (invisible)
-            sun_factor = rpm / 1500.0
-            sun_color = interpolate_color(BLACK, NEON_CYAN, sun_factor)
-        elif rpm <= 4500:
-            # Mid RPM: cyan -> yellow
-            sun_factor = (rpm - 1500) / 3000.0
-            sun_color = interpolate_color(NEON_CYAN, YELLOW, sun_factor)
-        else:
-            # High RPM: bright yellow
-            sun_color = YELLOW
+        # Mountain color (same progression as grid) and sun color (black -> cyan -> yellow) from the lookup tables
+        index = gradient_index(rpm, GRADIENT_MAX_RPM)
+        mountain_color = SYNTHWAVE_RPM_COLORS[index]
+        mountain_fill_color = SYNTHWAVE_MOUNTAIN_FILLS[index]
+        sun_color = SYNTHWAVE_SUN_COLORS[index]
+        sun_bands = SYNTHWAVE_SUN_BANDS[index]
     
     # Draw simple geometric mountains and sun like in the image
     import math
@@ -1174,13 +1926,6 @@ def draw_synthwave_mountains(surface, rpm):
     left_peak_x = center_x - int(50 * scale_factor)
     left_peak_y = center_y - int(10 * scale_factor)
     
-    # Create duller colors for fills (reduce intensity by ~40%)
-    def make_duller(color):
-        return tuple(int(c * 0.6) for c in color)
-    
-    mountain_fill_color = make_duller(mountain_color)
-    sun_fill_color = make_duller(sun_color) if sun_color != BLACK else BLACK
-    
     # Draw bigger sun (behind both mountains) - stretched horizontally and scaled
     sun_center_x = center_x
     sun_center_y = center_y + int(30 * scale_factor)
@@ -1203,17 +1948,8 @@ def draw_synthwave_mountains(surface, rpm):
             if band_index >= num_bands:
                 band_index = num_bands - 1
             
-            # Use the band index to create discrete color steps
-            band_factor = band_index / (num_bands - 1)
-            
-            # Interpolate between bright sun color at top and darker at bottom
-            bright_color = sun_color
-            dark_color = make_duller(make_duller(sun_color))  # Extra dark (36% of original)
-            
-            gradient_color = tuple(
-                int(bright_color[i] * (1 - band_factor) + dark_color[i] * band_factor)
-                for i in range(3)
-            )
+            # Bands step from the bright sun color at top to 36% of it at the bottom
+            band_color = sun_bands[band_index]
             
             # Calculate the width of the ellipse at this y position
             if abs(y - sun_center_y) <= sun_radius_y:
@@ -1228,7 +1964,7 @@ def draw_synthwave_mountains(surface, rpm):
                 
                 # Draw horizontal line with gradient color
                 if start_x <= end_x:
-                    pygame.draw.line(surface, gradient_color, (start_x, y), (end_x, y), 1)
+                    pygame.draw.line(surface, band_color, (start_x, y), (end_x, y), 1)
         
         # Draw sun outline
         for angle in range(0, 360, 3):
@@ -1273,222 +2009,84 @@ def draw_synthwave_mountains(surface, rpm):
     pygame.draw.line(surface, mountain_color, (left_peak_x, left_peak_y), (left_base_right, base_y), 2)  # Right side
     pygame.draw.line(surface, mountain_color, (left_base_left, base_y), (left_base_right, base_y), 2)  # Base
 
+def synthwave_speedometer_ticks():
+    """Tick lines and number positions of the Synthwave speedometer for the current unit system"""
+    return diagonal_speedometer_ticks(SPEEDO_X_OFFSET, SPEEDO_Y_OFFSET, SPEEDO_LENGTH, speed_tick_count,
+                                      max_speed, tuple(speed_numbers), switch_metric, SPEEDO_NUMBER_DISTANCE)
+
+def diagonal_speedometer_memo(current_speed):
+    """Memo state of draw_diagonal_speedometer - how many ticks and numbers are lit"""
+    ticks = synthwave_speedometer_ticks()
+    lit_ticks = sum(1 for tick in ticks if tick.mph < current_speed)
+    lit_numbers = sum(1 for tick in ticks if tick.label is not None and tick.label_speed <= current_speed)
+    return None, (lit_ticks, lit_numbers)
+
+@memoize_gauge(diagonal_speedometer_memo)
 def draw_diagonal_speedometer(surface, current_speed):
     """Draw curved diagonal speedometer with horizontal ticks"""
-    line_start_x = SPEEDO_X_OFFSET
-    line_start_y = SPEEDO_Y_OFFSET
-    line_length = SPEEDO_LENGTH
-    angle_deg = 60
-    angle_rad = math.radians(angle_deg)
-    
-    line_end_x = line_start_x + line_length * math.cos(angle_rad)
-    line_end_y = line_start_y - line_length * math.sin(angle_rad)
-    
-    # Convert speed and scale for metric if needed (use aggregated display_speed, not raw current_speed)
-    if switch_metric:
-        display_speed_for_drawing = mph_to_kph(display_speed)
-        max_display_speed = mph_to_kph(max_speed)  # ~137 KPH
-        display_numbers = [int(mph_to_kph(mph)) for mph in speed_numbers]  # Convert speed numbers to KPH
-    else:
-        display_speed_for_drawing = display_speed
-        max_display_speed = max_speed
-        display_numbers = speed_numbers
-    
-    for i in range(speed_tick_count):
-        mph = (i / (speed_tick_count - 1)) * max_speed  # Always use original MPH for tick positioning
-        display_mph = (i / (speed_tick_count - 1)) * max_display_speed  # Display value (MPH or KPH)
-        ratio = i / (speed_tick_count - 1)
-        
-        curve_intensity = 80
-        curve_offset = math.sin(ratio * math.pi) * curve_intensity
-        
-        base_tick_x = line_start_x + ratio * (line_end_x - line_start_x)
-        base_tick_y = line_start_y + ratio * (line_end_y - line_start_y)
-        
-        tick_x = base_tick_x - curve_offset
-        tick_y = base_tick_y
-        
-        is_numbered_tick = any(abs(mph - num) < 2.5 for num in speed_numbers)
-        
-        # Horizontal tick line
-        if is_numbered_tick:
-            tick_length = 120
-            tick_x1 = tick_x - tick_length/2 - 40
-            tick_x2 = tick_x + tick_length/2
-        else:
-            tick_length = 120
-            tick_x1 = tick_x - tick_length/2
-            tick_x2 = tick_x + tick_length/2
-        
-        tick_y1 = tick_y
-        tick_y2 = tick_y
-        
-        color = BRIGHT_GREEN if mph < current_speed else DULL_GREEN
-        pygame.draw.line(surface, color, (tick_x1, tick_y1), (tick_x2, tick_y2), 16)
-        
-        if is_numbered_tick:
-            closest_num = min(speed_numbers, key=lambda x: abs(x - mph))
-            if abs(mph - closest_num) < 2.5:
-                font_number = pygame.font.SysFont('Arial', 30, bold=True)
-                # Display the converted number
-                if switch_metric:
-                    display_num = int(mph_to_kph(closest_num))
-                else:
-                    display_num = closest_num
-                
-                # Dim numbers when not reached, bright when reached (like tachometer)
-                if closest_num <= current_speed:
-                    number_color = YELLOW  # Bright when reached
-                else:
-                    number_color = (100, 100, 0)  # Dimmed yellow when not reached
-                
-                number_text = font_number.render(str(display_num), True, number_color)
-                number_x = tick_x1 - SPEEDO_NUMBER_DISTANCE
-                number_y = tick_y - 12
-                surface.blit(number_text, (number_x, number_y))
+    # Tick lines and number positions come precomputed per unit system - only colours change
+    ticks = synthwave_speedometer_ticks()
+    font_number = get_font('Arial', 30)
+    for tick in ticks:
+        color = BRIGHT_GREEN if tick.mph < current_speed else DULL_GREEN
+        pygame.draw.line(surface, color, tick.start, tick.end, 16)
+        
+        if tick.label is not None:
+            # Dim numbers when not reached, bright when reached (like tachometer)
+            if tick.label_speed <= current_speed:
+                number_color = YELLOW  # Bright when reached
+            else:
+                number_color = (100, 100, 0)  # Dimmed yellow when not reached
+            
+            number_text = render_text(font_number, tick.label, True, number_color)
+            surface.blit(number_text, tick.number_pos)
 
 def get_modified_tachometer_position(rpm):
     """Calculate position along smoothed mountain-shaped RPM line with linear x-spacing"""
-    
-    # Starting point (bottom left)
-    line_start_x = TACHO_X_OFFSET - 120
-    line_start_y = TACHO_Y_OFFSET
-    
-    # End point (bottom right) - extended length for wider ticks spacing
-    line_end_x = TACHO_X_OFFSET + 400  # Extended from 350 to 400 for wider tick spacing
-    line_end_y = TACHO_Y_OFFSET
-    
-    # Peak at 4500 RPM (75% along the line)
-    peak_rpm = 4500
-    peak_ratio = peak_rpm / max_rpm  # 0.75
-    
-    # Linear x-coordinate progression (equal spacing)
-    ratio = rpm / max_rpm
-    tick_x = line_start_x + ratio * (line_end_x - line_start_x)
-    
-    # Y-coordinate follows mountain shape with peak at 4500 RPM - more vertical stretch
-    if rpm <= peak_rpm:
-        # Rising part: 0 to peak at 4500 RPM
-        segment_ratio = rpm / peak_rpm
-        # Sharper rise to peak with more height
-        peak_height = 280  # Increased from 200 for more vertical stretch
-        # Use a sharper curve (power function instead of sine)
-        tick_y = line_start_y - (segment_ratio ** 0.7 * peak_height)
-    else:
-        # Falling part: 4500 to 6000 RPM
-        segment_ratio = (rpm - peak_rpm) / (max_rpm - peak_rpm)
-        # Sharper fall from peak
-        peak_height = 280
-        fall_height = 60  # Increased fall for more dramatic curve
-        # Use sharper curve for the fall
-        tick_y = line_start_y - peak_height + (segment_ratio ** 0.8 * fall_height)
-    
-    return tick_x, tick_y
+    return mountain_position(rpm, TACHO_X_OFFSET, TACHO_Y_OFFSET, max_rpm)
 
 def draw_modified_tachometer(surface, current_rpm):
     """Draw modified tachometer following exact original Corvette C4 pattern"""
+    # 26 ticks equally spaced from 0 to 6000 RPM - positions, lengths and numbered squares precomputed
+    ticks = mountain_tachometer_ticks(TACHO_X_OFFSET, TACHO_Y_OFFSET, max_rpm, 26, tuple(rpm_numbers))
+    font_number = get_font('Arial', 24)
+    square_size = 18  # Same as the tick thickness (15% wider than speedometer)
     
-    # Generate ticks with equal spacing along the RPM line
-    # Total of 26 ticks based on your pattern, equally spaced from 0 to 6000 RPM
-    
-    all_ticks = []
-    total_ticks = 26
-    
-    for i in range(total_ticks):
-        # Equal RPM spacing from 0 to 6000
-        rpm = (i / (total_ticks - 1)) * max_rpm
+    for tick in ticks:
+        rpm = tick.rpm
         
         # Determine color based on RPM ranges from your specification
-        if rpm <= 4000:  # 0-40 (0-4000 RPM): green
+        if rpm <= 4500:  # 0-45 (0-4500 RPM): green
             active_color = BRIGHT_GREEN
             inactive_color = DULL_GREEN
-        elif rpm <= 4500:  # 40-45 (4000-4500 RPM): green (starting to fall)
-            active_color = BRIGHT_GREEN
-            inactive_color = DULL_GREEN
-        elif rpm <= 5000:  # 45-50 (4500-5000 RPM): yellow
+        elif rpm <= 5400:  # 45-54 (4500-5400 RPM): yellow
             active_color = YELLOW
             inactive_color = (100, 100, 0)
-        else:  # 50-60 (5000-6000 RPM): mix of yellow and red
-            if rpm <= 5400:  # First part yellow
-                active_color = YELLOW
-                inactive_color = (100, 100, 0)
-            else:  # Last part red
-                active_color = RED
-                inactive_color = (100, 0, 0)
-        
-        all_ticks.append((rpm, active_color, inactive_color))
-    
-    # Draw all ticks
-    for i, (rpm, active_color, inactive_color) in enumerate(all_ticks):
-        # Stop at 6000 RPM exactly
-        if rpm > 6000:
-            continue
-            
-        tick_x, tick_y = get_modified_tachometer_position(rpm)
-        
-        # Determine if this is a major numbered tick (0, 1000, 2000, 3000, 4000, 5000, 6000)
-        # Calculate which ticks should be numbered based on exact positions
-        numbered_tick_indices = []
-        for target_rpm in rpm_numbers:
-            target_index = round((target_rpm / max_rpm) * (total_ticks - 1))
-            numbered_tick_indices.append(target_index)
-        
-        is_numbered_tick = i in numbered_tick_indices
-        
-        # All ticks have same length (constant thickness and spacing) - 20% longer
-        base_tick_length = 72  # Increased from 60 to 72 (20% longer)
-        
-        # Adjust length based on curve geometry to maintain visual consistency
-        curve_position = rpm / max_rpm
-        if curve_position <= 0.2:  # Start of curve
-            tick_length = base_tick_length + 24  # Increased from 20 to 24 (20% longer)
-        elif curve_position <= 0.75:  # Middle ascending part (up to peak at 4500)
-            tick_length = base_tick_length + 12  # Increased from 10 to 12 (20% longer)
-        else:  # Descending part after peak
-            tick_length = base_tick_length - 6  # Increased from -5 to -6 (20% longer)
-        
-        # All ticks same length - no longer ticks for numbered points
-        tick_y1 = tick_y - tick_length/2
-        tick_y2 = tick_y + tick_length/2
-        
-        # Color based on current RPM (handle None case)
-        if current_rpm is None:
-            # No RPM data - show all ticks as inactive
-            color = inactive_color
+        else:  # Last part red
+            active_color = RED
+            inactive_color = (100, 0, 0)
+        
+        # Color based on current RPM (no RPM data - show all ticks as inactive)
+        if current_rpm is not None and rpm <= current_rpm:
+            color = active_color
         else:
-            # Normal RPM comparison
-            if rpm <= current_rpm:
-                color = active_color
-            else:
-                color = inactive_color
+            color = inactive_color
         
-        # Draw tick with increased thickness (15% wider than speedometer)
-        pygame.draw.line(surface, color, (tick_x, tick_y1), (tick_x, tick_y2), 18)  # 15% wider than speedometer (16 * 1.15 = 18)
+        # Draw tick with increased thickness (15% wider than speedometer: 16 * 1.15 = 18)
+        pygame.draw.line(surface, color, (tick.x, tick.y1), (tick.x, tick.y2), 18)
         
         # Draw small square and RPM numbers for major ticks
-        if is_numbered_tick:
-            # Draw small square on top of tick - same width as tick (18 pixels)
-            square_size = 18  # Same as new tick thickness (15% wider)
-            square_x = tick_x - square_size // 2
-            square_y = tick_y1 - square_size - 3  # Above the tick
+        if tick.label is not None:
+            square_x, square_y = tick.square
+            pygame.draw.rect(surface, color, (square_x, square_y, square_size, square_size))
             
-            square_color = color  # Same color as the tick
-            pygame.draw.rect(surface, square_color, (square_x, square_y, square_size, square_size))
-            
-            # Draw RPM number above the square
-            font_number = pygame.font.SysFont('Arial', 24, bold=True)
-            
-            # Find which numbered RPM this tick represents based on tick index
-            target_rpm = rpm_numbers[numbered_tick_indices.index(i)]
-            display_num = str(int(target_rpm // 1000))
-            
-            # Show numbers based on current RPM (handle None case)
+            # Show numbers based on current RPM (dim when no data)
             if current_rpm is None:
-                number_color = (80, 80, 0)  # Dim when no data
+                number_color = (80, 80, 0)
             else:
                 number_color = YELLOW if rpm <= current_rpm else (80, 80, 0)
             
-            number_text = font_number.render(display_num, True, number_color)
+            number_text = render_text(font_number, tick.label, True, number_color)
             number_rect = number_text.get_rect()
             number_x = square_x + square_size // 2 - number_rect.width // 2  # Center above square
             number_y = square_y - number_rect.height - 5  # Above the square
@@ -1499,25 +2097,12 @@ def draw_synthwave_grid(surface, value, is_speed=True, grid_x=650, grid_y=180):
     max_width = 280
     min_width = 60
     
-    def interpolate_color(color1, color2, factor):
-        return tuple(int(c1 + (c2 - c1) * factor) for c1, c2 in zip(color1, color2))
-    
+    # Speed: cyan->purple up to 40 mph, purple->red up to 85 mph
+    # RPM: cyan->purple up to 3000 rpm, purple->red up to 7000 rpm
     if is_speed:
-        # Speed-based colors (0-40 mph: cyan->purple, 40-85 mph: purple->red)
-        if value <= 40:
-            factor = value / 40.0
-            color = interpolate_color(NEON_CYAN, PURPLE, factor)
-        else:
-            factor = min((value - 40) / 45.0, 1.0)
-            color = interpolate_color(PURPLE, RED, factor)
+        color = gradient_color(SYNTHWAVE_SPEED_COLORS, value, GRADIENT_MAX_SPEED)
     else:
-        # RPM-based colors (0-3000 rpm: cyan->purple, 3000-7000 rpm: purple->red)
-        if value <= 3000:
-            factor = value / 3000.0
-            color = interpolate_color(NEON_CYAN, PURPLE, factor)
-        else:
-            factor = min((value - 3000) / 4000.0, 1.0)
-            color = interpolate_color(PURPLE, RED, factor)
+        color = gradient_color(SYNTHWAVE_RPM_COLORS, value, GRADIENT_MAX_RPM)
     
     # Horizontal perspective lines
     for i in range(8):
@@ -1544,169 +2129,69 @@ def draw_synthwave_grid(surface, value, is_speed=True, grid_x=650, grid_y=180):
 
 def draw_connection_status(surface, x_offset=10):
     """Draw connection status indicator"""
-    status_font = pygame.font.SysFont('Arial', 16, bold=True)
+    status_font = get_font('Arial', 16)
     if serial_connected:
         # No status display when connected (user doesn't want distraction)
         pass
     else:
         if was_ever_connected:
-            status_text = status_font.render("ARDUINO DISCONNECTED", True, RED)
+            status_text = render_text(status_font, "ARDUINO DISCONNECTED", True, RED)
         else:
-            status_text = status_font.render("DEMO MODE", True, YELLOW)
+            status_text = render_text(status_font, "DEMO MODE", True, YELLOW)
         surface.blit(status_text, (x_offset, 10))
 
 def draw_diagonal_speedometer_smooth(surface, current_speed):
     """Draw curved diagonal line with smooth bar filling - Corvette C4 version"""
-    # Calculated geometry (same as original speedometer)
-    line_start_x = SPEEDO_X_OFFSET
-    line_start_y = SPEEDO_Y_OFFSET
-    line_length = SPEEDO_LENGTH
-    angle_deg = 60
-    angle_rad = math.radians(angle_deg)
-    
-    line_end_x = line_start_x + line_length * math.cos(angle_rad)
-    line_end_y = line_start_y - line_length * math.sin(angle_rad)
-    
-    # Draw the curved path as a thick smooth filled bar with flat ends
+    # Same curve as the Synthwave speedometer, bar made of thin horizontal rects along it
     bar_thickness = 80  # Even thicker for speedometer (was 60, now 80)
+    segments = diagonal_bar_segments(SPEEDO_X_OFFSET, SPEEDO_Y_OFFSET, SPEEDO_LENGTH, speed_tick_count * 8,
+                                     bar_thickness, bar_thickness // 5)  # Thin rects look less boxy
     
-    # Calculate how much of the bar to fill based on current speed
+    # Background curve (full length, dimmed), then the filled portion up to the current speed
     speed_ratio = min(current_speed / max_speed, 1.0)
-    
-    # Draw the background curve (full length, dimmed)
-    for i in range(speed_tick_count * 8):  # More points for smoother curve
-        ratio = i / (speed_tick_count * 8 - 1)
-        
-        # Create a curved path
-        curve_intensity = 80
-        curve_offset = math.sin(ratio * math.pi) * curve_intensity
-        
-        # Position along the diagonal line with curve
-        base_x = line_start_x + ratio * (line_end_x - line_start_x)
-        base_y = line_start_y + ratio * (line_end_y - line_start_y)
-        
-        # Apply curve offset
-        center_x = base_x - curve_offset
-        center_y = base_y
-        
-        # Draw background segment as horizontal rectangle following curve direction
-        rect_width = bar_thickness
-        rect_height = bar_thickness // 5  # Even thinner height for less boxy appearance
-        rect = pygame.Rect(int(center_x - rect_width//2), int(center_y - rect_height//2), 
-                          rect_width, rect_height)
+    for rect in segments:
         pygame.draw.rect(surface, DULL_GREEN, rect)
-    
-    # Draw the filled portion (up to current speed)
-    fill_points = int(speed_tick_count * 8 * speed_ratio)
-    for i in range(fill_points):
-        ratio = i / (speed_tick_count * 8 - 1)
-        
-        # Create a curved path
-        curve_intensity = 80
-        curve_offset = math.sin(ratio * math.pi) * curve_intensity
-        
-        # Position along the diagonal line with curve
-        base_x = line_start_x + ratio * (line_end_x - line_start_x)
-        base_y = line_start_y + ratio * (line_end_y - line_start_y)
-        
-        # Apply curve offset
-        center_x = base_x - curve_offset
-        center_y = base_y
-        
-        # Draw filled segment as horizontal rectangle following curve direction
-        rect_width = bar_thickness
-        rect_height = bar_thickness // 5  # Even thinner height for less boxy appearance
-        rect = pygame.Rect(int(center_x - rect_width//2), int(center_y - rect_height//2), 
-                          rect_width, rect_height)
+    for rect in segments[:max(0, int(len(segments) * speed_ratio))]:
         pygame.draw.rect(surface, BRIGHT_GREEN, rect)
     
-    # Draw horizontal black grid lines - milestone positions + intermediate lines
-    # First draw milestone grid lines (matching milestone positions)
-    for speed_num in speed_numbers:
-        # Calculate position along the curve (same as milestone calculation)
-        ratio = speed_num / max_speed
-        curve_intensity = 80
-        curve_offset = math.sin(ratio * math.pi) * curve_intensity
-        
-        base_x = line_start_x + ratio * (line_end_x - line_start_x)
-        base_y = line_start_y + ratio * (line_end_y - line_start_y)
-        
-        grid_x = base_x - curve_offset
-        grid_y = base_y
-        
-        # Draw horizontal black grid line through the whole bar at milestone level
-        grid_line_left = grid_x - bar_thickness  # Extend beyond bar left
-        grid_line_right = grid_x + bar_thickness  # Extend beyond bar right
+    # Horizontal black grid lines through the whole bar - milestones, then 2 thinner lines between each
+    milestones = diagonal_speed_marks(SPEEDO_X_OFFSET, SPEEDO_Y_OFFSET, SPEEDO_LENGTH, tuple(speed_numbers), max_speed)
+    for grid_x, grid_y in milestones:
         pygame.draw.line(surface, BLACK, 
-                        (int(grid_line_left), int(grid_y)), 
-                        (int(grid_line_right), int(grid_y)), 2)
-    
-    # Add intermediate grid lines (2 lines between each milestone)
-    for i in range(len(speed_numbers) - 1):
-        current_speed_num = speed_numbers[i]
-        next_speed_num = speed_numbers[i + 1]
-        
-        # Add 2 intermediate lines between current and next milestone
-        for j in range(1, 3):  # j = 1, 2 (two intermediate lines)
-            intermediate_speed = current_speed_num + (next_speed_num - current_speed_num) * (j / 3.0)
-            
-            # Calculate position for intermediate grid line
-            ratio = intermediate_speed / max_speed
-            curve_intensity = 80
-            curve_offset = math.sin(ratio * math.pi) * curve_intensity
-            
-            base_x = line_start_x + ratio * (line_end_x - line_start_x)
-            base_y = line_start_y + ratio * (line_end_y - line_start_y)
-            
-            grid_x = base_x - curve_offset
-            grid_y = base_y
-            
-            # Draw intermediate grid line (slightly thinner)
-            grid_line_left = grid_x - bar_thickness  # Extend beyond bar left
-            grid_line_right = grid_x + bar_thickness  # Extend beyond bar right
-            pygame.draw.line(surface, BLACK, 
-                            (int(grid_line_left), int(grid_y)), 
-                            (int(grid_line_right), int(grid_y)), 1)  # Thinner line for intermediate
+                        (int(grid_x - bar_thickness), int(grid_y)), 
+                        (int(grid_x + bar_thickness), int(grid_y)), 2)
+    for grid_x, grid_y in diagonal_speed_marks(SPEEDO_X_OFFSET, SPEEDO_Y_OFFSET, SPEEDO_LENGTH,
+                                               intermediate_speeds(tuple(speed_numbers)), max_speed):
+        pygame.draw.line(surface, BLACK, 
+                        (int(grid_x - bar_thickness), int(grid_y)), 
+                        (int(grid_x + bar_thickness), int(grid_y)), 1)
     
     # Draw horizontal milestone lines and speed numbers at key positions
-    for speed_num in speed_numbers:
-        # Calculate position along the curve
-        ratio = speed_num / max_speed
-        curve_intensity = 80
-        curve_offset = math.sin(ratio * math.pi) * curve_intensity
-        
-        base_x = line_start_x + ratio * (line_end_x - line_start_x)
-        base_y = line_start_y + ratio * (line_end_y - line_start_y)
-        
-        tick_x = base_x - curve_offset
-        tick_y = base_y
-        
-        # Draw horizontal milestone line starting to the left of the bar with spacing
-        line_start_x_pos = tick_x - bar_thickness // 2 - 15  # Reduced gap from bar (was 30px, now 15px)
-        line_end_x_pos = tick_x - 80  # Extend leftward
+    font_number = get_font('Arial', 30)
+    for speed_num, (tick_x, tick_y) in zip(speed_numbers, milestones):
+        # Milestone line starts to the left of the bar with spacing and extends leftward
+        line_start_x_pos = tick_x - bar_thickness // 2 - 15
+        line_end_x_pos = tick_x - 80
         pygame.draw.line(surface, YELLOW if speed_num <= current_speed else (100, 100, 0), 
                         (int(line_start_x_pos), int(tick_y)), (int(line_end_x_pos), int(tick_y)), 3)
         
-        # Draw speed numbers (both reached and dimmed unreached)
-        # Position number with much more spacing from milestone line
-        number_x = tick_x - 150  # Much more spacing from milestone line (was 130, now 150)
-        number_y = tick_y - 12
-        
-        font_number = pygame.font.SysFont('Arial', 30, bold=True)
-        
         # Color based on whether speed is reached (like tachometer)
         if speed_num <= current_speed:
             number_color = YELLOW  # Bright when reached
         else:
             number_color = (100, 100, 0)  # Dimmed yellow when not reached
         
-        number_text = font_number.render(str(speed_num), True, number_color)
-        surface.blit(number_text, (number_x, number_y))
+        # Number well clear of the milestone line
+        number_text = render_text(font_number, str(speed_num), True, number_color)
+        surface.blit(number_text, (tick_x - 150, tick_y - 12))
 
 def draw_modified_tachometer_smooth(surface, rpm):
     """Draw RPM-to-power curve tachometer with smooth bar filling - Corvette C4 version"""
     # Use the same mountain-shaped curve as original Synthwave tachometer
     bar_thickness = 60  # Much thicker (was 20, now 60)
+    total_points = 500  # Much more points for smoother curve (was 200, now 500)
+    segments = mountain_bar_segments(TACHO_X_OFFSET, TACHO_Y_OFFSET, max_rpm, total_points,
+                                     bar_thickness // 5, bar_thickness)  # Thin rects look less boxy
     
     # Calculate how much of the curve to fill based on current RPM
     # Safety check for None values
@@ -1714,99 +2199,51 @@ def draw_modified_tachometer_smooth(surface, rpm):
         rpm = 0
     rpm_ratio = min(rpm / max_rpm, 1.0)
     
-    # Draw the background curve (full length, dimmed)
-    total_points = 500  # Much more points for smoother curve (was 200, now 500)
-    for i in range(total_points):
-        point_rpm = (i / (total_points - 1)) * max_rpm
-        tick_x, tick_y = get_modified_tachometer_position(point_rpm)
-        
-        # Draw background segment as vertical rectangle following curve direction
-        rect_width = bar_thickness // 5  # Even thinner width for less boxy appearance (was //3, now //5)
-        rect_height = bar_thickness
-        rect = pygame.Rect(int(tick_x - rect_width//2), int(tick_y - rect_height//2), 
-                          rect_width, rect_height)
-        
-        # Color background to match filled bar progression but dimmed
-        if point_rpm <= 4000:
-            bg_color = DULL_GREEN  # Dimmed green
-        elif point_rpm <= 4500:
+    # Background curve (full length), coloured like the filled bar but dimmed
+    for point_rpm, rect in segments:
+        if point_rpm <= 4500:
             bg_color = DULL_GREEN  # Dimmed green
-        elif point_rpm <= 5000:
+        elif point_rpm <= 5400:
             bg_color = (100, 100, 0)  # Dimmed yellow
         else:
-            if point_rpm <= 5400:
-                bg_color = (100, 100, 0)  # Dimmed yellow
-            else:
-                bg_color = (100, 0, 0)  # Dimmed red
-        
+            bg_color = (100, 0, 0)  # Dimmed red
         pygame.draw.rect(surface, bg_color, rect)
     
-    # Draw the filled portion (up to current RPM)
-    fill_points = int(total_points * rpm_ratio)
-    for i in range(fill_points):
-        point_rpm = (i / (total_points - 1)) * max_rpm
-        tick_x, tick_y = get_modified_tachometer_position(point_rpm)
-        
-        # Choose color based on RPM (same as original)
-        if point_rpm <= 4000:
-            fill_color = BRIGHT_GREEN
-        elif point_rpm <= 4500:
+    # Filled portion (up to current RPM)
+    for point_rpm, rect in segments[:max(0, int(total_points * rpm_ratio))]:
+        if point_rpm <= 4500:
             fill_color = BRIGHT_GREEN
-        elif point_rpm <= 5000:
+        elif point_rpm <= 5400:
             fill_color = YELLOW
         else:
-            if point_rpm <= 5400:
-                fill_color = YELLOW
-            else:
-                fill_color = RED
-        
-        # Draw filled segment as vertical rectangle following curve direction
-        rect_width = bar_thickness // 5  # Even thinner width for less boxy appearance (was //3, now //5)
-        rect_height = bar_thickness
-        rect = pygame.Rect(int(tick_x - rect_width//2), int(tick_y - rect_height//2), 
-                          rect_width, rect_height)
+            fill_color = RED
         pygame.draw.rect(surface, fill_color, rect)
     
-    # Draw vertical black grid lines on the bar for visual separation
-    grid_spacing = 20  # Grid line every 20 points along the curve
-    for i in range(0, total_points, grid_spacing):
-        grid_rpm = (i / (total_points - 1)) * max_rpm
-        grid_x, grid_y = get_modified_tachometer_position(grid_rpm)
-        
-        # Draw vertical black grid line through the whole bar
-        grid_line_top = grid_y - bar_thickness  # Extend beyond bar top
-        grid_line_bottom = grid_y + bar_thickness  # Extend beyond bar bottom
+    # Vertical black grid lines through the whole bar every 20 points for visual separation
+    for grid_rpm, grid_x, grid_y in mountain_curve(TACHO_X_OFFSET, TACHO_Y_OFFSET, max_rpm, total_points)[::20]:
         pygame.draw.line(surface, BLACK, 
-                        (int(grid_x), int(grid_line_top)), 
-                        (int(grid_x), int(grid_line_bottom)), 2)
+                        (int(grid_x), int(grid_y - bar_thickness)), 
+                        (int(grid_x), int(grid_y + bar_thickness)), 2)
     
     # Draw milestone vertical lines and numbers at key positions
-    for rpm_num in rpm_numbers:
-        tick_x, tick_y = get_modified_tachometer_position(rpm_num)
-        
-        # Draw vertical milestone line starting above the bar with more spacing
-        line_start_y = tick_y - bar_thickness // 2 - 20  # Start above curve with 20px spacing (was 10px)
-        line_end_y = tick_y - 80  # Extend upward (shorter line)
+    font_number = get_font('Arial', 24)
+    for rpm_num, (tick_x, tick_y) in zip(rpm_numbers, mountain_rpm_marks(TACHO_X_OFFSET, TACHO_Y_OFFSET,
+                                                                         max_rpm, tuple(rpm_numbers))):
+        # Vertical milestone line starting 20px above the bar, extending upward
+        line_start_y = tick_y - bar_thickness // 2 - 20
+        line_end_y = tick_y - 80
         pygame.draw.line(surface, YELLOW if rpm_num <= rpm else (100, 100, 0), 
                         (int(tick_x), int(line_start_y)), (int(tick_x), int(line_end_y)), 3)
         
-        # Draw RPM numbers (both reached and dimmed unreached)
-        # Position number higher above the curve
-        number_x = tick_x
-        number_y = tick_y - 100  # Moved up from -40 to -100
-        
-        # Draw number (show as x1000 format)
-        display_num = int(rpm_num / 1000)
-        font_number = pygame.font.SysFont('Arial', 24, bold=True)
-        
         # Color based on whether RPM is reached (like other styles)
         if rpm_num <= rpm:
             number_color = YELLOW  # Bright when reached
         else:
             number_color = (100, 100, 0)  # Dimmed yellow when not reached
         
-        number_text = font_number.render(str(display_num), True, number_color)
-        text_rect = number_text.get_rect(center=(number_x, number_y))
+        # Number (x1000 format) higher above the curve
+        number_text = render_text(font_number, str(int(rpm_num / 1000)), True, number_color)
+        text_rect = number_text.get_rect(center=(tick_x, tick_y - 100))
         surface.blit(number_text, text_rect)
 
 def draw_redline_warning(surface, rpm):
@@ -1818,18 +2255,18 @@ def draw_redline_warning(surface, rpm):
         start_y = TACHO_DIGITAL_Y - 170 + 105 + 40  # Below RPM/100 label
         
         # 80s style font - use a bold, blocky font (50% larger)
-        warning_font = pygame.font.SysFont('Courier', 42, bold=True)  # Increased from 28 to 42 (50% larger)
+        warning_font = get_font('Courier', 42)  # Increased from 28 to 42 (50% larger)
         
         # Color based on RPM level
         if rpm > 5500:
             # Red after 5500 RPM with pulsing effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.015)) * 0.3 + 0.7  # Faster pulse, less dramatic
+            pulse = abs(math.sin(dashboard_clock() * 0.015)) * 0.3 + 0.7  # Faster pulse, less dramatic
             warning_color = (int(255 * pulse), 0, 0)
         else:
             # Yellow after 4500 RPM
             warning_color = YELLOW
         
-        warning_text = warning_font.render("REDLINE", True, warning_color)
+        warning_text = render_text(warning_font, "REDLINE", True, warning_color)
         
         # Position the text (moved 25 pixels to the right)
         text_rect = warning_text.get_rect()
@@ -1841,11 +2278,17 @@ def draw_rounded_rect_border(surface, color, rect, radius, thickness=3):
     """Draw a simple rectangular border"""
     pygame.draw.rect(surface, color, rect, thickness)
 
-def draw_dsi_7_segment_digit(surface, x, y, digit, color, size=30, dim_factor=1.0):
+def draw_dsi_7_segment_digit(surface, x, y, digit, color, size=30, dim_factor=1.0, atlas=True):
     """Draw a 7-segment digit specifically sized for DSI gauges with optional dimming"""
     if digit < 0 or digit > 9:
         return
     
+    # Blit the pre-rendered digit - atlas=False draws the segment polygons (sprite builds)
+    if atlas:
+        sprite, pad = get_digit_sprite(draw_dsi_7_segment_digit, digit, color, size, dim_factor)
+        surface.blit(sprite, (x - pad, y - pad))
+        return
+    
     segments = SEGMENTS[digit]
     w, h = size, size * 1.5
     gap = 2
@@ -1951,9 +2394,75 @@ def draw_dsi_multi_digit_display(surface, value, num_digits, start_x, start_y, d
     if decimal_pos is not None:
         decimal_x = start_x + decimal_pos * digit_spacing + size // 8  # Fine-tuned position between digits
         decimal_y = start_y + int(size * 1.5) - 8
-        pygame.draw.circle(surface, color, (decimal_x, decimal_y), 4)
+        draw_decimal_point(surface, decimal_x, decimal_y, '.', color, 8)
+
+# DSI fuel gauge ticks - 17 for a resolution of 1/16th, every 4th labelled (E, 1/4, 1/2, 3/4, F)
+DSI_FUEL_TICK_LABELS = ["E", "", "", "", "1/4", "", "", "", "1/2", "", "", "", "3/4", "", "", "", "F"]
+
+def dsi_fuel_ticks_memo(fuel_level, center_x, y_end, height, font):
+    """Memo slot and state of draw_dsi_fuel_ticks - how many ticks and labels are lit"""
+    tick_count = len(DSI_FUEL_TICK_LABELS)
+    lit_ticks = sum(1 for i in range(tick_count) if i / (tick_count - 1) <= (fuel_level + 0.001))
+    lit_labels = sum(1 for i in range(tick_count) if i / (tick_count - 1) <= fuel_level)
+    return (center_x, y_end, height, font), (lit_ticks, lit_labels)
+
+@memoize_gauge(dsi_fuel_ticks_memo)
+def draw_dsi_fuel_ticks(dsi_surface, fuel_level, fuel_center_x, fuel_y_end, fuel_height, font_small):
+    """Draw the DSI fuel level ticks and their labels, E at the bottom, F at the top"""
+    # Draw fuel level ticks as horizontal bars (like speedometer) - higher resolution
+    tick_count = len(DSI_FUEL_TICK_LABELS)
+    tick_labels = DSI_FUEL_TICK_LABELS
+    
+    for i in range(tick_count):
+        # Calculate position from bottom to top (E at bottom, F at top)
+        tick_y = fuel_y_end - (i / (tick_count - 1)) * fuel_height
+        fuel_ratio = i / (tick_count - 1)  # 0.0 to 1.0
+        
+        # Determine tick properties based on fuel level
+        # Add small tolerance for floating-point precision (fixes 100% display issue)
+        if fuel_ratio <= (fuel_level + 0.001):
+            # Active ticks (fuel present)
+            if fuel_ratio < 0.1:  # Very low fuel - red
+                tick_color = RED
+            elif fuel_ratio < 0.25:  # Low fuel - orange
+                tick_color = ORANGE
+            else:  # Normal fuel - green
+                tick_color = BRIGHT_GREEN
+        else:
+            # Inactive ticks (no fuel)
+            if fuel_ratio < 0.1:
+                tick_color = (100, 0, 0)  # Dim red
+            elif fuel_ratio < 0.25:
+                tick_color = (100, 50, 0)  # Dim orange
+            else:
+                tick_color = DULL_GREEN  # Dim green
+        
+        # All ticks same length and 25% longer
+        tick_width = int(80 * 1.25)  # 100px (25% longer)
+        tick_thickness = 12  # Reduced thickness for better fit in window (was 16)
+        
+        # Calculate tick position (centered)
+        tick_start_x = fuel_center_x - tick_width // 2
+        tick_end_x = fuel_center_x + tick_width // 2
+        
+        # Draw thick horizontal tick (like speedometer)
+        pygame.draw.line(dsi_surface, tick_color, 
+                        (tick_start_x, tick_y), 
+                        (tick_end_x, tick_y), 
+                        tick_thickness)
+        
+        # Draw label if exists (to the left of the tick with dash)
+        if tick_labels[i]:
+            label_color = YELLOW if fuel_ratio <= fuel_level else (80, 80, 0)
+            label_text = render_text(font_small, tick_labels[i], True, label_color)
+            label_rect = label_text.get_rect()
+            
+            # Position label to the left of tick
+            label_x = tick_start_x - label_rect.width - 20  # More space for dash
+            label_y = tick_y - label_rect.height // 2
+            dsi_surface.blit(label_text, (label_x, label_y))
 
-def draw_dsi_screen_content(surface, speed, rpm):
+def draw_dsi_screen_content(surface, speed, rpm, layer=None):
     """Draw C4 Corvette style dashboard for the 3rd DSI screen (800x480)"""
     global current_fuel_level, current_oil_pressure, current_coolant_temp, current_oil_temp
     global switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts
@@ -1963,11 +2472,19 @@ def draw_dsi_screen_content(surface, speed, rpm):
     # Use the passed surface directly (should be 800x480 landscape)
     dsi_surface = surface
     
+    # Borders, titles, units, symbols and fuel scale dashes come from the static layer cache -
+    # the layer is opaque (black background), layer="static" draws only those parts
+    if layer is None:
+        static, position = get_static_layer(("dsi_screen",), dsi_surface.get_size(),
+                                            lambda s: draw_dsi_screen_content(s, speed, rpm, "static"), BLACK)
+        dsi_surface.blit(static, position)
+    static_pass = layer == "static"
+    
     # Fonts matching the main dashboard
-    font_large = pygame.font.SysFont('Arial', 32, bold=True)  # For titles
-    font_medium = pygame.font.SysFont('Arial', 24, bold=True)  # For labels
-    font_small = pygame.font.SysFont('Arial', 18, bold=True)   # For small text
-    font_digits = pygame.font.SysFont('Arial', 36, bold=True)  # For digital displays
+    font_large = get_font('Arial', 32)  # For titles
+    font_medium = get_font('Arial', 24)  # For labels
+    font_small = get_font('Arial', 18)   # For small text
+    font_digits = get_font('Arial', 36)  # For digital displays
     
     # Colors matching main dashboard
     border_color = YELLOW
@@ -1986,10 +2503,11 @@ def draw_dsi_screen_content(surface, speed, rpm):
     
     # === 1. GAUGE 1 (Top Left) - Oil Pressure or Oil Temperature ===
     oil_rect = (margin, top_margin, gauge_width, gauge_height)
-    draw_rounded_rect_border(dsi_surface, border_color, oil_rect, corner_radius, 3)
+    if static_pass:
+        draw_rounded_rect_border(dsi_surface, border_color, oil_rect, corner_radius, 3)
     
     # Determine which gauge to show based on switch states
-    time_ms = pygame.time.get_ticks()
+    time_ms = dashboard_clock()
     
     if switch_oil_pressure:
         # Show Oil Pressure Gauge
@@ -2016,18 +2534,19 @@ def draw_dsi_screen_content(surface, speed, rpm):
             warning_light_active = pressure_kpa < psi_to_kpa(5)  # Convert 5 PSI threshold to kPa
         else:
             warning_light_active = oil_pressure < 5
-        if warning_light_active:
+        if warning_light_active and not static_pass:
             # Blinking red rectangular warning light - same height as digits
             # Stay on most of the time, off briefly
-            blink_time = pygame.time.get_ticks() // 200  # Faster cycle (200ms)
+            blink_time = dashboard_clock() // 200  # Faster cycle (200ms)
             if blink_time % 5 != 0:  # Show light 4 out of 5 cycles (80% on, 20% off)
                 digit_height = int(44 * 1.5)  # Same height as 7-segment digits
                 warning_rect = (oil_rect[0] + 80, oil_rect[1] + 40, 25, digit_height)
                 pygame.draw.rect(dsi_surface, RED, warning_rect, 0)
         
-        # Pressure unit label (left side)
-        pressure_text = font_medium.render(pressure_unit, True, text_color)
-        dsi_surface.blit(pressure_text, (oil_rect[0] + 15, oil_rect[1] + 35))
+        if static_pass:
+            # Pressure unit label (left side)
+            pressure_text = render_text(font_medium, pressure_unit, True, text_color)
+            dsi_surface.blit(pressure_text, (oil_rect[0] + 15, oil_rect[1] + 35))
         
         # Oil pressure digits (right side) - 7-segment display with leading zero dimming
         digit_size = int(35 * 1.25)  # 44 (25% larger)
@@ -2035,26 +2554,27 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = oil_rect[0] + gauge_width - 3 * digit_spacing - 15
         start_y = oil_rect[1] + 40
         
-        draw_dsi_multi_digit_display(dsi_surface, display_pressure, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
-        
-        # "OIL PRESS" label and oil symbol (bottom)
-        oil_label = font_small.render("OIL PRESS", True, text_color)
-        oil_label_rect = oil_label.get_rect()
-        dsi_surface.blit(oil_label, (oil_rect[0] + (gauge_width - oil_label_rect.width) // 2, oil_rect[1] + gauge_height - 35))
+        if not static_pass:
+            draw_dsi_multi_digit_display(dsi_surface, display_pressure, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
         
-        # Oil symbol from PNG
-        if oil_symbol:
-            symbol_x = oil_rect[0] + (gauge_width - oil_label_rect.width) // 2 - 45  # Moved further left
-            symbol_y = oil_rect[1] + gauge_height - 55  # Moved up
-            # Scale the symbol to appropriate size (about 40x40 pixels - 2x larger)
-            scaled_symbol = pygame.transform.scale(oil_symbol, (40, 40))
-            dsi_surface.blit(scaled_symbol, (symbol_x, symbol_y))
-        else:
-            # Fallback: Simple oil can symbol (rectangle with spout)
-            oil_can_x = oil_rect[0] + (gauge_width - oil_label_rect.width) // 2 - 25
-            oil_can_y = oil_rect[1] + gauge_height - 30
-            pygame.draw.rect(dsi_surface, text_color, (oil_can_x, oil_can_y, 12, 16), 2)
-            pygame.draw.rect(dsi_surface, text_color, (oil_can_x + 12, oil_can_y + 2, 6, 4), 2)
+        if static_pass:
+            # "OIL PRESS" label and oil symbol (bottom)
+            oil_label = render_text(font_small, "OIL PRESS", True, text_color)
+            oil_label_rect = oil_label.get_rect()
+            dsi_surface.blit(oil_label, (oil_rect[0] + (gauge_width - oil_label_rect.width) // 2, oil_rect[1] + gauge_height - 35))
+            
+            # Oil symbol from PNG (about 40x40 pixels - 2x larger)
+            oil_symbol = assets.get("oil", (40, 40))
+            if oil_symbol:
+                symbol_x = oil_rect[0] + (gauge_width - oil_label_rect.width) // 2 - 45  # Moved further left
+                symbol_y = oil_rect[1] + gauge_height - 55  # Moved up
+                dsi_surface.blit(oil_symbol, (symbol_x, symbol_y))
+            else:
+                # Fallback: Simple oil can symbol (rectangle with spout)
+                oil_can_x = oil_rect[0] + (gauge_width - oil_label_rect.width) // 2 - 25
+                oil_can_y = oil_rect[1] + gauge_height - 30
+                pygame.draw.rect(dsi_surface, text_color, (oil_can_x, oil_can_y, 12, 16), 2)
+                pygame.draw.rect(dsi_surface, text_color, (oil_can_x + 12, oil_can_y + 2, 6, 4), 2)
     
     elif switch_oil_temp:
         # Show Oil Temperature Gauge
@@ -2083,72 +2603,75 @@ def draw_dsi_screen_content(surface, speed, rpm):
             warning_light_active = oil_temp_celsius > fahrenheit_to_celsius(250)  # Convert 250°F threshold to °C
         else:
             warning_light_active = oil_temp > 250
-        if warning_light_active:
+        if warning_light_active and not static_pass:
             # Blinking red rectangular warning light - same height as digits
             # Stay on most of the time, off briefly
-            blink_time = pygame.time.get_ticks() // 200  # Faster cycle (200ms)
+            blink_time = dashboard_clock() // 200  # Faster cycle (200ms)
             if blink_time % 5 != 0:  # Show light 4 out of 5 cycles (80% on, 20% off)
                 digit_height = int(44 * 1.5)  # Same height as 7-segment digits
                 warning_rect = (oil_rect[0] + gauge_width - 80, oil_rect[1] + 40, 25, digit_height)
                 pygame.draw.rect(dsi_surface, RED, warning_rect, 0)
         
-        # Oil temperature digits (left side) - handle "LO" temperature or normal display
-        if display_oil_temp <= -999:  # Special "LO" temperature value from Arduino
-            # Display "LO" like original C4 cluster
-            lo_font = pygame.font.SysFont('Arial', 48, bold=True)
-            lo_text = lo_font.render("LO", True, digit_color)
-            lo_rect = lo_text.get_rect()
-            dsi_surface.blit(lo_text, (oil_rect[0] + 30, oil_rect[1] + 35))
-        else:
-            # Normal temperature display - 7-segment display with negative sign support and leading zero dimming
-            temp_value = int(display_oil_temp)
-            is_negative = temp_value < 0
-            abs_temp = abs(temp_value)
+        if not static_pass:
+            # Oil temperature digits (left side) - handle "LO" temperature or normal display
+            if display_oil_temp <= -999:  # Special "LO" temperature value from Arduino
+                # Display "LO" like original C4 cluster
+                lo_font = get_font('Arial', 48)
+                lo_text = render_text(lo_font, "LO", True, digit_color)
+                lo_rect = lo_text.get_rect()
+                dsi_surface.blit(lo_text, (oil_rect[0] + 30, oil_rect[1] + 35))
+            else:
+                # Normal temperature display - 7-segment display with negative sign support and leading zero dimming
+                temp_value = int(display_oil_temp)
+                is_negative = temp_value < 0
+                abs_temp = abs(temp_value)
             
-            digit_size = int(35 * 1.25)  # 44 (25% larger)
-            digit_spacing = int(40 * 1.5)  # 60 (50% more spacing)
-            # Adjust start position to make room for negative sign
-            base_start_x = oil_rect[0] + 15
-            start_x = base_start_x + (25 if is_negative else 0)  # Move digits right if negative
-            start_y = oil_rect[1] + 40
+                digit_size = int(35 * 1.25)  # 44 (25% larger)
+                digit_spacing = int(40 * 1.5)  # 60 (50% more spacing)
+                # Adjust start position to make room for negative sign
+                base_start_x = oil_rect[0] + 15
+                start_x = base_start_x + (25 if is_negative else 0)  # Move digits right if negative
+                start_y = oil_rect[1] + 40
             
-            # Draw negative sign if temperature is negative
-            if is_negative:
-                minus_font = pygame.font.SysFont('Arial', 32, bold=True)  # Larger font for longer minus
-                minus_text = minus_font.render("−", True, digit_color)  # Using proper minus symbol (longer)
-                dsi_surface.blit(minus_text, (base_start_x + 5, start_y + 12))  # Positioned before digits
+                # Draw negative sign if temperature is negative
+                if is_negative:
+                    minus_font = get_font('Arial', 32)  # Larger font for longer minus
+                    minus_text = render_text(minus_font, "−", True, digit_color)  # Using proper minus symbol (longer)
+                    dsi_surface.blit(minus_text, (base_start_x + 5, start_y + 12))  # Positioned before digits
             
-            draw_dsi_multi_digit_display(dsi_surface, abs_temp, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
-        
-        # Temperature unit symbol (right side)
-        temp_symbol = font_medium.render(temp_unit, True, text_color)
-        temp_symbol_rect = temp_symbol.get_rect()
-        dsi_surface.blit(temp_symbol, (oil_rect[0] + gauge_width - temp_symbol_rect.width - 15, oil_rect[1] + 35))
-        
-        # "OIL TEMP" label and symbols (bottom) - moved right to avoid symbol overlap
-        oil_temp_label = font_small.render("OIL TEMP", True, text_color)
-        oil_temp_label_rect = oil_temp_label.get_rect()
-        dsi_surface.blit(oil_temp_label, (oil_rect[0] + (gauge_width - oil_temp_label_rect.width) // 2 + 30, oil_rect[1] + gauge_height - 35))
-        
-        # Oil symbol and coolant temp symbol from PNG (side by side)
-        if oil_symbol and coolant_temp_symbol:
-            # Oil symbol (left)
-            oil_symbol_x = oil_rect[0] + (gauge_width - oil_temp_label_rect.width) // 2 - 65  # Further left for two symbols
-            oil_symbol_y = oil_rect[1] + gauge_height - 55  # Moved up
-            scaled_oil_symbol = pygame.transform.scale(oil_symbol, (40, 40))
-            dsi_surface.blit(scaled_oil_symbol, (oil_symbol_x, oil_symbol_y))
+                draw_dsi_multi_digit_display(dsi_surface, abs_temp, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
+        
+        if static_pass:
+            # Temperature unit symbol (right side)
+            temp_symbol = render_text(font_medium, temp_unit, True, text_color)
+            temp_symbol_rect = temp_symbol.get_rect()
+            dsi_surface.blit(temp_symbol, (oil_rect[0] + gauge_width - temp_symbol_rect.width - 15, oil_rect[1] + 35))
+            
+            # "OIL TEMP" label and symbols (bottom) - moved right to avoid symbol overlap
+            oil_temp_label = render_text(font_small, "OIL TEMP", True, text_color)
+            oil_temp_label_rect = oil_temp_label.get_rect()
+            dsi_surface.blit(oil_temp_label, (oil_rect[0] + (gauge_width - oil_temp_label_rect.width) // 2 + 30, oil_rect[1] + gauge_height - 35))
             
-            # Coolant temp symbol (right of oil symbol)
-            temp_symbol_x = oil_symbol_x + 45  # 45 pixels to the right
-            temp_symbol_y = oil_symbol_y
-            scaled_temp_symbol = pygame.transform.scale(coolant_temp_symbol, (40, 40))
-            dsi_surface.blit(scaled_temp_symbol, (temp_symbol_x, temp_symbol_y))
+            # Oil symbol and coolant temp symbol from PNG (side by side)
+            oil_symbol = assets.get("oil", (40, 40))
+            coolant_temp_symbol = assets.get("coolant_temp", (40, 40))
+            if oil_symbol and coolant_temp_symbol:
+                # Oil symbol (left)
+                oil_symbol_x = oil_rect[0] + (gauge_width - oil_temp_label_rect.width) // 2 - 65  # Further left for two symbols
+                oil_symbol_y = oil_rect[1] + gauge_height - 55  # Moved up
+                dsi_surface.blit(oil_symbol, (oil_symbol_x, oil_symbol_y))
+            
+                # Coolant temp symbol (right of oil symbol)
+                temp_symbol_x = oil_symbol_x + 45  # 45 pixels to the right
+                temp_symbol_y = oil_symbol_y
+                dsi_surface.blit(coolant_temp_symbol, (temp_symbol_x, temp_symbol_y))
     
     # If no switches active, just show empty gauge border
     
     # === 2. GAUGE 2 (Top Right) - Coolant Temperature or Volts ===
     coolant_rect = (DSI_SCREEN_WIDTH - gauge_width - margin, top_margin, gauge_width, gauge_height)
-    draw_rounded_rect_border(dsi_surface, border_color, coolant_rect, corner_radius, 3)
+    if static_pass:
+        draw_rounded_rect_border(dsi_surface, border_color, coolant_rect, corner_radius, 3)
     
     if switch_coolant_temp:
         # Show Coolant Temperature Gauge
@@ -2176,66 +2699,67 @@ def draw_dsi_screen_content(surface, speed, rpm):
             warning_light_active = coolant_temp_celsius > fahrenheit_to_celsius(230)  # Convert 230°F threshold to °C
         else:
             warning_light_active = coolant_temp > 230
-        if warning_light_active:
+        if warning_light_active and not static_pass:
             # Blinking red rectangular warning light - same height as digits
             # Stay on most of the time, off briefly
-            blink_time = pygame.time.get_ticks() // 200  # Faster cycle (200ms)
+            blink_time = dashboard_clock() // 200  # Faster cycle (200ms)
             if blink_time % 5 != 0:  # Show light 4 out of 5 cycles (80% on, 20% off)
                 digit_height = int(44 * 1.5)  # Same height as 7-segment digits
                 warning_rect = (coolant_rect[0] + gauge_width - 80, coolant_rect[1] + 40, 25, digit_height)
                 pygame.draw.rect(dsi_surface, RED, warning_rect, 0)
         
-        # Temperature digits (left side) - handle "LO" temperature or normal display
-        if display_coolant_temp <= -999:  # Special "LO" temperature value from Arduino
-            # Display "LO" like original C4 cluster
-            lo_font = pygame.font.SysFont('Arial', 48, bold=True)
-            lo_text = lo_font.render("LO", True, digit_color)
-            lo_rect = lo_text.get_rect()
-            dsi_surface.blit(lo_text, (coolant_rect[0] + 30, coolant_rect[1] + 35))
-        else:
-            # Normal temperature display - 7-segment display with negative sign support and leading zero dimming
-            temp_value = int(display_coolant_temp)
-            is_negative = temp_value < 0
-            abs_temp = abs(temp_value)
+        if not static_pass:
+            # Temperature digits (left side) - handle "LO" temperature or normal display
+            if display_coolant_temp <= -999:  # Special "LO" temperature value from Arduino
+                # Display "LO" like original C4 cluster
+                lo_font = get_font('Arial', 48)
+                lo_text = render_text(lo_font, "LO", True, digit_color)
+                lo_rect = lo_text.get_rect()
+                dsi_surface.blit(lo_text, (coolant_rect[0] + 30, coolant_rect[1] + 35))
+            else:
+                # Normal temperature display - 7-segment display with negative sign support and leading zero dimming
+                temp_value = int(display_coolant_temp)
+                is_negative = temp_value < 0
+                abs_temp = abs(temp_value)
             
-            digit_size = int(35 * 1.25)  # 44 (25% larger)
-            digit_spacing = int(40 * 1.5)  # 60 (50% more spacing)
-            # Adjust start position to make room for negative sign
-            base_start_x = coolant_rect[0] + 15
-            start_x = base_start_x + (25 if is_negative else 0)  # Move digits right if negative
-            start_y = coolant_rect[1] + 40
+                digit_size = int(35 * 1.25)  # 44 (25% larger)
+                digit_spacing = int(40 * 1.5)  # 60 (50% more spacing)
+                # Adjust start position to make room for negative sign
+                base_start_x = coolant_rect[0] + 15
+                start_x = base_start_x + (25 if is_negative else 0)  # Move digits right if negative
+                start_y = coolant_rect[1] + 40
             
-            # Draw negative sign if temperature is negative
-            if is_negative:
-                minus_font = pygame.font.SysFont('Arial', 32, bold=True)  # Larger font for longer minus
-                minus_text = minus_font.render("−", True, digit_color)  # Using proper minus symbol (longer)
-                dsi_surface.blit(minus_text, (base_start_x + 5, start_y + 12))  # Positioned before digits
+                # Draw negative sign if temperature is negative
+                if is_negative:
+                    minus_font = get_font('Arial', 32)  # Larger font for longer minus
+                    minus_text = render_text(minus_font, "−", True, digit_color)  # Using proper minus symbol (longer)
+                    dsi_surface.blit(minus_text, (base_start_x + 5, start_y + 12))  # Positioned before digits
             
-            draw_dsi_multi_digit_display(dsi_surface, abs_temp, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
-        
-        # Temperature unit symbol (right side)
-        temp_symbol = font_medium.render(temp_unit, True, text_color)
-        temp_symbol_rect = temp_symbol.get_rect()
-        dsi_surface.blit(temp_symbol, (coolant_rect[0] + gauge_width - temp_symbol_rect.width - 15, coolant_rect[1] + 35))
-        
-        # "COOLANT TEMP" label and thermometer symbol (bottom)
-        coolant_label = font_small.render("COOLANT TEMP", True, text_color)
-        coolant_label_rect = coolant_label.get_rect()
-        dsi_surface.blit(coolant_label, (coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2, coolant_rect[1] + gauge_height - 35))
-        
-        # Coolant temperature symbol from PNG
-        if coolant_temp_symbol:
-            symbol_x = coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2 - 45  # Moved further left
-            symbol_y = coolant_rect[1] + gauge_height - 55  # Moved up
-            # Scale the symbol to appropriate size (about 40x40 pixels - 2x larger)
-            scaled_symbol = pygame.transform.scale(coolant_temp_symbol, (40, 40))
-            dsi_surface.blit(scaled_symbol, (symbol_x, symbol_y))
-        else:
-            # Fallback: Simple thermometer symbol
-            therm_x = coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2 - 25
-            therm_y = coolant_rect[1] + gauge_height - 30
-            pygame.draw.circle(dsi_surface, text_color, (therm_x + 3, therm_y + 12), 4, 2)
-            pygame.draw.rect(dsi_surface, text_color, (therm_x, therm_y, 6, 12), 2)
+                draw_dsi_multi_digit_display(dsi_surface, abs_temp, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3)
+        
+        if static_pass:
+            # Temperature unit symbol (right side)
+            temp_symbol = render_text(font_medium, temp_unit, True, text_color)
+            temp_symbol_rect = temp_symbol.get_rect()
+            dsi_surface.blit(temp_symbol, (coolant_rect[0] + gauge_width - temp_symbol_rect.width - 15, coolant_rect[1] + 35))
+            
+            # "COOLANT TEMP" label and thermometer symbol (bottom)
+            coolant_label = render_text(font_small, "COOLANT TEMP", True, text_color)
+            coolant_label_rect = coolant_label.get_rect()
+            dsi_surface.blit(coolant_label, (coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2, coolant_rect[1] + gauge_height - 35))
+            
+            # Coolant temperature symbol from PNG (about 40x40 pixels - 2x larger)
+            coolant_temp_symbol = assets.get("coolant_temp", (40, 40))
+            if coolant_temp_symbol:
+                symbol_x = coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2 - 45  # Moved further left
+                symbol_y = coolant_rect[1] + gauge_height - 55  # Moved up
+                dsi_surface.blit(coolant_temp_symbol, (symbol_x, symbol_y))
+            else:
+                # Fallback: Simple thermometer symbol
+                therm_x = coolant_rect[0] + (gauge_width - coolant_label_rect.width) // 2 - 25
+                therm_y = coolant_rect[1] + gauge_height - 30
+                pygame.draw.circle(dsi_surface, text_color, (therm_x + 3, therm_y + 12), 4, 2)
+                pygame.draw.rect(dsi_surface, text_color, (therm_x, therm_y, 6, 12), 2)
     
     elif switch_volts:
         # Show Volts Gauge
@@ -2247,10 +2771,10 @@ def draw_dsi_screen_content(surface, speed, rpm):
         
         # Warning light for low voltage (between digits and V)
         warning_light_active = volts_value < 11.0
-        if warning_light_active:
+        if warning_light_active and not static_pass:
             # Blinking red rectangular warning light - same height as digits
             # Stay on most of the time, off briefly
-            blink_time = pygame.time.get_ticks() // 200  # Faster cycle (200ms)
+            blink_time = dashboard_clock() // 200  # Faster cycle (200ms)
             if blink_time % 5 != 0:  # Show light 4 out of 5 cycles (80% on, 20% off)
                 digit_height = int(44 * 1.5)  # Same height as 7-segment digits
                 # Position between last digit and V symbol - moved right to avoid decimal point overlap
@@ -2263,31 +2787,32 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = coolant_rect[0] + 15
         start_y = coolant_rect[1] + 40
         
-        draw_dsi_multi_digit_display(dsi_surface, volts_value, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
-        
-        # V symbol (right side)
-        volts_symbol = font_medium.render("V", True, text_color)
-        volts_symbol_rect = volts_symbol.get_rect()
-        dsi_surface.blit(volts_symbol, (coolant_rect[0] + gauge_width - volts_symbol_rect.width - 15, coolant_rect[1] + 35))
-        
-        # "VOLTS" label and battery symbol (bottom)
-        volts_label = font_small.render("VOLTS", True, text_color)
-        volts_label_rect = volts_label.get_rect()
-        dsi_surface.blit(volts_label, (coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2, coolant_rect[1] + gauge_height - 35))
-        
-        # Battery symbol from PNG
-        if battery_symbol:
-            symbol_x = coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2 - 45  # Moved further left
-            symbol_y = coolant_rect[1] + gauge_height - 55  # Moved up
-            # Scale the symbol to appropriate size (about 40x40 pixels - 2x larger)
-            scaled_symbol = pygame.transform.scale(battery_symbol, (40, 40))
-            dsi_surface.blit(scaled_symbol, (symbol_x, symbol_y))
-        else:
-            # Fallback: Simple battery symbol (rectangle)
-            battery_x = coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2 - 25
-            battery_y = coolant_rect[1] + gauge_height - 30
-            pygame.draw.rect(dsi_surface, text_color, (battery_x, battery_y, 16, 10), 2)
-            pygame.draw.rect(dsi_surface, text_color, (battery_x + 16, battery_y + 3, 3, 4), 2)
+        if not static_pass:
+            draw_dsi_multi_digit_display(dsi_surface, volts_value, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
+        
+        if static_pass:
+            # V symbol (right side)
+            volts_symbol = render_text(font_medium, "V", True, text_color)
+            volts_symbol_rect = volts_symbol.get_rect()
+            dsi_surface.blit(volts_symbol, (coolant_rect[0] + gauge_width - volts_symbol_rect.width - 15, coolant_rect[1] + 35))
+            
+            # "VOLTS" label and battery symbol (bottom)
+            volts_label = render_text(font_small, "VOLTS", True, text_color)
+            volts_label_rect = volts_label.get_rect()
+            dsi_surface.blit(volts_label, (coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2, coolant_rect[1] + gauge_height - 35))
+            
+            # Battery symbol from PNG (about 40x40 pixels - 2x larger)
+            battery_symbol = assets.get("battery", (40, 40))
+            if battery_symbol:
+                symbol_x = coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2 - 45  # Moved further left
+                symbol_y = coolant_rect[1] + gauge_height - 55  # Moved up
+                dsi_surface.blit(battery_symbol, (symbol_x, symbol_y))
+            else:
+                # Fallback: Simple battery symbol (rectangle)
+                battery_x = coolant_rect[0] + (gauge_width - volts_label_rect.width) // 2 - 25
+                battery_y = coolant_rect[1] + gauge_height - 30
+                pygame.draw.rect(dsi_surface, text_color, (battery_x, battery_y, 16, 10), 2)
+                pygame.draw.rect(dsi_surface, text_color, (battery_x + 16, battery_y + 3, 3, 4), 2)
     
     # If no switches active, just show empty gauge border
     
@@ -2304,21 +2829,23 @@ def draw_dsi_screen_content(surface, speed, rpm):
         else:
             range_miles = current_fuel_range  # Use last known value when disconnected
         
-        # "RANGE" title (top) - removed "TRIP"
-        range_title = font_small.render("RANGE", True, text_color)
-        range_title_rect = range_title.get_rect()
-        dsi_surface.blit(range_title, (range_rect[0] + (gauge_width - range_title_rect.width) // 2, range_rect[1] + 35))
+        if static_pass:
+            # "RANGE" title (top) - removed "TRIP"
+            range_title = render_text(font_small, "RANGE", True, text_color)
+            range_title_rect = range_title.get_rect()
+            dsi_surface.blit(range_title, (range_rect[0] + (gauge_width - range_title_rect.width) // 2, range_rect[1] + 35))
         
         # Distance unit label (bottom)
         if switch_metric:
             range_km = miles_to_km(range_miles)
-            distance_text = font_medium.render("KM", True, text_color)
+            distance_text = render_text(font_medium, "KM", True, text_color)
             display_range = range_km
         else:
-            distance_text = font_medium.render("MILES", True, text_color)
+            distance_text = render_text(font_medium, "MILES", True, text_color)
             display_range = range_miles
         distance_text_rect = distance_text.get_rect()
-        dsi_surface.blit(distance_text, (range_rect[0] + (gauge_width - distance_text_rect.width) // 2, range_rect[1] + gauge_height - 35))
+        if static_pass:
+            dsi_surface.blit(distance_text, (range_rect[0] + (gauge_width - distance_text_rect.width) // 2, range_rect[1] + gauge_height - 35))
         
         # Range digits (right side) - format 000.0 - 7-segment display with leading zero dimming
         digit_size = int(28 * 1.25)  # 35 (25% larger)
@@ -2327,7 +2854,8 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = range_rect[0] + gauge_width - total_width - 10
         start_y = range_rect[1] + 75
         
-        draw_dsi_multi_digit_display(dsi_surface, display_range, 4, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=3)
+        if not static_pass:
+            draw_dsi_multi_digit_display(dsi_surface, display_range, 4, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=3)
     
     elif switch_trip_odo:
         # Show Trip Odometer Gauge
@@ -2338,21 +2866,23 @@ def draw_dsi_screen_content(surface, speed, rpm):
         else:
             trip_miles = persistent_data.data["trip_odometer"]  # Use Pi's trip data when disconnected
         
-        # "TRIP ODO" title (top)
-        trip_title = font_small.render("TRIP ODO", True, text_color)
-        trip_title_rect = trip_title.get_rect()
-        dsi_surface.blit(trip_title, (range_rect[0] + (gauge_width - trip_title_rect.width) // 2, range_rect[1] + 35))
+        if static_pass:
+            # "TRIP ODO" title (top)
+            trip_title = render_text(font_small, "TRIP ODO", True, text_color)
+            trip_title_rect = trip_title.get_rect()
+            dsi_surface.blit(trip_title, (range_rect[0] + (gauge_width - trip_title_rect.width) // 2, range_rect[1] + 35))
         
         # Distance unit label (bottom)
         if switch_metric:
             trip_km = miles_to_km(trip_miles)
-            distance_text = font_medium.render("KM", True, text_color)
+            distance_text = render_text(font_medium, "KM", True, text_color)
             display_trip = trip_km
         else:
-            distance_text = font_medium.render("MILES", True, text_color)
+            distance_text = render_text(font_medium, "MILES", True, text_color)
             display_trip = trip_miles
         distance_text_rect = distance_text.get_rect()
-        dsi_surface.blit(distance_text, (range_rect[0] + (gauge_width - distance_text_rect.width) // 2, range_rect[1] + gauge_height - 35))
+        if static_pass:
+            dsi_surface.blit(distance_text, (range_rect[0] + (gauge_width - distance_text_rect.width) // 2, range_rect[1] + gauge_height - 35))
         
         # Trip digits (right side) - format 000.0 - 7-segment display with leading zero dimming
         digit_size = int(28 * 1.25)  # 35 (25% larger)
@@ -2361,7 +2891,8 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = range_rect[0] + gauge_width - total_width - 10
         start_y = range_rect[1] + 75
         
-        draw_dsi_multi_digit_display(dsi_surface, display_trip, 4, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=3)
+        if not static_pass:
+            draw_dsi_multi_digit_display(dsi_surface, display_trip, 4, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=3)
     
     # If no switches active, just show empty gauge area
     
@@ -2378,10 +2909,11 @@ def draw_dsi_screen_content(surface, speed, rpm):
         else:
             instant_mpg = current_inst_mpg  # Use last known value when disconnected
         
-        # "INSTANT" title (top)
-        instant_title = font_small.render("INSTANT", True, text_color)
-        instant_title_rect = instant_title.get_rect()
-        dsi_surface.blit(instant_title, (mpg_rect[0] + (gauge_width - instant_title_rect.width) // 2, mpg_rect[1] + 35))
+        if static_pass:
+            # "INSTANT" title (top)
+            instant_title = render_text(font_small, "INSTANT", True, text_color)
+            instant_title_rect = instant_title.get_rect()
+            dsi_surface.blit(instant_title, (mpg_rect[0] + (gauge_width - instant_title_rect.width) // 2, mpg_rect[1] + 35))
         
         # Handle special instant MPG values from Arduino
         digit_size = int(28 * 1.25)  # 35 (25% larger)
@@ -2389,7 +2921,10 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = mpg_rect[0] + 15
         start_y = mpg_rect[1] + 75
         
-        if instant_mpg == 0.0:
+        if static_pass:
+            # Readout follows the engine state - nothing static here
+            pass
+        elif instant_mpg == 0.0:
             # Engine idling - show GPH using real fuel flow data
             if current_fuel_flow_gph > 0.01:  # Use real data if available
                 gph_value = current_fuel_flow_gph
@@ -2400,8 +2935,8 @@ def draw_dsi_screen_content(surface, speed, rpm):
             draw_dsi_multi_digit_display(dsi_surface, gph_value, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
         elif instant_mpg == -1.0:
             # Engine off - show "OFF"
-            off_font = pygame.font.SysFont('Arial', 32, bold=True)
-            off_text = off_font.render("OFF", True, (128, 128, 128))  # Gray color for OFF
+            off_font = get_font('Arial', 32)
+            off_text = render_text(off_font, "OFF", True, (128, 128, 128))  # Gray color for OFF
             off_rect = off_text.get_rect()
             dsi_surface.blit(off_text, (start_x + 25, start_y + 10))
         else:
@@ -2416,20 +2951,21 @@ def draw_dsi_screen_content(surface, speed, rpm):
                 draw_dsi_multi_digit_display(dsi_surface, display_instant, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
             else:
                 # Handle unexpected negative values - show "---"
-                dash_font = pygame.font.SysFont('Arial', 32, bold=True)
-                dash_text = dash_font.render("---", True, (128, 128, 128))
+                dash_font = get_font('Arial', 32)
+                dash_text = render_text(dash_font, "---", True, (128, 128, 128))
                 dsi_surface.blit(dash_text, (start_x + 25, start_y + 10))
         
         # Fuel economy unit label (under the digits)
         if instant_mpg == 0.0:
             # Show "GPH" when idling
-            fuel_econ_text = font_medium.render("GPH", True, text_color)
+            fuel_econ_text = render_text(font_medium, "GPH", True, text_color)
         elif switch_metric:
-            fuel_econ_text = font_medium.render("L/100km", True, text_color)
+            fuel_econ_text = render_text(font_medium, "L/100km", True, text_color)
         else:
-            fuel_econ_text = font_medium.render("MPG", True, text_color)
+            fuel_econ_text = render_text(font_medium, "MPG", True, text_color)
         fuel_econ_text_rect = fuel_econ_text.get_rect()
-        dsi_surface.blit(fuel_econ_text, (mpg_rect[0] + (gauge_width - fuel_econ_text_rect.width) // 2, mpg_rect[1] + gauge_height - 35))
+        if not static_pass:
+            dsi_surface.blit(fuel_econ_text, (mpg_rect[0] + (gauge_width - fuel_econ_text_rect.width) // 2, mpg_rect[1] + gauge_height - 35))
     
     elif switch_avg_mpg:
         # Show Average MPG Gauge
@@ -2440,10 +2976,11 @@ def draw_dsi_screen_content(surface, speed, rpm):
         else:
             avg_mpg = current_avg_mpg  # Use last known value when disconnected
         
-        # "AVERAGE" title (top)
-        avg_title = font_small.render("AVERAGE", True, text_color)
-        avg_title_rect = avg_title.get_rect()
-        dsi_surface.blit(avg_title, (mpg_rect[0] + (gauge_width - avg_title_rect.width) // 2, mpg_rect[1] + 35))
+        if static_pass:
+            # "AVERAGE" title (top)
+            avg_title = render_text(font_small, "AVERAGE", True, text_color)
+            avg_title_rect = avg_title.get_rect()
+            dsi_surface.blit(avg_title, (mpg_rect[0] + (gauge_width - avg_title_rect.width) // 2, mpg_rect[1] + 35))
         
         # Fuel economy digits (left side) - format 00.0 - 7-segment display with leading zero dimming
         if switch_metric:
@@ -2456,15 +2993,17 @@ def draw_dsi_screen_content(surface, speed, rpm):
         start_x = mpg_rect[0] + 15
         start_y = mpg_rect[1] + 75
         
-        draw_dsi_multi_digit_display(dsi_surface, display_avg, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
+        if not static_pass:
+            draw_dsi_multi_digit_display(dsi_surface, display_avg, 3, start_x, start_y, digit_spacing, digit_color, digit_size, 0.3, decimal_pos=2)
         
         # Fuel economy unit label (under the digits)
         if switch_metric:
-            fuel_econ_text = font_medium.render("L/100km", True, text_color)
+            fuel_econ_text = render_text(font_medium, "L/100km", True, text_color)
         else:
-            fuel_econ_text = font_medium.render("MPG", True, text_color)
+            fuel_econ_text = render_text(font_medium, "MPG", True, text_color)
         fuel_econ_text_rect = fuel_econ_text.get_rect()
-        dsi_surface.blit(fuel_econ_text, (mpg_rect[0] + (gauge_width - fuel_econ_text_rect.width) // 2, mpg_rect[1] + gauge_height - 35))
+        if static_pass:
+            dsi_surface.blit(fuel_econ_text, (mpg_rect[0] + (gauge_width - fuel_econ_text_rect.width) // 2, mpg_rect[1] + gauge_height - 35))
     else:
         # If no switches active, just show empty gauge area
         pass
@@ -2483,75 +3022,31 @@ def draw_dsi_screen_content(surface, speed, rpm):
     else:
         fuel_level = current_fuel_level / 100.0  # Use last known value when disconnected
     
-    # Draw fuel level ticks as horizontal bars (like speedometer) - higher resolution
-    tick_count = 17  # More ticks for better resolution (every 1/16th)
-    # Define which ticks get labels (every 4th tick: 0, 4, 8, 12, 16 = E, 1/4, 1/2, 3/4, F)
-    tick_labels = ["E", "", "", "", "1/4", "", "", "", "1/2", "", "", "", "3/4", "", "", "", "F"]
+    # Only the yellow dashes are static - tick and label colors follow the fuel level
+    if static_pass:
+        tick_width = int(80 * 1.25)  # Same tick length as draw_dsi_fuel_ticks()
+        for i, tick_label in enumerate(DSI_FUEL_TICK_LABELS):
+            if tick_label:
+                # Draw small yellow dash between label and tick
+                tick_y = fuel_y_end - (i / (len(DSI_FUEL_TICK_LABELS) - 1)) * fuel_height
+                dash_x = fuel_center_x - tick_width // 2 - 12  # Position dash between label and tick
+                pygame.draw.line(dsi_surface, YELLOW, (dash_x - 6, tick_y), (dash_x, tick_y), 3)
+        # RESERVE and "UNLEADED FUEL ONLY" swap with the fuel level, so both stay dynamic
+        return
     
-    for i in range(tick_count):
-        # Calculate position from bottom to top (E at bottom, F at top)
-        tick_y = fuel_y_end - (i / (tick_count - 1)) * fuel_height
-        fuel_ratio = i / (tick_count - 1)  # 0.0 to 1.0
-        
-        # Determine tick properties based on fuel level
-        # Add small tolerance for floating-point precision (fixes 100% display issue)
-        if fuel_ratio <= (fuel_level + 0.001):
-            # Active ticks (fuel present)
-            if fuel_ratio < 0.1:  # Very low fuel - red
-                tick_color = RED
-            elif fuel_ratio < 0.25:  # Low fuel - orange
-                tick_color = ORANGE
-            else:  # Normal fuel - green
-                tick_color = BRIGHT_GREEN
-        else:
-            # Inactive ticks (no fuel)
-            if fuel_ratio < 0.1:
-                tick_color = (100, 0, 0)  # Dim red
-            elif fuel_ratio < 0.25:
-                tick_color = (100, 50, 0)  # Dim orange
-            else:
-                tick_color = DULL_GREEN  # Dim green
-        
-        # All ticks same length and 25% longer
-        tick_width = int(80 * 1.25)  # 100px (25% longer)
-        tick_thickness = 12  # Reduced thickness for better fit in window (was 16)
-        
-        # Calculate tick position (centered)
-        tick_start_x = fuel_center_x - tick_width // 2
-        tick_end_x = fuel_center_x + tick_width // 2
-        
-        # Draw thick horizontal tick (like speedometer)
-        pygame.draw.line(dsi_surface, tick_color, 
-                        (tick_start_x, tick_y), 
-                        (tick_end_x, tick_y), 
-                        tick_thickness)
-        
-        # Draw label if exists (to the left of the tick with dash)
-        if tick_labels[i]:
-            label_color = YELLOW if fuel_ratio <= fuel_level else (80, 80, 0)
-            label_text = font_small.render(tick_labels[i], True, label_color)
-            label_rect = label_text.get_rect()
-            
-            # Position label to the left of tick
-            label_x = tick_start_x - label_rect.width - 20  # More space for dash
-            label_y = tick_y - label_rect.height // 2
-            dsi_surface.blit(label_text, (label_x, label_y))
-            
-            # Draw small yellow dash between label and tick
-            dash_x = tick_start_x - 12  # Position dash between label and tick
-            dash_y = tick_y
-            pygame.draw.line(dsi_surface, YELLOW, (dash_x - 6, dash_y), (dash_x, dash_y), 3)
+    # Ticks only change when the level crosses one of them - memoized per 1/16th
+    draw_dsi_fuel_ticks(dsi_surface, fuel_level, fuel_center_x, fuel_y_end, fuel_height, font_small)
     
     # "RESERVE" warning (only if fuel is very low)
     if fuel_level < 0.1:
-        reserve_text = font_medium.render("RESERVE", True, RED)
+        reserve_text = render_text(font_medium, "RESERVE", True, RED)
         reserve_rect = reserve_text.get_rect()
         dsi_surface.blit(reserve_text, (fuel_center_x - reserve_rect.width // 2, fuel_y_end + 20))
     
     # "UNLEADED FUEL ONLY" text and fuel pump symbol (bottom) - hide when RESERVE warning is showing
     if fuel_level >= 0.1:  # Only show when NOT in reserve (same condition as reserve warning but inverted)
-        fuel_text1 = font_small.render("UNLEADED", True, text_color)
-        fuel_text2 = font_small.render("FUEL ONLY", True, text_color)
+        fuel_text1 = render_text(font_small, "UNLEADED", True, text_color)
+        fuel_text2 = render_text(font_small, "FUEL ONLY", True, text_color)
         
         fuel_text1_rect = fuel_text1.get_rect()
         fuel_text2_rect = fuel_text2.get_rect()
@@ -2561,13 +3056,12 @@ def draw_dsi_screen_content(surface, speed, rpm):
         dsi_surface.blit(fuel_text1, (fuel_center_x - fuel_text1_rect.width // 2, text_y))
         dsi_surface.blit(fuel_text2, (fuel_center_x - fuel_text2_rect.width // 2, text_y + 20))
         
-        # Gas pump symbol from PNG (to the left of the text)
+        # Gas pump symbol from PNG (to the left of the text, about 50x50 pixels - 2x larger)
+        gas_pump_symbol = assets.get("gas_pump", (50, 50))
         if gas_pump_symbol:
             symbol_x = fuel_center_x - 100  # Moved further left
             symbol_y = text_y - 15  # Moved up
-            # Scale the symbol to appropriate size (about 50x50 pixels - 2x larger)
-            scaled_symbol = pygame.transform.scale(gas_pump_symbol, (50, 50))
-            dsi_surface.blit(scaled_symbol, (symbol_x, symbol_y))
+            dsi_surface.blit(gas_pump_symbol, (symbol_x, symbol_y))
         else:
             # Fallback: More realistic gas pipe symbol
             pipe_x = fuel_center_x - 80
@@ -2584,20 +3078,12 @@ def draw_dsi_screen_content(surface, speed, rpm):
     # DSI content is now drawn directly on the passed surface
     # No need to blit since we're using the surface parameter directly
 
-print("C4 Corvette Dashboard - Triple Display System")
-print(f"Arduino: {SERIAL_PORT} @ {SERIAL_BAUD} baud - {'Connected' if serial_connected else 'Demo Mode'}")
-print("Press ESC to exit | F11 for fullscreen")
-
-# Signal handler for graceful shutdown
+# Signal handler for graceful shutdown (registered by main())
 def signal_handler(signum, frame):
     """Handle SIGTERM and SIGINT for graceful shutdown"""
     global running
     running = False
 
-# Register signal handlers
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
-
 # ===== CITROËN BX STYLE FUNCTIONS =====
 
 def draw_bx_road_speedometer(surface, speed, rect):
@@ -2649,8 +3135,8 @@ def draw_bx_road_speedometer(surface, speed, rect):
         pygame.draw.line(surface, color, (tick_left_x, tick_y), (tick_right_x, tick_y), thickness)
     
     # Draw digital speed in the center
-    font = pygame.font.SysFont('Arial', 48, bold=True)
-    speed_text = font.render(f"{int(speed)}", True, BX_GREEN)
+    font = get_font('Arial', 48)
+    speed_text = render_text(font, f"{int(speed)}", True, BX_GREEN)
     speed_rect = speed_text.get_rect(center=(center_x, bottom_y - road_height // 2))
     surface.blit(speed_text, speed_rect)
 
@@ -2701,8 +3187,8 @@ def draw_bx_arch_tachometer(surface, rpm, rect):
         pygame.draw.line(surface, color, (inner_x, inner_y), (outer_x, outer_y), thickness)
     
     # Draw digital RPM below arch
-    font = pygame.font.SysFont('Arial', 24, bold=True)
-    rpm_text = font.render(f"{int(rpm)}", True, BX_GREEN)
+    font = get_font('Arial', 24)
+    rpm_text = render_text(font, f"{int(rpm)}", True, BX_GREEN)
     rpm_rect = rpm_text.get_rect(center=(center_x, center_y + 40))
     surface.blit(rpm_text, rpm_rect)
 
@@ -2722,11 +3208,11 @@ def draw_bx_horizontal_bar(surface, value, max_value, rect, label):
         pygame.draw.rect(surface, BX_GREEN, (bar_x + 2, bar_y + 2, fill_width - 4, bar_height - 4))
     
     # Draw label and value
-    font = pygame.font.SysFont('Arial', 16, bold=True)
-    label_text = font.render(label, True, BX_GREEN)
+    font = get_font('Arial', 16)
+    label_text = render_text(font, label, True, BX_GREEN)
     surface.blit(label_text, (bar_x, bar_y - 25))
     
-    value_text = font.render(f"{value:.1f}", True, BX_GREEN)
+    value_text = render_text(font, f"{value:.1f}", True, BX_GREEN)
     surface.blit(value_text, (bar_x + bar_width - 50, bar_y - 25))
 
 def draw_bx_vertical_bar(surface, value, max_value, rect, label):
@@ -2746,22 +3232,22 @@ def draw_bx_vertical_bar(surface, value, max_value, rect, label):
                         (bar_x + 2, bar_y + bar_height - fill_height - 2, bar_width - 4, fill_height))
     
     # Draw label and value
-    font = pygame.font.SysFont('Arial', 14, bold=True)
-    label_text = font.render(label, True, BX_GREEN)
+    font = get_font('Arial', 14)
+    label_text = render_text(font, label, True, BX_GREEN)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
-    value_text = font.render(f"{value:.1f}", True, BX_GREEN)
+    value_text = render_text(font, f"{value:.1f}", True, BX_GREEN)
     value_rect = value_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 20))
     surface.blit(value_text, value_rect)
 
 def draw_bx_digital_display(surface, value, label, rect):
     """Draw digital display for trip, range, MPG values"""
-    font_label = pygame.font.SysFont('Arial', 14, bold=True)
-    font_value = pygame.font.SysFont('Arial', 20, bold=True)
+    font_label = get_font('Arial', 14)
+    font_value = get_font('Arial', 20)
     
     # Draw label
-    label_text = font_label.render(label, True, BX_DIM_GREEN)
+    label_text = render_text(font_label, label, True, BX_DIM_GREEN)
     surface.blit(label_text, (rect[0], rect[1]))
     
     # Draw value
@@ -2770,7 +3256,7 @@ def draw_bx_digital_display(surface, value, label, rect):
     else:
         value_str = str(value)
     
-    value_text = font_value.render(value_str, True, BX_GREEN)
+    value_text = render_text(font_value, value_str, True, BX_GREEN)
     surface.blit(value_text, (rect[0], rect[1] + 20))
 
 def draw_bx_horizontal_bar_thick(surface, value, max_value, rect, label):
@@ -2789,8 +3275,8 @@ def draw_bx_horizontal_bar_thick(surface, value, max_value, rect, label):
         pygame.draw.rect(surface, BX_GREEN, (bar_x + 4, bar_y + 4, fill_width - 8, bar_height - 8))
     
     # Draw label with medium font (72pt → 36pt)
-    font_medium = pygame.font.SysFont('Arial', 36, bold=True)
-    label_text = font_medium.render(label, True, BX_GREEN)
+    font_medium = get_font('Arial', 36)
+    label_text = render_text(font_medium, label, True, BX_GREEN)
     surface.blit(label_text, (bar_x, bar_y - 50))  # Adjusted space for smaller text
     
     # Draw value using DSEG 7-segment display (smaller size)
@@ -2802,8 +3288,8 @@ def draw_bx_horizontal_bar_thick(surface, value, max_value, rect, label):
         # Handle special "LO" temperature readings
         if value <= -999:  # Special "LO" temperature value from Arduino
             # Display "LO" like original C4 cluster
-            lo_font = pygame.font.SysFont('Arial', dseg_size, bold=True)
-            lo_text = lo_font.render("LO", True, BX_GREEN)
+            lo_font = get_font('Arial', dseg_size)
+            lo_text = render_text(lo_font, "LO", True, BX_GREEN)
             lo_x = bar_x + bar_width - 80
             lo_y = bar_y - 70
             surface.blit(lo_text, (lo_x, lo_y))
@@ -2857,14 +3343,14 @@ def draw_bx_horizontal_bar_thick(surface, value, max_value, rect, label):
                                    digit_width, BX_GREEN, dseg_size, leading_zero_dim=0.5)
     except (ValueError, TypeError):
         # Fallback: draw "---" if value conversion fails
-        font_fallback = pygame.font.SysFont('Arial', dseg_size, bold=True)
-        fallback_text = font_fallback.render("---", True, BX_GREEN)
+        font_fallback = get_font('Arial', dseg_size)
+        fallback_text = render_text(font_fallback, "---", True, BX_GREEN)
         fallback_x = bar_x + bar_width - 100
         fallback_y = bar_y - 70  # Match DSEG position
         surface.blit(fallback_text, (fallback_x, fallback_y))
     
     # Add min/max static values outside the bar with larger font
-    min_max_font = pygame.font.SysFont('Arial', 24, bold=True)  # Increased from 18 to 24
+    min_max_font = get_font('Arial', 24)  # Increased from 18 to 24
     
     # Determine min/max values based on gauge type
     if "VOLT" in label.upper():
@@ -2880,13 +3366,13 @@ def draw_bx_horizontal_bar_thick(surface, value, max_value, rect, label):
         min_val, max_val = "0", str(int(max_value))
     
     # Draw min value (outside bottom left of bar) - brighter color
-    min_text = min_max_font.render(min_val, True, BX_GREEN)
+    min_text = render_text(min_max_font, min_val, True, BX_GREEN)
     min_x = bar_x - 10  # Moved outside bar (was bar_x + 5)
     min_y = bar_y + bar_height + 10  # Below the bar (was bar_y + bar_height - 25)
     surface.blit(min_text, (min_x, min_y))
     
     # Draw max value (outside bottom right of bar) - brighter color
-    max_text = min_max_font.render(max_val, True, BX_GREEN)
+    max_text = render_text(min_max_font, max_val, True, BX_GREEN)
     max_text_rect = max_text.get_rect()
     max_x = bar_x + bar_width - max_text_rect.width + 10  # Moved outside bar (was - 5)
     max_y = bar_y + bar_height + 10  # Below the bar (was bar_y + bar_height - 25)
@@ -2905,8 +3391,14 @@ def draw_bx_single_dseg_bordered(surface, value, label, rect):
     # Draw the single display
     draw_bx_single_dseg_display(surface, value, label, inner_rect)
 
-def draw_bx_thick_road_speedometer(surface, speed, rect):
+def draw_bx_thick_road_speedometer(surface, speed, rect, layer=None):
     """Draw Citroën BX style road speedometer - THICK TAPERED BARS that fill based on speed"""
+    # Static parts (road outlines, unit label) come from the layer cache - layer="static" draws only them
+    if layer is None:
+        static, position = get_static_layer(("bx_road", rect), surface.get_size(),
+                                            lambda s: draw_bx_thick_road_speedometer(s, speed, rect, "static"))
+        surface.blit(static, position)
+    
     # Road dimensions - much wider gap for triple digit DSEG numbers
     road_bottom_width = 507  # 30% wider again (390 * 1.3 = 507)
     road_top_width = 152     # 30% wider top (117 * 1.3 = 152)
@@ -2939,23 +3431,37 @@ def draw_bx_thick_road_speedometer(surface, speed, rect):
     right_top_outer = center_x + road_top_width // 2
     right_top_inner = right_top_outer - bar_thickness_top
     
-    # Draw complete left road bar outline (dim green background)
-    left_complete_points = [
-        (left_bottom_outer, bottom_y),
-        (left_top_outer, top_y),
-        (left_top_inner, top_y),
-        (left_bottom_inner, bottom_y)
-    ]
-    pygame.draw.polygon(surface, BX_DIM_GREEN, left_complete_points)
-    
-    # Draw complete right road bar outline (dim green background)
-    right_complete_points = [
-        (right_bottom_outer, bottom_y),
-        (right_top_outer, top_y),
-        (right_top_inner, top_y),
-        (right_bottom_inner, bottom_y)
-    ]
-    pygame.draw.polygon(surface, BX_DIM_GREEN, right_complete_points)
+    if layer == "static":
+        # Draw complete left road bar outline (dim green background)
+        left_complete_points = [
+            (left_bottom_outer, bottom_y),
+            (left_top_outer, top_y),
+            (left_top_inner, top_y),
+            (left_bottom_inner, bottom_y)
+        ]
+        pygame.draw.polygon(surface, BX_DIM_GREEN, left_complete_points)
+        
+        # Draw complete right road bar outline (dim green background)
+        right_complete_points = [
+            (right_bottom_outer, bottom_y),
+            (right_top_outer, top_y),
+            (right_top_inner, top_y),
+            (right_bottom_inner, bottom_y)
+        ]
+        pygame.draw.polygon(surface, BX_DIM_GREEN, right_complete_points)
+        
+        # Add MPH/KPH label under DSEG speed (same font as milestone numbers)
+        milestone_font_size = int(16 * 1.3)  # Same as milestone font (21pt)
+        unit_font = get_font('Arial', milestone_font_size)
+        dseg_size = 45
+        dseg_y = bottom_y - road_height // 2 - 20
+        
+        # Check metric switch for unit display
+        unit_text = "KPH" if switch_metric else "MPH"
+        unit_label = render_text(unit_font, unit_text, True, BX_GREEN)
+        unit_rect = unit_label.get_rect(center=(center_x, dseg_y + dseg_size + 50))  # Reduced spacing to prevent bottom cutoff
+        surface.blit(unit_label, unit_rect)
+        return
     
     # Draw filled portion on top (bright green) - same shape but clipped to fill height
     if fill_height > 0:
@@ -3015,8 +3521,8 @@ def draw_bx_thick_road_speedometer(surface, speed, rect):
         # Draw speed numbers outside the road (30% larger font)
         if marker_speed == 0 or marker_speed % 40 == 0:  # Show numbers at 0, 40, 80, 120
             milestone_font_size = int(16 * 1.3)  # 30% larger (16 * 1.3 = 21)
-            font = pygame.font.SysFont('Arial', milestone_font_size, bold=True)
-            speed_num_text = font.render(str(marker_speed), True, marker_color)
+            font = get_font('Arial', milestone_font_size)
+            speed_num_text = render_text(font, str(marker_speed), True, marker_color)
             
             # Left side number (outside left marker)
             left_num_rect = speed_num_text.get_rect(center=(left_marker_start - 20, marker_y))
@@ -3047,22 +3553,12 @@ def draw_bx_thick_road_speedometer(surface, speed, rect):
     # Draw DSEG speed display
     draw_multi_digit_display(surface, speed_value, num_digits, dseg_x, dseg_y, 
                            digit_width, BX_GREEN, dseg_size, leading_zero_dim=0.5)
-    
-    # Add MPH/KPH label under DSEG speed (same font as milestone numbers)
-    milestone_font_size = int(16 * 1.3)  # Same as milestone font (21pt)
-    unit_font = pygame.font.SysFont('Arial', milestone_font_size, bold=True)
-    
-    # Check metric switch for unit display
-    unit_text = "KPH" if switch_metric else "MPH"
-    unit_label = unit_font.render(unit_text, True, BX_GREEN)
-    unit_rect = unit_label.get_rect(center=(center_x, dseg_y + dseg_size + 50))  # Reduced spacing to prevent bottom cutoff
-    surface.blit(unit_label, unit_rect)
 
 def draw_bx_gph_display(surface, gph_value, label, rect):
     """Draw GPH display using Synthwave method (no multiplication)"""
     # Label font and positioning
-    label_font = pygame.font.SysFont('Arial', 24, bold=True)
-    label_text = label_font.render(label, True, BX_GREEN)
+    label_font = get_font('Arial', 24)
+    label_text = render_text(label_font, label, True, BX_GREEN)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -3082,8 +3578,8 @@ def draw_bx_gph_display(surface, gph_value, label, rect):
 def draw_bx_single_dseg_display(surface, value, label, rect):
     """Draw single DSEG value with label (larger size for single display)"""
     # Label font and positioning (larger for single display)
-    label_font = pygame.font.SysFont('Arial', 24, bold=True)
-    label_text = label_font.render(label, True, BX_GREEN)
+    label_font = get_font('Arial', 24)
+    label_text = render_text(label_font, label, True, BX_GREEN)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -3094,14 +3590,14 @@ def draw_bx_single_dseg_display(surface, value, label, rect):
     # Handle special values
     if value == -1.0:  # IDLE
         # Show "IDLE" text
-        idle_font = pygame.font.SysFont('Arial', 32, bold=True)
-        idle_text = idle_font.render("IDLE", True, BX_GREEN)
+        idle_font = get_font('Arial', 32)
+        idle_text = render_text(idle_font, "IDLE", True, BX_GREEN)
         idle_rect = idle_text.get_rect(center=(rect[0] + rect[2]//2, dseg_y + dseg_area_height//2))
         surface.blit(idle_text, idle_rect)
     elif value == -2.0:  # OFF
         # Show "OFF" text
-        off_font = pygame.font.SysFont('Arial', 32, bold=True)
-        off_text = off_font.render("OFF", True, BX_GREEN)
+        off_font = get_font('Arial', 32)
+        off_text = render_text(off_font, "OFF", True, BX_GREEN)
         off_rect = off_text.get_rect(center=(rect[0] + rect[2]//2, dseg_y + dseg_area_height//2))
         surface.blit(off_text, off_rect)
     else:
@@ -3202,7 +3698,7 @@ def draw_bx_horizontal_arch_tachometer(surface, rpm, rect):
         
         # Determine line color based on RPM and redline
         if line_actual_rpm >= 4500:  # Redline range (same as synthwave)
-            bg_color = (150, 50, 50)  # Dim red for redline background
+            bg_color = REDLINE_DIM_RED  # Dim red for redline background
             fill_color = (255, 100, 100)  # Bright red for redline fill
         else:
             bg_color = BX_DIM_GREEN  # Normal dim green
@@ -3255,32 +3751,39 @@ def draw_bx_horizontal_arch_tachometer(surface, rpm, rect):
         # Draw RPM numbers below markers (show at 0, 2000, 4000, 6000)
         if marker_rpm % 2000 == 0:  # Show numbers at 0, 2000, 4000, 6000
             milestone_font_size = int(16 * 1.3)  # Same as speedometer (21pt)
-            font = pygame.font.SysFont('Arial', milestone_font_size, bold=True)
+            font = get_font('Arial', milestone_font_size)
             
             # Format RPM number (show as thousands: 0, 2, 4, 6)
             rpm_display = marker_rpm // 1000
-            rpm_num_text = font.render(str(rpm_display), True, marker_color)
+            rpm_num_text = render_text(font, str(rpm_display), True, marker_color)
             rpm_num_rect = rpm_num_text.get_rect(center=(marker_x, marker_end_y + 12))  # Moved slightly up from +15 to +12
             surface.blit(rpm_num_text, rpm_num_rect)
     
     # Draw REDLINE warning text when RPM >= 4500 (between speedometer and tachometer area)
     if rpm >= 4500:
         # Pulsing effect for redline warning
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.01)) * 0.5 + 0.5
-        warning_font = pygame.font.SysFont('Arial', 32, bold=True)
+        pulse = abs(math.sin(dashboard_clock() * 0.01)) * 0.5 + 0.5
+        warning_font = get_font('Arial', 32)
         
         if rpm >= 5000:  # Critical redline - red pulsing
             warning_color = (int(255 * pulse), 0, 0)
         else:  # Warning zone - yellow
             warning_color = (255, 255, 0)
         
-        warning_text = warning_font.render("REDLINE", True, warning_color)
+        warning_text = render_text(warning_font, "REDLINE", True, warning_color)
         # Position between speedometer (bottom) and tachometer (top) - center of DSI screen
         warning_rect = warning_text.get_rect(center=(center_x, center_y + 20))
         surface.blit(warning_text, warning_rect)
 
-def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme='amber'):
+def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme='amber', layer=None):
     """Draw Subaru XT style 3D vertical bar with proper depth order and real values"""
+    # The frame sits both behind and in front of the fill, so it is cached as two static layers:
+    # layer="static" draws the back edges, layer="overlay" the frame faces, grid and labels
+    if layer is None:
+        static, position = get_static_layer(("xt_bar", rect, label), surface.get_size(),
+                                            lambda s: draw_xt_3d_vertical_bar(s, value, max_value, rect, label, color_scheme, "static"))
+        surface.blit(static, position)
+    
     # Enhanced 3D effect parameters
     bar_width = rect[2] - 40
     bar_height = rect[3] - 120  # More space for labels and DSEG numbers
@@ -3303,22 +3806,23 @@ def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme
     
     # STEP 1: Draw vertex lines FIRST (background layer - will be hidden by faces)
     vertex_color = (max(0, XT_AMBER[0] - 50), max(0, XT_AMBER[1] - 30), max(0, XT_AMBER[2] - 10))  # Slightly darker than bright amber, ensure valid range
-    
-    # Only draw vertex lines that should be visible (not hidden behind faces)
-    # Back edges (always visible)
-    pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y - depth), (bar_x + depth, bar_y + bar_height - depth), 2)  # Left back edge
-    pygame.draw.line(surface, vertex_color, (bar_x + bar_width + depth, bar_y - depth), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Right back edge
-    pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y - depth), (bar_x + bar_width + depth, bar_y - depth), 2)  # Top back edge
-    pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y + bar_height - depth), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Bottom back edge
-    
-    # Depth connecting edges (always visible)
-    pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x + depth, bar_y - depth), 2)  # Top-left connection
-    pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y), (bar_x + bar_width + depth, bar_y - depth), 2)  # Top-right connection
-    pygame.draw.line(surface, vertex_color, (bar_x, bar_y + bar_height), (bar_x + depth, bar_y + bar_height - depth), 2)  # Bottom-left connection
-    pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y + bar_height), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Bottom-right connection
+    if layer == "static":
+        # Only draw vertex lines that should be visible (not hidden behind faces)
+        # Back edges (always visible)
+        pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y - depth), (bar_x + depth, bar_y + bar_height - depth), 2)  # Left back edge
+        pygame.draw.line(surface, vertex_color, (bar_x + bar_width + depth, bar_y - depth), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Right back edge
+        pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y - depth), (bar_x + bar_width + depth, bar_y - depth), 2)  # Top back edge
+        pygame.draw.line(surface, vertex_color, (bar_x + depth, bar_y + bar_height - depth), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Bottom back edge
+        
+        # Depth connecting edges (always visible)
+        pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x + depth, bar_y - depth), 2)  # Top-left connection
+        pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y), (bar_x + bar_width + depth, bar_y - depth), 2)  # Top-right connection
+        pygame.draw.line(surface, vertex_color, (bar_x, bar_y + bar_height), (bar_x + depth, bar_y + bar_height - depth), 2)  # Bottom-left connection
+        pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y + bar_height), (bar_x + bar_width + depth, bar_y + bar_height - depth), 2)  # Bottom-right connection
+        return
     
     # STEP 2: Draw filled portion (middle layer)
-    if not show_lo:
+    if layer is None and not show_lo:
         fill_height = int((value / max_value) * bar_height)
         if fill_height > 0:
             fill_y = bar_y + bar_height - fill_height
@@ -3352,93 +3856,100 @@ def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme
                 # Top-right connection of fill
                 pygame.draw.line(surface, fill_vertex_color, (bar_x + bar_width - 6, fill_y + 2), (bar_x + bar_width + depth - 10, fill_y - depth + 4), 2)
     
-    # STEP 3: Draw frame faces ON TOP (front layer) - will hide vertex lines behind them
-    # Main frame (ONLY border, no fill to keep it transparent)
-    pygame.draw.rect(surface, dim_color, (bar_x, bar_y, bar_width, bar_height), 4)
-    
-    # Top face frame (3D effect) - brighter (will hide top vertex lines)
-    top_points = [(bar_x, bar_y), (bar_x + depth, bar_y - depth), 
-                  (bar_x + bar_width + depth, bar_y - depth), (bar_x + bar_width, bar_y)]
-    pygame.draw.polygon(surface, bright_color, top_points)
-    pygame.draw.polygon(surface, dim_color, top_points, 2)  # Outline
-    
-    # Right face frame (3D effect) - darker for depth (will hide right vertex lines)
-    right_points = [(bar_x + bar_width, bar_y), (bar_x + bar_width + depth, bar_y - depth),
-                    (bar_x + bar_width + depth, bar_y + bar_height - depth), (bar_x + bar_width, bar_y + bar_height)]
-    pygame.draw.polygon(surface, darker_color, right_points)
-    pygame.draw.polygon(surface, dim_color, right_points, 2)  # Outline
-    
-    # Add horizontal grid lines to container bar for reference
-    grid_color = (max(0, dim_color[0] + 20), max(0, dim_color[1] + 15), max(0, dim_color[2] + 10))  # Slightly brighter than dim color
-    num_grid_lines = 8  # Number of horizontal reference lines
-    
-    for i in range(1, num_grid_lines):  # Skip first and last (they're the borders)
-        grid_y = bar_y + (i * bar_height // num_grid_lines)
-        # Main horizontal grid line (front face)
-        pygame.draw.line(surface, grid_color, (bar_x + 4, grid_y), (bar_x + bar_width - 4, grid_y), 1)
-        # 3D effect grid line on right face - FIXED to match vertex line angles exactly
-        grid_right_start_y = grid_y - depth  # Match the exact angle of vertex lines
-        pygame.draw.line(surface, grid_color, (bar_x + bar_width, grid_y), (bar_x + bar_width + depth, grid_right_start_y), 1)
-    
-    # Add min/max labels at the beginning and end of the bar (like Citroën style) - MUCH LARGER SIZE
-    minmax_font = pygame.font.SysFont('Arial', 24, bold=True)  # Increased from 20 to 24 for better readability
-    
-    # Determine min/max labels based on gauge type
-    if "FUEL" in label.upper():
-        min_label = "E"
-        max_label = "F"
-    elif "TEMP" in label.upper():
-        min_label = "LO"
-        max_label = "HI"
-    elif "VOLTS" in label.upper():
-        min_label = "8"
-        max_label = "16"
-    elif "PRESS" in label.upper():
-        min_label = "0"
-        max_label = "80"
-    else:
-        min_label = "0"
-        max_label = str(int(max_value))
-    
-    # Draw min label (bottom of bar) - LARGER
-    min_text = minmax_font.render(min_label, True, bright_color)
-    min_rect = min_text.get_rect(center=(bar_x - 30, bar_y + bar_height - 15))
-    surface.blit(min_text, min_rect)
-    
-    # Draw max label (top of bar) - LARGER
-    max_text = minmax_font.render(max_label, True, bright_color)
-    max_rect = max_text.get_rect(center=(bar_x - 30, bar_y + 15))
-    surface.blit(max_text, max_rect)
-    
-    # STEP 4: Draw front vertex lines ON TOP (only the ones that should be visible in front)
-    # Front edges (visible on top of everything)
-    pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x, bar_y + bar_height), 2)  # Left front edge
-    pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y), (bar_x + bar_width, bar_y + bar_height), 2)  # Right front edge
-    pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x + bar_width, bar_y), 2)  # Top front edge
-    pygame.draw.line(surface, vertex_color, (bar_x, bar_y + bar_height), (bar_x + bar_width, bar_y + bar_height), 2)  # Bottom front edge
-    
-    # Draw multi-line label with better formatting
-    font_label = pygame.font.SysFont('Arial', 16, bold=True)
-    
-    # Handle multi-line labels
-    if "BATTERY" in label.upper():
-        lines = ["BATTERY", "VOLTS"]
-    elif "COOLANT" in label.upper():
-        lines = ["COOLANT", "TEMP °F"]
-    elif "OIL TEMP" in label.upper():
-        lines = ["OIL", "TEMP °F"]
-    elif "OIL PRESS" in label.upper():
-        lines = ["OIL", "PRESS PSI"]
-    elif "FUEL" in label.upper():
-        lines = ["FUEL", "%"]
-    else:
-        lines = [label]
+    if layer == "overlay":
+        # STEP 3: Draw frame faces ON TOP (front layer) - will hide vertex lines behind them
+        # Main frame (ONLY border, no fill to keep it transparent)
+        pygame.draw.rect(surface, dim_color, (bar_x, bar_y, bar_width, bar_height), 4)
+        
+        # Top face frame (3D effect) - brighter (will hide top vertex lines)
+        top_points = [(bar_x, bar_y), (bar_x + depth, bar_y - depth), 
+                      (bar_x + bar_width + depth, bar_y - depth), (bar_x + bar_width, bar_y)]
+        pygame.draw.polygon(surface, bright_color, top_points)
+        pygame.draw.polygon(surface, dim_color, top_points, 2)  # Outline
+        
+        # Right face frame (3D effect) - darker for depth (will hide right vertex lines)
+        right_points = [(bar_x + bar_width, bar_y), (bar_x + bar_width + depth, bar_y - depth),
+                        (bar_x + bar_width + depth, bar_y + bar_height - depth), (bar_x + bar_width, bar_y + bar_height)]
+        pygame.draw.polygon(surface, darker_color, right_points)
+        pygame.draw.polygon(surface, dim_color, right_points, 2)  # Outline
+        
+        # Add horizontal grid lines to container bar for reference
+        grid_color = (max(0, dim_color[0] + 20), max(0, dim_color[1] + 15), max(0, dim_color[2] + 10))  # Slightly brighter than dim color
+        num_grid_lines = 8  # Number of horizontal reference lines
+        
+        for i in range(1, num_grid_lines):  # Skip first and last (they're the borders)
+            grid_y = bar_y + (i * bar_height // num_grid_lines)
+            # Main horizontal grid line (front face)
+            pygame.draw.line(surface, grid_color, (bar_x + 4, grid_y), (bar_x + bar_width - 4, grid_y), 1)
+            # 3D effect grid line on right face - FIXED to match vertex line angles exactly
+            grid_right_start_y = grid_y - depth  # Match the exact angle of vertex lines
+            pygame.draw.line(surface, grid_color, (bar_x + bar_width, grid_y), (bar_x + bar_width + depth, grid_right_start_y), 1)
+        
+        # Add min/max labels at the beginning and end of the bar (like Citroën style) - MUCH LARGER SIZE
+        minmax_font = get_font('Arial', 24)  # Increased from 20 to 24 for better readability
+        
+        # Determine min/max labels based on gauge type
+        if "FUEL" in label.upper():
+            min_label = "E"
+            max_label = "F"
+        elif "TEMP" in label.upper():
+            min_label = "LO"
+            max_label = "HI"
+        elif "VOLTS" in label.upper():
+            min_label = "8"
+            max_label = "16"
+        elif "PRESS" in label.upper():
+            min_label = "0"
+            max_label = "80"
+        else:
+            min_label = "0"
+            max_label = str(int(max_value))
+        
+        # Draw min label (bottom of bar) - LARGER
+        min_text = render_text(minmax_font, min_label, True, bright_color)
+        min_rect = min_text.get_rect(center=(bar_x - 30, bar_y + bar_height - 15))
+        surface.blit(min_text, min_rect)
+        
+        # Draw max label (top of bar) - LARGER
+        max_text = render_text(minmax_font, max_label, True, bright_color)
+        max_rect = max_text.get_rect(center=(bar_x - 30, bar_y + 15))
+        surface.blit(max_text, max_rect)
+        
+        # STEP 4: Draw front vertex lines ON TOP (only the ones that should be visible in front)
+        # Front edges (visible on top of everything)
+        pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x, bar_y + bar_height), 2)  # Left front edge
+        pygame.draw.line(surface, vertex_color, (bar_x + bar_width, bar_y), (bar_x + bar_width, bar_y + bar_height), 2)  # Right front edge
+        pygame.draw.line(surface, vertex_color, (bar_x, bar_y), (bar_x + bar_width, bar_y), 2)  # Top front edge
+        pygame.draw.line(surface, vertex_color, (bar_x, bar_y + bar_height), (bar_x + bar_width, bar_y + bar_height), 2)  # Bottom front edge
+        
+        # Draw multi-line label with better formatting
+        font_label = get_font('Arial', 16)
+        
+        # Handle multi-line labels
+        if "BATTERY" in label.upper():
+            lines = ["BATTERY", "VOLTS"]
+        elif "COOLANT" in label.upper():
+            lines = ["COOLANT", "TEMP °F"]
+        elif "OIL TEMP" in label.upper():
+            lines = ["OIL", "TEMP °F"]
+        elif "OIL PRESS" in label.upper():
+            lines = ["OIL", "PRESS PSI"]
+        elif "FUEL" in label.upper():
+            lines = ["FUEL", "%"]
+        else:
+            lines = [label]
+        
+        # Draw each line of the label
+        for i, line in enumerate(lines):
+            line_text = render_text(font_label, line, True, bright_color)
+            line_rect = line_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20 + i * 20))
+            surface.blit(line_text, line_rect)
+        return
     
-    # Draw each line of the label
-    for i, line in enumerate(lines):
-        line_text = font_label.render(line, True, bright_color)
-        line_rect = line_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20 + i * 20))
-        surface.blit(line_text, line_rect)
+    # Frame faces, grid and labels go on top of the fill
+    overlay, position = get_static_layer(("xt_bar_overlay", rect, label), surface.get_size(),
+                                         lambda s: draw_xt_3d_vertical_bar(s, value, max_value, rect, label, color_scheme, "overlay"))
+    surface.blit(overlay, position)
     
     # Draw value in DSEG style with REAL VALUES from Arduino
     dseg_size = 30  # Larger DSEG digits
@@ -3446,8 +3957,8 @@ def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme
     
     if show_lo:
         # Show "LO" text for low temperature readings
-        lo_font = pygame.font.SysFont('Arial', 32, bold=True)
-        lo_text = lo_font.render("LO", True, bright_color)
+        lo_font = get_font('Arial', 32)
+        lo_text = render_text(lo_font, "LO", True, bright_color)
         lo_rect = lo_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 40))
         surface.blit(lo_text, lo_rect)
     else:
@@ -3475,8 +3986,8 @@ def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme
             # Check for RESERVE warning (low fuel)
             if value < 10:  # Less than 10% fuel
                 # Show RESERVE warning instead of DSEG digits
-                reserve_font = pygame.font.SysFont('Arial', 28, bold=True)
-                reserve_text = reserve_font.render("RESERVE", True, XT_DIM_AMBER)  # Same color as unfilled bars
+                reserve_font = get_font('Arial', 28)
+                reserve_text = render_text(reserve_font, "RESERVE", True, XT_DIM_AMBER)  # Same color as unfilled bars
                 reserve_rect = reserve_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 40))
                 surface.blit(reserve_text, reserve_rect)
                 return  # Skip DSEG display
@@ -3511,8 +4022,8 @@ def draw_xt_3d_vertical_bar(surface, value, max_value, rect, label, color_scheme
             # Draw red danger rectangle near the label
             danger_rect = pygame.Rect(rect[0] + rect[2] - 40, rect[1] + 5, 30, 20)
             pygame.draw.rect(surface, (255, 0, 0), danger_rect)  # Red rectangle
-            danger_font = pygame.font.SysFont('Arial', 12, bold=True)
-            danger_text = danger_font.render("!", True, (255, 255, 255))  # White exclamation
+            danger_font = get_font('Arial', 12)
+            danger_text = render_text(danger_font, "!", True, (255, 255, 255))  # White exclamation
             danger_text_rect = danger_text.get_rect(center=danger_rect.center)
             surface.blit(danger_text, danger_text_rect)
         
@@ -3663,9 +4174,9 @@ def draw_xt_road_bars(surface, speed, rpm, rect):
         if marker_rpm % 2000 == 0:
             # Font size varies from small at top (16) to large at bottom (28) - BIGGER
             font_size = int(16 + (marker_progress * 12))  # 16 to 28
-            font = pygame.font.SysFont('Arial', font_size, bold=True)
+            font = get_font('Arial', font_size)
             rpm_display = marker_rpm // 1000
-            rpm_text = font.render(str(rpm_display), True, marker_color)
+            rpm_text = render_text(font, str(rpm_display), True, marker_color)
             rpm_rect = rpm_text.get_rect(center=(left_marker_end + 15, marker_y))
             surface.blit(rpm_text, rpm_rect)
     
@@ -3690,8 +4201,8 @@ def draw_xt_road_bars(surface, speed, rpm, rect):
         if marker_speed % 40 == 0:
             # Font size varies from small at top (16) to large at bottom (28) - BIGGER
             font_size = int(16 + (marker_progress * 12))  # 16 to 28
-            font = pygame.font.SysFont('Arial', font_size, bold=True)
-            speed_text = font.render(str(marker_speed), True, marker_color)
+            font = get_font('Arial', font_size)
+            speed_text = render_text(font, str(marker_speed), True, marker_color)
             # Special positioning for 120 to avoid overlap with milestone line
             if marker_speed == 120:
                 speed_rect = speed_text.get_rect(center=(right_marker_start - 25, marker_y))
@@ -3711,8 +4222,8 @@ def draw_xt_road_bars(surface, speed, rpm, rect):
                            digit_width, XT_AMBER, dseg_size, leading_zero_dim=0.3)
     
     # RPM label - MOVED EVEN MORE TO THE RIGHT
-    font = pygame.font.SysFont('Arial', 18, bold=True)
-    rpm_label = font.render("RPM x100", True, XT_AMBER)
+    font = get_font('Arial', 18)
+    rpm_label = render_text(font, "RPM x100", True, XT_AMBER)
     rpm_label_rect = rpm_label.get_rect(center=(rpm_x + 50, rpm_y + dseg_size + 50))
     surface.blit(rpm_label, rpm_label_rect)
     
@@ -3724,19 +4235,69 @@ def draw_xt_road_bars(surface, speed, rpm, rect):
                            digit_width, XT_AMBER, dseg_size, leading_zero_dim=0.3)
     
     # Speed label - MOVED EVEN MORE TO THE RIGHT
-    speed_label = font.render("MPH", True, XT_AMBER)
+    speed_label = render_text(font, "MPH", True, XT_AMBER)
     speed_label_rect = speed_label.get_rect(center=(speed_x + 75, speed_y + dseg_size + 50))
     surface.blit(speed_label, speed_label_rect)
     
     # REDLINE warning text in center gap when RPM > 5000
     if rpm > 5000:
-        redline_font = pygame.font.SysFont('Arial', 24, bold=True)
-        redline_text = redline_font.render("REDLINE", True, (255, 140, 0))  # Same bright orange as redline fill
+        redline_font = get_font('Arial', 24)
+        redline_text = render_text(redline_font, "REDLINE", True, (255, 140, 0))  # Same bright orange as redline fill
         redline_rect = redline_text.get_rect(center=(center_x, top_y + road_height // 2))
         surface.blit(redline_text, redline_rect)
 
-def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label):
+def zx_tick_bar_state(value, max_value, label):
+    """What a 300ZX tick bar shows for value - (active tick, danger flag, readout)"""
+    # Calculate which tick should be bright (based on value) - 20 ticks
+    num_ticks = 20
+    value_progress = min(value / max_value, 1.0)
+    active_tick = int(value_progress * (num_ticks - 1))
+    
+    # Check for danger levels and add red warning rectangle
+    is_danger = False
+    if "OIL" in label.upper() and "TEMP" in label.upper() and value > 280:  # Oil temp > 280°F
+        is_danger = True
+    elif "OIL" in label.upper() and "PRESS" in label.upper() and value < 5:  # Oil pressure < 5 PSI
+        is_danger = True
+    elif "COOLANT" in label.upper() and value > 230:  # Coolant temp > 230°F
+        is_danger = True
+    elif "VOLT" in label.upper() and (value < 10.5 or value > 15.5):  # Voltage out of range
+        is_danger = True
+    elif "FUEL" in label.upper() and value < 10:  # Fuel < 10%
+        is_danger = True
+    
+    # Readout below the bar - a word, or (display value, digits, decimal position) for the DSEG digits
+    if "TEMP" in label.upper() and value < 100:
+        readout = "LO"  # Low temperature readings
+    elif "FUEL" in label.upper() and value < 10:
+        readout = "RESERVE"  # Low fuel
+    elif "TEMP" in label.upper():
+        readout = (int(round(value)), 3, None)  # Temperature: XXX format (e.g., 185)
+    elif "PRESS" in label.upper():
+        readout = (int(round(value)), 2, None)  # Pressure: 00 format (e.g., 40)
+    elif "VOLT" in label.upper():
+        readout = (round(value, 1), 3, 2)  # Voltage: 00.0 format (e.g., 12.6) - same rounding as the .1f digits
+    elif "FUEL" in label.upper():
+        readout = (int(round(value)), 3, None)  # Fuel: XXX format (e.g., 75)
+    else:
+        readout = (round(value, 1), 3, 2)  # Default: XX.X format
+    return active_tick, is_danger, readout
+
+def zx_tick_bar_memo(value, max_value, rect, label, layer=None):
+    """Memo slot and state of draw_zx_vertical_tick_bar - static passes draw directly"""
+    if layer is not None:
+        return None
+    return (rect, label, max_value), zx_tick_bar_state(value, max_value, label)
+
+@memoize_gauge(zx_tick_bar_memo)
+def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label, layer=None):
     """Draw Nissan 300ZX style vertical bar with dimmed ticks and single bright tick at value level"""
+    # Static parts (borders, dimmed ticks, labels) come from the layer cache - layer="static" draws only them
+    if layer is None:
+        static, position = get_static_layer(("zx_tick_bar", rect, label, surface.get_size(), surface.get_bitsize()),
+                                            surface.get_size(),
+                                            lambda s: draw_zx_vertical_tick_bar(s, value, max_value, rect, label, "static"))
+        surface.blit(static, position)
     
     # Bar dimensions - MUCH WIDER (4x wider)
     bar_width = 160  # Increased from 40 to 160 (4x wider)
@@ -3745,8 +4306,9 @@ def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label):
     bar_y = rect[1] + 60  # Space for label at top
     
     # Draw left and right border lines
-    pygame.draw.line(surface, ZX_TURQUOISE, (bar_x, bar_y), (bar_x, bar_y + bar_height), 2)
-    pygame.draw.line(surface, ZX_TURQUOISE, (bar_x + bar_width, bar_y), (bar_x + bar_width, bar_y + bar_height), 2)
+    if layer == "static":
+        pygame.draw.line(surface, ZX_TURQUOISE, (bar_x, bar_y), (bar_x, bar_y + bar_height), 2)
+        pygame.draw.line(surface, ZX_TURQUOISE, (bar_x + bar_width, bar_y), (bar_x + bar_width, bar_y + bar_height), 2)
     
     # Draw ticks - EVEN THICKER WITH SMALLER GAPS
     num_ticks = 20  # Number of tick marks
@@ -3754,9 +4316,8 @@ def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label):
     tick_gap = 1     # Smaller gap between ticks (reduced from 2 to 1)
     tick_spacing = (bar_height - (num_ticks - 1) * tick_gap) / num_ticks
     
-    # Calculate which tick should be bright (based on value)
-    value_progress = min(value / max_value, 1.0)
-    active_tick = int(value_progress * (num_ticks - 1))
+    # Which tick is bright, the danger flag and the readout below the bar
+    active_tick, is_danger, readout = zx_tick_bar_state(value, max_value, label)
     
     for i in range(num_ticks):
         # Calculate tick position with gaps
@@ -3765,129 +4326,97 @@ def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label):
         tick_end_x = bar_x + bar_width - 5
         
         # Use bright color for the active tick, dim for others
-        if i == active_tick:
+        # (the static layer holds every tick dimmed, so a frame only repaints the active one)
+        if layer == "static":
+            tick_color = ZX_DIM_TURQUOISE
+        elif i == active_tick:
             tick_color = ZX_BRIGHT_TURQUOISE
         else:
-            tick_color = ZX_DIM_TURQUOISE
+            continue
         
         # Draw thick tick as filled rectangle
         tick_rect = pygame.Rect(tick_start_x, tick_y, tick_end_x - tick_start_x, tick_height)
         pygame.draw.rect(surface, tick_color, tick_rect)
     
-    # Check for danger levels and add red warning rectangle
-    is_danger = False
-    if "OIL" in label.upper() and "TEMP" in label.upper() and value > 280:  # Oil temp > 280°F
-        is_danger = True
-    elif "OIL" in label.upper() and "PRESS" in label.upper() and value < 5:  # Oil pressure < 5 PSI
-        is_danger = True
-    elif "COOLANT" in label.upper() and value > 230:  # Coolant temp > 230°F
-        is_danger = True
-    elif "VOLT" in label.upper() and (value < 10.5 or value > 15.5):  # Voltage out of range
-        is_danger = True
-    elif "FUEL" in label.upper() and value < 10:  # Fuel < 10%
-        is_danger = True
-    
-    # Draw label at top - LARGER FONT
-    label_font = pygame.font.SysFont('Arial', 20, bold=True)  # Increased from 16 to 20
-    label_text = label_font.render(label, True, ZX_TURQUOISE)
-    label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 30))
-    surface.blit(label_text, label_rect)
+    if layer == "static":
+        # Draw label at top - LARGER FONT
+        label_font = get_font('Arial', 20)  # Increased from 16 to 20
+        label_text = render_text(label_font, label, True, ZX_TURQUOISE)
+        label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 30))
+        surface.blit(label_text, label_rect)
+        
+        # Add min/max labels with milestone lines (like previous styles) - LARGER FONT
+        minmax_font = get_font('Arial', 22)  # Increased from 18 to 22
+        
+        # Determine min/max labels based on gauge type
+        if "FUEL" in label.upper():
+            min_label = "E"
+            max_label = "F"
+        elif "TEMP" in label.upper():
+            min_label = "LO"
+            max_label = "HI"
+        elif "VOLT" in label.upper():
+            min_label = "8"
+            max_label = "16"
+        elif "PRESS" in label.upper():
+            min_label = "0"
+            max_label = "80"
+        else:
+            min_label = "0"
+            max_label = str(int(max_value))
+        
+        # Right border line x position
+        right_border_x = bar_x + bar_width
+        
+        # Draw max label (top of bar) with milestone line
+        max_text = render_text(minmax_font, max_label, True, ZX_TURQUOISE)
+        max_label_x = right_border_x + 30  # 30px to the right of bar
+        max_label_y = bar_y
+        max_rect = max_text.get_rect(center=(max_label_x, max_label_y))
+        surface.blit(max_text, max_rect)
+        
+        # Milestone line from right border to max label
+        pygame.draw.line(surface, ZX_TURQUOISE, (right_border_x, bar_y), (max_label_x - 15, max_label_y), 2)
+        
+        # Draw min label (bottom of bar) with milestone line
+        min_text = render_text(minmax_font, min_label, True, ZX_TURQUOISE)
+        min_label_x = right_border_x + 30  # 30px to the right of bar
+        min_label_y = bar_y + bar_height
+        min_rect = min_text.get_rect(center=(min_label_x, min_label_y))
+        surface.blit(min_text, min_rect)
+        
+        # Milestone line from right border to min label
+        pygame.draw.line(surface, ZX_TURQUOISE, (right_border_x, bar_y + bar_height), (min_label_x - 15, min_label_y), 2)
+        return
     
     # Draw red danger rectangle near the label if dangerous level detected
     if is_danger:
         danger_rect = pygame.Rect(rect[0] + rect[2] - 40, rect[1] + 10, 30, 20)
         pygame.draw.rect(surface, (255, 0, 0), danger_rect)  # Red rectangle
-        danger_font = pygame.font.SysFont('Arial', 14, bold=True)
-        danger_text = danger_font.render("!", True, (255, 255, 255))  # White exclamation
+        danger_font = get_font('Arial', 14)
+        danger_text = render_text(danger_font, "!", True, (255, 255, 255))  # White exclamation
         danger_text_rect = danger_text.get_rect(center=danger_rect.center)
         surface.blit(danger_text, danger_text_rect)
     
-    # Add min/max labels with milestone lines (like previous styles) - LARGER FONT
-    minmax_font = pygame.font.SysFont('Arial', 22, bold=True)  # Increased from 18 to 22
+    # Draw value below bar using DSEG digits - BIGGER SIZE
+    dseg_size = 40  # Large DSEG digits
+    digit_width = dseg_size + 12
     
-    # Determine min/max labels based on gauge type
-    if "FUEL" in label.upper():
-        min_label = "E"
-        max_label = "F"
-    elif "TEMP" in label.upper():
-        min_label = "LO"
-        max_label = "HI"
-    elif "VOLT" in label.upper():
-        min_label = "8"
-        max_label = "16"
-    elif "PRESS" in label.upper():
-        min_label = "0"
-        max_label = "80"
-    else:
-        min_label = "0"
-        max_label = str(int(max_value))
-    
-    # Right border line x position
-    right_border_x = bar_x + bar_width
-    
-    # Draw max label (top of bar) with milestone line
-    max_text = minmax_font.render(max_label, True, ZX_TURQUOISE)
-    max_label_x = right_border_x + 30  # 30px to the right of bar
-    max_label_y = bar_y
-    max_rect = max_text.get_rect(center=(max_label_x, max_label_y))
-    surface.blit(max_text, max_rect)
-    
-    # Milestone line from right border to max label
-    pygame.draw.line(surface, ZX_TURQUOISE, (right_border_x, bar_y), (max_label_x - 15, max_label_y), 2)
-    
-    # Draw min label (bottom of bar) with milestone line
-    min_text = minmax_font.render(min_label, True, ZX_TURQUOISE)
-    min_label_x = right_border_x + 30  # 30px to the right of bar
-    min_label_y = bar_y + bar_height
-    min_rect = min_text.get_rect(center=(min_label_x, min_label_y))
-    surface.blit(min_text, min_rect)
-    
-    # Milestone line from right border to min label
-    pygame.draw.line(surface, ZX_TURQUOISE, (right_border_x, bar_y + bar_height), (min_label_x - 15, min_label_y), 2)
-    
-    # Draw value below bar using DSEG digits - BIGGER SIZE
-    dseg_size = 40  # Large DSEG digits
-    digit_width = dseg_size + 12
-    
-    if "TEMP" in label.upper() and value < 100:
+    if readout == "LO":
         # Show "LO" text for low temperature readings
-        lo_font = pygame.font.SysFont('Arial', dseg_size, bold=True)
-        lo_text = lo_font.render("LO", True, ZX_TURQUOISE)
+        lo_font = get_font('Arial', dseg_size)
+        lo_text = render_text(lo_font, "LO", True, ZX_TURQUOISE)
         lo_rect = lo_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 40))
         surface.blit(lo_text, lo_rect)
-    elif "FUEL" in label.upper() and value < 10:
+    elif readout == "RESERVE":
         # Show "RESERVE" text for low fuel (red color)
-        reserve_font = pygame.font.SysFont('Arial', 28, bold=True)
-        reserve_text = reserve_font.render("RESERVE", True, (255, 0, 0))  # Red color for warning
+        reserve_font = get_font('Arial', 28)
+        reserve_text = render_text(reserve_font, "RESERVE", True, (255, 0, 0))  # Red color for warning
         reserve_rect = reserve_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 40))
         surface.blit(reserve_text, reserve_rect)
     else:
-        # Format value for DSEG display
-        if "TEMP" in label.upper():
-            # Temperature: XXX format (e.g., 185)
-            display_value = int(round(value))
-            num_digits = 3
-            decimal_pos = None
-        elif "PRESS" in label.upper():
-            # Pressure: 00 format (e.g., 40) - using same format as voltage for consistency
-            display_value = int(round(value))
-            num_digits = 2
-            decimal_pos = None
-        elif "VOLT" in label.upper():
-            # Voltage: 00.0 format (e.g., 12.6)
-            display_value = value
-            num_digits = 3
-            decimal_pos = 2
-        elif "FUEL" in label.upper():
-            # Fuel: XXX format (e.g., 75)
-            display_value = int(round(value))
-            num_digits = 3
-            decimal_pos = None
-        else:
-            # Default: XX.X format
-            display_value = value
-            num_digits = 3
-            decimal_pos = 2
+        # DSEG digits for the value as rounded by zx_tick_bar_state()
+        display_value, num_digits, decimal_pos = readout
         
         # Center DSEG display
         total_width = num_digits * digit_width
@@ -3901,8 +4430,8 @@ def draw_zx_vertical_tick_bar(surface, value, max_value, rect, label):
 def draw_zx_gph_display(surface, gph_value, label, rect):
     """Draw GPH display using Synthwave method (no multiplication)"""
     # Label at top
-    label_font = pygame.font.SysFont('Arial', 22, bold=True)
-    label_text = label_font.render(label, True, ZX_TURQUOISE)
+    label_font = get_font('Arial', 22)
+    label_text = render_text(label_font, label, True, ZX_TURQUOISE)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -3919,8 +4448,8 @@ def draw_zx_dseg_display_large(surface, value, label, rect):
     """Draw Nissan 300ZX style DSEG display for MPG/Range/Trip - LARGER SIZE"""
     
     # Label at top - LARGER FONT
-    label_font = pygame.font.SysFont('Arial', 22, bold=True)  # Increased from 18
-    label_text = label_font.render(label, True, ZX_TURQUOISE)
+    label_font = get_font('Arial', 22)  # Increased from 18
+    label_text = render_text(label_font, label, True, ZX_TURQUOISE)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -3930,13 +4459,13 @@ def draw_zx_dseg_display_large(surface, value, label, rect):
     
     # Handle special values
     if value == -1.0:  # IDLE
-        idle_font = pygame.font.SysFont('Arial', 32, bold=True)  # Larger idle text
-        idle_text = idle_font.render("IDLE", True, ZX_TURQUOISE)
+        idle_font = get_font('Arial', 32)  # Larger idle text
+        idle_text = render_text(idle_font, "IDLE", True, ZX_TURQUOISE)
         idle_rect = idle_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(idle_text, idle_rect)
     elif value == -2.0:  # OFF
-        off_font = pygame.font.SysFont('Arial', 32, bold=True)  # Larger off text
-        off_text = off_font.render("OFF", True, ZX_TURQUOISE)
+        off_font = get_font('Arial', 32)  # Larger off text
+        off_text = render_text(off_font, "OFF", True, ZX_TURQUOISE)
         off_rect = off_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(off_text, off_rect)
     else:
@@ -3968,8 +4497,8 @@ def draw_zx_dseg_display(surface, value, label, rect):
     """Draw Nissan 300ZX style DSEG display for MPG/Range/Trip"""
     
     # Label at top
-    label_font = pygame.font.SysFont('Arial', 18, bold=True)
-    label_text = label_font.render(label, True, ZX_TURQUOISE)
+    label_font = get_font('Arial', 18)
+    label_text = render_text(label_font, label, True, ZX_TURQUOISE)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -3979,13 +4508,13 @@ def draw_zx_dseg_display(surface, value, label, rect):
     
     # Handle special values
     if value == -1.0:  # IDLE
-        idle_font = pygame.font.SysFont('Arial', 24, bold=True)
-        idle_text = idle_font.render("IDLE", True, ZX_TURQUOISE)
+        idle_font = get_font('Arial', 24)
+        idle_text = render_text(idle_font, "IDLE", True, ZX_TURQUOISE)
         idle_rect = idle_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(idle_text, idle_rect)
     elif value == -2.0:  # OFF
-        off_font = pygame.font.SysFont('Arial', 24, bold=True)
-        off_text = off_font.render("OFF", True, ZX_TURQUOISE)
+        off_font = get_font('Arial', 24)
+        off_text = render_text(off_font, "OFF", True, ZX_TURQUOISE)
         off_rect = off_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(off_text, off_rect)
     else:
@@ -4010,183 +4539,56 @@ def draw_zx_dseg_display(surface, value, label, rect):
 
 def draw_zx_horizontal_tachometer(surface, rpm, rect):
     """Draw Nissan 300ZX style horizontal tachometer line with curved top edge and variable height ticks"""
-    import math
-    
-    # Define max_rpm first
-    max_rpm = 6000
-    
-    # Tachometer line dimensions - SIGNIFICANTLY WIDER - MOVED DOWN
-    line_width = rect[2] - 40  # Reduced margin from 100 to 40 (60px wider)
-    line_height = 60
-    line_x = rect[0] + 20  # Reduced margin from 50 to 20 (30px wider on each side)
-    line_y = rect[1] + rect[3] - 120  # Moved down (was -150, now -120, +30px down)
-    
-    # Create curved top edge using tanh-like function
-    curve_points = []
-    num_curve_points = 100  # Number of points to define the curve
-    
-    for i in range(num_curve_points + 1):
-        x_progress = i / num_curve_points  # 0 to 1
-        x_pos = line_x + (x_progress * line_width)
-        
-        # Tanh-like curve: y = tanh(4 * (x - 0.5)) scaled and shifted
-        # This creates a smooth S-curve that rises from left to right
-        curve_input = 4 * (x_progress - 0.5)  # Range from -2 to 2
-        tanh_value = math.tanh(curve_input)  # Range from -1 to 1
-        
-        # Scale and position the curve - LIFT LEFT SIDE
-        curve_height = (tanh_value + 1.4) * 1.2 * line_height  # Added 0.4 offset to lift left side
-        y_pos = line_y + line_height - curve_height
-        
-        curve_points.append((int(x_pos), int(y_pos)))
-    
-    # Add bottom corners to complete the shape
-    bottom_left = (line_x, line_y + line_height)
-    bottom_right = (line_x + line_width, line_y + line_height)
-    
-    # Create complete polygon for the tachometer shape
-    tach_shape = [bottom_left] + curve_points + [bottom_right]
+    # Curved (tanh) outline, fill tick columns and milestone positions are precomputed per rect
+    shape = zx_tachometer_shape(tuple(rect))
+    line_x, line_y = shape.line_x, shape.line_y
+    line_width, line_height = shape.line_width, shape.line_height
+    bottom_y = line_y + line_height
     
     # Draw border of the curved tachometer with redline section
     gray_color = (128, 128, 128)  # Gray for border and milestone lines
-    red_color = (255, 0, 0)       # Red for redline section
-    
-    # Calculate redline start position (5000 RPM = 83.3% of 6000 RPM)
-    redline_start_progress = 5000 / max_rpm  # 0.833
-    redline_start_x = line_x + (redline_start_progress * line_width)
-    
-    # Draw gray border for normal range (0-5000 RPM)
-    normal_curve_points = []
-    redline_curve_points = []
-    
-    for i in range(num_curve_points + 1):
-        x_progress = i / num_curve_points
-        x_pos = line_x + (x_progress * line_width)
-        
-        curve_input = 4 * (x_progress - 0.5)
-        tanh_value = math.tanh(curve_input)
-        curve_height = (tanh_value + 1.4) * 1.2 * line_height
-        y_pos = line_y + line_height - curve_height
-        
-        if x_progress <= redline_start_progress:
-            normal_curve_points.append((int(x_pos), int(y_pos)))
-        else:
-            redline_curve_points.append((int(x_pos), int(y_pos)))
-    
-    # Draw normal range border (gray)
-    if len(normal_curve_points) > 1:
-        pygame.draw.lines(surface, gray_color, False, normal_curve_points, 2)
-    
-    # Draw redline range border (red)  
-    if len(redline_curve_points) > 1:
-        pygame.draw.lines(surface, red_color, False, redline_curve_points, 2)
+    red_color = (255, 0, 0)       # Red for redline section (5000+ RPM)
+    if len(shape.normal_curve) > 1:
+        pygame.draw.lines(surface, gray_color, False, shape.normal_curve, 2)
+    if len(shape.redline_curve) > 1:
+        pygame.draw.lines(surface, red_color, False, shape.redline_curve, 2)
     
     # Draw bottom and side borders
-    pygame.draw.line(surface, gray_color, (line_x, line_y + line_height), (redline_start_x, line_y + line_height), 2)  # Bottom normal
-    pygame.draw.line(surface, red_color, (redline_start_x, line_y + line_height), (line_x + line_width, line_y + line_height), 2)  # Bottom redline
-    pygame.draw.line(surface, gray_color, (line_x, line_y + line_height), normal_curve_points[0], 2)  # Left side
-    pygame.draw.line(surface, red_color, (line_x + line_width, line_y + line_height), redline_curve_points[-1], 2)  # Right side
-    
-    # Calculate fill progress
-    rpm_progress = min(rpm / max_rpm, 1.0)
-    fill_width = int(rpm_progress * line_width)
-    
-    # Draw vertical ticks as fill instead of solid area (left to right based on RPM)
-    num_fill_ticks = 30  # Reduced further for thicker ticks with gaps
-    tick_width = 12  # Much thicker ticks
-    tick_gap = 3    # Small gap between ticks
-    # Calculate spacing to fill entire width
-    available_width = line_width
-    total_gap_space = (num_fill_ticks - 1) * tick_gap
-    remaining_width = available_width - total_gap_space
-    actual_tick_width = remaining_width / num_fill_ticks
-    tick_start_x = line_x  # Start from beginning, not centered
-    
-    for i in range(num_fill_ticks):
-        tick_x = tick_start_x + i * (actual_tick_width + tick_gap)
-        
-        # Calculate curve height at this x position
-        x_progress = (tick_x - line_x) / line_width
-        curve_input = 4 * (x_progress - 0.5)
-        tanh_value = math.tanh(curve_input)
-        curve_height = (tanh_value + 1.4) * 1.2 * line_height
-        curve_y = line_y + line_height - curve_height
-        
-        # Draw thick vertical tick with variable height based on RPM
-        tick_start_y = line_y + line_height
-        full_tick_height = tick_start_y - curve_y  # Full height to curve
-        
-        # Variable tick height based on RPM (0-100% of full height)
-        rpm_progress = min(rpm / max_rpm, 1.0)
+    pygame.draw.line(surface, gray_color, (line_x, bottom_y), (shape.redline_start_x, bottom_y), 2)  # Bottom normal
+    pygame.draw.line(surface, red_color, (shape.redline_start_x, bottom_y), (line_x + line_width, bottom_y), 2)  # Bottom redline
+    pygame.draw.line(surface, gray_color, (line_x, bottom_y), shape.normal_curve[0], 2)  # Left side
+    pygame.draw.line(surface, red_color, (line_x + line_width, bottom_y), shape.redline_curve[-1], 2)  # Right side
+    
+    # Vertical ticks as fill (left to right based on RPM), each as tall as the RPM share of its column
+    rpm_progress = min(rpm / 6000, 1.0)
+    fill_right = line_x + int(rpm_progress * line_width)
+    for tick_x, full_tick_height, is_redline in shape.fill_ticks:
         actual_tick_height = full_tick_height * rpm_progress
-        tick_end_y = tick_start_y - actual_tick_height
-        
         if actual_tick_height > 0:
-            # Determine if this tick is in redline zone (5000+ RPM)
-            tick_rpm = (tick_x - line_x) / line_width * max_rpm
-            is_redline = tick_rpm >= 5000
-            
-            # Color logic: redline ticks are red, normal ticks are turquoise
-            if tick_x <= line_x + fill_width:
-                # Filled area
-                if is_redline:
-                    tick_color = (255, 100, 100)  # Bright red for filled redline ticks
-                else:
-                    tick_color = ZX_BRIGHT_TURQUOISE  # Bright turquoise for filled normal ticks
+            # Redline ticks are red, normal ticks are turquoise - bright when filled
+            if tick_x <= fill_right:
+                tick_color = (255, 100, 100) if is_redline else ZX_BRIGHT_TURQUOISE
             else:
-                # Unfilled area
-                if is_redline:
-                    tick_color = (150, 50, 50)    # Dim red for unfilled redline ticks
-                else:
-                    tick_color = ZX_DIM_TURQUOISE  # Dim turquoise for unfilled normal ticks
+                tick_color = REDLINE_DIM_RED if is_redline else ZX_DIM_TURQUOISE
             
-            tick_rect = pygame.Rect(int(tick_x), int(tick_end_y), int(actual_tick_width), int(actual_tick_height))
+            tick_rect = pygame.Rect(int(tick_x), int(bottom_y - actual_tick_height), int(shape.tick_width), int(actual_tick_height))
             pygame.draw.rect(surface, tick_color, tick_rect)
     
-    # Draw milestone markers OUTSIDE the bar - GRAY COLOR
-    milestone_rpms = [0, 1000, 2000, 3000, 4000, 5000, 6000]
-    
-    for milestone_rpm in milestone_rpms:
-        # Calculate position along tachometer width
-        rpm_progress = milestone_rpm / max_rpm
-        milestone_x = line_x + (rpm_progress * line_width)
-        
-        # Calculate curve height at this position
-        x_progress = rpm_progress
-        curve_input = 4 * (x_progress - 0.5)
-        tanh_value = math.tanh(curve_input)
-        curve_height = (tanh_value + 1.4) * 1.2 * line_height
-        curve_y = line_y + line_height - curve_height
-        
-        # Draw milestone line OUTSIDE (below) the bar
-        milestone_start_y = line_y + line_height + 5  # Start below bar
-        milestone_end_y = milestone_start_y + 15      # 15px long line
-        
-        # Use red color for redline markers (5000+ RPM), gray for others
-        if milestone_rpm >= 5000:  # Redline starts at 5000 RPM
-            line_color = (255, 0, 0)  # Red for redline
-        else:
-            line_color = gray_color   # Gray for normal range
-            
+    # Draw milestone markers OUTSIDE (below) the bar with RPM numbers under them - red from the redline
+    milestone_font = get_font('Arial', 22)
+    milestone_start_y = bottom_y + 5
+    milestone_end_y = milestone_start_y + 15  # 15px long line
+    for milestone_rpm, milestone_x in shape.milestones:
+        line_color = red_color if milestone_rpm >= 5000 else gray_color
         pygame.draw.line(surface, line_color, (milestone_x, milestone_start_y), (milestone_x, milestone_end_y), 2)
         
-        # Draw RPM numbers below milestone lines (show ALL numbers) - LARGER FONT
-        milestone_font = pygame.font.SysFont('Arial', 22, bold=True)  # Increased from 16 to 22
-        rpm_display = milestone_rpm // 1000  # Show as 0, 1, 2, 3, 4, 5, 6
-        
-        # Use red color for redline (5000+ RPM), gray for others
-        if milestone_rpm >= 5000:  # Redline starts at 5000 RPM
-            number_color = (255, 0, 0)  # Red for redline
-        else:
-            number_color = gray_color    # Gray for normal range
-            
-        rpm_text = milestone_font.render(str(rpm_display), True, number_color)
+        rpm_text = render_text(milestone_font, str(milestone_rpm // 1000), True, line_color)
         rpm_rect = rpm_text.get_rect(center=(milestone_x, milestone_end_y + 15))
         surface.blit(rpm_text, rpm_rect)
     
     # RPM label - MOVED EVEN HIGHER
-    rpm_font = pygame.font.SysFont('Arial', 18, bold=True)
-    rpm_text = rpm_font.render("RPM x1000", True, ZX_TURQUOISE)
+    rpm_font = get_font('Arial', 18)
+    rpm_text = render_text(rpm_font, "RPM x1000", True, ZX_TURQUOISE)
     rpm_rect = rpm_text.get_rect(topright=(rect[0] + rect[2] - 20, rect[1] - 60))  # Moved even higher (was -30, now -60)
     surface.blit(rpm_text, rpm_rect)
 
@@ -4198,13 +4600,13 @@ def draw_xt_dseg_display(surface, value, label, rect):
     
     # Handle special values
     if value == -1.0:  # IDLE
-        idle_font = pygame.font.SysFont('Arial', 28, bold=True)
-        idle_text = idle_font.render("IDLE", True, XT_AMBER)
+        idle_font = get_font('Arial', 28)
+        idle_text = render_text(idle_font, "IDLE", True, XT_AMBER)
         idle_rect = idle_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(idle_text, idle_rect)
     elif value == -2.0:  # OFF
-        off_font = pygame.font.SysFont('Arial', 28, bold=True)
-        off_text = off_font.render("OFF", True, XT_AMBER)
+        off_font = get_font('Arial', 28)
+        off_text = render_text(off_font, "OFF", True, XT_AMBER)
         off_rect = off_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + rect[3]//2))
         surface.blit(off_text, off_rect)
     else:
@@ -4233,16 +4635,16 @@ def draw_xt_dseg_display(surface, value, label, rect):
                                    digit_width, XT_AMBER, dseg_size, leading_zero_dim=0.5, decimal_pos=decimal_pos)
     
     # Draw label
-    font = pygame.font.SysFont('Arial', 18, bold=True)
-    label_text = font.render(label, True, XT_AMBER)
+    font = get_font('Arial', 18)
+    label_text = render_text(font, label, True, XT_AMBER)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + 20))
     surface.blit(label_text, label_rect)
 
 def draw_xt_gph_display(surface, gph_value, label, rect):
     """Draw GPH display using Synthwave method (no multiplication)"""
     # Label
-    font = pygame.font.SysFont('Arial', 18, bold=True)
-    label_text = font.render(label, True, XT_AMBER)
+    font = get_font('Arial', 18)
+    label_text = render_text(font, label, True, XT_AMBER)
     label_rect = label_text.get_rect(center=(rect[0] + rect[2]//2, rect[1] + 20))
     surface.blit(label_text, label_rect)
     
@@ -4255,15 +4657,310 @@ def draw_xt_gph_display(surface, gph_value, label, rect):
     # Use the exact same function as Synthwave
     draw_dsi_multi_digit_display(surface, gph_value, 3, start_x, start_y, digit_spacing, XT_AMBER, digit_size, 0.5, decimal_pos=2)
 
-# Main loop
+# Render benchmark (tools/benchmark_render.py) - a scripted telemetry sweep instead of the demo
+# values, timing of every draw_* function and a JSON report, all only in benchmark runs
+BENCHMARK_SWEEP = BENCHMARK_FRAMES and os.environ.get('DASHBOARD_BENCHMARK_SWEEP', '0') == '1'
+BENCHMARK_PROFILE = BENCHMARK_FRAMES and os.environ.get('DASHBOARD_BENCHMARK_PROFILE', '0') == '1'
+BENCHMARK_JSON = os.environ.get('DASHBOARD_BENCHMARK_JSON') if BENCHMARK_FRAMES else None
+BENCHMARK_WARMUP = 10  # First frames build caches - left out of the statistics
+FRAME_BUDGET_MS = 1000.0 / 60  # The loop's 60 FPS cap
+
+# Every switch the sweep toggles - all 512 combinations, metric included
+SWEEP_SWITCHES = ("switch_oil_pressure", "switch_oil_temp", "switch_coolant_temp", "switch_volts",
+                  "switch_fuel_range", "switch_trip_odo", "switch_inst_mpg", "switch_avg_mpg", "switch_metric")
+SWEEP_COMBINATIONS = 1 << len(SWEEP_SWITCHES)
+# Each combination is held long enough for the gauge memo to settle and then hit, like a driver
+# flipping a switch - shorter runs visit fewer combinations, never shorter holds
+SWEEP_HOLD_FRAMES = GAUGE_MEMO_SETTLE + 4
+SWEEP_STRIDE = 205  # Odd, so the visited combinations are distinct and every switch toggles
+
+def triangle(frame, period):
+    """0 -> 1 -> 0 over period frames"""
+    phase = (frame % period) / period
+    return 2 * phase if phase < 0.5 else 2 * (1 - phase)
+
+def apply_benchmark_sweep(frame):
+    """Scripted telemetry for one frame of a sweep run, returns (speed, rpm) like read_arduino_data()"""
+    global current_speed, current_rpm, display_speed, display_rpm, serial_connected
+    global current_fuel_level, current_oil_pressure, current_coolant_temp, current_oil_temp
+    global current_battery_voltage, current_brightness, current_fuel_range, current_inst_mpg
+    global current_avg_mpg, current_fuel_flow_gph
+    global switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts
+    global switch_fuel_range, switch_trip_odo, switch_inst_mpg, switch_avg_mpg, switch_metric
+    
+    serial_connected = True  # Sweep values stand in for the Arduino, so every gauge shows them
+    
+    # Speed 0-140 mph and RPM 0-6500 swing with different periods, so each switch combination
+    # sees other values; the sensors cover their warning ranges (LO, RESERVE, danger flags)
+    current_speed = display_speed = 140.0 * triangle(frame, 240)
+    current_rpm = display_rpm = 6500.0 * triangle(frame, 170)
+    current_fuel_level = 100.0 - 100.0 * triangle(frame, 400)
+    current_oil_pressure = 80.0 * triangle(frame, 130)
+    current_coolant_temp = 60.0 + 200.0 * triangle(frame, 310)
+    current_oil_temp = 60.0 + 250.0 * triangle(frame, 290)
+    current_battery_voltage = 9.0 + 8.0 * triangle(frame, 210)
+    current_inst_mpg = 40.0 * triangle(frame, 190) if current_speed >= 1.0 else 0.0  # 0 = idling (GPH)
+    current_avg_mpg = 19.8
+    current_fuel_range = current_fuel_level * 3.5
+    current_fuel_flow_gph = 0.8 + 3.0 * triangle(frame, 150)
+    current_brightness = 75.0
+    
+    # Next switch combination every SWEEP_HOLD_FRAMES - all 512 in a run of 512 holds
+    combination = (frame // SWEEP_HOLD_FRAMES * SWEEP_STRIDE) % SWEEP_COMBINATIONS
+    (switch_oil_pressure, switch_oil_temp, switch_coolant_temp, switch_volts, switch_fuel_range,
+     switch_trip_odo, switch_inst_mpg, switch_avg_mpg, switch_metric) = (
+        bool(combination & (1 << bit)) for bit in range(len(SWEEP_SWITCHES)))
+    return current_speed, current_rpm
+
+# Per-draw profile - every draw_* function and the per-screen phases (brightness, rotate, blit,
+# push) are wrapped with a timer; nested draws count towards their caller's inclusive time but
+# not its self time. Benchmark runs keep every frame, the live profile (DASHBOARD_PROFILE=1,
+# F2 shows the HUD on the DSI screen) the last PROFILE_RING_FRAMES
+show_profile_hud = os.environ.get('DASHBOARD_PROFILE_HUD', '0') == '1'  # Start with the HUD up
+LIVE_PROFILE = show_profile_hud or os.environ.get('DASHBOARD_PROFILE', '0') == '1'
+PROFILED_PHASES = ("render_frame", "read_arduino_data", "apply_telemetry", "handle_events",
+                   "apply_software_brightness", "rotate_screen", "composite_screen", "push_display")
+PROFILE_RING_FRAMES = 120  # Frames the HUD averages over (2 seconds at 60 FPS)
+PROFILE_HUD_INTERVAL_NS = 500 * 1000000  # HUD text refresh - steady enough to read
+PROFILE_HUD_COLOR = (255, 255, 255)      # In every indexed palette (WARNING_INKS)
+draw_frame_profile = {}  # name -> [calls, inclusive ns, self ns] in the current frame
+draw_profile = {}        # name -> list of (calls, inclusive ms, self ms) per frame it ran in (benchmark)
+profile_stack = []       # Nested-draw time of each running timed call
+profile_depth = {}       # name -> recursion depth (static layer passes call themselves)
+profile_ring = {}        # name -> array of self ns per frame, PROFILE_RING_FRAMES long
+profile_frame_ends = array('q', bytes(8 * PROFILE_RING_FRAMES))  # perf_counter_ns at the end of each frame
+profile_frames = 0       # Frames recorded into the ring so far
+profile_hud_lines = []   # Rendered (label, value) HUD rows, refreshed every PROFILE_HUD_INTERVAL_NS
+profile_hud_time = 0     # perf_counter_ns of the last refresh
+profile_hud_serial = 0   # Serial lines received at the last refresh
+profile_timers = {}      # name -> unwrapped function while the timers are in
+
+def profiled(name, draw):
+    """draw wrapped to add its calls and time to draw_frame_profile"""
+    def timed(*args, **kwargs):
+        profile_stack.append(0)
+        profile_depth[name] = profile_depth.get(name, 0) + 1
+        start = time.perf_counter_ns()
+        try:
+            return draw(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            nested = profile_stack.pop()
+            if profile_stack:
+                profile_stack[-1] += elapsed
+            profile_depth[name] -= 1
+            entry = draw_frame_profile.setdefault(name, [0, 0, 0])
+            entry[0] += 1
+            entry[2] += elapsed - nested
+            if not profile_depth[name]:
+                entry[1] += elapsed  # Outermost call only - a recursive call is already inside it
+            if trace_events is not None:
+                trace_events.append((name, start, start + elapsed, render_thread, None))
+    timed.__name__ = name
+    timed.__doc__ = draw.__doc__
+    return timed
+
+def end_frame_profile(rebuilt):
+    """Move the current frame's draw timings into draw_profile and the live ring - benchmark
+    warm-up frames and frames that rebuilt static layers are left out of draw_profile, so the
+    breakdown shows the steady-state cost"""
+    global profile_frames
+    if BENCHMARK_PROFILE and loop_counter > BENCHMARK_WARMUP and not rebuilt:
+        for name, (calls, inclusive, self_ns) in draw_frame_profile.items():
+            draw_profile.setdefault(name, []).append((calls, inclusive / 1e6, self_ns / 1e6))
+    if LIVE_PROFILE:
+        slot = profile_frames % PROFILE_RING_FRAMES
+        for name, entry in draw_frame_profile.items():
+            if name not in profile_ring:
+                profile_ring[name] = array('q', bytes(8 * PROFILE_RING_FRAMES))
+            profile_ring[name][slot] = entry[2]
+        for name, ring in profile_ring.items():
+            if name not in draw_frame_profile:
+                ring[slot] = 0  # Did not run this frame (other style, switch state)
+        profile_frame_ends[slot] = time.perf_counter_ns()
+        profile_frames += 1
+    draw_frame_profile.clear()
+
+def profile_ring_top(count):
+    """(name, mean self ms per frame) of the costliest profiled functions over the ring"""
+    frames = min(profile_frames, PROFILE_RING_FRAMES)
+    means = [(name, sum(ring) / frames / 1e6) for name, ring in profile_ring.items()]
+    return sorted(means, key=lambda item: -item[1])[:count]
+
+def profile_ring_fps():
+    """Frames per second over the ring, from the first to the last recorded frame end"""
+    frames = min(profile_frames, PROFILE_RING_FRAMES)
+    if frames < 2:
+        return 0.0
+    newest = profile_frame_ends[(profile_frames - 1) % PROFILE_RING_FRAMES]
+    oldest = profile_frame_ends[(profile_frames - frames) % PROFILE_RING_FRAMES]
+    return (frames - 1) * 1e9 / max(newest - oldest, 1)
+
+def draw_profile_hud(surface):
+    """Performance HUD in the top left of the DSI screen - FPS, serial lines/sec, top 5 phases"""
+    global profile_hud_lines, profile_hud_time, profile_hud_serial
+    now = time.perf_counter_ns()
+    if now - profile_hud_time >= PROFILE_HUD_INTERVAL_NS or not profile_hud_lines:
+        # Serial lines (and binary frames) the reader ingested since the last refresh
+        received = (serial_reader.lines_received + serial_reader.binary_frames) if serial_reader else 0
+        lines_per_second = (received - profile_hud_serial) * 1e9 / max(now - profile_hud_time, 1)
+        profile_hud_serial = received
+        profile_hud_time = now
+        
+        font = get_font('Arial', 20)
+        rows = [(f"{profile_ring_fps():.1f} FPS", f"{lines_per_second:.0f} lines/s")]
+        rows += [(name, f"{ms:.2f}ms") for name, ms in profile_ring_top(5)]
+        profile_hud_lines = [(render_text(font, label, True, PROFILE_HUD_COLOR),
+                              render_text(font, value, True, PROFILE_HUD_COLOR)) for label, value in rows]
+    
+    # Labels left, values right-aligned in a second column, on a black box so the gauges
+    # underneath don't bleed through the text
+    label_width = max(label.get_width() for label, value in profile_hud_lines)
+    value_width = max(value.get_width() for label, value in profile_hud_lines)
+    row_height = profile_hud_lines[0][0].get_height()
+    surface.fill(BLACK, (4, 4, label_width + value_width + 28, row_height * len(profile_hud_lines) + 8))
+    y = 8
+    for label, value in profile_hud_lines:
+        surface.blit(label, (10, y))
+        surface.blit(value, (label_width + value_width + 26 - value.get_width(), y))
+        y += row_height
+
+# Frame trace (F4 or SIGUSR1) - TRACE_SECONDS of every timed call, frame, clock.tick sleep and
+# serial reader wait/read/parse as Chrome Trace Event JSON for ui.perfetto.dev or chrome://tracing.
+# Without DASHBOARD_PROFILE=1 the profile timers go in for the trace and come out after it.
+# Events are kept per frame in a ring of the last TRACE_FRAMES, so an uncapped frame rate can't
+# grow the trace past TRACE_SECONDS at 60 FPS
+TRACE_SECONDS = float(os.environ.get('DASHBOARD_TRACE_SECONDS', '10'))
+TRACE_FRAMES = int(TRACE_SECONDS * 60)
+TRACE_FRAME_MAX_EVENTS = 20000  # Serial thread events per frame if the render loop stalls
+trace_events = None      # (name, start ns, end ns, thread, args) of the current frame, None = not tracing
+trace_frames = deque(maxlen=TRACE_FRAMES)  # Event lists of the finished frames
+trace_start_ns = 0
+trace_requested = False  # Set by SIGUSR1, the next frame starts the trace
+trace_writer = None      # Thread writing the last trace file
+render_thread = None     # Thread the frames run on, the timed calls' track
+
+def trace_event(name, start_ns, end_ns, args=None):
+    """Add a complete event on the calling thread to the running trace (list.append is atomic)"""
+    events = trace_events
+    if events is not None and len(events) < TRACE_FRAME_MAX_EVENTS:
+        events.append((name, start_ns, end_ns, threading.get_ident(), args))
+
+def start_trace():
+    """Start recording a TRACE_SECONDS trace - the serial reader thread records into it as well"""
+    global trace_events, trace_start_ns, trace_requested, render_thread
+    trace_requested = False
+    if trace_events is not None:
+        return
+    install_profile_timers()  # No-op when they are in from the start
+    render_thread = threading.get_ident()  # Called from step() / handle_events()
+    trace_start_ns = time.perf_counter_ns()
+    trace_frames.clear()
+    trace_events = []
+    if serial_reader:
+        serial_reader.trace = trace_event
+    print(f"📼 Recording a {TRACE_SECONDS:g}s frame trace...")
+
+def end_trace_frame():
+    """Move the finished frame's events into the ring - the oldest frame drops out once it is full"""
+    global trace_events
+    events, trace_events = trace_events, []
+    trace_frames.append(events)
+
+def finish_trace():
+    """Stop recording and write the trace as dashboard_trace_<time>.json on a background thread"""
+    global trace_events, trace_writer
+    if trace_events:
+        trace_frames.append(trace_events)
+    trace_events = None
+    if serial_reader:
+        serial_reader.trace = None
+    if not (BENCHMARK_PROFILE or LIVE_PROFILE):
+        remove_profile_timers()  # Only in for the trace
+    
+    # Only the hand-over happens on the render thread - encoding and writing run beside the frames
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    names[render_thread] = "render"
+    path = f"dashboard_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    trace_writer = threading.Thread(target=write_trace, name="trace writer",
+                                    args=(path, list(trace_frames), names, render_thread, trace_start_ns))
+    trace_frames.clear()
+    trace_writer.start()
+
+def write_trace(path, frames, names, render_tid, start_ns):
+    """Write frame event lists as Chrome Trace Event JSON, one event per line"""
+    pid = os.getpid()
+    try:
+        with open(path, 'w') as f:
+            # Thread names for the Perfetto tracks, then every call as a complete ("X") event in microseconds
+            f.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+            tids = {event[3] for events in frames for event in events}
+            for tid in tids:
+                f.write(json.dumps({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                    "args": {"name": names.get(tid, str(tid))}}) + ",\n")
+            count = 0
+            for events in frames:
+                for name, start, end, tid, args in events:
+                    event = {"name": name, "cat": "draw" if name.startswith("draw_") else "frame" if tid == render_tid else "serial",
+                             "ph": "X", "ts": (start - start_ns) / 1000.0, "dur": (end - start) / 1000.0, "pid": pid, "tid": tid}
+                    if args:
+                        event["args"] = args
+                    f.write(("" if not count else ",\n") + json.dumps(event))
+                    count += 1
+            f.write("\n]}\n")
+        print(f"📼 Frame trace saved to {path} ({len(frames)} frames, {count} events) - open it in ui.perfetto.dev")
+    except Exception as e:
+        print(f"Error saving frame trace: {e}")
+
+def trace_signal_handler(sig, frame):
+    """SIGUSR1 - record a frame trace (started by the next frame, not inside the handler)"""
+    global trace_requested
+    trace_requested = True
+
+def percentile(sorted_values, fraction):
+    """Value at fraction (0-1) of an ascending list - same indexing as the BENCHMARK line"""
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)] if sorted_values else 0.0
+
+def frame_summary(times):
+    """mean/p50/p95/p99/max of frame times in ms"""
+    ordered = sorted(times)
+    return {
+        "frames": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+def summarize_draw_profile(frame_ms):
+    """Per-draw timings as {name: stats}, slowest inclusive mean first - share is of the total frame_ms"""
+    summary = {}
+    for name, samples in draw_profile.items():
+        inclusive = sorted(sample[1] for sample in samples)
+        summary[name] = {
+            "frames": len(samples),
+            "calls_per_frame": round(sum(sample[0] for sample in samples) / len(samples), 2),
+            "mean_ms": round(sum(inclusive) / len(inclusive), 3),
+            "self_ms": round(sum(sample[2] for sample in samples) / len(samples), 3),
+            "p95_ms": round(percentile(inclusive, 0.95), 3),
+            "max_ms": round(inclusive[-1], 3),
+            "share": round(sum(inclusive) / max(sum(frame_ms), 1e-9), 4),
+            "over_budget_frames": sum(1 for value in inclusive if value > FRAME_BUDGET_MS),
+        }
+    return dict(sorted(summary.items(), key=lambda item: -item[1]["mean_ms"]))
+
+# Main loop state
 running = True
 loop_counter = 0
+frame_font_loads = 0  # Font loads in the last frame (target: 0 after warm-up)
+frame_times = []      # Render time per frame in ms (benchmark runs only)
+rebuild_frames = set() # Benchmark frames that rebuilt static layers (style / switch changes)
+disconnect_shown = False  # "ARDUINO DISCONNECTED" currently painted on the window background
 
-while running:
-    loop_counter += 1
-    
-    # Read data from Arduino
-    speed, rpm = read_arduino_data()
+def render_frame(speed, rpm):
+    """Draw the three screens for the current values, rotate them onto the window and push it"""
+    global last_brightness_value, software_brightness, disconnect_shown, full_redraw
     
     # Update screen brightness based on dimmer input (only when changed)
     if serial_connected:
@@ -4283,16 +4980,28 @@ while running:
     else:
         software_brightness = 0.75
     
-    # Clear main screen
-    screen.fill(BLACK)
-    
-    # Show simple disconnection message if needed
-    if not serial_connected and was_ever_connected:
-        # Arduino was connected before but now disconnected - show simple message
-        disconnect_font = pygame.font.SysFont('Arial', 56, bold=True)
-        disconnect_text = disconnect_font.render("ARDUINO DISCONNECTED", True, RED)
-        disconnect_rect = disconnect_text.get_rect(center=(TOTAL_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(disconnect_text, disconnect_rect)
+    # The disconnect message sits on the window background - repaint everything when it comes or goes
+    show_disconnect = not serial_connected and was_ever_connected
+    if show_disconnect != disconnect_shown:
+        disconnect_shown = show_disconnect
+        full_redraw = True
+    full_frame = full_redraw or not DIRTY_UPDATES
+    
+    if full_frame:
+        # Clear main screen
+        screen.fill(BLACK)
+        
+        # Show simple disconnection message if needed
+        if show_disconnect:
+            # Arduino was connected before but now disconnected - show simple message
+            disconnect_font = get_font('Arial', 56)
+            disconnect_text = render_text(disconnect_font, "ARDUINO DISCONNECTED", True, RED)
+            disconnect_rect = disconnect_text.get_rect(center=(TOTAL_WIDTH // 2, SCREEN_HEIGHT // 2))
+            screen.blit(disconnect_text, disconnect_rect)
+    
+    # Indexed or true-colour render targets for this style
+    if render_targets_style != current_style_index:
+        select_render_targets(current_style_index)
     
     # === LEFT SIDE - SPEEDOMETER ===
     if current_style_index == STYLE_SYNTHWAVE:
@@ -4436,15 +5145,15 @@ while running:
             draw_zx_dseg_display_large(speedometer_surface, range_value, "RANGE", range_rect)
     
     # Apply software brightness to speedometer
-    apply_software_brightness(speedometer_surface, software_brightness)
+    apply_software_brightness(speedometer_rotation, software_brightness)
     
     # Rotate speedometer surface 270 degrees (90° + 180° to fix upside-down display)
-    rotated_speedo = pygame.transform.rotate(speedometer_surface, 270)
+    rotated_speedo = rotate_screen(speedometer_rotation)
     speedo_rect = rotated_speedo.get_rect()
     # Move speedometer a bit more UP on left screen
     speedo_center_x = 2100  # Move a bit more UP to top of left screen
     speedo_center_y = (SCREEN_HEIGHT - speedo_rect.height) // 2 + 30
-    screen.blit(rotated_speedo, (speedo_center_x, speedo_center_y))
+    composite_screen(speedometer_rotation, rotated_speedo, (speedo_center_x, speedo_center_y), full_frame)
     
     # === RIGHT SIDE - TACHOMETER ===
     if current_style_index == STYLE_SYNTHWAVE:
@@ -4605,50 +5314,49 @@ while running:
         draw_odometer_display(tachometer_surface, persistent_data.data["total_odometer"])
     
     # Apply software brightness to tachometer
-    apply_software_brightness(tachometer_surface, software_brightness)
+    apply_software_brightness(tachometer_rotation, software_brightness)
     
     # Rotate tachometer surface 270 degrees (90° + 180° to fix upside-down display)
-    rotated_tacho = pygame.transform.rotate(tachometer_surface, 270)
+    rotated_tacho = rotate_screen(tachometer_rotation)
     tacho_rect = rotated_tacho.get_rect()
     # Move tachometer more LEFT on right screen
     tacho_center_x = 3000  # Keep X position
     tacho_center_y = -100  # Move more LEFT on right screen
-    screen.blit(rotated_tacho, (tacho_center_x, tacho_center_y))
+    composite_screen(tachometer_rotation, rotated_tacho, (tacho_center_x, tacho_center_y), full_frame)
     
     # === BOTTOM - DSI SCREEN ===
-    # Create temporary surface for DSI content to apply brightness
-    dsi_temp_surface = pygame.Surface((DSI_SCREEN_WIDTH, DSI_SCREEN_HEIGHT))
-    dsi_temp_surface.fill(BLACK)
+    # Persistent DSI render target - cleared, not reallocated, every frame
+    dsi_render_surface.fill(BLACK)
     
-    # Draw DSI content on temporary surface
+    # Draw DSI content on the render target
     if current_style_index == STYLE_SYNTHWAVE:
         # Original DSI screen with multiple gauges
-        draw_dsi_screen_content(dsi_temp_surface, speed, rpm)
+        draw_dsi_screen_content(dsi_render_surface, speed, rpm)
     elif current_style_index == STYLE_CITROEN_BX:
         # Citroën BX style DSI - road speedometer and arch tachometer
-        dsi_temp_surface.fill(BX_BLACK)
+        dsi_render_surface.fill(BX_BLACK)
         
         # Road speedometer (bottom half)
         speed_rect = (0, 240, 800, 240)
-        draw_bx_thick_road_speedometer(dsi_temp_surface, speed, speed_rect)
+        draw_bx_thick_road_speedometer(dsi_render_surface, speed, speed_rect)
         
         # Arch tachometer (top half)
         rpm_rect = (0, 0, 800, 240)
         safe_rpm = rpm if rpm is not None else 0
-        draw_bx_horizontal_arch_tachometer(dsi_temp_surface, safe_rpm, rpm_rect)
+        draw_bx_horizontal_arch_tachometer(dsi_render_surface, safe_rpm, rpm_rect)
     
     elif current_style_index == STYLE_SUBARU_XT:
         # Subaru XT style DSI - road bars with top-to-bottom fill and DSEG displays at top
-        dsi_temp_surface.fill(XT_BLACK)
+        dsi_render_surface.fill(XT_BLACK)
         
         # Road bars (full screen)
         road_rect = (0, 0, 800, 480)
         safe_rpm = rpm if rpm is not None else 0
-        draw_xt_road_bars(dsi_temp_surface, speed, safe_rpm, road_rect)
+        draw_xt_road_bars(dsi_render_surface, speed, safe_rpm, road_rect)
     
     elif current_style_index == STYLE_NISSAN_300ZX:
         # Nissan 300ZX style DSI - horizontal tachometer line and speedometer DSEG
-        dsi_temp_surface.fill(ZX_BLACK)
+        dsi_render_surface.fill(ZX_BLACK)
         
         # Speedometer DSEG digits (top center)
         speed_dseg_size = 60
@@ -4661,248 +5369,347 @@ while running:
         speed_dseg_x = 70   # Moved further left (was 100, now 70, -30px more left)
         speed_dseg_y = 140  # Moved way down (was 80, now 140, +60px more down)
         
-        draw_multi_digit_display(dsi_temp_surface, speed_display_value, speed_num_digits, 
+        draw_multi_digit_display(dsi_render_surface, speed_display_value, speed_num_digits, 
                                speed_dseg_x, speed_dseg_y, speed_digit_width, ZX_TURQUOISE, 
                                speed_dseg_size, leading_zero_dim=0.3)
         
         # Speed label - POSITIONED TO THE RIGHT OF DSEG DIGITS (MOVED SLIGHTLY MORE RIGHT)
-        speed_font = pygame.font.SysFont('Arial', 24, bold=True)
-        speed_label = speed_font.render("MPH", True, ZX_TURQUOISE)
+        speed_font = get_font('Arial', 24)
+        speed_label = render_text(speed_font, "MPH", True, ZX_TURQUOISE)
         speed_label_x = speed_dseg_x + speed_total_width + 30  # Moved slightly more right (was +20, now +30)
         speed_label_y = speed_dseg_y + (speed_dseg_size // 2)  # Vertically center with digits
         speed_label_rect = speed_label.get_rect(center=(speed_label_x, speed_label_y))
-        dsi_temp_surface.blit(speed_label, speed_label_rect)
+        dsi_render_surface.blit(speed_label, speed_label_rect)
         
         # Horizontal tachometer line (lower portion)
         tacho_rect = (0, 200, DSI_SCREEN_WIDTH, 200)
         safe_rpm = rpm if rpm is not None else 0
-        draw_zx_horizontal_tachometer(dsi_temp_surface, safe_rpm, tacho_rect)
+        draw_zx_horizontal_tachometer(dsi_render_surface, safe_rpm, tacho_rect)
         
         # REDLINE warning - aligned with MPH level but slightly higher
         if safe_rpm >= 5000:
-            redline_font = pygame.font.SysFont('Arial', 28, bold=True)
-            redline_text = redline_font.render("REDLINE", True, (255, 0, 0))  # Red color
+            redline_font = get_font('Arial', 28)
+            redline_text = render_text(redline_font, "REDLINE", True, (255, 0, 0))  # Red color
             redline_y = speed_dseg_y - 20  # Align with MPH level but 20px higher
             redline_rect = redline_text.get_rect(center=(DSI_SCREEN_WIDTH // 2, redline_y))
-            dsi_temp_surface.blit(redline_text, redline_rect)
+            dsi_render_surface.blit(redline_text, redline_rect)
     
     elif current_style_index == STYLE_CORVETTE_C4:
         # Corvette C4 style DSI - same as Synthwave (original DSI screen)
-        draw_dsi_screen_content(dsi_temp_surface, speed, rpm)
+        draw_dsi_screen_content(dsi_render_surface, speed, rpm)
+    
+    if show_profile_hud and LIVE_PROFILE:
+        draw_profile_hud(dsi_render_surface)
     
     # Apply software brightness to DSI surface
-    apply_software_brightness(dsi_temp_surface, software_brightness)
+    apply_software_brightness(dsi_rotation, software_brightness)
     
     # Rotate DSI surface 180 degrees to fix upside-down display
-    rotated_dsi = pygame.transform.rotate(dsi_temp_surface, 180)
+    rotated_dsi = rotate_screen(dsi_rotation)
     # Find middle ground for DSI position (between 4000 and 4100)
     dsi_x = 4050  # Middle ground between previous positions
     dsi_y = 0     # Keep Y at 0
-    screen.blit(rotated_dsi, (dsi_x, dsi_y))
+    composite_screen(dsi_rotation, rotated_dsi, (dsi_x, dsi_y), full_frame)
     
     # Clean dashboard - all debugging elements removed
-
+    if show_dirty_rects or dirty_outlines:
+        outline_dirty_regions(full_frame)
     
-    pygame.display.flip()
-    clock.tick(60)  # 60 FPS for more responsive display
-    
-    # Handle events
+    push_display(full_frame)
+    full_redraw = False
+
+def handle_events():
+    """Window and keyboard events - ESC or closing the window stops, F11 toggles fullscreen, F3 the dirty
+    overlay, F2 the performance HUD, F4 records a frame trace"""
+    global running, full_redraw, show_dirty_rects, show_profile_hud
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 running = False
-            elif event.key == pygame.K_F11:
+            elif event.key == pygame.K_F11 and display_output:
                 # Toggle fullscreen
-                is_fullscreen = not is_fullscreen
+                open_window(not is_fullscreen)
                 if is_fullscreen:
-                    screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT), pygame.NOFRAME)
                     print("Combined dashboard: Switched to BORDERLESS FULLSCREEN")
                 else:
-                    screen = pygame.display.set_mode((TOTAL_WIDTH, SCREEN_HEIGHT))
                     print("Combined dashboard: Switched to WINDOWED")
+                full_redraw = True  # New window surface starts out blank
+            elif event.key == pygame.K_F3:
+                # Toggle the dirty-rectangle debug overlay
+                show_dirty_rects = not show_dirty_rects
+                print(f"Dirty-rectangle overlay {'ON' if show_dirty_rects else 'OFF'}")
+            elif event.key == pygame.K_F2:
+                # Toggle the performance HUD - the timers are only wrapped in with DASHBOARD_PROFILE=1
+                if LIVE_PROFILE:
+                    show_profile_hud = not show_profile_hud
+                    print(f"Performance HUD {'ON' if show_profile_hud else 'OFF'}")
+                else:
+                    print("Performance HUD needs DASHBOARD_PROFILE=1 at start")
+            elif event.key == pygame.K_F4:
+                start_trace()
+        elif event.type == pygame.VIDEOEXPOSE:
+            full_redraw = True  # Window contents were lost (uncovered / restored)
 
-# Cleanup
-if serial_connected:
-    ser.close()
-    print("Serial connection closed")
+def install_profile_timers():
+    """Wrap every draw_* function, the phases and save_data with their timers (once)"""
+    if profile_timers:
+        return
+    for name, draw in list(globals().items()):
+        if (name.startswith("draw_") or name in PROFILED_PHASES) and callable(draw):
+            profile_timers[name] = draw
+            globals()[name] = profiled(name, draw)
+    # Odometer and settings writes happen on the render thread
+    profile_timers["save_data"] = PersistentDataManager.save_data
+    PersistentDataManager.save_data = profiled("save_data", PersistentDataManager.save_data)
 
-pygame.quit()
-print("Combined dashboard closed")
+def remove_profile_timers():
+    """Put the unwrapped functions back"""
+    for name, draw in profile_timers.items():
+        if name == "save_data":
+            PersistentDataManager.save_data = draw
+        else:
+            globals()[name] = draw
+    profile_timers.clear()
+    draw_frame_profile.clear()
 
-# ===== CITROËN BX STYLE FUNCTIONS =====
+# Profile timers go in once every draw function and phase is defined (benchmark or DASHBOARD_PROFILE),
+# else only while a frame trace records
+if BENCHMARK_PROFILE or LIVE_PROFILE:
+    install_profile_timers()
 
-def draw_bx_road_speedometer(surface, speed, rect):
-    """Draw Citroën BX style road speedometer - two vertical lines going into distance"""
-    # Road dimensions
-    road_bottom_width = 120
-    road_top_width = 40
-    road_height = 200
-    
-    # Calculate road lines (perspective effect)
-    center_x = rect[0] + rect[2] // 2
-    bottom_y = rect[1] + rect[3] - 20
-    top_y = bottom_y - road_height
-    
-    # Left road line
-    left_bottom = center_x - road_bottom_width // 2
-    left_top = center_x - road_top_width // 2
-    
-    # Right road line  
-    right_bottom = center_x + road_bottom_width // 2
-    right_top = center_x + road_top_width // 2
-    
-    # Draw road lines
-    pygame.draw.line(surface, BX_GREEN, (left_bottom, bottom_y), (left_top, top_y), 3)
-    pygame.draw.line(surface, BX_GREEN, (right_bottom, bottom_y), (right_top, top_y), 3)
-    
-    # Draw speed ticks along the road (0-120 MPH)
-    max_speed = 120
-    num_ticks = 12  # Every 10 MPH
-    
-    for i in range(num_ticks + 1):
-        tick_speed = i * 10
-        tick_progress = i / num_ticks
-        
-        # Calculate tick position (bottom to top)
-        tick_y = bottom_y - (tick_progress * road_height)
-        tick_left_x = left_bottom - (tick_progress * (road_bottom_width - road_top_width) // 2)
-        tick_right_x = right_bottom + (tick_progress * (road_bottom_width - road_top_width) // 2)
-        
-        # Highlight ticks based on current speed
-        if tick_speed <= speed:
-            color = BX_GREEN
-            thickness = 3
+def print_session_stats():
+    """Cache, layer, rotation and allocation statistics at exit - plus the BENCHMARK line and JSON report"""
+    total_lookups = text_cache_hits + text_cache_misses
+    print(f"Text cache: {text_cache_hits} hits, {text_cache_misses} misses "
+          f"({text_cache_hits / total_lookups if total_lookups else 0:.1%} hit rate), "
+          f"{len(text_cache)} entries, {text_cache_bytes // 1024} KB")
+    print(f"Static layers: {static_layer_builds} builds over {loop_counter} frames, {len(static_layers)} cached")
+    print(f"Symbol assets: {sum(1 for image in assets.sources.values() if image is not None)} images, "
+          f"{assets.builds} scaled/tinted variants built")
+    print(f"Digit atlas: {digit_sprite_builds} sprites built, {len(digit_atlas)} cached")
+    if gauge_memo_summary():
+        print(f"Gauge memo hits: {', '.join(gauge_memo_summary())}")
+    if TILED_ROTATION:
+        rotation_buffers = rgb_targets[3:] + (indexed_targets[3:] if indexed_targets else ())
+        rotated_tiles = sum(buffer.tile_rotations for buffer in rotation_buffers)
+        full_rotations = sum(buffer.full_rotations for buffer in rotation_buffers)
+        print(f"Rotation: {rotated_tiles} tiles, {full_rotations} full rotates over {loop_counter} frames")
+    
+    if frame_allocations:
+        # First frames fill the text cache and build the static layers - report them apart
+        warmup = frame_allocations[:60]
+        steady = frame_allocations[60:]
+        print(f"Surface allocations: {sum(warmup)} in the first {len(warmup)} frames, "
+              f"{sum(steady)} over the next {len(steady)} ({sum(1 for count in steady if count)} frames allocated, "
+              f"max {max(steady, default=0)} in one frame)")
+    
+    if DIRTY_UPDATES and full_window_pixels:
+        print(f"Display: pushed {pushed_pixels / full_window_pixels:.1%} of the full-window pixels")
+    
+    memo_hits = sum(hits for hits, misses, builds in gauge_memo_stats.values())
+    memo_calls = sum(hits + misses for hits, misses, builds in gauge_memo_stats.values())
+    if frame_times:
+        # One parseable line for tools/benchmark_rotation.py (first frames build caches - skipped)
+        measured = frame_times[min(BENCHMARK_WARMUP, len(frame_times) - 1):]
+        stats = frame_summary(measured)
+        print(f"BENCHMARK style={current_style_index} rotation={'tiled' if TILED_ROTATION else 'full'} "
+              f"frames={stats['frames']} mean_ms={stats['mean_ms']:.2f} "
+              f"p50_ms={stats['p50_ms']:.2f} p95_ms={stats['p95_ms']:.2f} p99_ms={stats['p99_ms']:.2f} "
+              f"allocs_per_frame={sum(frame_allocations[BENCHMARK_WARMUP:]) / max(len(frame_allocations) - BENCHMARK_WARMUP, 1):.2f} "
+              f"memo_hit_rate={memo_hits / max(memo_calls, 1):.3f}")
+    
+        if BENCHMARK_JSON:
+            # Full report for tools/benchmark_render.py - frames that rebuilt static layers (switch
+            # changes in a sweep) are also summarized on their own
+            first = BENCHMARK_WARMUP
+            steady = [ms for i, ms in enumerate(frame_times) if i >= first and i not in rebuild_frames]
+            if not steady:
+                print(f"❌ No steady frames in {len(frame_times)} - the run needs more than "
+                      f"{BENCHMARK_WARMUP} warmup frames plus a switch hold of {SWEEP_HOLD_FRAMES}")
+            report = {
+                "style": current_style_index,
+                "rotation": 'tiled' if TILED_ROTATION else 'full',
+                "indexed": INDEXED_RENDERING,
+                "sweep": bool(BENCHMARK_SWEEP),
+                "switch_combinations": min((len(frame_times) + SWEEP_HOLD_FRAMES - 1) // SWEEP_HOLD_FRAMES, SWEEP_COMBINATIONS) if BENCHMARK_SWEEP else 0,
+                "budget_ms": round(FRAME_BUDGET_MS, 3),
+                "frame": stats,
+                "steady_frame": frame_summary(steady),
+                "rebuild_frame": frame_summary([ms for i, ms in enumerate(frame_times)
+                                                if i >= first and i in rebuild_frames]),
+                "over_budget_frames": sum(1 for ms in steady if ms > FRAME_BUDGET_MS),  # Steady frames only
+                "allocs_per_frame": round(sum(frame_allocations[BENCHMARK_WARMUP:]) / max(len(frame_allocations) - BENCHMARK_WARMUP, 1), 3),
+                "memo_hit_rate": round(memo_hits / max(memo_calls, 1), 4),
+                "draw": summarize_draw_profile(steady) if BENCHMARK_PROFILE else {},
+            }
+            with open(BENCHMARK_JSON, 'w') as f:
+                json.dump(report, f, indent=2)
+
+class DashboardEngine:
+    """The whole dashboard behind start() / step() / shutdown() - the state lives in this module's
+    globals, so there is one engine per process"""
+
+    def __init__(self, window=None, headless=bool(BENCHMARK_FRAMES), arduino=not BENCHMARK_FRAMES,
+                 fps=0 if BENCHMARK_FRAMES else 60, clock=frame_clock if BENCHMARK_FRAMES else None,
+                 data_file=None):
+        self.window = window      # Surface to composite the screens onto, None = open the dashboard window
+        self.headless = headless  # SDL dummy video driver - nothing is shown
+        self.arduino = arduino    # Open the Arduino port (False = demo values unless step() gets telemetry)
+        self.fps = fps            # Frame rate cap of step(), 0 = as fast as possible
+        self.clock = clock        # Callable returning ms for timeouts, holds and animations (None = pygame ticks / replay time)
+        # Odometer/trip/style JSON - the car's file only when talking to the Arduino, else a temp file
+        self.data_file = data_file or (PERSISTENT_DATA_FILE if arduino else ENGINE_DATA_FILE)
+        self.started = False
+
+    @property
+    def running(self):
+        """False once ESC, a closed window, a signal or the end of a benchmark run stopped the dashboard"""
+        return running
+
+    @property
+    def surfaces(self):
+        """(speedometer, tachometer, DSI) render surfaces of the current style, before rotation"""
+        return speedometer_surface, tachometer_surface, dsi_render_surface
+
+    def start(self):
+        """Start pygame, open the window, load fonts, symbols and persistent data, connect the Arduino"""
+        global running, screen, display_output, clock, persistent_data
+        init_pygame(self.headless)
+        warm_font_registry()
+        
+        if self.window is None:
+            open_window(fullscreen_mode)
+            if fullscreen_mode:
+                print("Combined dashboard started in BORDERLESS FULLSCREEN mode")
+            else:
+                print("Combined dashboard started in WINDOWED mode")
+                print("Instructions: Press F11 for fullscreen")
+            pygame.display.set_caption("C4 Dual Dashboard - Combined")
+            pygame.mouse.set_visible(False)  # Hide mouse cursor for dashboard
+            display_output = True
         else:
-            color = BX_DIM_GREEN
-            thickness = 1
-            
-        # Draw tick across the road
-        pygame.draw.line(surface, color, (tick_left_x, tick_y), (tick_right_x, tick_y), thickness)
-    
-    # Draw digital speed in the center
-    font = pygame.font.SysFont('Arial', 48, bold=True)
-    speed_text = font.render(f"{int(speed)}", True, BX_GREEN)
-    speed_rect = speed_text.get_rect(center=(center_x, bottom_y - road_height // 2))
-    surface.blit(speed_text, speed_rect)
+            # Frames go into the caller's surface - convert() still needs a display pixel format
+            if pygame.display.get_surface() is None:
+                pygame.display.set_mode((1, 1), pygame.NOFRAME)
+            screen = self.window
+            display_output = False
+        clock = pygame.time.Clock()
+        create_render_targets()
+        if assets.preload(SYMBOL_SIZES) == len(SYMBOL_FILES):
+            print("Symbol images loaded successfully")
+        
+        persistent_data = PersistentDataManager(self.data_file)
+        load_saved_style()
+        connect_arduino(self.arduino, self.clock)
+        
+        print("C4 Corvette Dashboard - Triple Display System")
+        print(f"Arduino: {SERIAL_PORT} @ {SERIAL_BAUD} baud - {'Connected' if serial_connected else 'Demo Mode'}")
+        print("Press ESC to exit | F11 for fullscreen")
+        running = True
+        self.started = True
 
-def draw_bx_arch_tachometer(surface, rpm, rect):
-    """Draw Citroën BX style arch tachometer above the speedometer"""
-    # Arch dimensions
-    center_x = rect[0] + rect[2] // 2
-    center_y = rect[1] + 60
-    radius = 100
-    
-    # RPM range (0-6000)
-    max_rpm = 6000
-    start_angle = math.pi  # 180 degrees (left)
-    end_angle = 0  # 0 degrees (right)
-    total_angle = start_angle - end_angle
-    
-    # Draw arch background
-    pygame.draw.arc(surface, BX_DIM_GREEN, 
-                   (center_x - radius, center_y - radius, radius * 2, radius * 2),
-                   end_angle, start_angle, 3)
-    
-    # Draw RPM ticks
-    num_ticks = 12  # Every 500 RPM
-    for i in range(num_ticks + 1):
-        tick_rpm = i * 500
-        tick_progress = i / num_ticks
-        
-        # Calculate tick angle (left to right)
-        tick_angle = start_angle - (tick_progress * total_angle)
-        
-        # Highlight ticks based on current RPM
-        if tick_rpm <= rpm:
-            color = BX_GREEN
-            thickness = 4
+    def step(self, telemetry=None, now_ms=None):
+        """Render one frame, returns False once the dashboard should stop - telemetry is a
+        TelemetrySnapshot to show instead of the Arduino's, now_ms the frame time in its clock"""
+        global loop_counter, running, serial_connected, surface_allocations, font_loads, frame_font_loads
+        loop_counter += 1
+        frame_start = time.perf_counter()
+        if trace_requested:
+            start_trace()
+        frame_start_ns = time.perf_counter_ns()
+        
+        # Read data from Arduino (or the caller's snapshot, or the scripted sweep of a benchmark run)
+        if telemetry is not None:
+            serial_connected = True  # Injected telemetry stands in for the Arduino
+            speed, rpm = apply_telemetry(telemetry, now_ms)
+            # No reader queue here - a button state that differs from the shown one is the change
+            buttons = (telemetry.trip_btn, telemetry.avg_btn)
+            changed = None not in buttons and buttons != (button_trip_reset, button_avg_reset)
+            update_buttons([(telemetry.status_time, *buttons)] if changed else (),
+                           now_ms if now_ms is not None else dashboard_clock())
+        elif BENCHMARK_SWEEP:
+            speed, rpm = apply_benchmark_sweep(loop_counter)
         else:
-            color = BX_DIM_GREEN
-            thickness = 2
-            
-        # Calculate tick position
-        inner_radius = radius - 15
-        outer_radius = radius + 5
-        
-        inner_x = center_x + inner_radius * math.cos(tick_angle)
-        inner_y = center_y - inner_radius * math.sin(tick_angle)
-        outer_x = center_x + outer_radius * math.cos(tick_angle)
-        outer_y = center_y - outer_radius * math.sin(tick_angle)
-        
-        pygame.draw.line(surface, color, (inner_x, inner_y), (outer_x, outer_y), thickness)
-    
-    # Draw digital RPM below arch
-    font = pygame.font.SysFont('Arial', 24, bold=True)
-    rpm_text = font.render(f"{int(rpm)}", True, BX_GREEN)
-    rpm_rect = rpm_text.get_rect(center=(center_x, center_y + 40))
-    surface.blit(rpm_text, rpm_rect)
+            speed, rpm = read_arduino_data(now_ms)
+        frame_layer_builds = static_layer_builds
+        
+        render_frame(speed, rpm)
+        rebuilt = static_layer_builds != frame_layer_builds
+        
+        if BENCHMARK_FRAMES:
+            # Time the work, not the 60 FPS cap
+            frame_times.append((time.perf_counter() - frame_start) * 1000.0)
+            if rebuilt:
+                rebuild_frames.add(len(frame_times) - 1)
+            if loop_counter >= BENCHMARK_FRAMES:
+                running = False
+        if profile_timers:
+            end_frame_profile(rebuilt)
+        if self.fps:
+            tick_start = time.perf_counter_ns()
+            clock.tick(self.fps)  # 60 FPS for more responsive display
+            if trace_events is not None:
+                trace_event("clock.tick", tick_start, time.perf_counter_ns())
+        
+        # Surfaces allocated this frame - after warm-up this should stay at zero
+        frame_allocations.append(surface_allocations)
+        surface_allocations = 0
+        
+        # Fonts loaded this frame - anything here was missing from WARM_FONTS
+        frame_font_loads = font_loads
+        if frame_font_loads:
+            print(f"⚠️ Frame {loop_counter} loaded {frame_font_loads} font(s) - add to WARM_FONTS "
+                  f"({len(font_registry)} cached)")
+            font_loads = 0
+        
+        handle_events()
+        if trace_events is not None:
+            frame_end_ns = time.perf_counter_ns()
+            trace_event("frame", frame_start_ns, frame_end_ns, {"frame": loop_counter})
+            if frame_end_ns - trace_start_ns >= TRACE_SECONDS * 1e9:
+                finish_trace()
+            else:
+                end_trace_frame()
+        return running
 
-def draw_bx_horizontal_bar(surface, value, max_value, rect, label):
-    """Draw horizontal bar gauge for fuel level"""
-    bar_width = rect[2] - 40
-    bar_height = 20
-    bar_x = rect[0] + 20
-    bar_y = rect[1] + 30
-    
-    # Draw background bar
-    pygame.draw.rect(surface, BX_DIM_GREEN, (bar_x, bar_y, bar_width, bar_height), 2)
-    
-    # Draw filled portion
-    fill_width = int((value / max_value) * bar_width)
-    if fill_width > 0:
-        pygame.draw.rect(surface, BX_GREEN, (bar_x + 2, bar_y + 2, fill_width - 4, bar_height - 4))
-    
-    # Draw label and value
-    font = pygame.font.SysFont('Arial', 16, bold=True)
-    label_text = font.render(label, True, BX_GREEN)
-    surface.blit(label_text, (bar_x, bar_y - 25))
-    
-    value_text = font.render(f"{value:.1f}", True, BX_GREEN)
-    surface.blit(value_text, (bar_x + bar_width - 50, bar_y - 25))
+    def shutdown(self):
+        """Stop the serial reader, print the session statistics and close pygame"""
+        global running, text_cache_bytes
+        running = False
+        if trace_events is not None:
+            finish_trace()  # Keep what was recorded so far
+        if trace_writer is not None:
+            trace_writer.join()  # Let the file finish before exiting
+        if serial_reader:
+            serial_reader.stop()
+            print("Serial connection closed")
+        if session_recorder:
+            session_recorder.close_log()
+        print_session_stats()
+        pygame.quit()
+        # pygame.quit() frees the fonts - an engine started later loads its own
+        font_registry.clear()
+        text_cache.clear()
+        text_cache_bytes = 0
+        print("Combined dashboard closed")
+        self.started = False
 
-def draw_bx_vertical_bar(surface, value, max_value, rect, label):
-    """Draw vertical bar gauge for oil pressure, temperature, etc."""
-    bar_width = 20
-    bar_height = rect[3] - 80
-    bar_x = rect[0] + rect[2] // 2 - bar_width // 2
-    bar_y = rect[1] + 50
-    
-    # Draw background bar
-    pygame.draw.rect(surface, BX_DIM_GREEN, (bar_x, bar_y, bar_width, bar_height), 2)
-    
-    # Draw filled portion (bottom to top)
-    fill_height = int((value / max_value) * bar_height)
-    if fill_height > 0:
-        pygame.draw.rect(surface, BX_GREEN, 
-                        (bar_x + 2, bar_y + bar_height - fill_height - 2, bar_width - 4, fill_height))
-    
-    # Draw label and value
-    font = pygame.font.SysFont('Arial', 14, bold=True)
-    label_text = font.render(label, True, BX_GREEN)
-    label_rect = label_text.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + 20))
-    surface.blit(label_text, label_rect)
-    
-    value_text = font.render(f"{value:.1f}", True, BX_GREEN)
-    value_rect = value_text.get_rect(center=(rect[0] + rect[2] // 2, bar_y + bar_height + 20))
-    surface.blit(value_text, value_rect)
+def main():
+    """Run the dashboard until ESC, a closed window, SIGTERM/SIGINT or the end of a benchmark run"""
+    engine = DashboardEngine()
+    engine.start()
+    
+    # Register signal handlers
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGUSR1, trace_signal_handler)  # kill -USR1 <pid> records a frame trace
+    try:
+        while engine.step():
+            pass
+    finally:
+        engine.shutdown()
 
-def draw_bx_digital_display(surface, value, label, rect):
-    """Draw digital display for trip, range, MPG values"""
-    font_label = pygame.font.SysFont('Arial', 14, bold=True)
-    font_value = pygame.font.SysFont('Arial', 20, bold=True)
-    
-    # Draw label
-    label_text = font_label.render(label, True, BX_DIM_GREEN)
-    surface.blit(label_text, (rect[0], rect[1]))
-    
-    # Draw value
-    if isinstance(value, float):
-        value_str = f"{value:.1f}"
-    else:
-        value_str = str(value)
-    
-    value_text = font_value.render(value_str, True, BX_GREEN)
-    surface.blit(value_text, (rect[0], rect[1] + 20))
-# Duplicate function removed - moved to proper location before main loop
\ No newline at end of file
+if __name__ == "__main__":
+    main()
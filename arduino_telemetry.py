@@ -0,0 +1,714 @@
+"""
+Arduino Telemetry Reader for the C4 Corvette Dashboard
+Owns the serial port on a background thread so the 60 FPS render loop never blocks on readline()
+"""
+
+import binascii
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+from operator import attrgetter
+
+# Typed converters - builtins/bound methods so a field costs one C call, not a Python frame
+parse_float = float                                       # Analog values
+parse_switch = {"0": False, "1": True}.__getitem__        # 0/1 switch and button states
+CONVERT_ERRORS = (ValueError, KeyError)
+
+# Wire key -> (frame slot, converter, timestamp slot) - same keys arduino_code.cpp prints
+# speed_time/rpm_time: last SPEED/RPM sample, status_time: last switch/button line
+TELEMETRY_FIELDS = (
+    ("SPEED", "speed", parse_float, "speed_time"),
+    ("RPM", "rpm", parse_float, "rpm_time"),
+    ("FUEL", "fuel", parse_float, None),
+    ("OIL", "oil", parse_float, None),
+    ("COOLANT", "coolant", parse_float, None),
+    ("OILTEMP", "oil_temp", parse_float, None),
+    ("BATTERY", "battery", parse_float, None),
+    ("BRIGHTNESS", "brightness", parse_float, None),
+    ("FUEL_CONSUMPTION", "fuel_consumption", parse_float, None),
+    ("TRIP_ODO", "trip_odo", parse_float, None),
+    ("TOTAL_ODO", "total_odo", parse_float, None),
+    ("FUEL_USED", "fuel_used", parse_float, None),
+    ("FUELRNG", "fuel_range", parse_float, None),
+    ("IMPG", "inst_mpg", parse_float, None),
+    ("AMPG", "avg_mpg", parse_float, None),
+    ("FLOW", "flow", parse_float, None),
+    ("OIL_P_SW", "oil_pressure_sw", parse_switch, "status_time"),
+    ("OIL_T_SW", "oil_temp_sw", parse_switch, "status_time"),
+    ("COOL_SW", "coolant_sw", parse_switch, "status_time"),
+    ("VOLT_SW", "volts_sw", parse_switch, "status_time"),
+    ("FUELR_SW", "fuel_range_sw", parse_switch, "status_time"),
+    ("TRIP_SW", "trip_sw", parse_switch, "status_time"),
+    ("IMPG_SW", "inst_mpg_sw", parse_switch, "status_time"),
+    ("AMPG_SW", "avg_mpg_sw", parse_switch, "status_time"),
+    ("METR_SW", "metric_sw", parse_switch, "status_time"),
+    ("TRIP_BTN", "trip_btn", parse_switch, "status_time"),
+    ("AVG_BTN", "avg_btn", parse_switch, "status_time"),
+)
+
+TELEMETRY_SLOTS = tuple(field[1] for field in TELEMETRY_FIELDS)
+TIMING_SLOTS = ("speed_time", "rpm_time", "status_time", "sequence")
+FRESHNESS_SLOTS = ("field_times", "confirmed_time")
+
+# Latest known value of every field plus when each message group last arrived
+# field_times: when each field was last received, confirmed_time: last in-sequence delta/keyframe
+# (in delta mode an omitted field is unchanged - see field_age())
+TelemetrySnapshot = namedtuple("TelemetrySnapshot", TELEMETRY_SLOTS + TIMING_SLOTS + FRESHNESS_SLOTS)
+
+EMPTY_SNAPSHOT = TelemetrySnapshot(*([None] * len(TELEMETRY_SLOTS)), 0, 0, 0, 0,
+                                   (0,) * len(TELEMETRY_SLOTS), 0)
+
+
+class TelemetryFrame:
+    """Preallocated record the parser fills in place (one per reader, reused for every line)"""
+    __slots__ = TELEMETRY_SLOTS + TIMING_SLOTS + FRESHNESS_SLOTS + ("delta_sequence", "delta_synced")
+
+    def __init__(self):
+        for name, value in zip(TelemetrySnapshot._fields, EMPTY_SNAPSHOT):
+            setattr(self, name, value)
+        self.field_times = list(EMPTY_SNAPSHOT.field_times)
+        self.delta_sequence = -1
+        self.delta_synced = False
+
+    def snapshot(self):
+        """Immutable copy for the render loop"""
+        return TelemetrySnapshot._make(_frame_values(self) + (tuple(self.field_times), self.confirmed_time))
+
+_frame_values = attrgetter(*(TELEMETRY_SLOTS + TIMING_SLOTS))
+FIELD_INDEX = {slot: index for index, slot in enumerate(TELEMETRY_SLOTS)}
+
+
+def field_age(snapshot, slot, now):
+    """Milliseconds since a field was last known to be current (None if never received)"""
+    if getattr(snapshot, slot) is None:
+        return None
+    return now - max(snapshot.field_times[FIELD_INDEX[slot]], snapshot.confirmed_time)
+
+
+def compile_dispatch(fields=TELEMETRY_FIELDS):
+    """Build the key -> (slot, converter, timestamp slot, field index) table once"""
+    for key, slot, convert, stamp in fields:
+        if slot not in TelemetryFrame.__slots__ or (stamp and stamp not in TelemetryFrame.__slots__):
+            raise ValueError(f"Telemetry field {key} has no TelemetryFrame slot")
+    return {key: (slot, convert, stamp, FIELD_INDEX[slot]) for key, slot, convert, stamp in fields}
+
+TELEMETRY_DISPATCH = compile_dispatch()
+
+
+def parse_telemetry_line(frame, line, now, dispatch=TELEMETRY_DISPATCH):
+    """Fill frame from one KEY:value,... line, returns the number of fields accepted"""
+    accepted = 0
+    lookup = dispatch.get
+    field_times = frame.field_times
+    for pair in line.split(","):
+        key, _, value = pair.partition(":")
+        handler = lookup(key)
+        if handler is None:
+            continue  # Unknown key or fragment
+        slot, convert, stamp, index = handler
+        try:
+            setattr(frame, slot, convert(value))
+        except CONVERT_ERRORS:
+            continue  # Skip corrupt values
+        if stamp is not None:
+            setattr(frame, stamp, now)
+        field_times[index] = now
+        accepted += 1
+    return accepted
+
+# Delta telemetry lines (optional, negotiated in the INIT_REQUEST handshake)
+# KF:<seq>,KEY:value,...  keyframe with every field (once a second)
+# DF:<seq>[,KEY:value...] only the fields that changed since the last line (every 100ms)
+DELTA_PREFIXES = ("KF:", "DF:")
+
+
+def parse_delta_line(frame, line, now):
+    """Merge a keyframe or delta line into frame, returns False if the header is corrupt"""
+    header, _, body = line.partition(",")
+    try:
+        sequence = int(header[3:])
+    except ValueError:
+        return False
+    if body:
+        parse_telemetry_line(frame, body, now)
+
+    if header.startswith("KF:"):
+        frame.delta_synced = True
+    elif sequence != (frame.delta_sequence + 1) & 0xFF:
+        # Lost a delta - omitted fields may be out of date until the next keyframe
+        frame.delta_synced = False
+    frame.delta_sequence = sequence
+
+    if frame.delta_synced:
+        # Every omitted field is confirmed unchanged as of now
+        frame.confirmed_time = now
+        frame.speed_time = now
+        frame.rpm_time = now
+        frame.status_time = now
+    return True
+
+# Binary telemetry frames (optional, negotiated in the INIT_REQUEST handshake)
+# Wire format: 0x00 + COBS(payload + CRC16-CCITT little-endian) + 0x00
+# Layouts must match sendFastFrame()/sendStatusFrame() in arduino_code.cpp
+FRAME_FAST = 0x01
+FRAME_STATUS = 0x02
+FAST_FRAME = struct.Struct("<BBfffffHfff")  # type, seq, speed, fuel, oil, coolant, oil temp, rpm, battery, brightness, fuel consumption
+STATUS_FRAME = struct.Struct("<BBHffff")    # type, seq, switch/button flags, range, inst MPG, avg MPG, flow
+CRC_SIZE = 2
+
+# STATUS_FRAME flag bits -> frame slot
+STATUS_FLAGS = (
+    (1 << 0, "trip_btn"),
+    (1 << 1, "avg_btn"),
+    (1 << 2, "oil_pressure_sw"),
+    (1 << 3, "oil_temp_sw"),
+    (1 << 4, "coolant_sw"),
+    (1 << 5, "volts_sw"),
+    (1 << 6, "avg_mpg_sw"),
+    (1 << 7, "inst_mpg_sw"),
+    (1 << 8, "trip_sw"),
+    (1 << 9, "fuel_range_sw"),
+    (1 << 10, "metric_sw"),
+)
+
+FAST_FIELD_INDEXES = tuple(FIELD_INDEX[slot] for slot in (
+    "speed", "fuel", "oil", "coolant", "oil_temp", "rpm", "battery", "brightness", "fuel_consumption"))
+STATUS_FIELD_INDEXES = tuple(FIELD_INDEX[slot] for slot in (
+    "fuel_range", "inst_mpg", "avg_mpg", "flow")) + tuple(FIELD_INDEX[slot] for _, slot in STATUS_FLAGS)
+
+
+def crc16(data):
+    """CRC-16/CCITT-FALSE, same as crc16() in arduino_code.cpp"""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def cobs_decode(source, target, offset):
+    """Decode one COBS block into target at offset, returns the decoded length or -1 if malformed"""
+    read = 0
+    write = offset
+    length = len(source)
+    while read < length:
+        code = source[read]
+        if code == 0:
+            return -1
+        read += 1
+        end = read + code - 1
+        if end > length:
+            return -1
+        target[write:write + code - 1] = source[read:end]
+        write += code - 1
+        read = end
+        if code != 0xFF and read < length:
+            target[write] = 0
+            write += 1
+    return write - offset
+
+
+def decode_binary_frame(frame, buffer, offset, length, now):
+    """Unpack one CRC-checked payload from the decode buffer into frame, returns False if unknown"""
+    frame_type = buffer[offset]
+    if frame_type == FRAME_FAST and length == FAST_FRAME.size:
+        (_, _, frame.speed, frame.fuel, frame.oil, frame.coolant, frame.oil_temp, rpm,
+         frame.battery, frame.brightness, frame.fuel_consumption) = FAST_FRAME.unpack_from(buffer, offset)
+        frame.rpm = float(rpm)
+        frame.speed_time = now
+        frame.rpm_time = now
+        field_times = frame.field_times
+        for index in FAST_FIELD_INDEXES:
+            field_times[index] = now
+        return True
+    if frame_type == FRAME_STATUS and length == STATUS_FRAME.size:
+        (_, _, flags, frame.fuel_range, frame.inst_mpg, frame.avg_mpg,
+         frame.flow) = STATUS_FRAME.unpack_from(buffer, offset)
+        for bit, slot in STATUS_FLAGS:
+            setattr(frame, slot, bool(flags & bit))
+        frame.status_time = now
+        field_times = frame.field_times
+        for index in STATUS_FIELD_INDEXES:
+            field_times[index] = now
+        return True
+    return False
+
+
+def encode_binary_frame(payload):
+    """Wire bytes for one payload (used by the simulator/tests, the Arduino does this in C++)"""
+    data = payload + struct.pack("<H", crc16(payload))
+    encoded = bytearray([0])  # Code byte placeholder
+    code_index = 0
+    for byte in data:
+        if byte == 0:
+            encoded[code_index] = len(encoded) - code_index
+            code_index = len(encoded)
+            encoded.append(0)
+        else:
+            encoded.append(byte)
+            if len(encoded) - code_index == 0xFF:
+                encoded[code_index] = 0xFF
+                code_index = len(encoded)
+                encoded.append(0)
+    encoded[code_index] = len(encoded) - code_index
+    return b"\x00" + bytes(encoded) + b"\x00"
+
+
+# Messages the Pi must act on (handled on the main thread, in order)
+CONTROL_PREFIXES = ("INIT_REQUEST:", "RESET_TRIP:", "STYLE_CHANGE:", "SAVE_DATA:")
+
+
+# Receive buffer size - several seconds of 20 Hz traffic, and the longest a line may get
+RX_BUFFER_SIZE = 4096
+
+
+# Reconnect polling while the Arduino is unplugged
+RECONNECT_INTERVAL = 1.0
+
+# USB vendor IDs of Arduino boards and the usual clone USB-serial chips (CH340, FTDI, CP210x)
+ARDUINO_VIDS = (0x2341, 0x2A03, 0x1A86, 0x0403, 0x10C4)
+COMMON_PORTS = ('/dev/ttyACM0', '/dev/ttyACM1', '/dev/ttyUSB0', '/dev/ttyUSB1')
+
+
+def monotonic_ms():
+    """Default clock for sample timestamps (milliseconds)"""
+    return int(time.monotonic() * 1000)
+
+
+class SerialIngest:
+    """Drains every pending byte into one reusable buffer and splits out lines and binary frames"""
+
+    def __init__(self, size=RX_BUFFER_SIZE):
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self.fill = 0  # Bytes currently held (complete messages + trailing fragment)
+        self.waited = False  # Last read() found the port idle and blocked for the next byte
+
+        # Binary frames are COBS-decoded here, then unpacked in place by the reader
+        self.decoded = bytearray(size)
+        self.decoded_view = memoryview(self.decoded)
+
+        # Statistics
+        self.bytes_read = 0
+        self.overflows = 0   # Buffer filled without a complete message - garbage discarded
+        self.crc_errors = 0  # Binary frames that failed COBS/CRC checks
+
+    def read(self, ser):
+        """Read everything waiting on the port in one call, returns (lines, frames)"""
+        # frames are (offset, length) of CRC-checked payloads in self.decoded, valid until the next read
+        free = len(self.buffer) - self.fill
+        waiting = ser.in_waiting
+        self.waited = not waiting
+        if waiting:
+            count = ser.readinto(self.view[self.fill:self.fill + min(waiting, free)])
+        else:
+            # Nothing pending - wait (up to the port timeout) for the next byte
+            count = ser.readinto(self.view[self.fill:self.fill + 1])
+        if not count:
+            return [], []
+        self.fill += count
+        self.bytes_read += count
+        return self._split()
+
+    def _split(self):
+        """Cut complete messages out of the buffer, keeping any partial one for the next read"""
+        buffer = self.buffer
+        view = self.view
+        fill = self.fill
+        lines = []
+        frames = []
+        decoded_fill = 0
+        start = 0
+
+        while start < fill:
+            if buffer[start] == 0:
+                # Binary frame: runs to the next zero delimiter
+                end = buffer.find(b"\x00", start + 1, fill)
+                if end == -1:
+                    break  # Incomplete frame
+                if end > start + 1:
+                    length = cobs_decode(view[start + 1:end], self.decoded, decoded_fill)
+                    if length > CRC_SIZE and self._crc_ok(decoded_fill, length):
+                        frames.append((decoded_fill, length - CRC_SIZE))
+                        decoded_fill += length
+                    else:
+                        self.crc_errors += 1
+                    start = end + 1
+                else:
+                    start = end  # Back-to-back delimiters - second zero opens the next frame
+            else:
+                # Text line: runs to the next newline, unless a frame starts first
+                end = buffer.find(b"\n", start, fill)
+                zero = buffer.find(b"\x00", start, fill if end == -1 else end)
+                if zero != -1:
+                    start = zero  # Fragment cut off by a frame (or a frame tail on connect)
+                    continue
+                if end == -1:
+                    break  # Incomplete line
+                if end > start:
+                    lines.append(bytes(view[start:end]))
+                start = end + 1
+
+        if start:
+            # Move the trailing fragment to the front (memoryview copy handles the overlap)
+            remaining = fill - start
+            view[:remaining] = view[start:fill]
+            self.fill = remaining
+        elif fill == len(buffer):
+            # A full buffer with no complete message is noise - drop it rather than stall forever
+            self.fill = 0
+            self.overflows += 1
+        return lines, frames
+
+    def _crc_ok(self, offset, length):
+        """Check the little-endian CRC16 trailing a decoded payload"""
+        decoded = self.decoded
+        payload_end = offset + length - CRC_SIZE
+        received = decoded[payload_end] | (decoded[payload_end + 1] << 8)
+        return crc16(self.decoded_view[offset:payload_end]) == received
+
+
+class PortSupervisor:
+    """Picks the Arduino port from USB descriptors and opens only that one (opening resets the board)"""
+
+    def __init__(self, baud, timeout, last_port=None, serial_number=None, fixed_port=None):
+        self.baud = baud
+        self.timeout = timeout
+        self.fixed_port = fixed_port        # DASHBOARD_SERIAL_PORT - no discovery at all
+        self.last_port = last_port          # Port that worked last time (cached in persistent data)
+        self.serial_number = serial_number  # USB serial number - finds the board again if it re-enumerates
+        self.port = None
+        self.attempts = 0
+
+    def candidates(self):
+        """Ports worth opening, best first - listing ports reads USB descriptors and opens nothing"""
+        if self.fixed_port:
+            return [(self.fixed_port, None)]
+        from serial.tools import list_ports
+
+        ranked = []
+        for info in list_ports.comports():
+            if self.serial_number and info.serial_number == self.serial_number:
+                rank = 0  # Same board, even if it came back as ttyACM1
+            elif info.device == self.last_port:
+                rank = 1
+            elif info.vid in ARDUINO_VIDS:
+                rank = 2
+            elif info.device in COMMON_PORTS:
+                rank = 3 + COMMON_PORTS.index(info.device)
+            else:
+                continue  # Not ours - never open (and reset) unrelated devices
+            ranked.append((rank, info.device, info.serial_number))
+        ranked.sort()
+        return [(device, serial_number) for _, device, serial_number in ranked]
+
+    def open(self):
+        """Open the best candidate that works, returns the serial port or None"""
+        import serial
+
+        for device, serial_number in self.candidates():
+            self.attempts += 1
+            try:
+                ser = serial.Serial(device, self.baud, timeout=self.timeout)
+            except Exception:
+                continue
+            self.port = device
+            self.last_port = device
+            if serial_number:
+                self.serial_number = serial_number
+            return ser
+        return None
+
+
+class SerialReader(threading.Thread):
+    """Background thread that reads and parses Arduino lines and publishes snapshots"""
+
+    def __init__(self, ser, clock=monotonic_ms, reconnect=None):
+        super().__init__(name="arduino-serial-reader", daemon=True)
+        self.ser = ser
+        self.clock = clock
+        self.reconnect = reconnect  # Callable returning a freshly opened port or None (PortSupervisor.open)
+        self.trace = None           # Callable(name, start_ns, end_ns) while a frame trace records this thread
+        self.connected = ser is not None and ser.is_open
+
+        # Published state - replaced (never mutated) so readers need no lock
+        self.snapshot = EMPTY_SNAPSHOT
+        self.control_messages = deque()  # append/popleft are thread-safe
+        self.button_events = deque()     # (time, trip_btn, avg_btn) at every button change - see pop_button_events()
+        self.buttons = (None, None)
+
+        # Working state, only touched by the reader thread
+        self.frame = TelemetryFrame()
+
+        self.ingest = SerialIngest()
+        self._write_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        # Statistics
+        self.lines_received = 0
+        self.telemetry_lines = 0
+        self.frames_coalesced = 0  # Telemetry frames superseded within a batch
+        self.frames_dropped = 0    # Telemetry frames with nothing parseable (corrupt)
+        self.binary_frames = 0     # Frames received in binary mode (see arduino_code.cpp)
+        self.delta_gaps = 0        # Delta sequence breaks (values held until the next keyframe)
+        self.reconnects = 0
+
+    @property
+    def is_open(self):
+        """Serial-like flag so PersistentDataManager.send_init_data() can write through the reader"""
+        return self.connected
+
+    def write(self, data):
+        """Write to the Arduino from any thread"""
+        with self._write_lock:
+            return self.ser.write(data)
+
+    def pop_control_messages(self):
+        """Return control messages received since the last call (oldest first)"""
+        messages = []
+        while self.control_messages:
+            messages.append(self.control_messages.popleft())
+        return messages
+
+    def pop_button_events(self):
+        """Return the button changes since the last call (oldest first) - a press and release that
+        both land between two snapshots would otherwise never be seen by the render loop"""
+        events = []
+        while self.button_events:
+            events.append(self.button_events.popleft())
+        return events
+
+    def stop(self):
+        """Stop the thread and close the serial port"""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
+        self._close()
+
+    def run(self):
+        """Drain the port until stopped, reopening it through reconnect() if it fails"""
+        while not self._stop_event.is_set():
+            if not self.connected:
+                if self.reconnect is None:
+                    break
+                ser = self.reconnect()
+                if ser is None:
+                    self._stop_event.wait(RECONNECT_INTERVAL)
+                    continue
+                # Fresh board (it resets on open) - drop any half line and wait for a keyframe
+                self.ingest.fill = 0
+                self.frame.delta_synced = False
+                self.ser = ser
+                self.connected = True
+                self.reconnects += 1
+            trace = self.trace
+            start = time.perf_counter_ns() if trace else 0
+            try:
+                lines, frames = self.ingest.read(self.ser)  # Blocks this thread only (up to the port timeout)
+            except Exception:
+                # Arduino connection lost - render loop freezes last values until reconnect() finds it again
+                self._close()
+                continue
+            if trace:
+                # A read that found the port idle spent its time waiting, not draining - its own event
+                read_end = time.perf_counter_ns()
+                trace("serial wait" if self.ingest.waited else "serial ingest", start, read_end)
+            if lines or frames:
+                self.process_batch(lines, frames)
+                if trace:
+                    trace("parse", read_end, time.perf_counter_ns())
+
+        self._close()
+
+    def process_batch(self, lines, frames=()):
+        """Handle one drained batch: keep every control message, coalesce the telemetry"""
+        now = self.clock()
+        telemetry_frames = 0
+
+        # Binary frames unpack straight from the ingest decode buffer
+        decoded = self.ingest.decoded
+        for offset, length in frames:
+            if decode_binary_frame(self.frame, decoded, offset, length, now):
+                telemetry_frames += 1
+                self.binary_frames += 1
+                self._note_buttons(now)
+            else:
+                self.frames_dropped += 1
+
+        for raw in lines:
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if not line:
+                continue
+            self.lines_received += 1
+
+            if line.startswith(CONTROL_PREFIXES):
+                self.control_messages.append(line)
+            elif line.startswith(DELTA_PREFIXES):
+                was_synced = self.frame.delta_synced
+                if parse_delta_line(self.frame, line, now):
+                    telemetry_frames += 1
+                    self._note_buttons(now)
+                    if was_synced and not self.frame.delta_synced:
+                        self.delta_gaps += 1
+                else:
+                    self.frames_dropped += 1
+            elif "SPEED:" in line or "FUELRNG:" in line or "AMPG_SW:" in line:
+                # Newer frames overwrite older values key by key
+                if parse_telemetry_line(self.frame, line, now):
+                    telemetry_frames += 1
+                    self._note_buttons(now)
+                else:
+                    self.frames_dropped += 1
+            # Silently ignore ECU_DATA/ARDUINO_STATUS/DEBUG chatter
+
+        if telemetry_frames:
+            # One snapshot per batch - the render loop only ever needs the newest values
+            self.frames_coalesced += telemetry_frames - 1
+            self.telemetry_lines += telemetry_frames
+            self.frame.sequence += 1
+            self.snapshot = self.frame.snapshot()
+
+    def _note_buttons(self, now):
+        """Queue the button states if this frame changed them"""
+        buttons = (self.frame.trip_btn, self.frame.avg_btn)
+        if buttons != self.buttons and None not in buttons:
+            self.buttons = buttons
+            self.button_events.append((now,) + buttons)
+
+    def _close(self):
+        """Close the port once and mark the link as down"""
+        self.connected = False
+        if self.ser:
+            try:
+                self.ser.close()
+            except Exception:
+                pass
+
+
+# Session logs: magic, then one <IH> record (ms since start, byte count) + raw bytes per chunk read
+SESSION_MAGIC = b"C4SERLOG\x01"
+SESSION_RECORD = struct.Struct("<IH")
+
+
+def read_session_log(path):
+    """Load a recorded session as a list of (ms, bytes) chunks"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(SESSION_MAGIC):
+        raise ValueError(f"{path} is not a serial session log")
+
+    records = []
+    offset = len(SESSION_MAGIC)
+    while offset + SESSION_RECORD.size <= len(data):
+        ms, length = SESSION_RECORD.unpack_from(data, offset)
+        offset += SESSION_RECORD.size
+        records.append((ms, data[offset:offset + length]))
+        offset += length  # A chunk cut short by a crash is kept as far as it got
+    return records
+
+
+class SerialRecorder:
+    """Serial wrapper that tees every chunk read from the port into a session log"""
+
+    def __init__(self, ser, path, clock=monotonic_ms):
+        self.ser = ser
+        self.clock = clock
+        self.log = open(path, "wb")
+        self.log.write(SESSION_MAGIC)
+        self.start = clock()
+        self.bytes_recorded = 0
+
+    @property
+    def is_open(self):
+        return self.ser.is_open
+
+    @property
+    def in_waiting(self):
+        return self.ser.in_waiting
+
+    def readinto(self, buffer):
+        """Read from the port and log exactly what arrived, with its arrival time"""
+        count = self.ser.readinto(buffer)
+        if count:
+            self.log.write(SESSION_RECORD.pack(self.clock() - self.start, count))
+            self.log.write(buffer[:count])
+            self.bytes_recorded += count
+        return count
+
+    def write(self, data):
+        return self.ser.write(data)
+
+    def close(self):
+        """Close the port - the log stays open so a reconnected port can keep recording"""
+        if not self.log.closed:
+            self.log.flush()
+        self.ser.close()
+
+    def close_log(self):
+        if not self.log.closed:
+            self.log.close()
+
+
+class ReplaySerial:
+    """Serial-like object that plays a recorded session back at 1x, Nx or full speed (speed=0)"""
+
+    def __init__(self, path, speed=1.0, timeout=0.1):
+        self.records = read_session_log(path)
+        self.speed = speed
+        self.timeout = timeout
+        self.index = 0
+        self.pending = bytearray()  # Chunks that have "arrived" but were not read yet
+        self.log_time = 0           # Recorded time of the newest chunk delivered
+        self.bytes_written = 0      # Writes go nowhere - there is no Arduino to answer
+        self.is_open = True
+        self.start = time.perf_counter()
+
+    def clock(self):
+        """Recorded session time (ms) - use as SerialReader clock for speed-independent timestamps"""
+        return self.log_time
+
+    @property
+    def finished(self):
+        return self.index >= len(self.records) and not self.pending
+
+    @property
+    def in_waiting(self):
+        self._arrive()
+        return len(self.pending)
+
+    def _arrive(self):
+        """Move every chunk that is due by now into the pending bytes"""
+        records = self.records
+        if self.speed <= 0:
+            # As fast as possible - one chunk at a time so reads keep their recorded boundaries
+            if not self.pending and self.index < len(records):
+                self.log_time, data = records[self.index]
+                self.pending += data
+                self.index += 1
+            return
+        elapsed = (time.perf_counter() - self.start) * 1000.0 * self.speed
+        while self.index < len(records) and records[self.index][0] <= elapsed:
+            self.log_time, data = records[self.index]
+            self.pending += data
+            self.index += 1
+
+    def readinto(self, buffer):
+        """Same contract as serial.Serial.readinto(), raises EOFError once the session is over"""
+        if not self.is_open:
+            raise EOFError("replay closed")
+        self._arrive()
+        if not self.pending:
+            if self.index >= len(self.records):
+                raise EOFError("end of recorded session")
+            # Wait for the next chunk like a real port would, at most one timeout
+            due = self.start + self.records[self.index][0] / 1000.0 / self.speed
+            time.sleep(min(max(due - time.perf_counter(), 0.0), self.timeout))
+            self._arrive()
+        count = min(len(buffer), len(self.pending))
+        buffer[:count] = self.pending[:count]
+        del self.pending[:count]
+        return count
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return len(data)
+
+    def close(self):
+        self.is_open = False
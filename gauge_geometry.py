@@ -0,0 +1,211 @@
+"""
+Gauge Geometry for the C4 Corvette Dashboard
+Tick coordinates, label positions and outlines of the curved gauges, computed once per layout and
+unit system instead of on every frame - the draw functions only pick colours for the current value
+"""
+
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+KPH_PER_MPH = 1.60934  # Same factor as mph_to_kph() in the dashboard
+
+# One tick of the diagonal (Synthwave) speedometer - start/end of the horizontal line,
+# label text/position/speed for numbered ticks (None otherwise)
+SpeedometerTick = namedtuple("SpeedometerTick", "mph start end label number_pos label_speed")
+
+# One tick of the mountain-shaped (Synthwave) tachometer - square is the (x, y) of the
+# marker above numbered ticks (None otherwise)
+TachometerTick = namedtuple("TachometerTick", "rpm x y1 y2 label square")
+
+# Outline and fill layout of the 300ZX horizontal tachometer
+ZXTachometerShape = namedtuple("ZXTachometerShape",
+                               "line_x line_y line_width line_height redline_start_x "
+                               "normal_curve redline_curve fill_ticks tick_width milestones")
+
+
+# ===== DIAGONAL SPEEDOMETER (Synthwave / Corvette C4) =====
+
+def diagonal_line_end(start_x, start_y, length, angle_deg=60):
+    """End point of the straight diagonal the speedometer curve bends away from"""
+    angle_rad = math.radians(angle_deg)
+    return start_x + length * math.cos(angle_rad), start_y - length * math.sin(angle_rad)
+
+def diagonal_curve_point(start_x, start_y, end_x, end_y, ratio, curve_intensity=80):
+    """Point at ratio (0-1) along the diagonal, pushed left by a half-sine bulge"""
+    curve_offset = math.sin(ratio * math.pi) * curve_intensity
+    base_x = start_x + ratio * (end_x - start_x)
+    base_y = start_y + ratio * (end_y - start_y)
+    return base_x - curve_offset, base_y
+
+@lru_cache(maxsize=None)
+def diagonal_speedometer_ticks(start_x, start_y, length, tick_count, max_speed, speed_numbers, metric, number_distance):
+    """Tick lines and number labels of the Synthwave speedometer as SpeedometerTicks"""
+    end_x, end_y = diagonal_line_end(start_x, start_y, length)
+    ticks = []
+    for i in range(tick_count):
+        mph = (i / (tick_count - 1)) * max_speed  # Always MPH for positioning
+        ratio = i / (tick_count - 1)
+        tick_x, tick_y = diagonal_curve_point(start_x, start_y, end_x, end_y, ratio)
+
+        # Numbered ticks reach 40px further left to make room for the number
+        tick_length = 120
+        label_speed = min(speed_numbers, key=lambda x: abs(x - mph))
+        if abs(mph - label_speed) < 2.5:
+            tick_x1 = tick_x - tick_length/2 - 40
+            label = str(int(label_speed * KPH_PER_MPH)) if metric else str(label_speed)
+            number_pos = (tick_x1 - number_distance, tick_y - 12)
+        else:
+            tick_x1 = tick_x - tick_length/2
+            label = number_pos = label_speed = None
+        ticks.append(SpeedometerTick(mph, (tick_x1, tick_y), (tick_x + tick_length/2, tick_y),
+                                     label, number_pos, label_speed))
+    return tuple(ticks)
+
+@lru_cache(maxsize=None)
+def diagonal_bar_segments(start_x, start_y, length, samples, width, height):
+    """(left, top, width, height) of the rects that make up the Corvette C4 speedometer bar"""
+    end_x, end_y = diagonal_line_end(start_x, start_y, length)
+    segments = []
+    for i in range(samples):
+        center_x, center_y = diagonal_curve_point(start_x, start_y, end_x, end_y, i / (samples - 1))
+        segments.append((int(center_x - width//2), int(center_y - height//2), width, height))
+    return tuple(segments)
+
+@lru_cache(maxsize=None)
+def diagonal_speed_marks(start_x, start_y, length, speeds, max_speed):
+    """Curve point for each speed in speeds (milestones, grid lines)"""
+    end_x, end_y = diagonal_line_end(start_x, start_y, length)
+    return tuple(diagonal_curve_point(start_x, start_y, end_x, end_y, speed / max_speed) for speed in speeds)
+
+def intermediate_speeds(speed_numbers, steps=3):
+    """The speeds splitting each gap between numbered speeds into equal steps"""
+    return tuple(speed_numbers[i] + (speed_numbers[i + 1] - speed_numbers[i]) * (j / float(steps))
+                 for i in range(len(speed_numbers) - 1) for j in range(1, steps))
+
+
+# ===== MOUNTAIN TACHOMETER (Synthwave / Corvette C4) =====
+
+def mountain_position(rpm, x_offset, y_offset, max_rpm):
+    """Position along the smoothed mountain-shaped RPM line with linear x-spacing"""
+    # Bottom left to bottom right - extended length for wider tick spacing
+    line_start_x = x_offset - 120
+    line_start_y = y_offset
+    line_end_x = x_offset + 400
+
+    # Peak at 4500 RPM (75% along the line)
+    peak_rpm = 4500
+
+    # Linear x-coordinate progression (equal spacing)
+    ratio = rpm / max_rpm
+    tick_x = line_start_x + ratio * (line_end_x - line_start_x)
+
+    # Y follows the mountain - power curves give a sharper rise and fall than a sine
+    peak_height = 280
+    if rpm <= peak_rpm:
+        segment_ratio = rpm / peak_rpm
+        tick_y = line_start_y - (segment_ratio ** 0.7 * peak_height)
+    else:
+        segment_ratio = (rpm - peak_rpm) / (max_rpm - peak_rpm)
+        fall_height = 60
+        tick_y = line_start_y - peak_height + (segment_ratio ** 0.8 * fall_height)
+
+    return tick_x, tick_y
+
+@lru_cache(maxsize=None)
+def mountain_curve(x_offset, y_offset, max_rpm, samples):
+    """(rpm, x, y) at samples evenly spaced RPMs from 0 to max_rpm"""
+    points = []
+    for i in range(samples):
+        rpm = (i / (samples - 1)) * max_rpm
+        points.append((rpm,) + mountain_position(rpm, x_offset, y_offset, max_rpm))
+    return tuple(points)
+
+@lru_cache(maxsize=None)
+def mountain_bar_segments(x_offset, y_offset, max_rpm, samples, width, height):
+    """(rpm, rect) of the rects that make up the Corvette C4 tachometer bar"""
+    return tuple((rpm, (int(x - width//2), int(y - height//2), width, height))
+                 for rpm, x, y in mountain_curve(x_offset, y_offset, max_rpm, samples))
+
+@lru_cache(maxsize=None)
+def mountain_rpm_marks(x_offset, y_offset, max_rpm, rpms):
+    """Curve point for each RPM in rpms (milestones)"""
+    return tuple(mountain_position(rpm, x_offset, y_offset, max_rpm) for rpm in rpms)
+
+@lru_cache(maxsize=None)
+def mountain_tachometer_ticks(x_offset, y_offset, max_rpm, total_ticks, rpm_numbers):
+    """Ticks of the Synthwave tachometer as TachometerTicks, equal RPM spacing"""
+    # Ticks closest to the numbered RPMs carry the square and the number
+    numbered = {}
+    for target_rpm in rpm_numbers:
+        numbered.setdefault(round((target_rpm / max_rpm) * (total_ticks - 1)), target_rpm)
+
+    ticks = []
+    base_tick_length = 72
+    square_size = 18  # Same as the tick thickness
+    for i in range(total_ticks):
+        rpm = (i / (total_ticks - 1)) * max_rpm
+        tick_x, tick_y = mountain_position(rpm, x_offset, y_offset, max_rpm)
+
+        # Length varies along the curve to keep the look consistent
+        curve_position = rpm / max_rpm
+        if curve_position <= 0.2:  # Start of curve
+            tick_length = base_tick_length + 24
+        elif curve_position <= 0.75:  # Ascending to the peak at 4500
+            tick_length = base_tick_length + 12
+        else:  # Descending after the peak
+            tick_length = base_tick_length - 6
+        tick_y1 = tick_y - tick_length/2
+
+        label = square = None
+        if i in numbered:
+            label = str(int(numbered[i] // 1000))
+            square = (tick_x - square_size // 2, tick_y1 - square_size - 3)
+        ticks.append(TachometerTick(rpm, tick_x, tick_y1, tick_y + tick_length/2, label, square))
+    return tuple(ticks)
+
+
+# ===== 300ZX HORIZONTAL TACHOMETER =====
+
+def zx_curve_y(x_progress, line_y, line_height):
+    """Top edge of the 300ZX tachometer - a tanh S-curve rising left to right, left side lifted"""
+    tanh_value = math.tanh(4 * (x_progress - 0.5))
+    curve_height = (tanh_value + 1.4) * 1.2 * line_height
+    return line_y + line_height - curve_height
+
+@lru_cache(maxsize=None)
+def zx_tachometer_shape(rect, max_rpm=6000, curve_points=100, fill_ticks=30, tick_gap=3, redline_rpm=5000):
+    """Outline, fill ticks and milestone positions of the 300ZX tachometer in rect"""
+    line_width = rect[2] - 40
+    line_height = 60
+    line_x = rect[0] + 20
+    line_y = rect[1] + rect[3] - 120
+
+    # Curved top border, split where the redline starts
+    redline_start_progress = redline_rpm / max_rpm
+    normal_curve = []
+    redline_curve = []
+    for i in range(curve_points + 1):
+        x_progress = i / curve_points
+        point = (int(line_x + (x_progress * line_width)), int(zx_curve_y(x_progress, line_y, line_height)))
+        if x_progress <= redline_start_progress:
+            normal_curve.append(point)
+        else:
+            redline_curve.append(point)
+
+    # Vertical fill ticks spread over the whole width - (x, full height to the curve, redline)
+    tick_width = (line_width - (fill_ticks - 1) * tick_gap) / fill_ticks
+    ticks = []
+    for i in range(fill_ticks):
+        tick_x = line_x + i * (tick_width + tick_gap)
+        x_progress = (tick_x - line_x) / line_width
+        full_height = (line_y + line_height) - zx_curve_y(x_progress, line_y, line_height)
+        ticks.append((tick_x, full_height, x_progress * max_rpm >= redline_rpm))
+
+    # Milestone lines under the bar at every 1000 RPM
+    milestones = tuple((milestone_rpm, line_x + (milestone_rpm / max_rpm * line_width))
+                       for milestone_rpm in range(0, max_rpm + 1, 1000))
+
+    return ZXTachometerShape(line_x, line_y, line_width, line_height,
+                             line_x + (redline_start_progress * line_width),
+                             tuple(normal_curve), tuple(redline_curve), tuple(ticks), tick_width, milestones)
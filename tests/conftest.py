@@ -0,0 +1,6 @@
+"""Tests import the dashboard modules from the repository root"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -0,0 +1,33 @@
+"""Serial-like stand-ins for the ingest, reader and recorder tests"""
+
+
+class FakeSerial:
+    """Hands out pre-scripted chunks, one per readinto() call, like a port with bursty traffic"""
+
+    def __init__(self, chunks):
+        self.chunks = [bytes(chunk) for chunk in chunks]
+        self.is_open = True
+        self.written = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def readinto(self, buffer):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks[0]
+        count = min(len(buffer), len(chunk))
+        buffer[:count] = chunk[:count]
+        if count < len(chunk):
+            self.chunks[0] = chunk[count:]
+        else:
+            self.chunks.pop(0)
+        return count
+
+    def write(self, data):
+        self.written += data
+        return len(data)
+
+    def close(self):
+        self.is_open = False
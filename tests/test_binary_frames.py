@@ -0,0 +1,82 @@
+"""Binary telemetry frames - COBS framing, CRC16 and unpacking into a TelemetryFrame"""
+
+from arduino_telemetry import (FAST_FRAME, FIELD_INDEX, FRAME_FAST, FRAME_STATUS, STATUS_FRAME, SerialIngest,
+                               TelemetryFrame, cobs_decode, crc16, decode_binary_frame, encode_binary_frame)
+from serial_fakes import FakeSerial
+
+FAST = FAST_FRAME.pack(FRAME_FAST, 7, 64.5, 48.0, 0.0, 195.0, 210.0, 3200, 13.8, 80.0, 2.5)
+STATUS = STATUS_FRAME.pack(FRAME_STATUS, 8, (1 << 0) | (1 << 10), 280.0, 0.0, 18.5, 1.25)
+
+
+def decode_wire(wire):
+    """Payloads the ingest accepts from raw wire bytes, plus its CRC error count"""
+    ingest = SerialIngest()
+    lines, frames = ingest.read(FakeSerial([wire]))
+    return [bytes(ingest.decoded[offset:offset + length]) for offset, length in frames], ingest.crc_errors
+
+
+def test_crc16_matches_ccitt_false():
+    assert crc16(b"123456789") == 0x29B1  # CRC-16/CCITT-FALSE check value
+
+
+def test_encode_decode_round_trip():
+    for payload in (FAST, STATUS, b"\x00" * 5, bytes(range(1, 256)) + bytes(range(0, 60))):
+        wire = encode_binary_frame(payload)
+        assert wire[0] == 0 and wire[-1] == 0
+        assert 0 not in wire[1:-1]  # COBS leaves no zero inside the frame
+        target = bytearray(len(payload) + 8)
+        length = cobs_decode(wire[1:-1], target, 0)
+        assert bytes(target[:length]) == payload + crc16(payload).to_bytes(2, "little")
+        assert decode_wire(wire) == ([payload], 0)
+
+
+def test_decode_fast_frame_into_frame():
+    frame = TelemetryFrame()
+    buffer = bytearray(4) + FAST  # At an offset, like the shared decode buffer
+    assert decode_binary_frame(frame, buffer, 4, len(FAST), 900)
+    assert (frame.speed, frame.oil, frame.rpm) == (64.5, 0.0, 3200.0)
+    assert frame.brightness == 80.0 and frame.fuel_consumption == 2.5
+    assert frame.speed_time == frame.rpm_time == 900
+    assert frame.field_times[FIELD_INDEX["coolant"]] == 900
+    assert frame.status_time == 0
+
+
+def test_decode_status_frame_into_frame():
+    frame = TelemetryFrame()
+    assert decode_binary_frame(frame, STATUS, 0, len(STATUS), 950)
+    assert frame.trip_btn is True and frame.metric_sw is True
+    assert frame.avg_btn is False and frame.oil_pressure_sw is False
+    assert (frame.fuel_range, frame.avg_mpg, frame.flow) == (280.0, 18.5, 1.25)
+    assert frame.status_time == 950 and frame.speed_time == 0
+
+
+def test_unknown_type_or_length_is_rejected():
+    frame = TelemetryFrame()
+    assert not decode_binary_frame(frame, b"\x09" + FAST[1:], 0, len(FAST), 1)
+    assert not decode_binary_frame(frame, FAST, 0, len(FAST) - 1, 1)
+    assert frame.speed is None
+
+
+def test_crc_mismatch_is_dropped():
+    wire = bytearray(encode_binary_frame(FAST))
+    wire[6] = wire[6] ^ 0x01 or 0x01  # Flip a bit inside the frame, never into a zero
+    payloads, crc_errors = decode_wire(bytes(wire) + encode_binary_frame(STATUS))
+    assert payloads == [STATUS]  # The next frame still decodes
+    assert crc_errors == 1
+
+
+def test_truncated_cobs_frame_is_dropped():
+    wire = encode_binary_frame(FAST)
+    # Lost bytes: the last code byte now points past the closing delimiter
+    target = bytearray(64)
+    assert cobs_decode(wire[1:-4], target, 0) == -1
+    assert cobs_decode(b"\x05\x01\x02", target, 0) == -1
+    payloads, crc_errors = decode_wire(wire[:-4] + b"\x00" + encode_binary_frame(STATUS))
+    assert payloads == [STATUS]
+    assert crc_errors == 1
+
+
+def test_frame_too_short_for_crc_is_dropped():
+    payloads, crc_errors = decode_wire(b"\x00\x02\x07\x00")
+    assert payloads == []
+    assert crc_errors == 1
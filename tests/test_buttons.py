@@ -0,0 +1,77 @@
+"""Trip/average button holds - queued changes in order, holds checked every frame"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+
+import arduino_combined_dashboard as dashboard
+
+
+class FakePersistentData:
+    def __init__(self):
+        self.data = {"trip_odometer": 12.3, "dashboard_style": 0}
+        self.saves = 0
+
+    def save_data(self):
+        self.saves += 1
+
+
+@pytest.fixture
+def buttons(monkeypatch):
+    persistent = FakePersistentData()
+    monkeypatch.setattr(dashboard, "persistent_data", persistent)
+    for name in ("button_trip_reset", "button_avg_reset", "button_trip_triggered", "button_avg_triggered",
+                 "button_combo_triggered"):
+        monkeypatch.setattr(dashboard, name, False)
+    for name in ("button_trip_start_time", "button_avg_start_time", "button_combo_start_time"):
+        monkeypatch.setattr(dashboard, name, None)
+    monkeypatch.setattr(dashboard, "current_style_index", 0)
+    return persistent
+
+
+def test_held_button_fires_once_without_another_change(buttons):
+    dashboard.update_buttons([(1000, True, False)], 1000)
+    dashboard.update_buttons((), 1500)
+    assert buttons.data["trip_odometer"] == 12.3
+    dashboard.update_buttons((), 2000)  # Still held - no new status line needed
+    assert buttons.data["trip_odometer"] == 0.0 and buttons.saves == 1
+    buttons.data["trip_odometer"] = 5.0
+    dashboard.update_buttons((), 2500)
+    assert buttons.data["trip_odometer"] == 5.0  # Once per hold
+
+
+def test_short_press_between_frames_does_not_fire(buttons):
+    dashboard.update_buttons([(1000, True, False), (1400, False, False)], 1450)
+    dashboard.update_buttons((), 3000)
+    assert buttons.data["trip_odometer"] == 12.3 and buttons.saves == 0
+
+
+def test_hold_that_ended_between_frames_still_fires(buttons):
+    # Press and release both queued since the last frame - the press lasted until the release
+    dashboard.update_buttons([(1000, True, False), (2100, False, False)], 2120)
+    assert buttons.data["trip_odometer"] == 0.0
+
+
+def test_combo_hold_changes_style(buttons):
+    dashboard.update_buttons([(1000, True, False), (1020, True, True)], 1020)
+    dashboard.update_buttons((), 2100)
+    assert dashboard.current_style_index == 1
+    assert buttons.data["trip_odometer"] == 12.3  # The combo is not a trip hold
+
+
+def test_press_at_clock_zero_is_timed_from_zero(buttons):
+    # A replay or engine clock starts at 0 - a press then is a real start time, not "no press"
+    dashboard.update_buttons([(0, True, False)], 0)
+    dashboard.update_buttons((), 999)
+    assert buttons.data["trip_odometer"] == 12.3
+    dashboard.update_buttons((), 1000)
+    assert buttons.data["trip_odometer"] == 0.0 and buttons.saves == 1
+
+
+def test_combo_from_clock_zero_changes_style_once(buttons):
+    dashboard.update_buttons([(0, True, True)], 0)
+    dashboard.update_buttons((), 1000)
+    dashboard.update_buttons((), 1500)
+    assert dashboard.current_style_index == 1 and buttons.saves == 1
@@ -0,0 +1,41 @@
+"""DashboardEngine - importing opens nothing, an engine renders into the caller's surface"""
+
+import os
+import subprocess
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def test_import_has_no_side_effects(tmp_path):
+    # Fresh interpreter in an empty directory - no display, no port, no files
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); import pygame, arduino_combined_dashboard; "
+            "print(pygame.display.get_init(), arduino_combined_dashboard.serial_reader)")
+    result = subprocess.run([sys.executable, "-c", code, ROOT], cwd=tmp_path, capture_output=True, text=True,
+                            env=dict(os.environ, SDL_VIDEODRIVER="dummy"), timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "False None"
+    assert os.listdir(tmp_path) == []
+
+
+def test_engine_renders_injected_telemetry_into_a_window_surface(tmp_path, monkeypatch):
+    import arduino_combined_dashboard as dashboard
+    from arduino_telemetry import TelemetryFrame, parse_telemetry_line
+    
+    monkeypatch.chdir(tmp_path)  # Persistent data lands here, not in the repo
+    window = pygame.Surface((5000, 768))
+    engine = dashboard.DashboardEngine(window=window, headless=True, arduino=False, fps=0)
+    engine.start()
+    try:
+        frame = TelemetryFrame()
+        parse_telemetry_line(frame, "SPEED:55.0,RPM:2500,FUEL:60.0,OIL:40.0,COOLANT:190.0", 1000)
+        snapshot = frame.snapshot()._replace(sequence=1)
+        assert engine.step(snapshot, 1000)
+        assert dashboard.current_speed == 55.0 and dashboard.current_rpm == 2500.0
+        assert pygame.transform.average_color(window)[:3] != (0, 0, 0)  # Something was drawn
+    finally:
+        engine.shutdown()
@@ -0,0 +1,85 @@
+"""Delta telemetry - KF:/DF: lines merged into a TelemetryFrame, sequence gaps and field ages"""
+
+from arduino_telemetry import SerialReader, TelemetryFrame, field_age, parse_delta_line
+from serial_fakes import FakeSerial
+
+
+def test_keyframe_then_deltas_stay_synced():
+    frame = TelemetryFrame()
+    assert parse_delta_line(frame, "KF:10,SPEED:50.0,RPM:2000,FUEL:70.0,OIL:45.0", 100)
+    assert parse_delta_line(frame, "DF:11,SPEED:51.0", 200)
+    assert parse_delta_line(frame, "DF:12", 300)  # Nothing changed
+    assert frame.delta_synced
+    assert (frame.speed, frame.rpm, frame.fuel) == (51.0, 2000.0, 70.0)
+    # Omitted fields are confirmed unchanged by every in-sequence line
+    assert frame.confirmed_time == frame.rpm_time == frame.status_time == 300
+
+
+def test_sequence_jump_forces_resync():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:10,SPEED:50.0,FUEL:70.0", 100)
+    parse_delta_line(frame, "DF:11,SPEED:52.0", 200)
+    assert parse_delta_line(frame, "DF:13,SPEED:55.0", 300)  # DF:12 was lost
+    assert not frame.delta_synced
+    assert frame.speed == 55.0 and frame.speed_time == 300  # Fields that did arrive still count
+    assert frame.confirmed_time == 200
+    # In sequence again, but only a keyframe can vouch for the omitted fields
+    parse_delta_line(frame, "DF:14", 400)
+    assert not frame.delta_synced and frame.confirmed_time == 200
+    parse_delta_line(frame, "KF:15,SPEED:56.0,FUEL:69.0", 500)
+    assert frame.delta_synced and frame.confirmed_time == 500
+
+
+def test_sequence_wraps_at_256():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:254", 1)
+    parse_delta_line(frame, "DF:255", 2)
+    parse_delta_line(frame, "DF:0", 3)
+    assert frame.delta_synced and frame.confirmed_time == 3
+
+
+def test_delta_before_any_keyframe_is_not_synced():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "DF:0,SPEED:10.0", 50)
+    assert not frame.delta_synced
+    assert frame.speed == 10.0 and frame.confirmed_time == 0
+
+
+def test_corrupt_header_is_rejected():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:3,SPEED:20.0", 10)
+    assert not parse_delta_line(frame, "DF:x4,SPEED:99.0", 20)
+    assert not parse_delta_line(frame, "DF:,SPEED:99.0", 20)
+    assert frame.speed == 20.0 and frame.delta_sequence == 3
+
+
+def test_malformed_field_in_delta_is_skipped():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:1,SPEED:20.0,OIL:40.0", 10)
+    assert parse_delta_line(frame, "DF:2,SPEED:2o.5,OIL:41.0,NOPE:1", 20)
+    assert frame.speed == 20.0 and frame.oil == 41.0
+    assert frame.delta_synced  # A bad value is not a lost line
+
+
+def test_field_age_follows_confirmation():
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:1,SPEED:20.0,FUEL:70.0", 1000)
+    parse_delta_line(frame, "DF:2,SPEED:21.0", 1100)
+    snapshot = frame.snapshot()
+    assert field_age(snapshot, "fuel", 1500) == 400  # Confirmed by DF:2
+    assert field_age(snapshot, "coolant", 1500) is None  # Never received
+    parse_delta_line(frame, "DF:4,SPEED:22.0", 1200)  # Gap - fuel is no longer vouched for
+    snapshot = frame.snapshot()
+    assert field_age(snapshot, "fuel", 1500) == 400
+    assert field_age(snapshot, "speed", 1500) == 300
+
+
+def test_reader_counts_delta_gaps():
+    ser = FakeSerial([b"KF:1,SPEED:10.0\nDF:2,SPEED:11.0\nDF:5,SPEED:14.0\nDF:6\nKF:7,SPEED:15.0\nDF:9\n"])
+    reader = SerialReader(ser, clock=lambda: 42)
+    lines, frames = reader.ingest.read(ser)
+    reader.process_batch(lines, frames)
+    assert reader.delta_gaps == 2
+    assert reader.telemetry_lines == 6
+    assert reader.snapshot.speed == 15.0
+    assert not reader.frame.delta_synced
@@ -0,0 +1,29 @@
+"""Persistent data file of an engine - only the car's engine writes to the working directory"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import arduino_combined_dashboard as dashboard
+
+
+def test_engine_without_arduino_uses_a_temp_file():
+    engine = dashboard.DashboardEngine(headless=True, arduino=False)
+    assert engine.data_file == dashboard.ENGINE_DATA_FILE
+    assert os.path.dirname(engine.data_file) != os.getcwd()
+    assert dashboard.DashboardEngine(headless=True, arduino=True).data_file == dashboard.PERSISTENT_DATA_FILE
+
+
+def test_data_file_and_backups_stay_where_asked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "data" / "odo.json"
+    path.parent.mkdir()
+    engine = dashboard.DashboardEngine(headless=True, arduino=False, data_file=str(path))
+    data = dashboard.PersistentDataManager(engine.data_file)
+    assert path.exists()  # Defaults written on first load
+    data.data["save_count"] = 998
+    data.update_data(100.0, 1.0, 0.5)
+    data.update_data(101.0, 2.0, 0.6)  # Save 1000 - backup before writing
+    assert len([name for name in os.listdir(path.parent) if name.startswith("odo.json.backup_")]) == 1
+    assert dashboard.PersistentDataManager(str(path)).data["total_odometer"] == 101.0
+    assert os.listdir(tmp_path) == ["data"]
@@ -0,0 +1,36 @@
+"""Frame trace - F4 / SIGUSR1 records draw timings even when the profile was off at start"""
+
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import arduino_combined_dashboard as dashboard
+
+
+def test_trace_puts_the_timers_in_and_takes_them_out(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # The trace file lands here
+    assert not (dashboard.LIVE_PROFILE or dashboard.BENCHMARK_PROFILE)
+    render_frame = dashboard.render_frame
+    engine = dashboard.DashboardEngine(window=pygame.Surface((5000, 768)), headless=True, arduino=False,
+                                       fps=0, data_file=str(tmp_path / "data.json"))
+    engine.start()
+    try:
+        engine.step()
+        assert not dashboard.profile_timers
+        dashboard.trace_signal_handler(None, None)
+        engine.step()  # Starts the trace and records this frame
+        assert dashboard.render_frame is not render_frame and dashboard.trace_events is not None
+        monkeypatch.setattr(dashboard, "TRACE_SECONDS", 0)
+        engine.step()  # Over TRACE_SECONDS - the trace is written
+        assert dashboard.render_frame is render_frame and not dashboard.profile_timers
+        dashboard.trace_writer.join()
+    finally:
+        engine.shutdown()
+
+    (path,) = tmp_path.glob("dashboard_trace_*.json")
+    with open(path) as f:
+        names = {event["name"] for event in json.load(f)["traceEvents"]}
+    assert {"frame", "render_frame", "rotate_screen"} <= names
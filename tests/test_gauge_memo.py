@@ -0,0 +1,56 @@
+"""Gauge memo - layers are reused only on a target of the same size and pixel format"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import arduino_combined_dashboard as dashboard
+
+
+@pytest.fixture
+def memo(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((8, 8))
+    monkeypatch.setattr(dashboard, "gauge_memo", {})
+    monkeypatch.setattr(dashboard, "gauge_memo_build_frame", None)
+    monkeypatch.setattr(dashboard, "indexed_style", None)
+    calls = []
+
+    @dashboard.memoize_gauge(lambda value: ("bar", value // 10))
+    def draw_test_bar(surface, value):
+        calls.append(surface.get_size())
+        pygame.draw.rect(surface, (255, 0, 0), (0, 0, 4, 4))
+
+    yield draw_test_bar, calls
+    pygame.display.quit()
+
+
+def settle(draw, surface, value):
+    """Call until the memo has built its layer (one build per frame, so bump loop_counter)"""
+    for frame in range(dashboard.GAUGE_MEMO_SETTLE + 1):
+        dashboard.loop_counter += 1
+        draw(surface, value)
+
+
+def test_settled_gauge_is_blitted_from_its_layer(memo):
+    draw, calls = memo
+    surface = pygame.Surface((100, 50), pygame.SRCALPHA)
+    settle(draw, surface, 42)
+    drawn = len(calls)
+    draw(surface, 45)  # Same tick
+    assert len(calls) == drawn
+    assert surface.get_at((1, 1)) == (255, 0, 0, 255)
+
+
+def test_other_target_gets_its_own_layer(memo):
+    draw, calls = memo
+    settle(draw, pygame.Surface((100, 50), pygame.SRCALPHA), 42)
+    drawn = len(calls)
+    small = pygame.Surface((30, 20), pygame.SRCALPHA)
+    draw(small, 42)
+    assert len(calls) == drawn + 1 and calls[-1] == (30, 20)  # Drawn, not the 100x50 layer
+    assert small.get_at((1, 1)) == (255, 0, 0, 255)
+    assert len(dashboard.gauge_memo) == 2
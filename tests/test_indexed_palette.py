@@ -0,0 +1,74 @@
+"""Indexed palettes - the BX, XT and 300ZX screens look the same on 8-bit targets as in true colour"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import arduino_combined_dashboard as dashboard
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SWEEP_FRAMES = (0, 85, 300, 1100, 2600, 4200)  # Idle, redline (pulsing REDLINE), warnings, other switches
+TOLERANCE = 12       # Per channel
+STRAY_PIXELS = 250   # Allowed further off per screen - text is anti-aliased against the style
+                     # background, so its edges on the odometer's gray boxes differ a little
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)  # Symbol PNGs load like they do in the car
+    now = [0]
+    engine = dashboard.DashboardEngine(window=pygame.Surface((5000, 768)), headless=True, arduino=False,
+                                       fps=0, clock=lambda: now[0], data_file=str(tmp_path / "data.json"))
+    engine.start()
+    yield engine, now
+    engine.shutdown()
+
+
+def render(engine, frame, indexed_targets, monkeypatch):
+    """The three screens of one sweep frame in RGB, drawn into the indexed or the true-colour targets"""
+    monkeypatch.setattr(dashboard, "indexed_targets", indexed_targets)
+    dashboard.render_targets_style = None  # Select the targets again
+    dashboard.render_frame(*dashboard.apply_benchmark_sweep(frame))
+    screens = []
+    for surface in engine.surfaces:
+        screen = pygame.Surface(surface.get_size()).convert()
+        screen.blit(surface, (0, 0))
+        screens.append(screen)
+    return screens
+
+
+def stray_pixels(a, b):
+    """Pixels where a and b differ by more than TOLERANCE in any channel"""
+    difference = a.copy()
+    difference.blit(b, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    back = b.copy()
+    back.blit(a, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    difference.blit(back, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    close = pygame.mask.from_threshold(difference, (0, 0, 0), (TOLERANCE, TOLERANCE, TOLERANCE, 255))
+    return a.get_width() * a.get_height() - close.count()
+
+
+@pytest.mark.parametrize("style", sorted(dashboard.INDEXED_STYLES))
+def test_indexed_render_matches_true_colour(engine, style, monkeypatch):
+    engine, now = engine
+    monkeypatch.setattr(dashboard, "current_style_index", style)
+    indexed_targets = dashboard.indexed_targets
+    assert indexed_targets
+    for frame in SWEEP_FRAMES:
+        now[0] = frame * 17  # Same pulse phase in both renders
+        indexed = render(engine, frame, indexed_targets, monkeypatch)
+        assert dashboard.speedometer_surface.get_bitsize() == 8
+        true_colour = render(engine, frame, None, monkeypatch)
+        assert dashboard.speedometer_surface.get_bitsize() != 8
+        for screen, (a, b) in enumerate(zip(indexed, true_colour)):
+            assert stray_pixels(a, b) <= STRAY_PIXELS, f"frame {frame}, screen {screen}"
+
+
+def test_palette_holds_every_ink_exactly():
+    for background, inks in dashboard.INDEXED_STYLES.values():
+        palette = dashboard.build_style_palette(background, inks)
+        assert len(palette) == 256 and palette[-1] == dashboard.INDEXED_KEY_COLOR
+        assert all(tuple(ink) in palette for ink in inks + [background])
@@ -0,0 +1,94 @@
+"""RotatedBuffer - only changed tiles are rotated, and the result matches a full rotation"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import arduino_combined_dashboard as dashboard
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((8, 8))
+    yield
+    pygame.display.quit()
+
+
+def make_source(indexed):
+    if indexed:
+        source = pygame.Surface((300, 200), 0, 8)
+        source.set_palette([(i, 255 - i, i // 2) for i in range(256)])
+    else:
+        source = pygame.Surface((300, 200)).convert()
+    source.fill((0, 0, 0))
+    return source
+
+
+def same_pixels(a, b):
+    return pygame.image.tobytes(a, 'P' if a.get_bitsize() == 8 else 'RGBX') == \
+           pygame.image.tobytes(b, 'P' if b.get_bitsize() == 8 else 'RGBX')
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("angle", [0, 90, 180, 270])
+def test_changed_tiles_only(indexed, angle):
+    source = make_source(indexed)
+    buffer = dashboard.RotatedBuffer(source, angle)
+    buffer.update()
+    assert buffer.full_rotations == 1
+    
+    assert buffer.update() and buffer.dirty == []  # Nothing drawn, nothing rotated
+    
+    source.fill((200, 10, 10) if not indexed else 77, (130, 70, 3, 3))  # Inside tile (2, 1)
+    source.set_at((299, 199), (5, 6, 7) if not indexed else 12)         # Last pixel, short edge tile
+    rotated = buffer.update()
+    assert buffer.tile_rotations == 2
+    assert sorted(buffer.dirty, key=tuple) == sorted(
+        (buffer.rotated_rect(pygame.Rect(128, 64, 64, 64)), buffer.rotated_rect(pygame.Rect(256, 192, 44, 8))), key=tuple)
+    assert same_pixels(rotated, pygame.transform.rotate(source, angle))
+    
+    # Same pixels drawn again - no change
+    source.fill((200, 10, 10) if not indexed else 77, (130, 70, 3, 3))
+    buffer.update()
+    assert buffer.dirty == []
+
+
+def test_reset_rotates_everything_again():
+    source = make_source(False)
+    buffer = dashboard.RotatedBuffer(source, 270)
+    buffer.update()
+    buffer.reset()
+    buffer.update()
+    assert buffer.full_rotations == 2
+    source.fill((1, 2, 3))  # Whole screen - one full copy instead of every tile
+    buffer.update()
+    assert buffer.full_rotations == 3 and buffer.dirty == [buffer.surface.get_rect()]
+
+
+def test_dimming_touches_refreshed_tiles_only(monkeypatch):
+    monkeypatch.setattr(dashboard, "TILED_ROTATION", True)
+    source = make_source(False)
+    source.fill((200, 120, 40))
+    buffer = dashboard.RotatedBuffer(source, 270)
+    dashboard.apply_software_brightness(buffer, 0.5)
+    buffer.update()
+    assert buffer.full_rotations == 1
+    
+    source.fill((10, 250, 90), (130, 70, 3, 3))
+    dashboard.apply_software_brightness(buffer, 0.5)  # Same level - nothing redone
+    rotated = buffer.update()
+    assert buffer.tile_rotations == 1 and buffer.full_rotations == 1
+    
+    # Same pixels as dimming the whole rotated screen, and the source itself stays undimmed
+    expected = pygame.transform.rotate(source, 270)
+    expected.blit(dashboard.brightness_overlay(expected.get_size(), buffer.brightness_level), (0, 0))
+    assert same_pixels(rotated, expected)
+    assert source.get_at((0, 0))[:3] == (200, 120, 40)
+    
+    dashboard.apply_software_brightness(buffer, 1.0)  # Level change - the whole copy is redone
+    rotated = buffer.update()
+    assert buffer.full_rotations == 2 and same_pixels(rotated, pygame.transform.rotate(source, 270))
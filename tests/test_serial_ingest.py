@@ -0,0 +1,106 @@
+"""SerialIngest - splitting drained bytes into lines and binary frames"""
+
+from arduino_telemetry import FRAME_STATUS, STATUS_FRAME, SerialIngest, SerialReader, encode_binary_frame
+from serial_fakes import FakeSerial
+
+
+def status_frame(seq=1, flags=0b101):
+    return encode_binary_frame(STATUS_FRAME.pack(FRAME_STATUS, seq, flags, 310.0, 21.5, 19.0, 0.8))
+
+
+def read_all(ingest, ser):
+    """Every (lines, payloads) read until the fake port is empty"""
+    results = []
+    while ser.chunks:
+        lines, frames = ingest.read(ser)
+        results.append((lines, [bytes(ingest.decoded[offset:offset + length]) for offset, length in frames]))
+    return results
+
+
+def test_line_split_across_reads():
+    ingest = SerialIngest()
+    ser = FakeSerial([b"SPEED:1", b"2.5,RPM:800\nFUEL:", b"50.0\n"])
+    assert read_all(ingest, ser) == [
+        ([], []),
+        ([b"SPEED:12.5,RPM:800"], []),
+        ([b"FUEL:50.0"], []),
+    ]
+    assert ingest.fill == 0
+
+
+def test_several_lines_in_one_read():
+    ingest = SerialIngest()
+    ser = FakeSerial([b"A:1\nB:2\n\nC:3\nD:"])
+    lines, frames = ingest.read(ser)
+    assert lines == [b"A:1", b"B:2", b"C:3"]  # Empty lines are skipped
+    assert frames == []
+    assert bytes(ingest.buffer[:ingest.fill]) == b"D:"
+
+
+def test_frame_split_across_reads():
+    ingest = SerialIngest()
+    wire = status_frame()
+    ser = FakeSerial([wire[:5], wire[5:]])
+    results = read_all(ingest, ser)
+    assert results[0] == ([], [])
+    assert results[1][1] == [STATUS_FRAME.pack(FRAME_STATUS, 1, 0b101, 310.0, 21.5, 19.0, 0.8)]
+    assert ingest.crc_errors == 0
+
+
+def test_mixed_text_and_binary_stream():
+    ingest = SerialIngest()
+    ser = FakeSerial([b"INIT_REQUEST:1\n" + status_frame(1) + b"SPEED:40.0\n" + status_frame(2) + status_frame(3)])
+    lines, frames = ingest.read(ser)
+    assert lines == [b"INIT_REQUEST:1", b"SPEED:40.0"]
+    sequences = [ingest.decoded[offset + 1] for offset, length in frames]
+    assert sequences == [1, 2, 3]
+    assert all(length == STATUS_FRAME.size for offset, length in frames)
+
+
+def test_line_fragment_cut_off_by_frame_is_dropped():
+    ingest = SerialIngest()
+    # Half a line (the board reset mid-print), then a frame and a whole line
+    ser = FakeSerial([b"SPEED:4" + status_frame() + b"RPM:900\n"])
+    lines, frames = ingest.read(ser)
+    assert lines == [b"RPM:900"]
+    assert len(frames) == 1
+
+
+def test_overflow_without_delimiter_is_discarded():
+    ingest = SerialIngest(size=64)
+    ser = FakeSerial([b"x" * 64, b"SPEED:10.0\n"])
+    assert ingest.read(ser) == ([], [])
+    assert ingest.overflows == 1
+    assert ingest.fill == 0
+    # The next message after the noise comes through intact
+    assert ingest.read(ser) == ([b"SPEED:10.0"], [])
+
+
+def test_unterminated_frame_overflow_is_discarded():
+    ingest = SerialIngest(size=32)
+    ser = FakeSerial([b"\x00" + b"\x07" * 31, b"\nRPM:1000\n"])
+    assert ingest.read(ser) == ([], [])
+    assert ingest.overflows == 1
+    lines, frames = ingest.read(ser)
+    assert lines == [b"RPM:1000"]
+
+
+def test_read_never_exceeds_free_space():
+    ingest = SerialIngest(size=16)
+    ser = FakeSerial([b"AB:1\nCD:2\nEF:3\nGH:4\n"])
+    lines = []
+    while ser.chunks:
+        lines += ingest.read(ser)[0]
+    assert lines == [b"AB:1", b"CD:2", b"EF:3", b"GH:4"]
+    assert ingest.overflows == 0
+    assert ingest.bytes_read == 20
+
+
+def test_batch_keeps_control_messages_and_coalesces_telemetry():
+    ser = FakeSerial([b"SPEED:10.0,RPM:800\nINIT_REQUEST:1\nSPEED:12.0\nRESET_TRIP:1\nSPEED:14.0,RPM:900\n"])
+    reader = SerialReader(ser, clock=lambda: 42)
+    reader.process_batch(*reader.ingest.read(ser))
+    assert reader.pop_control_messages() == ["INIT_REQUEST:1", "RESET_TRIP:1"]
+    assert reader.snapshot.speed == 14.0 and reader.snapshot.rpm == 900.0
+    assert reader.snapshot.sequence == 1  # One snapshot for the whole batch
+    assert reader.frames_coalesced == 2 and reader.telemetry_lines == 3
@@ -0,0 +1,96 @@
+"""SerialRecorder -> ReplaySerial round trip - same bytes, same timing, clean end of session"""
+
+import time
+
+import pytest
+
+from arduino_telemetry import ReplaySerial, SerialIngest, SerialRecorder, read_session_log
+from serial_fakes import FakeSerial
+
+CHUNKS = [b"SPEED:10.0,RPM:900\n", b"SPEED:12", b".5,RPM:1200\nTRIP_RESET\n", b"\x00" * 3 + b"\xff" * 40]
+ARRIVALS = [5, 40, 41, 300]  # ms after the recorder started
+
+
+def record(tmp_path):
+    """Record CHUNKS as if each arrived at its ARRIVALS time, returns the log path"""
+    path = tmp_path / "session.bin"
+    times = iter([1000] + [1000 + ms for ms in ARRIVALS])
+    recorder = SerialRecorder(FakeSerial(CHUNKS), str(path), clock=lambda: next(times))
+    buffer = bytearray(64)
+    received = []
+    while True:
+        count = recorder.readinto(buffer)
+        if not count:
+            break
+        received.append(bytes(buffer[:count]))
+    recorder.close()
+    recorder.close_log()
+    assert received == CHUNKS
+    assert recorder.bytes_recorded == sum(map(len, CHUNKS))
+    return path
+
+
+def test_log_keeps_chunk_boundaries_and_arrival_times(tmp_path):
+    assert read_session_log(record(tmp_path)) == list(zip(ARRIVALS, CHUNKS))
+
+
+def test_full_speed_replay_gives_back_the_same_reads(tmp_path):
+    replay = ReplaySerial(str(record(tmp_path)), speed=0)
+    buffer = bytearray(64)
+    reads = []
+    while not replay.finished:
+        assert replay.in_waiting
+        count = replay.readinto(buffer)
+        reads.append((replay.clock(), bytes(buffer[:count])))
+    assert reads == list(zip(ARRIVALS, CHUNKS))
+    with pytest.raises(EOFError):
+        replay.readinto(buffer)
+
+
+def test_timed_replay_waits_for_each_chunk(tmp_path):
+    speed = 10.0
+    replay = ReplaySerial(str(record(tmp_path)), speed=speed, timeout=1.0)
+    buffer = bytearray(256)
+    data = bytearray()
+    expected = 0
+    for ms, chunk in zip(ARRIVALS, CHUNKS):
+        expected += len(chunk)
+        while len(data) < expected:
+            data += buffer[:replay.readinto(buffer)]
+        # Never early - the chunk is only handed out once its recorded time has passed
+        assert (time.perf_counter() - replay.start) * 1000.0 * speed >= ms
+        assert replay.clock() >= ms
+    assert bytes(data) == b"".join(CHUNKS)
+    assert replay.finished and replay.in_waiting == 0
+    with pytest.raises(EOFError):
+        replay.readinto(buffer)
+
+
+def test_replay_feeds_the_ingest_like_the_port(tmp_path):
+    replay = ReplaySerial(str(record(tmp_path)), speed=0)
+    ingest = SerialIngest()
+    lines = []
+    while not replay.finished:
+        batch, _ = ingest.read(replay)
+        lines += batch
+    assert lines == [b"SPEED:10.0,RPM:900", b"SPEED:12.5,RPM:1200", b"TRIP_RESET"]
+
+
+def test_closed_replay_ends_the_session(tmp_path):
+    replay = ReplaySerial(str(record(tmp_path)), speed=0)
+    replay.close()
+    with pytest.raises(EOFError):
+        replay.readinto(bytearray(8))
+
+
+def test_truncated_log_keeps_what_arrived(tmp_path):
+    path = record(tmp_path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])  # Crash mid-write of the last chunk
+    records = read_session_log(str(path))
+    assert [ms for ms, _ in records] == ARRIVALS
+    assert records[-1][1] == CHUNKS[-1][:-10]
+    with open(path, "wb") as f:
+        f.write(b"not a log")
+    with pytest.raises(ValueError):
+        read_session_log(str(path))
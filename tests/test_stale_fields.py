@@ -0,0 +1,44 @@
+"""Per-field staleness - expire_stale_fields() zeroes what the Arduino stopped confirming"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+
+import arduino_combined_dashboard as dashboard
+from arduino_telemetry import TelemetryFrame, parse_delta_line
+
+
+@pytest.fixture
+def gauges(monkeypatch):
+    for name, value in (("display_speed", 50.0), ("current_rpm", 2000.0), ("display_rpm", 2000.0),
+                        ("current_fuel_level", 60.0), ("current_oil_pressure", 40.0),
+                        ("current_coolant_temp", 190.0), ("stale_fields", set())):
+        monkeypatch.setattr(dashboard, name, value)
+    frame = TelemetryFrame()
+    parse_delta_line(frame, "KF:1,SPEED:50.0,RPM:2000,FUEL:60.0,OIL:40.0", 1000)
+    return frame
+
+
+def test_fresh_fields_are_left_alone(gauges):
+    dashboard.expire_stale_fields(gauges.snapshot(), 1400)
+    assert dashboard.display_speed == 50.0 and dashboard.current_rpm == 2000.0
+    assert dashboard.current_fuel_level == 60.0
+
+
+def test_speed_and_rpm_time_out_without_a_new_snapshot(gauges):
+    dashboard.expire_stale_fields(gauges.snapshot(), 1500)
+    assert dashboard.display_speed == 0.0
+    assert dashboard.current_rpm is None and dashboard.display_rpm == 0.0
+    assert dashboard.current_fuel_level == 60.0  # Sensors get longer
+
+
+def test_stale_sensor_reads_zero_until_confirmed_again(gauges):
+    dashboard.expire_stale_fields(gauges.snapshot(), 1000 + dashboard.SENSOR_STALE_MS)
+    assert dashboard.current_fuel_level == 0.0 and dashboard.current_oil_pressure == 0.0
+    assert dashboard.current_coolant_temp == 190.0  # Never received - nothing to expire
+    assert dashboard.stale_fields == {"fuel", "oil"}
+    parse_delta_line(gauges, "KF:2,FUEL:58.0", 4100)  # Keyframe vouches for every field
+    dashboard.expire_stale_fields(gauges.snapshot(), 4200)
+    assert not dashboard.stale_fields
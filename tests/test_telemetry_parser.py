@@ -0,0 +1,50 @@
+"""Text telemetry lines - parse_telemetry_line() into a TelemetryFrame"""
+
+from arduino_telemetry import FIELD_INDEX, TelemetryFrame, parse_telemetry_line
+
+
+def test_fields_and_timestamps():
+    frame = TelemetryFrame()
+    accepted = parse_telemetry_line(frame, "SPEED:55.5,RPM:2400,FUEL:61.0,TRIP_BTN:1,METR_SW:0", 1000)
+    assert accepted == 5
+    assert (frame.speed, frame.rpm, frame.fuel) == (55.5, 2400.0, 61.0)
+    assert frame.trip_btn is True and frame.metric_sw is False
+    assert frame.speed_time == frame.rpm_time == frame.status_time == 1000
+    assert frame.field_times[FIELD_INDEX["fuel"]] == 1000
+    assert frame.field_times[FIELD_INDEX["oil"]] == 0  # Not in the line
+
+
+def test_malformed_values_are_skipped():
+    frame = TelemetryFrame()
+    parse_telemetry_line(frame, "SPEED:40.0,OIL_P_SW:1", 500)
+    accepted = parse_telemetry_line(frame, "SPEED:4x.0,RPM:900,OIL_P_SW:2,FUEL:", 600)
+    assert accepted == 1  # Only RPM
+    assert frame.speed == 40.0 and frame.speed_time == 500  # Corrupt value keeps the old sample
+    assert frame.oil_pressure_sw is True and frame.status_time == 500
+    assert frame.rpm == 900.0 and frame.rpm_time == 600
+    assert frame.fuel is None
+
+
+def test_unknown_keys_and_fragments_are_ignored():
+    frame = TelemetryFrame()
+    accepted = parse_telemetry_line(frame, "ECU_DATA:7,speed:10,SPEED,:5,RPM:1200,PEED:3.0", 10)
+    assert accepted == 1
+    assert frame.rpm == 1200.0
+    assert frame.speed is None
+
+
+def test_cut_off_line_keeps_complete_pairs():
+    frame = TelemetryFrame()
+    # Bytes lost mid-line: the last pair is a fragment of another key
+    accepted = parse_telemetry_line(frame, "SPEED:70.0,RPM:3100,COOL", 20)
+    assert accepted == 2
+    assert frame.coolant is None
+
+
+def test_snapshot_is_an_immutable_copy():
+    frame = TelemetryFrame()
+    parse_telemetry_line(frame, "SPEED:30.0", 5)
+    snapshot = frame.snapshot()
+    parse_telemetry_line(frame, "SPEED:31.0", 6)
+    assert snapshot.speed == 30.0 and snapshot.speed_time == 5
+    assert snapshot.field_times[FIELD_INDEX["speed"]] == 5
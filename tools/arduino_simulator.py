@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Arduino Serial Simulator
+Creates a pseudo-terminal that talks like arduino_code.cpp (fast/switch lines, INIT_REQUEST,
+SAVE_DATA, debug chatter, optional binary/delta modes) so the dashboard's real serial path can be
+load tested on a plain Linux box with no hardware.
+
+Usage:
+    python3 tools/arduino_simulator.py --rate 100 --burst 20 --corrupt 0.01
+    DASHBOARD_SERIAL_PORT=/tmp/ttyARDUINO python3 arduino_combined_dashboard.py
+"""
+
+import argparse
+import math
+import os
+import random
+import select
+import sys
+import termios
+import time
+import tty
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arduino_telemetry import (FAST_FRAME, FRAME_FAST, FRAME_STATUS, STATUS_FLAGS, STATUS_FRAME,
+                               encode_binary_frame)
+
+# Configuration
+DEFAULT_LINK = "/tmp/ttyARDUINO"   # Stable name for DASHBOARD_SERIAL_PORT
+INIT_REQUEST_INTERVAL = 5.0         # Same as DATA_REQUEST_INTERVAL in arduino_code.cpp
+KEYFRAME_INTERVAL = 1.0             # Same as KEYFRAME_INTERVAL in arduino_code.cpp
+DEBUG_INTERVAL = 2.0                # DEBUG_MPG chatter
+STATUS_INTERVAL = 10.0              # ARDUINO_STATUS chatter
+BOOT_DELAY = 0.5                    # Bootloader time after the auto-reset on port open (Pi input is lost)
+IDLE_SPEED = termios.B9600          # pty line speed while nobody has the port open
+
+# Delta line keys/decimals, same order as DELTA_KEYS/DELTA_DECIMALS in arduino_code.cpp
+DELTA_FIELDS = (
+    ("SPEED", 1), ("FUEL", 1), ("OIL", 1), ("COOLANT", 1), ("OILTEMP", 1), ("RPM", 0),
+    ("BATTERY", 1), ("BRIGHTNESS", 1), ("FUEL_CONSUMPTION", 3),
+    ("FUELRNG", 1), ("IMPG", 1), ("AMPG", 1), ("FLOW", 3),
+    ("TRIP_BTN", 0), ("AVG_BTN", 0), ("OIL_P_SW", 0), ("OIL_T_SW", 0), ("COOL_SW", 0), ("VOLT_SW", 0),
+    ("AMPG_SW", 0), ("IMPG_SW", 0), ("TRIP_SW", 0), ("FUELR_SW", 0), ("METR_SW", 0),
+)
+SWITCH_KEYS = ("TRIP_BTN", "AVG_BTN", "OIL_P_SW", "OIL_T_SW", "COOL_SW", "VOLT_SW",
+               "AMPG_SW", "IMPG_SW", "TRIP_SW", "FUELR_SW", "METR_SW")
+
+
+class SimulatedCar:
+    """Smooth, repeatable sensor values for a simulated drive"""
+
+    def __init__(self):
+        self.fuel_used = 0.0
+        self.fuel_used_bpw = 0.0
+        self.switches = dict.fromkeys(SWITCH_KEYS, 0)
+        self.switches["AMPG_SW"] = 1
+        self.switches["TRIP_SW"] = 1
+
+    def values(self, t):
+        """Sensor values at t seconds, in DELTA_FIELDS order"""
+        speed = max(0.0, 45.0 + 40.0 * math.sin(t / 9.0))
+        rpm = 800.0 + speed * 38.0 + 300.0 * math.sin(t * 1.7)
+        flow = 0.4 + speed / 40.0
+        return [
+            speed, 62.0 - t / 600.0, 38.0 + 4.0 * math.sin(t / 3.0), 192.0 + 3.0 * math.sin(t / 30.0),
+            212.0 + 2.0 * math.sin(t / 40.0), rpm, 13.9 + 0.1 * math.sin(t), 85.0, flow * 6.0,
+            245.0 - t / 60.0, 12.0 + speed / 6.0, 19.8, flow,
+        ] + [self.switches[key] for key in SWITCH_KEYS]
+
+    def toggle_switches(self, t):
+        """Flip a display switch now and then so status changes show up in the stream"""
+        if int(t) % 15 == 0:
+            self.switches["METR_SW"] = int(t / 15.0) % 2
+
+
+def fast_line(values):
+    """SPEED/RPM line exactly like the firmware's snprintf output"""
+    return ("SPEED:%.1f,FUEL:%.1f,OIL:%.1f,COOLANT:%.1f,OILTEMP:%.1f,RPM:%d,BATTERY:%.1f,"
+            "BRIGHTNESS:%.1f,FUEL_CONSUMPTION:%.3f\n" % (
+                values[0], values[1], values[2], values[3], values[4], int(values[5]),
+                values[6], values[7], values[8]))
+
+
+def switch_line(values, switches):
+    """Switch/button line with the fuel economy values"""
+    return ("TRIP_BTN:%d,AVG_BTN:%d,OIL_P_SW:%d,OIL_T_SW:%d,COOL_SW:%d,VOLT_SW:%d,FUELRNG:%.1f,"
+            "IMPG:%.1f,AMPG:%.1f,FLOW:%.3f,AMPG_SW:%d,IMPG_SW:%d,TRIP_SW:%d,FUELR_SW:%d,METR_SW:%d\n" % (
+                switches["TRIP_BTN"], switches["AVG_BTN"], switches["OIL_P_SW"], switches["OIL_T_SW"],
+                switches["COOL_SW"], switches["VOLT_SW"], values[9], values[10], values[11], values[12],
+                switches["AMPG_SW"], switches["IMPG_SW"], switches["TRIP_SW"], switches["FUELR_SW"],
+                switches["METR_SW"]))
+
+
+def binary_frames(values, switches, sequence):
+    """Fast + status frames, same layouts as sendFastFrame()/sendStatusFrame()"""
+    fast = FAST_FRAME.pack(FRAME_FAST, sequence & 0xFF, *values[:5], int(values[5]), *values[6:9])
+    flags = 0
+    for (bit, _), key in zip(STATUS_FLAGS, SWITCH_KEYS):
+        if switches[key]:
+            flags |= bit
+    status = STATUS_FRAME.pack(FRAME_STATUS, sequence & 0xFF, flags, *values[9:13])
+    return encode_binary_frame(fast), encode_binary_frame(status)
+
+
+def corrupt(data):
+    """Damage a message the way a noisy USB cable or a reset does"""
+    damage = random.choice(("truncate", "garbage", "flip"))
+    if damage == "truncate":
+        return data[:random.randint(1, max(1, len(data) - 1))]
+    if damage == "garbage":
+        return bytes(random.randint(1, 255) for _ in range(random.randint(5, 40))) + data
+    position = random.randrange(len(data))
+    return data[:position] + bytes([data[position] ^ 0x5A]) + data[position + 1:]
+
+
+class Simulator:
+    """Writes the firmware message mix to the pty master and answers the Pi's control messages"""
+
+    def __init__(self, master, slave, args):
+        self.master = master
+        self.slave = slave
+        self.args = args
+        self.car = SimulatedCar()
+        self.binary = False
+        self.delta = False
+        self.initialized = False
+        self.sequence = 0
+        self.last_delta = {}
+        self.rx = b""
+        self.backlog = []  # Messages held back for the next burst
+        self.booted_at = time.monotonic()
+        self.resets = 0
+
+        # Statistics
+        self.lines_sent = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.corrupted = 0
+        self.bursts = 0
+        self.write_errors = 0
+
+    def check_port_open(self):
+        """Emulate the Mega's auto-reset: opening the port reconfigures the pty, so reboot"""
+        attributes = termios.tcgetattr(self.slave)
+        if attributes[4] == IDLE_SPEED and attributes[5] == IDLE_SPEED:
+            return False
+        # Back to the idle speed so the next open is noticed too
+        attributes[4] = attributes[5] = IDLE_SPEED
+        termios.tcsetattr(self.slave, termios.TCSANOW, attributes)
+        self.binary = False
+        self.delta = False
+        self.initialized = False
+        self.sequence = 0
+        self.last_delta = {}
+        self.rx = b""
+        self.booted_at = time.monotonic()
+        self.resets += 1
+        print("🔄 Port opened - simulating Arduino reset")
+        return True
+
+    def send(self, data):
+        """Queue one message (held while a burst builds), corrupting some of them"""
+        if self.args.corrupt and random.random() < self.args.corrupt:
+            data = corrupt(data)
+            self.corrupted += 1
+        self.backlog.append(data)
+
+    def flush(self):
+        """Write queued messages in one go - the pty buffers them if the reader falls behind"""
+        if not self.backlog:
+            return
+        data = b"".join(self.backlog)
+        self.backlog = []
+        try:
+            written = os.write(self.master, data)
+            self.bytes_sent += written
+            if written < len(data):
+                self.write_errors += 1  # pty buffer full - the tail is lost like a UART overrun
+        except OSError:
+            self.write_errors += 1  # Nobody reading (dashboard not started yet) - drop like a real UART
+
+    def send_line(self, text):
+        self.send(text.encode())
+        self.lines_sent += 1
+
+    def init_request(self):
+        """INIT_REQUEST with the same capability flags as requestPersistentData()"""
+        line = "INIT_REQUEST:PERSISTENT_DATA"
+        if self.args.binary:
+            line += ",BINARY:1"
+        if self.args.delta:
+            line += ",DELTA:1"
+        self.send_line(line + "\n")
+
+    def poll_commands(self):
+        """Handle INIT_DATA/BINARY_MODE/DELTA_MODE/AVG_MPG_UPDATE from the Pi"""
+        booting = time.monotonic() - self.booted_at < BOOT_DELAY
+        while select.select([self.master], [], [], 0)[0]:
+            try:
+                chunk = os.read(self.master, 1024)
+            except OSError:
+                return
+            if not chunk:
+                return
+            if not booting:
+                self.rx += chunk  # Anything sent while the bootloader runs never reaches the sketch
+        while b"\n" in self.rx:
+            raw, self.rx = self.rx.split(b"\n", 1)
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if line.startswith("INIT_DATA:"):
+                parts = line[10:].split(",")
+                try:
+                    self.car.fuel_used = float(parts[0])
+                    self.car.fuel_used_bpw = float(parts[1]) if len(parts) > 1 else 0.0
+                except ValueError:
+                    pass
+                self.initialized = True
+                print(f"📥 INIT_DATA received (fuel {self.car.fuel_used:.3f} gal)")
+            elif line.startswith("BINARY_MODE:"):
+                self.binary = self.args.binary and line[12:] == "1"
+                print(f"📥 Binary mode {'on' if self.binary else 'off'}")
+            elif line.startswith("DELTA_MODE:"):
+                self.delta = self.args.delta and line[11:] == "1"
+                self.last_delta = {}
+                print(f"📥 Delta mode {'on' if self.delta else 'off'}")
+
+    def telemetry(self, t, keyframe):
+        """One fast tick: fast line/frame (and switch data in delta mode)"""
+        values = self.car.values(t)
+        if self.binary:
+            fast, status = binary_frames(values, self.car.switches, self.sequence)
+            self.send(fast)
+            self.frames_sent += 1
+            self.sequence += 1
+            return status
+        if self.delta:
+            # Only fields whose printed value changed, everything on a keyframe
+            parts = ["KF:%d" % (self.sequence & 0xFF) if keyframe else "DF:%d" % (self.sequence & 0xFF)]
+            for (key, decimals), value in zip(DELTA_FIELDS, values):
+                text = "%.*f" % (decimals, value)
+                if keyframe or self.last_delta.get(key) != text:
+                    parts.append(f"{key}:{text}")
+                    self.last_delta[key] = text
+            self.send_line(",".join(parts) + "\n")
+            self.sequence += 1
+            return None
+        self.send_line(fast_line(values))
+        return None
+
+    def status(self, t, binary_status):
+        """Slow tick: switch line/frame (not sent in delta mode - switches ride in the deltas)"""
+        if self.delta:
+            return
+        if binary_status is not None:
+            self.send(binary_status)
+            self.frames_sent += 1
+            return
+        self.send_line(switch_line(self.car.values(t), self.car.switches))
+
+    def run(self):
+        """Main timing loop - fast ticks at --rate, switch ticks every 1.5 fast ticks like the firmware"""
+        args = self.args
+        fast_period = 1.0 / args.rate
+        status_period = fast_period * 1.5
+        start = time.monotonic()
+        next_fast = next_status = start
+        next_init = start
+        next_save = start + args.save_every
+        next_keyframe = start
+        next_debug = start + DEBUG_INTERVAL
+        next_chatter = start + STATUS_INTERVAL
+        next_burst = start + args.burst_every if args.burst else None
+        binary_status = None
+
+        while args.duration <= 0 or time.monotonic() - start < args.duration:
+            now = time.monotonic()
+            t = now - start
+            if self.check_port_open():
+                next_init = now + BOOT_DELAY
+            self.poll_commands()
+            self.car.toggle_switches(t)
+
+            if not self.initialized and now >= next_init:
+                self.init_request()
+                next_init = now + INIT_REQUEST_INTERVAL
+            if now >= next_fast:
+                keyframe = now >= next_keyframe
+                if keyframe:
+                    next_keyframe = now + KEYFRAME_INTERVAL
+                binary_status = self.telemetry(t, keyframe) or binary_status
+                next_fast += fast_period
+            if now >= next_status:
+                self.status(t, binary_status)
+                binary_status = None
+                next_status += status_period
+            if now >= next_save:
+                # Fuel totals like sendPersistentDataUpdate()
+                self.car.fuel_used += 0.0005 * args.save_every
+                self.send_line("SAVE_DATA:%.4f,%.4f\n" % (self.car.fuel_used, self.car.fuel_used_bpw))
+                next_save = now + args.save_every
+            if args.chatter and now >= next_debug:
+                self.send_line("DEBUG_MPG - Pin34_RAW:1 Pin40_RAW:1 AvgMpgSW:0 InstMpgSW:0\n")
+                next_debug = now + DEBUG_INTERVAL
+            if args.chatter and now >= next_chatter:
+                self.send_line("ARDUINO_STATUS: Waiting for ESP32 on Pin 19, Current fuel = 2.500\n")
+                next_chatter = now + STATUS_INTERVAL
+
+            # Bursts: hold everything back, then dump --burst messages' worth at once
+            if next_burst is not None:
+                if now >= next_burst and len(self.backlog) >= args.burst:
+                    self.flush()
+                    self.bursts += 1
+                    next_burst = now + args.burst_every
+            else:
+                self.flush()
+
+            if next_fast < now - 1.0:
+                next_fast = next_status = now  # Fell far behind (machine stalled) - don't replay the backlog
+            time.sleep(max(0.0, min(next_fast, next_status) - time.monotonic()))
+
+        self.flush()
+
+
+def open_pty(link):
+    """Create the pty (raw mode, so newlines pass untouched) and an optional stable symlink"""
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    attributes = termios.tcgetattr(slave)
+    attributes[4] = attributes[5] = IDLE_SPEED
+    termios.tcsetattr(slave, termios.TCSANOW, attributes)
+    os.set_blocking(master, False)  # Never stall the timing loop when the dashboard stops reading
+    port = os.ttyname(slave)
+    if link:
+        try:
+            if os.path.islink(link):
+                os.unlink(link)
+            os.symlink(port, link)
+        except OSError as e:
+            print(f"⚠️ Could not create {link}: {e}")
+            link = None
+    return master, slave, port, link
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate the dashboard Arduino on a pseudo-terminal")
+    parser.add_argument("--rate", type=float, default=10.0,
+                        help="fast line rate in Hz (firmware: 10, try 20/50/100/200)")
+    parser.add_argument("--burst", type=int, default=0,
+                        help="hold messages back and send this many at once (0 = no bursts)")
+    parser.add_argument("--burst-every", type=float, default=1.0, help="seconds between bursts")
+    parser.add_argument("--corrupt", type=float, default=0.0, help="fraction of messages to damage (0-1)")
+    parser.add_argument("--save-every", type=float, default=10.0, help="SAVE_DATA interval in seconds")
+    parser.add_argument("--binary", action="store_true", help="offer binary frames in INIT_REQUEST")
+    parser.add_argument("--delta", action="store_true", help="offer delta lines in INIT_REQUEST")
+    parser.add_argument("--no-chatter", dest="chatter", action="store_false",
+                        help="skip DEBUG_MPG/ARDUINO_STATUS lines")
+    parser.add_argument("--duration", type=float, default=0, help="seconds to run (0 = until Ctrl+C)")
+    parser.add_argument("--link", default=DEFAULT_LINK, help="symlink to the pty ('' for none)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for repeatable corruption")
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    master, slave, port, link = open_pty(args.link)
+    print("🔌 ARDUINO SIMULATOR")
+    print("=" * 40)
+    print(f"📡 Port: {port}" + (f" (linked as {link})" if link else ""))
+    print(f"⚙️  {args.rate:g} Hz, bursts {args.burst or 'off'}, corruption {args.corrupt:.1%}")
+    print(f"▶️  DASHBOARD_SERIAL_PORT={link or port} python3 arduino_combined_dashboard.py\n")
+
+    simulator = Simulator(master, slave, args)
+    start = time.monotonic()
+    try:
+        simulator.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.monotonic() - start
+        if link:
+            try:
+                os.unlink(link)
+            except OSError:
+                pass
+        os.close(slave)
+        os.close(master)
+
+    print(f"\n📊 {elapsed:.1f}s: {simulator.lines_sent:,} lines, {simulator.frames_sent:,} binary frames, "
+          f"{simulator.bytes_sent:,} bytes ({simulator.bytes_sent / elapsed if elapsed else 0:,.0f} B/s)")
+    print(f"   corrupted {simulator.corrupted:,}, bursts {simulator.bursts:,}, write errors {simulator.write_errors:,}, "
+          f"resets {simulator.resets:,}")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Render Benchmark
+Renders every dashboard style headless (SDL dummy video driver, no Arduino) with a scripted
+telemetry sweep - speed 0-140 mph, RPM 0-6500, the sensors through their warning ranges and the
+switch combinations including metric, each held for 12 frames (all 512 in 6144 frames, fewer
+in shorter runs) - and times every frame, every draw_* function and the brightness/rotate/blit/push
+phases of each screen.
+Frames where a switch change rebuilt the static layers are reported on their own; the frame
+statistics and the per-draw breakdown cover the steady frames in between.
+
+Usage:
+    python3 tools/benchmark_render.py                      # 6144 frames per style
+    python3 tools/benchmark_render.py --frames 2048 --styles 2 3
+    python3 tools/benchmark_render.py --json before.json   # Save the full report
+    python3 tools/benchmark_render.py --compare before.json --json after.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DASHBOARD = os.path.join(ROOT, 'arduino_combined_dashboard.py')
+STYLE_NAMES = ["Synthwave", "Citroën BX", "Subaru XT", "Nissan 300ZX", "Corvette C4"]
+
+
+def run(style, frames, profile=True):
+    """One headless sweep run, returns the dashboard's JSON report"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        report_path = f.name
+    try:
+        env = dict(os.environ,
+                   DASHBOARD_BENCHMARK_FRAMES=str(frames),
+                   DASHBOARD_BENCHMARK_SWEEP='1',
+                   DASHBOARD_BENCHMARK_PROFILE='1' if profile else '0',
+                   DASHBOARD_BENCHMARK_JSON=report_path,
+                   DASHBOARD_STYLE=str(style))
+        # Run from the repo root so the symbol PNGs load like they do in the car
+        result = subprocess.run([sys.executable, DASHBOARD], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=1800)
+        try:
+            with open(report_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            raise RuntimeError(f"no benchmark report from style {style}:\n{(result.stdout + result.stderr)[-2000:]}")
+    finally:
+        os.unlink(report_path)
+
+
+def git_commit():
+    """Current commit of the repo, so saved reports say what they measured"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def delta(new, old):
+    """Signed change as text, '' when there is nothing to compare with"""
+    if old is None:
+        return ''
+    return f" ({new - old:+.2f})"
+
+
+def print_report(results, budget_ms, top, baseline=None):
+    """Steady-state frame times for all styles, then the slowest draw functions of each"""
+    print(f"{'Style':<14} {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'over budget':>12} "
+          f"{'rebuild frames':>15}")
+    for style, report in results.items():
+        frame = report["steady_frame"]
+        rebuild = report["rebuild_frame"]
+        old = (baseline or {}).get(style, {}).get("steady_frame", {})
+        # Any steady frame over budget is a dropped frame at 60 FPS, not only a slow p95
+        over = frame["p95_ms"] > budget_ms or frame["p99_ms"] > budget_ms or report["over_budget_frames"] > 0
+        flag = "⚠️" if over else "✅"
+        print(f"{STYLE_NAMES[int(style)]:<14} {frame['mean_ms']:>5.2f}ms {frame['p50_ms']:>5.2f}ms "
+              f"{frame['p95_ms']:>5.2f}ms {frame['p99_ms']:>5.2f}ms {frame['max_ms']:>5.2f}ms "
+              f"{report['over_budget_frames']:>6}/{frame['frames']:<5} {rebuild['frames']:>5} x {rebuild['mean_ms']:>5.1f}ms "
+              f"{flag}{delta(frame['mean_ms'], old.get('mean_ms'))}")
+
+    for style, report in results.items():
+        if not report["draw"]:
+            continue
+        old_draws = (baseline or {}).get(style, {}).get("draw", {})
+        print(f"\n🔍 {STYLE_NAMES[int(style)]} - slowest draw functions and screen phases "
+              f"(inclusive ms per frame they ran in)")
+        print(f"   {'function':<40} {'calls':>6} {'mean':>8} {'self':>8} {'p95':>8} {'max':>8} {'share':>6}")
+        for name, draw in list(report["draw"].items())[:top]:
+            flag = " ⚠️" if draw["max_ms"] > budget_ms else ""
+            print(f"   {name:<40} {draw['calls_per_frame']:>6.1f} {draw['mean_ms']:>6.3f}ms {draw['self_ms']:>6.3f}ms "
+                  f"{draw['p95_ms']:>6.3f}ms {draw['max_ms']:>6.2f}ms {draw['share']:>6.1%}{flag}"
+                  f"{delta(draw['mean_ms'], old_draws.get(name, {}).get('mean_ms'))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frame time and per-draw breakdown of every dashboard style")
+    parser.add_argument("--frames", type=int, default=6144, help="frames rendered per style (default 6144 - "
+                        "each of the 512 switch combinations held for 12 frames)")
+    parser.add_argument("--styles", type=int, nargs="+", default=list(range(len(STYLE_NAMES))),
+                        help="style numbers to run (default all: 0-4)")
+    parser.add_argument("--top", type=int, default=10, help="draw functions listed per style (default 10)")
+    parser.add_argument("--json", help="write the full report to this file")
+    parser.add_argument("--compare", help="earlier --json report to show the changes against")
+    parser.add_argument("--no-profile", action="store_true", help="skip the per-draw timers (no breakdown)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["styles"]
+
+    print("⏱️ RENDER BENCHMARK")
+    print("=" * 64)
+    print(f"📊 {args.frames} frames per style, telemetry sweep, SDL dummy video driver\n")
+
+    results = {}
+    for style in args.styles:
+        print(f"▶️ {STYLE_NAMES[style]}...", flush=True)
+        results[str(style)] = run(style, args.frames, profile=not args.no_profile)
+        if not results[str(style)]["steady_frame"]["frames"]:
+            # Nothing to report - every frame was warmup or a switch change
+            sys.exit(f"❌ {STYLE_NAMES[style]}: no steady frames in {args.frames}, use --frames 100 or more")
+        print(f"   {results[str(style)]['switch_combinations']} switch combinations", flush=True)
+    budget_ms = next(iter(results.values()))["budget_ms"]
+    print(f"\n🎯 Frame budget {budget_ms:.1f}ms (60 FPS)"
+          + (f", compared with {args.compare}" if args.compare else "") + "\n")
+    print_report(results, budget_ms, args.top, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"commit": git_commit(), "frames": args.frames, "styles": results}, f, indent=2)
+        print(f"\n💾 Report saved to {args.json}")
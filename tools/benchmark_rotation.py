@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Screen Rotation Benchmark
+Renders every dashboard style headless (demo telemetry, no Arduino) twice - once rotating the
+whole speedometer, tachometer and DSI surfaces every frame, once through the tiled rotation
+buffers - and compares the frame times.
+
+Usage:
+    python3 tools/benchmark_rotation.py               # 300 frames per run
+    python3 tools/benchmark_rotation.py --frames 1000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DASHBOARD = os.path.join(ROOT, 'arduino_combined_dashboard.py')
+STYLE_NAMES = ["Synthwave", "Citroën BX", "Subaru XT", "Nissan 300ZX", "Corvette C4"]
+
+
+def run(style, tiled, frames):
+    """One headless dashboard run, returns the BENCHMARK summary as a dict"""
+    env = dict(os.environ,
+               DASHBOARD_BENCHMARK_FRAMES=str(frames),
+               DASHBOARD_STYLE=str(style),
+               DASHBOARD_TILED_ROTATION='1' if tiled else '0')
+    # Run from the repo root so the symbol PNGs load like they do in the car
+    output = subprocess.run([sys.executable, DASHBOARD], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=600).stdout
+    for line in output.splitlines():
+        if line.startswith("BENCHMARK "):
+            return dict(field.split("=", 1) for field in line.split()[1:])
+    raise RuntimeError(f"no benchmark summary from style {style}:\n{output[-2000:]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frame time with full vs tiled screen rotation")
+    parser.add_argument("--frames", type=int, default=300, help="frames rendered per run (default 300)")
+    args = parser.parse_args()
+
+    print("🔄 SCREEN ROTATION BENCHMARK")
+    print("=" * 64)
+    print(f"📊 {args.frames} frames per run, SDL dummy video driver\n")
+    print(f"{'Style':<14} {'full mean':>10} {'p95':>7} {'tiled mean':>11} {'p95':>7} {'speed-up':>9}")
+
+    for style, name in enumerate(STYLE_NAMES):
+        full = run(style, False, args.frames)
+        tiled = run(style, True, args.frames)
+        full_mean = float(full["mean_ms"])
+        tiled_mean = float(tiled["mean_ms"])
+        print(f"{name:<14} {full_mean:>8.2f}ms {float(full['p95_ms']):>5.2f}ms "
+              f"{tiled_mean:>9.2f}ms {float(tiled['p95_ms']):>5.2f}ms {full_mean / tiled_mean:>8.2f}x")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Telemetry Parser Micro-Benchmark
+Measures lines/second for the table-driven TelemetryFrame parser against the old
+dict-of-floats + "if KEY in data" chain that used to live in read_arduino_data()
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arduino_telemetry import TelemetryFrame, parse_telemetry_line
+
+# Configuration
+BENCHMARK_LINES = 200000
+REPEATS = 5
+
+# Same message mix arduino_code.cpp sends (fast line every 100ms, switch line every 150ms)
+FAST_LINE = ("SPEED:54.5,FUEL:62.3,OIL:41.0,COOLANT:192.0,OILTEMP:214.0,RPM:2150,"
+             "BATTERY:13.9,BRIGHTNESS:85.0,FUEL_CONSUMPTION:6.2500")
+STATUS_LINE = ("TRIP_BTN:0,AVG_BTN:0,OIL_P_SW:1,OIL_T_SW:0,COOL_SW:1,VOLT_SW:0,FUELRNG:245.3,"
+               "IMPG:21.4,AMPG:19.8,FLOW:2.55,AMPG_SW:1,IMPG_SW:0,TRIP_SW:1,FUELR_SW:0,METR_SW:0")
+
+LEGACY_KEYS = ("SPEED", "RPM", "FUEL", "OIL", "COOLANT", "OILTEMP", "BATTERY", "BRIGHTNESS",
+               "FUEL_CONSUMPTION", "TRIP_ODO", "TOTAL_ODO", "FUELRNG", "IMPG", "AMPG", "FLOW")
+LEGACY_SWITCHES = ("OIL_P_SW", "OIL_T_SW", "COOL_SW", "VOLT_SW", "FUELR_SW", "TRIP_SW",
+                   "IMPG_SW", "AMPG_SW", "METR_SW", "TRIP_BTN", "AVG_BTN")
+
+
+def legacy_parse(state, line):
+    """Old parser: dict of floats per line, then a chain of membership checks"""
+    pairs = line.split(",")
+    data = {}
+    for pair in pairs:
+        if ":" in pair:
+            key, value = pair.split(":", 1)
+            try:
+                data[key.strip()] = float(value.strip())
+            except ValueError:
+                pass
+    for key in LEGACY_KEYS:
+        if key in data:
+            state[key] = data[key]
+    for key in LEGACY_SWITCHES:
+        if key in data:
+            state[key] = bool(int(data[key]))
+    return len(data)
+
+
+def run(name, parse_one, lines):
+    """Best-of-N timing of parsing every line once"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for line in lines:
+            parse_one(line)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    rate = len(lines) / best
+    print(f"  {name:14}: {rate:12,.0f} lines/sec  ({best / len(lines) * 1e6:6.2f} us/line)")
+    return rate
+
+
+if __name__ == "__main__":
+    print("🔧 TELEMETRY PARSER BENCHMARK")
+    print("=" * 40)
+
+    # 3 fast lines for every 2 status lines, like the real 100ms/150ms cadence
+    pattern = [FAST_LINE, STATUS_LINE, FAST_LINE, FAST_LINE, STATUS_LINE]
+    lines = (pattern * (BENCHMARK_LINES // len(pattern) + 1))[:BENCHMARK_LINES]
+    print(f"📊 {len(lines):,} lines, best of {REPEATS} runs\n")
+
+    legacy_state = {}
+    legacy_rate = run("legacy dict", lambda line: legacy_parse(legacy_state, line), lines)
+
+    frame = TelemetryFrame()
+    table_rate = run("table-driven", lambda line: parse_telemetry_line(frame, line, 0), lines)
+
+    print(f"\n📈 Speed-up: {table_rate / legacy_rate:.2f}x")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Serial Session Replay
+Plays a session recorded with DASHBOARD_RECORD=<file> through the same reader thread the
+dashboard uses, and reports parser throughput and telemetry statistics for that drive.
+
+Usage:
+    python3 tools/replay_serial_session.py drive.log            # as fast as possible
+    python3 tools/replay_serial_session.py drive.log --speed 1  # real time (4 = 4x)
+
+To watch the drive on the dashboard instead:
+    DASHBOARD_REPLAY=drive.log DASHBOARD_REPLAY_SPEED=1 python3 arduino_combined_dashboard.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from arduino_telemetry import ReplaySerial, SerialReader
+
+
+def replay(path, speed):
+    """Run one replay to the end of the log, returns (reader, replay, seconds)"""
+    source = ReplaySerial(path, speed=speed)
+    # Recorded time as the clock, so timestamps come out the same at any speed
+    reader = SerialReader(source, clock=source.clock)
+    start = time.perf_counter()
+    reader.start()
+    reader.join()
+    return reader, source, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded Arduino serial session")
+    parser.add_argument("log", help="session log written with DASHBOARD_RECORD")
+    parser.add_argument("--speed", type=float, default=0, help="1 = real time, 4 = 4x, 0 = max (default)")
+    args = parser.parse_args()
+
+    print("📼 SERIAL SESSION REPLAY")
+    print("=" * 40)
+
+    reader, source, elapsed = replay(args.log, args.speed)
+    duration = source.records[-1][0] / 1000.0 if source.records else 0.0
+    total_bytes = sum(len(data) for _, data in source.records)
+
+    print(f"📊 {len(source.records):,} chunks, {total_bytes:,} bytes, {duration:.1f}s recorded")
+    print(f"⏱️  Replayed in {elapsed:.2f}s ({duration / elapsed if elapsed else 0:.1f}x real time)")
+    print(f"  Lines           : {reader.lines_received:,} ({reader.lines_received / elapsed if elapsed else 0:,.0f}/sec)")
+    print(f"  Telemetry frames: {reader.telemetry_lines:,} (coalesced {reader.frames_coalesced:,}, "
+          f"dropped {reader.frames_dropped:,})")
+    print(f"  Binary frames   : {reader.binary_frames:,} (CRC errors {reader.ingest.crc_errors:,})")
+    print(f"  Delta gaps      : {reader.delta_gaps:,}")
+    print(f"  Control messages: {len(reader.control_messages):,}")
+    print(f"  Buffer overflows: {reader.ingest.overflows:,}")